@@ -3,6 +3,7 @@
 Main application window with three-panel layout.
 """
 
+import copy
 import logging
 from pathlib import Path
 
@@ -38,6 +39,9 @@ class ThemeStudioWindow(QMainWindow):
         # Theme controller (MVC controller layer)
         self._theme_controller = None
 
+        # (plugin widget, snapshot of the theme) last applied to the preview
+        self._previewed_theme = None
+
         # Plugin registry (Task 4.3 + Introspection System)
         self._plugins = {}  # Manual plugins (e.g., GenericWidgetsPlugin)
         self._plugin_registry = PluginRegistry(self)  # Dynamic discovery via entry points
@@ -613,6 +617,17 @@ class ThemeStudioWindow(QMainWindow):
             logger.debug("_update_preview_theme: Widget already deleted")
             return
 
+        # Deferred updates queued by a burst of edits find the theme already applied
+        from vfwidgets_theme.core.theme_diff import ThemeDiff
+
+        snapshot = self._snapshot_theme(theme)
+        if self._previewed_theme is not None and self._previewed_theme[0] is plugin_widget:
+            diff = ThemeDiff.compare(self._previewed_theme[1], snapshot)
+            if not diff.has_visual_changes:
+                logger.debug("_update_preview_theme: Theme unchanged, skipping")
+                return
+        self._previewed_theme = None
+
         try:
             # Import theme system generators
             from vfwidgets_theme.widgets.palette_generator import PaletteGenerator
@@ -817,6 +832,7 @@ class ThemeStudioWindow(QMainWindow):
             except Exception as e:
                 logger.warning(f"_update_preview_theme: Failed to apply canvas theme: {e}")
 
+            self._previewed_theme = (plugin_widget, snapshot)
             logger.debug("_update_preview_theme: END")
 
         except RuntimeError:
@@ -901,6 +917,29 @@ class ThemeStudioWindow(QMainWindow):
         if hasattr(self, "inspector_panel"):
             self.inspector_panel.on_metadata_changed(field, value)
 
+    @staticmethod
+    def _snapshot_theme(theme):
+        """Copy a theme, since documents edit their theme's dicts in place.
+
+        Args:
+            theme: Theme to copy
+
+        Returns:
+            Theme with its own copies of all token dicts
+        """
+        from vfwidgets_theme.core.theme import Theme
+
+        return Theme.from_trusted(
+            name=theme.name,
+            version=theme.version,
+            type=theme.type,
+            colors=dict(theme.colors),
+            styles=dict(theme.styles),
+            metadata=dict(theme.metadata),
+            token_colors=copy.deepcopy(theme.token_colors),
+            fonts=copy.deepcopy(theme.fonts),
+        )
+
     def _deferred_update_preview_theme(self):
         """Deferred theme update for preview widgets.
 
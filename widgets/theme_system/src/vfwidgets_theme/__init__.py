@@ -38,109 +38,221 @@ protocols, and clean separation of concerns.
 
 """
 
-# Import core protocols for advanced usage
-# Import introspection API for plugin discovery
-from .core.introspection import (
-    PluginAvailability,
-    WidgetMetadata,
-    extract_theme_tokens,
-    validate_metadata,
-)
-
-# Import error handling and fallback system
-from .errors import (
-    # Error recovery system
-    ErrorRecoveryManager,
-    InvalidThemeFormatError,
-    PropertyNotFoundError,
-    ThemeLoadError,
-    # Extended exception hierarchy
-    ThemeNotFoundError,
-    ThemeSystemNotInitializedError,
-    create_error_recovery_manager,
-    get_global_error_recovery_manager,
-    notify_user,
-)
-from .fallbacks import (
-    # Core fallback data
-    MINIMAL_THEME,
-    # Fallback color system
-    FallbackColorSystem,
-    create_fallback_color_system,
-    get_fallback_color,
-    get_fallback_property,
-    # Convenience functions
-    get_fallback_theme,
-    get_global_fallback_color_system,
-    get_safe_color_palette,
-    is_valid_hex_color,
-    validate_theme_completeness,
-)
-from .logging import (
-    # Performance tracking
-    PerformanceTracker,
-    # Core logging classes
-    ThemeLogger,
-    # Configuration
-    configure_theme_logging,
-    create_theme_logger,
-    get_debug_logger,
-    get_global_performance_tracker,
-    get_performance_logger,
-    log_performance_warning,
-    # Convenience logging functions
-    log_theme_error,
-    log_theme_switch,
-    log_widget_themed,
-)
-from .protocols import (
-    ColorProvider,
-    ColorResolveError,
-    ColorValue,
-    PropertyKey,
-    PropertyValue,
-    QSSStyle,
-    StyleCallback,
-    StyleGenerationError,
-    StyleGenerator,
-    ThemeableWidget,
-    # Type aliases for better IDE support
-    ThemeData,
-    # Exception hierarchy for error handling
-    ThemeError,
-    ThemePropertyError,
-    # Core protocols for dependency injection
-    ThemeProvider,
-    ThemeValidationError,
-    get_protocol_version,
-    # Utility functions
-    validate_performance_requirements,
-)
+from typing import TYPE_CHECKING
+
+from .utils.lazy_import import lazy_exports
 
 # Version information
 __version__ = "2.0.0-rc4"
 __author__ = "VFWidgets Team"
 __description__ = "Performance-first theme system for PySide6/Qt applications"
 
-# Primary user-facing imports - THE API
-# Token constants for IDE autocomplete (API Consolidation Phase 2)
-from .core.token_constants import Tokens
-from .widgets import (
-    ThemedApplication,
-    ThemedDialog,
-    ThemedMainWindow,
-    ThemedQWidget,
-    ThemedWidget,
-    VFThemedApplication,  # NEW in v2.0.0 - Declarative theme configuration
-    create_themed_widget,
-    get_global_available_themes,
-    get_global_theme,
-    get_themed_application,
-    set_global_theme,
-)
-
-# Widget role enum for type-safe semantic styling (API Consolidation Phase 4)
-from .widgets.roles import WidgetRole, get_widget_role, set_widget_role
+# Public names are imported from their modules on first access, so importing
+# the package does not load Qt widgets, editors or validation frameworks
+_LAZY_IMPORTS = {
+    ".core.introspection": (
+        "PluginAvailability",
+        "WidgetMetadata",
+        "extract_theme_tokens",
+        "validate_metadata",
+    ),
+    ".errors": (
+        "ErrorRecoveryManager",
+        "InvalidThemeFormatError",
+        "PropertyNotFoundError",
+        "ThemeLoadError",
+        "ThemeNotFoundError",
+        "ThemeSystemNotInitializedError",
+        "create_error_recovery_manager",
+        "get_global_error_recovery_manager",
+        "notify_user",
+    ),
+    ".fallbacks": (
+        "MINIMAL_THEME",
+        "FallbackColorSystem",
+        "create_fallback_color_system",
+        "get_fallback_color",
+        "get_fallback_property",
+        "get_fallback_theme",
+        "get_global_fallback_color_system",
+        "get_safe_color_palette",
+        "is_valid_hex_color",
+        "validate_theme_completeness",
+    ),
+    ".logging": (
+        "PerformanceTracker",
+        "ThemeLogger",
+        "configure_theme_logging",
+        "create_theme_logger",
+        "get_debug_logger",
+        "get_global_performance_tracker",
+        "get_performance_logger",
+        "log_performance_warning",
+        "log_theme_error",
+        "log_theme_switch",
+        "log_widget_themed",
+    ),
+    ".protocols": (
+        "ColorProvider",
+        "ColorResolveError",
+        "ColorValue",
+        "PropertyKey",
+        "PropertyValue",
+        "QSSStyle",
+        "StyleCallback",
+        "StyleGenerationError",
+        "StyleGenerator",
+        "ThemeableWidget",
+        "ThemeData",
+        "ThemeError",
+        "ThemePropertyError",
+        "ThemeProvider",
+        "ThemeValidationError",
+        "get_protocol_version",
+        "validate_performance_requirements",
+    ),
+    ".core.token_constants": ("Tokens",),
+    ".tracing": (
+        "Tracer",
+        "disable_tracing",
+        "enable_tracing",
+        "get_tracer",
+        "is_tracing_enabled",
+        "trace_span",
+    ),
+    ".widgets": (
+        "ThemedApplication",
+        "ThemedDialog",
+        "ThemedMainWindow",
+        "ThemedQWidget",
+        "ThemedWidget",
+        "VFThemedApplication",
+        "create_themed_widget",
+        "get_global_available_themes",
+        "get_global_theme",
+        "get_themed_application",
+        "set_global_theme",
+    ),
+    ".widgets.roles": (
+        "WidgetRole",
+        "get_widget_role",
+        "set_widget_role",
+    ),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    # Import core protocols for advanced usage
+    # Import introspection API for plugin discovery
+    from .core.introspection import (
+        PluginAvailability,
+        WidgetMetadata,
+        extract_theme_tokens,
+        validate_metadata,
+    )
+
+    # Token constants for IDE autocomplete (API Consolidation Phase 2)
+    from .core.token_constants import Tokens
+
+    # Import error handling and fallback system
+    from .errors import (
+        # Error recovery system
+        ErrorRecoveryManager,
+        InvalidThemeFormatError,
+        PropertyNotFoundError,
+        ThemeLoadError,
+        # Extended exception hierarchy
+        ThemeNotFoundError,
+        ThemeSystemNotInitializedError,
+        create_error_recovery_manager,
+        get_global_error_recovery_manager,
+        notify_user,
+    )
+    from .fallbacks import (
+        # Core fallback data
+        MINIMAL_THEME,
+        # Fallback color system
+        FallbackColorSystem,
+        create_fallback_color_system,
+        get_fallback_color,
+        get_fallback_property,
+        # Convenience functions
+        get_fallback_theme,
+        get_global_fallback_color_system,
+        get_safe_color_palette,
+        is_valid_hex_color,
+        validate_theme_completeness,
+    )
+    from .logging import (
+        # Performance tracking
+        PerformanceTracker,
+        # Core logging classes
+        ThemeLogger,
+        # Configuration
+        configure_theme_logging,
+        create_theme_logger,
+        get_debug_logger,
+        get_global_performance_tracker,
+        get_performance_logger,
+        log_performance_warning,
+        # Convenience logging functions
+        log_theme_error,
+        log_theme_switch,
+        log_widget_themed,
+    )
+    from .protocols import (
+        ColorProvider,
+        ColorResolveError,
+        ColorValue,
+        PropertyKey,
+        PropertyValue,
+        QSSStyle,
+        StyleCallback,
+        StyleGenerationError,
+        StyleGenerator,
+        ThemeableWidget,
+        # Type aliases for better IDE support
+        ThemeData,
+        # Exception hierarchy for error handling
+        ThemeError,
+        ThemePropertyError,
+        # Core protocols for dependency injection
+        ThemeProvider,
+        ThemeValidationError,
+        get_protocol_version,
+        # Utility functions
+        validate_performance_requirements,
+    )
+
+    # Pipeline tracing
+    from .tracing import (
+        Tracer,
+        disable_tracing,
+        enable_tracing,
+        get_tracer,
+        is_tracing_enabled,
+        trace_span,
+    )
+
+    # Primary user-facing imports - THE API
+    from .widgets import (
+        ThemedApplication,
+        ThemedDialog,
+        ThemedMainWindow,
+        ThemedQWidget,
+        ThemedWidget,
+        VFThemedApplication,  # NEW in v2.0.0 - Declarative theme configuration
+        create_themed_widget,
+        get_global_available_themes,
+        get_global_theme,
+        get_themed_application,
+        set_global_theme,
+    )
+
+    # Widget role enum for type-safe semantic styling (API Consolidation Phase 4)
+    from .widgets.roles import WidgetRole, get_widget_role, set_widget_role
+
 
 __all__ = [
     # ======================================
@@ -228,6 +340,13 @@ __all__ = [
     "PerformanceTracker",
     "get_global_performance_tracker",
     "configure_theme_logging",
+    # Tracing
+    "Tracer",
+    "enable_tracing",
+    "disable_tracing",
+    "get_tracer",
+    "is_tracing_enabled",
+    "trace_span",
     # Utilities
     "validate_performance_requirements",
     "get_protocol_version",
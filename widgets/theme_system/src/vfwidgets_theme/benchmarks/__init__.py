@@ -0,0 +1,65 @@
+"""Runnable performance benchmarks for the theme system.
+
+Runs realistic scenarios (ThemedWidgets at 100/1k/10k scale, override
+churn, theme discovery, import time) with ThemeBenchmark, writes the results
+as JSON and checks them against a checked-in baseline:
+
+    python -m vfwidgets_theme.benchmarks --quick
+
+See ``python -m vfwidgets_theme.benchmarks --help`` for all options.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_exports
+
+# Scenarios import Qt, so everything is loaded on first access
+_LAZY_IMPORTS = {
+    ".baseline": (
+        "Comparison",
+        "DEFAULT_BASELINE_PATH",
+        "DEFAULT_THRESHOLD",
+        "build_report",
+        "compare_to_baseline",
+        "format_comparisons",
+        "load_report",
+        "save_report",
+    ),
+    ".runner": ("main",),
+    ".scenarios": (
+        "SCENARIOS",
+        "SuiteConfig",
+        "run_scenarios",
+    ),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .baseline import (
+        DEFAULT_BASELINE_PATH,
+        DEFAULT_THRESHOLD,
+        Comparison,
+        build_report,
+        compare_to_baseline,
+        format_comparisons,
+        load_report,
+        save_report,
+    )
+    from .runner import main
+    from .scenarios import SCENARIOS, SuiteConfig, run_scenarios
+
+__all__ = [
+    "Comparison",
+    "DEFAULT_BASELINE_PATH",
+    "DEFAULT_THRESHOLD",
+    "SCENARIOS",
+    "SuiteConfig",
+    "build_report",
+    "compare_to_baseline",
+    "format_comparisons",
+    "load_report",
+    "main",
+    "run_scenarios",
+    "save_report",
+]
@@ -0,0 +1,7 @@
+"""Run the benchmark suite: ``python -m vfwidgets_theme.benchmarks``."""
+
+import sys
+
+from .runner import main
+
+sys.exit(main())
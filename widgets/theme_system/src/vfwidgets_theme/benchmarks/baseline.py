@@ -0,0 +1,215 @@
+"""Benchmark result files and baseline regression checks.
+
+Results are stored as JSON: a small header describing the environment and
+one entry per result name holding the BenchmarkResult fields. A baseline is
+simply a results file that was checked in; it may also carry a
+``thresholds`` mapping with per-result regression thresholds.
+
+Example:
+    report = build_report(results)
+    save_report(report, "benchmark-results.json")
+    comparisons = compare_to_baseline(report, load_report(DEFAULT_BASELINE_PATH))
+    regressions = [c for c in comparisons if c.is_regression]
+
+"""
+
+import json
+import platform
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from ..testing.benchmarks import BenchmarkResult
+
+# Version of the results file layout
+RESULTS_FORMAT_VERSION = 1
+
+# Baseline shipped with the package
+DEFAULT_BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# Allowed slowdown before a result counts as a regression (0.25 = 25% slower)
+DEFAULT_THRESHOLD = 0.25
+
+# Statistic compared against the baseline; like timeit, the fastest run is
+# the best estimate, slower runs mostly measure other load on the machine
+COMPARED_METRIC = "min_time"
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """One result compared against its baseline."""
+
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def change(self) -> float:
+        """Relative change against the baseline (0.5 = 50% slower)."""
+        if self.baseline <= 0:
+            return 0.0
+        return self.current / self.baseline - 1.0
+
+    @property
+    def is_regression(self) -> bool:
+        """Whether the result is slower than the threshold allows."""
+        return self.change > self.threshold
+
+
+def _environment() -> dict[str, Any]:
+    """Describe the machine and library versions results were taken on."""
+    environment = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+    try:
+        import PySide6
+
+        environment["pyside6"] = PySide6.__version__
+    except ImportError:
+        pass
+    return environment
+
+
+def build_report(
+    results: dict[str, BenchmarkResult], config: Optional[dict[str, Any]] = None
+) -> dict[str, Any]:
+    """Build the JSON document for a benchmark run.
+
+    Args:
+        results: Benchmark results keyed by result name
+        config: Suite configuration the results were taken with
+
+    Returns:
+        JSON-serializable report
+
+    """
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "environment": _environment(),
+        "config": config or {},
+        "results": {name: result.to_dict() for name, result in results.items()},
+    }
+
+
+def save_report(report: dict[str, Any], path: Union[str, Path]) -> Path:
+    """Write a report to a JSON file.
+
+    Args:
+        report: Report from build_report()
+        path: File to write
+
+    Returns:
+        Path of the written file
+
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return path
+
+
+def load_report(path: Union[str, Path]) -> dict[str, Any]:
+    """Read a report or baseline file.
+
+    Args:
+        path: File to read
+
+    Returns:
+        Report dictionary
+
+    Raises:
+        ValueError: If the file has an unsupported format version
+
+    """
+    report = json.loads(Path(path).read_text(encoding="utf-8"))
+    version = report.get("format_version")
+    if version != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results format {version!r} in {path}")
+    return report
+
+
+def compare_to_baseline(
+    report: dict[str, Any],
+    baseline: dict[str, Any],
+    thresholds: Optional[dict[str, float]] = None,
+    default_threshold: Optional[float] = None,
+) -> list[Comparison]:
+    """Compare a benchmark run against a baseline.
+
+    Results missing from either side are skipped, so partial runs (a subset
+    of scenarios or scales) can still be checked.
+
+    Args:
+        report: Report of the current run
+        baseline: Baseline report
+        thresholds: Per-result thresholds, overriding the baseline's own
+        default_threshold: Threshold for results without their own, defaulting
+            to the baseline's ``default_threshold`` or DEFAULT_THRESHOLD
+
+    Returns:
+        Comparisons in baseline order; check ``is_regression`` on each
+
+    """
+    merged_thresholds = dict(baseline.get("thresholds", {}))
+    merged_thresholds.update(thresholds or {})
+    if default_threshold is None:
+        default_threshold = baseline.get("default_threshold", DEFAULT_THRESHOLD)
+
+    current_results = report.get("results", {})
+    comparisons = []
+    for name, baseline_result in baseline.get("results", {}).items():
+        current_result = current_results.get(name)
+        if current_result is None:
+            continue
+        comparisons.append(
+            Comparison(
+                name=name,
+                baseline=float(baseline_result[COMPARED_METRIC]),
+                current=float(current_result[COMPARED_METRIC]),
+                threshold=float(merged_thresholds.get(name, default_threshold)),
+            )
+        )
+    return comparisons
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    """Format comparisons as a plain text table.
+
+    Args:
+        comparisons: Output of compare_to_baseline()
+
+    Returns:
+        Table with one line per result
+
+    """
+    if not comparisons:
+        return "No results to compare against the baseline."
+
+    width = max(len(comparison.name) for comparison in comparisons)
+    lines = [f"{'result':<{width}}  {'baseline':>10}  {'current':>10}  {'change':>8}"]
+    for comparison in comparisons:
+        status = "  REGRESSION" if comparison.is_regression else ""
+        lines.append(
+            f"{comparison.name:<{width}}  {comparison.baseline * 1000:>8.2f}ms  "
+            f"{comparison.current * 1000:>8.2f}ms  {comparison.change:>+7.0%}{status}"
+        )
+    return "\n".join(lines)
+
+
+__all__ = [
+    "COMPARED_METRIC",
+    "Comparison",
+    "DEFAULT_BASELINE_PATH",
+    "DEFAULT_THRESHOLD",
+    "RESULTS_FORMAT_VERSION",
+    "build_report",
+    "compare_to_baseline",
+    "format_comparisons",
+    "load_report",
+    "save_report",
+]
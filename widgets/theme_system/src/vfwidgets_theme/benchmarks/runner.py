@@ -0,0 +1,199 @@
+"""Command line entry point of the benchmark suite.
+
+Usage:
+    python -m vfwidgets_theme.benchmarks
+    python -m vfwidgets_theme.benchmarks --scenario widgets --scales 100,1000
+    python -m vfwidgets_theme.benchmarks --threshold 0.5 --threshold-for import_time=1.0
+    python -m vfwidgets_theme.benchmarks --update-baseline
+
+The suite runs headless (``QT_QPA_PLATFORM=offscreen`` unless another
+platform is set), writes its results as JSON and compares them against the
+checked-in baseline. The exit status is 1 when any result regressed beyond
+its threshold, so the command can gate CI jobs.
+"""
+
+import argparse
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+from .baseline import (
+    DEFAULT_BASELINE_PATH,
+    build_report,
+    compare_to_baseline,
+    format_comparisons,
+    load_report,
+    save_report,
+)
+
+# Where results go when no --output is given
+DEFAULT_OUTPUT_PATH = Path("benchmark-results.json")
+
+# Reduced sizes for a quick local check
+QUICK_SCALES = (100, 1000)
+QUICK_ITERATIONS = 3
+QUICK_THEME_FILES = 100
+
+
+def _parse_scales(value: str) -> tuple[int, ...]:
+    """Parse a comma separated list of widget counts."""
+    try:
+        scales = tuple(int(part) for part in value.split(",") if part.strip())
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid scales: {value!r}") from None
+    if not scales or min(scales) <= 0:
+        raise argparse.ArgumentTypeError(f"invalid scales: {value!r}")
+    return scales
+
+
+def _parse_threshold_for(value: str) -> tuple[str, float]:
+    """Parse a NAME=FRACTION per-result threshold."""
+    name, separator, fraction = value.partition("=")
+    try:
+        if not separator or not name:
+            raise ValueError
+        return name, float(fraction)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NAME=FRACTION, got {value!r}") from None
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    from .scenarios import SCENARIOS
+
+    parser = argparse.ArgumentParser(
+        prog="python -m vfwidgets_theme.benchmarks",
+        description="Run the theme system benchmarks and check them against a baseline.",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=list(SCENARIOS),
+        help="Scenario to run; repeat for several (default: all)",
+    )
+    parser.add_argument(
+        "--scales",
+        type=_parse_scales,
+        help="Comma separated ThemedWidget counts (default: 100,1000,10000)",
+    )
+    parser.add_argument("--iterations", type=int, help="Timed runs per result (default: 5)")
+    parser.add_argument(
+        "--theme-files", type=int, help="Theme files in the discovery scenario (default: 500)"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Smaller scales and fewer iterations"
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_OUTPUT_PATH,
+        help=f"Results file to write (default: {DEFAULT_OUTPUT_PATH})",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE_PATH,
+        help="Baseline to compare against (default: the packaged baseline)",
+    )
+    parser.add_argument(
+        "--no-compare", action="store_true", help="Only write results, skip the comparison"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Write the results to the baseline file, keeping its thresholds",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        help="Allowed slowdown as a fraction, e.g. 0.25 for 25%% (default: from baseline)",
+    )
+    parser.add_argument(
+        "--threshold-for",
+        type=_parse_threshold_for,
+        action="append",
+        default=[],
+        metavar="NAME=FRACTION",
+        help="Allowed slowdown for one result; repeat for several",
+    )
+    parser.add_argument(
+        "--track-memory",
+        action="store_true",
+        help="Record peak memory with tracemalloc (slows down the timings)",
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Run the benchmark suite from the command line.
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit status: 0 on success, 1 on regressions, 2 on a missing baseline
+
+    """
+    # Must be set before the first QApplication is created
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from ..testing.benchmarks import ThemeBenchmark
+    from .scenarios import SuiteConfig, run_scenarios
+
+    args = build_parser().parse_args(argv)
+
+    config = SuiteConfig()
+    if args.quick:
+        config.scales = QUICK_SCALES
+        config.iterations = QUICK_ITERATIONS
+        config.theme_files = QUICK_THEME_FILES
+    if args.scales:
+        config.scales = args.scales
+    if args.iterations:
+        config.iterations = args.iterations
+    if args.theme_files:
+        config.theme_files = args.theme_files
+
+    benchmark = ThemeBenchmark(enable_memory_tracking=args.track_memory)
+    results = run_scenarios(args.scenario, config, benchmark)
+
+    report = build_report(results, asdict(config))
+    output = save_report(report, args.output)
+    print(f"Wrote {len(results)} benchmark results to {output}")
+
+    for name, result in results.items():
+        for error in result.errors:
+            print(f"error in {name}: {error}", file=sys.stderr)
+
+    if args.update_baseline:
+        if args.baseline.exists():
+            previous = load_report(args.baseline)
+            for key in ("thresholds", "default_threshold"):
+                if key in previous:
+                    report[key] = previous[key]
+        save_report(report, args.baseline)
+        print(f"Updated baseline {args.baseline}")
+        return 0
+
+    if args.no_compare:
+        return 0
+
+    if not args.baseline.exists():
+        print(f"Baseline not found: {args.baseline}", file=sys.stderr)
+        return 2
+
+    comparisons = compare_to_baseline(
+        report,
+        load_report(args.baseline),
+        thresholds=dict(args.threshold_for),
+        default_threshold=args.threshold,
+    )
+    print(format_comparisons(comparisons))
+
+    regressions = [comparison for comparison in comparisons if comparison.is_regression]
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed beyond their threshold")
+        return 1
+    return 0
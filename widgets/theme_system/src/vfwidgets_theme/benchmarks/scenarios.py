@@ -0,0 +1,508 @@
+"""Benchmark scenarios for the theme system.
+
+Each scenario builds real theme system objects (ThemedWidgets, the
+ThemeManager singleton, theme files on disk) and times them with
+ThemeBenchmark. Scenarios return their results keyed by a stable result
+name, which is what baselines are compared by.
+
+Scenarios:
+- widgets: ThemedWidget creation and theme switches at every scale
+- property_access: Theme property reads through ``widget.theme``
+- style_generation: Comprehensive stylesheet generation per widget class
+- override_churn: Setting and removing app overrides with live widgets
+- discovery: Repository discovery of a directory of theme files
+- token_scopes: Token color scope resolution on a large VS Code-style theme
+- theme_variants: Generating a family of color variants of a large theme
+- import_time: ``import vfwidgets_theme`` in a fresh interpreter
+"""
+
+import itertools
+import json
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from ..testing.benchmarks import BenchmarkResult, ThemeBenchmark
+
+# Themes the switch scenarios alternate between
+SWITCH_THEMES = ("dark", "light")
+
+# Tokens churned by the override scenario
+OVERRIDE_TOKENS = (
+    "editor.background",
+    "editor.foreground",
+    "button.background",
+    "button.foreground",
+    "input.background",
+    "list.activeSelectionBackground",
+)
+
+
+@dataclass
+class SuiteConfig:
+    """Sizes and repetition counts of a benchmark run."""
+
+    scales: tuple[int, ...] = (100, 1000, 10000)
+    iterations: int = 5
+    theme_files: int = 500
+    token_color_rules: int = 2000
+    scope_stacks: int = 10000
+    variant_tokens: int = 1500
+    variant_count: int = 8
+    override_widgets: int = 100
+    override_changes: int = 50
+
+
+def _application():
+    """Get the QApplication, creating one if needed."""
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
+
+
+def _process_events() -> None:
+    """Deliver pending events, including deferred widget deletion."""
+    from PySide6.QtCore import QCoreApplication, QEvent
+
+    app = _application()
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def _themed_widget_class():
+    """Create the ThemedWidget subclass used by widget scenarios."""
+    from PySide6.QtWidgets import QWidget
+
+    from ..widgets.base import ThemedWidget
+
+    class BenchmarkWidget(ThemedWidget, QWidget):
+        """Themed widget reading a few typical tokens."""
+
+        theme_config = {
+            "background": "colors.background",
+            "foreground": "colors.foreground",
+            "accent": "button.background",
+        }
+
+    return BenchmarkWidget
+
+
+def _theme_manager():
+    """Get the ThemeManager with the first switch theme active."""
+    from ..core.manager import ThemeManager
+
+    manager = ThemeManager.get_instance()
+    manager.set_theme(SWITCH_THEMES[0], immediate=True)
+    return manager
+
+
+def run_widget_scenario(
+    benchmark: ThemeBenchmark, config: SuiteConfig
+) -> dict[str, BenchmarkResult]:
+    """Time ThemedWidget creation and full theme switches at every scale."""
+    from PySide6.QtWidgets import QWidget
+
+    _application()
+    manager = _theme_manager()
+    widget_class = _themed_widget_class()
+    results = {}
+
+    for scale in config.scales:
+        roots = []
+
+        def create(_, scale=scale, roots=roots):
+            root = QWidget()
+            for _i in range(scale):
+                widget_class(root)
+            _process_events()
+            roots.append(root)
+
+        # Creating thousands of widgets is slow, so creation is timed once
+        results[f"create_widgets_{scale}"] = benchmark.benchmark_operation(
+            f"Create ThemedWidgets ({scale} widgets)", create, iterations=1
+        )
+        switches = itertools.count(1)
+
+        def switch(_, switches=switches):
+            manager.set_theme(SWITCH_THEMES[next(switches) % len(SWITCH_THEMES)], immediate=True)
+            _process_events()
+
+        results[f"theme_switch_{scale}"] = benchmark.benchmark_operation(
+            f"Theme Switch ({scale} widgets)", switch, iterations=config.iterations, warmup=1
+        )
+
+        for root in roots:
+            root.deleteLater()
+        _process_events()
+        manager.set_theme(SWITCH_THEMES[0], immediate=True)
+
+    return results
+
+
+def run_property_access_scenario(
+    benchmark: ThemeBenchmark, config: SuiteConfig
+) -> dict[str, BenchmarkResult]:
+    """Time theme property reads on a themed widget."""
+    _application()
+    _theme_manager()
+    widget = _themed_widget_class()()
+    reads = 10000
+
+    def read_properties(_):
+        theme = widget.theme
+        for _i in range(reads):
+            _ = theme.background
+            _ = theme.foreground
+            _ = theme.accent
+
+    result = benchmark.benchmark_operation(
+        f"Property Access ({reads * 3} reads)",
+        read_properties,
+        iterations=config.iterations,
+        warmup=1,
+    )
+    widget.deleteLater()
+    _process_events()
+    return {"property_access": result}
+
+
+def run_style_generation_scenario(
+    benchmark: ThemeBenchmark, config: SuiteConfig
+) -> dict[str, BenchmarkResult]:
+    """Time comprehensive stylesheet generation for a set of widget classes."""
+    from ..widgets.stylesheet_generator import StylesheetGenerator
+
+    theme = _theme_manager().current_theme
+    class_names = [f"BenchmarkWidget{i}" for i in range(20)]
+
+    def generate(_):
+        for class_name in class_names:
+            StylesheetGenerator(theme, class_name).generate_comprehensive_stylesheet()
+
+    result = benchmark.benchmark_operation(
+        f"Style Generation ({len(class_names)} widget classes)",
+        generate,
+        iterations=config.iterations,
+        warmup=1,
+    )
+    return {"style_generation": result}
+
+
+def run_override_scenario(
+    benchmark: ThemeBenchmark, config: SuiteConfig
+) -> dict[str, BenchmarkResult]:
+    """Time setting and removing app overrides while widgets are alive."""
+    from PySide6.QtWidgets import QWidget
+
+    _application()
+    manager = _theme_manager()
+    widget_class = _themed_widget_class()
+    root = QWidget()
+    for _i in range(config.override_widgets):
+        widget_class(root)
+    _process_events()
+
+    def churn(_):
+        for change in range(config.override_changes):
+            token = OVERRIDE_TOKENS[change % len(OVERRIDE_TOKENS)]
+            manager.set_app_override(token, f"#{change % 256:02x}3050")
+            _process_events()
+        for token in OVERRIDE_TOKENS:
+            manager.remove_app_override(token)
+        _process_events()
+
+    try:
+        result = benchmark.benchmark_operation(
+            f"Override Churn ({config.override_changes} changes, "
+            f"{config.override_widgets} widgets)",
+            churn,
+            iterations=config.iterations,
+            warmup=1,
+        )
+    finally:
+        for token in OVERRIDE_TOKENS:
+            manager.remove_app_override(token, notify=False)
+        root.deleteLater()
+        _process_events()
+
+    return {"override_churn": result}
+
+
+def write_theme_files(directory: Path, count: int) -> None:
+    """Write distinct, valid theme files for discovery benchmarks.
+
+    Args:
+        directory: Directory to write the files to
+        count: Number of theme files
+
+    """
+    for index in range(count):
+        shade = f"{index % 256:02x}"
+        theme = {
+            "name": f"benchmark-theme-{index}",
+            "version": "1.0.0",
+            "type": "dark" if index % 2 else "light",
+            "colors": {
+                "colors.background": f"#{shade}{shade}{shade}",
+                "colors.foreground": "#cccccc",
+                "editor.background": f"#1e{shade}1e",
+                "button.background": f"#0e{shade}9c",
+            },
+            "styles": {"QPushButton": "background-color: @colors.button.background;"},
+        }
+        path = directory / f"benchmark-theme-{index}.json"
+        path.write_text(json.dumps(theme), encoding="utf-8")
+
+
+def run_discovery_scenario(
+    benchmark: ThemeBenchmark, config: SuiteConfig
+) -> dict[str, BenchmarkResult]:
+    """Time repository discovery of a directory full of theme files."""
+    from ..core.repository import ThemeRepository
+
+    with tempfile.TemporaryDirectory(prefix="vftheme-benchmark-") as directory:
+        write_theme_files(Path(directory), config.theme_files)
+
+        def discover(repository):
+            themes = repository.discover_themes(directory, recursive=False)
+            if len(themes) != config.theme_files:
+                raise RuntimeError(f"Discovered {len(themes)} of {config.theme_files} themes")
+
+        result = benchmark.benchmark_operation(
+            f"Repository Discovery ({config.theme_files} theme files)",
+            discover,
+            iterations=config.iterations,
+            # Fresh repositories without the on-disk cache measure a cold scan
+            setup=lambda: ThemeRepository(use_discovery_cache=False),
+        )
+
+    return {f"repository_discovery_{config.theme_files}": result}
+
+
+# Scope parts of the synthetic token color rules and scope stacks
+SCOPE_CATEGORIES = (
+    "comment",
+    "constant",
+    "entity",
+    "keyword",
+    "markup",
+    "meta",
+    "punctuation",
+    "storage",
+    "string",
+    "support",
+    "variable",
+)
+SCOPE_KINDS = (
+    "block",
+    "class",
+    "control",
+    "definition",
+    "function",
+    "language",
+    "line",
+    "name",
+    "numeric",
+    "operator",
+    "other",
+    "quoted",
+    "tag",
+    "type",
+)
+SCOPE_LANGUAGES = ("c", "cpp", "css", "go", "html", "java", "js", "python", "rust", "ts")
+
+
+def make_token_colors(count: int) -> list[dict]:
+    """Build token color rules shaped like those of large VS Code themes.
+
+    Mixes plain scopes of one to three segments, language-specific scopes,
+    comma-separated scope lists and descendant selectors.
+
+    Args:
+        count: Number of rules
+
+    Returns:
+        token_colors rules
+
+    """
+    rules = []
+    for index in range(count):
+        category = SCOPE_CATEGORIES[index % len(SCOPE_CATEGORIES)]
+        kind = SCOPE_KINDS[(index // len(SCOPE_CATEGORIES)) % len(SCOPE_KINDS)]
+        language = SCOPE_LANGUAGES[index % len(SCOPE_LANGUAGES)]
+        shape = index % 4
+        if shape == 0:
+            scope = category if index % 3 else f"{category}.{kind}"
+        elif shape == 1:
+            scope = f"{category}.{kind}.{language}"
+        elif shape == 2:
+            scope = [f"{category}.{kind}", f"{category}.other.{language}"]
+        else:
+            scope = f"meta.function.{language} {category}.{kind}"
+        rules.append({"scope": scope, "settings": {"foreground": f"#{index % 0xFFFFFF:06x}"}})
+    return rules
+
+
+def make_scope_stacks(count: int) -> list[tuple[str, ...]]:
+    """Build scope stacks as a tokenizer would report them, with repeats."""
+    stacks = []
+    for index in range(count):
+        language = SCOPE_LANGUAGES[index % len(SCOPE_LANGUAGES)]
+        category = SCOPE_CATEGORIES[(index // 3) % len(SCOPE_CATEGORIES)]
+        kind = SCOPE_KINDS[(index // 7) % len(SCOPE_KINDS)]
+        stack = [f"source.{language}"]
+        if index % 2:
+            stack.append(f"meta.function.{language}")
+        stack.append(f"{category}.{kind}.begin.{language}")
+        stacks.append(tuple(stack))
+    return stacks
+
+
+def run_token_scopes_scenario(
+    benchmark: ThemeBenchmark, config: SuiteConfig
+) -> dict[str, BenchmarkResult]:
+    """Time compiling and querying the token color scope engine."""
+    from ..core.token_scopes import TokenScopeResolver
+
+    token_colors = make_token_colors(config.token_color_rules)
+    stacks = make_scope_stacks(config.scope_stacks)
+
+    compile_result = benchmark.benchmark_operation(
+        f"Token Scope Compile ({config.token_color_rules} rules)",
+        lambda _: TokenScopeResolver(token_colors),
+        iterations=config.iterations,
+    )
+
+    def resolve(resolver):
+        for stack in stacks:
+            resolver.resolve(stack)
+
+    resolve_result = benchmark.benchmark_operation(
+        f"Token Scope Resolution ({config.scope_stacks} stacks, {config.token_color_rules} rules)",
+        resolve,
+        iterations=config.iterations,
+        # A fresh resolver per run, so the cache starts cold
+        setup=lambda: TokenScopeResolver(token_colors),
+    )
+
+    return {
+        f"token_scope_compile_{config.token_color_rules}": compile_result,
+        f"token_scope_resolution_{config.scope_stacks}": resolve_result,
+    }
+
+
+def run_theme_variants_scenario(
+    benchmark: ThemeBenchmark, config: SuiteConfig
+) -> dict[str, BenchmarkResult]:
+    """Time generating a family of color variants of a large theme at once."""
+    from ..core.color_transforms import HSLTransform, OKLabTransform, RGBTransform
+    from ..core.theme import Theme
+    from ..factory import ThemeVariantGenerator, VariantSpec
+
+    colors = {}
+    for index in range(config.variant_tokens):
+        role = "foreground" if index % 2 else "background"
+        colors[f"token{index}.{role}"] = f"#{index * 7919 % 0xFFFFFF:06x}"
+    theme = Theme(name="variant-base", type="dark", colors=colors)
+    recipes = [
+        [OKLabTransform(contrast=1.3)],
+        [OKLabTransform(lightness=-0.05, chroma=0.7)],
+        [HSLTransform(hue=120, where=lambda token: token.endswith("foreground"))],
+        [RGBTransform(offset=-20)],
+    ]
+    specs = [
+        VariantSpec(f"_variant{index}", recipes[index % len(recipes)])
+        for index in range(config.variant_count)
+    ]
+    generator = ThemeVariantGenerator()
+
+    result = benchmark.benchmark_operation(
+        f"Theme Variants ({config.variant_count} variants, {config.variant_tokens} tokens)",
+        lambda _: generator.create_variants(theme, specs),
+        iterations=config.iterations,
+    )
+    return {f"theme_variants_{config.variant_count}x{config.variant_tokens}": result}
+
+
+IMPORT_TIME_SCRIPT = (
+    "import time; start = time.perf_counter(); import vfwidgets_theme; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def run_import_time_scenario(
+    benchmark: ThemeBenchmark, config: SuiteConfig
+) -> dict[str, BenchmarkResult]:
+    """Time ``import vfwidgets_theme`` in fresh interpreters."""
+    import_times = []
+
+    def import_package(_):
+        output = subprocess.run(
+            [sys.executable, "-c", IMPORT_TIME_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        import_times.append(float(output.strip().splitlines()[-1]))
+
+    result = benchmark.benchmark_operation(
+        "Import Time (import vfwidgets_theme)", import_package, iterations=config.iterations
+    )
+    # Report the import itself rather than interpreter startup
+    if import_times:
+        _replace_times(result, import_times)
+    return {"import_time": result}
+
+
+def _replace_times(result: BenchmarkResult, times: list[float]) -> None:
+    """Replace the timing statistics of a result with other measurements."""
+    ordered = sorted(times)
+    result.total_time = sum(times)
+    result.iterations = len(times)
+    result.min_time = ordered[0]
+    result.max_time = ordered[-1]
+    result.average_time = result.total_time / len(times)
+    result.median_time = ordered[len(ordered) // 2]
+    result.p95_time = ordered[-1]
+    result.p99_time = ordered[-1]
+    result.operations_per_second = len(times) / result.total_time if result.total_time else 0.0
+
+
+# Scenario name -> scenario function, in execution order
+SCENARIOS: dict[str, Callable[[ThemeBenchmark, SuiteConfig], dict[str, BenchmarkResult]]] = {
+    "widgets": run_widget_scenario,
+    "property_access": run_property_access_scenario,
+    "style_generation": run_style_generation_scenario,
+    "override_churn": run_override_scenario,
+    "discovery": run_discovery_scenario,
+    "token_scopes": run_token_scopes_scenario,
+    "theme_variants": run_theme_variants_scenario,
+    "import_time": run_import_time_scenario,
+}
+
+
+def run_scenarios(
+    names: Optional[list[str]] = None,
+    config: Optional[SuiteConfig] = None,
+    benchmark: Optional[ThemeBenchmark] = None,
+) -> dict[str, BenchmarkResult]:
+    """Run benchmark scenarios.
+
+    Args:
+        names: Scenarios to run (None for all, in SCENARIOS order)
+        config: Sizes and repetition counts
+        benchmark: Benchmark framework to measure with
+
+    Returns:
+        Dictionary mapping result name to benchmark result
+
+    """
+    config = config or SuiteConfig()
+    benchmark = benchmark or ThemeBenchmark(enable_memory_tracking=False)
+    results = {}
+    for name in names or list(SCENARIOS):
+        results.update(SCENARIOS[name](benchmark, config))
+    return results
@@ -11,62 +11,169 @@ The core module represents the heart of the theme system with all business logic
 separated from presentation (widgets) and infrastructure (engine).
 """
 
-# Core components (placeholders for Tasks 7-8)
-from .font_tokens import (
-    FontTokenRegistry,
-    create_qfont_from_token,
-    resolve_font_family,
-    resolve_font_size,
-    resolve_font_weight,
-)
-from .introspection import (
-    PluginAvailability,
-    WidgetMetadata,
-    extract_theme_tokens,
-    validate_metadata,
-)
-from .manager import (
-    ThemeManager,
-    create_theme_manager,
-)
-from .provider import (
-    CachedThemeProvider,
-    CompositeThemeProvider,
-    DefaultThemeProvider,
-    create_cached_provider,
-    create_composite_provider,
-    create_default_provider,
-)
-from .registry import (
-    DefaultRegistryEventHandler,
-    RegistryEntry,
-    RegistryEventHandler,
-    RegistryEventType,
-    ThemeWidgetRegistry,
-    create_widget_registry,
-)
-from .theme import (
-    PropertyResolver,
-    Theme,
-    ThemeBuilder,
-    ThemeCollection,
-    ThemeComposer,
-    ThemeValidator,
-    create_theme_from_dict,
-    load_theme_from_file,
-    save_theme_to_file,
-    validate_theme_data,
-)
-from .token_types import (
-    ColorTokenResolver,
-    FontTokenResolver,
-    GenericTokenResolver,
-    SizeTokenResolver,
-    TokenResolver,
-    TokenType,
-    TOKEN_RESOLVERS,
-    get_resolver,
-)
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_exports
+
+# Public names are imported from their submodules on first access
+_LAZY_IMPORTS = {
+    ".color_transforms": (
+        "HSLTransform",
+        "OKLabTransform",
+        "PackedPalette",
+        "RGBTransform",
+    ),
+    ".contrast": (
+        "ContrastMatrix",
+        "ContrastPair",
+        "ContrastResult",
+    ),
+    ".font_tokens": (
+        "FontTokenRegistry",
+        "create_qfont_from_token",
+        "resolve_font_family",
+        "resolve_font_size",
+        "resolve_font_weight",
+    ),
+    ".introspection": (
+        "PluginAvailability",
+        "WidgetMetadata",
+        "extract_theme_tokens",
+        "validate_metadata",
+    ),
+    ".manager": (
+        "ThemeManager",
+        "create_theme_manager",
+    ),
+    ".provider": (
+        "CachedThemeProvider",
+        "CompositeThemeProvider",
+        "DefaultThemeProvider",
+        "create_cached_provider",
+        "create_composite_provider",
+        "create_default_provider",
+    ),
+    ".registry": (
+        "DefaultRegistryEventHandler",
+        "RegistryEntry",
+        "RegistryEventHandler",
+        "RegistryEventType",
+        "ThemeWidgetRegistry",
+        "create_widget_registry",
+    ),
+    ".theme": (
+        "CompiledProperties",
+        "PropertyResolver",
+        "Theme",
+        "ThemeBuilder",
+        "ThemeCollection",
+        "ThemeComposer",
+        "ThemeValidator",
+        "create_theme_from_dict",
+        "load_theme_from_file",
+        "save_theme_to_file",
+        "validate_theme_data",
+    ),
+    ".theme_diff": (
+        "SectionDiff",
+        "ThemeDiff",
+    ),
+    ".token_scopes": (
+        "TokenScopeResolver",
+        "TokenStyle",
+    ),
+    ".token_types": (
+        "TOKEN_RESOLVERS",
+        "ColorTokenResolver",
+        "FontTokenResolver",
+        "GenericTokenResolver",
+        "SizeTokenResolver",
+        "TokenResolver",
+        "TokenType",
+        "get_resolver",
+    ),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    # Core components (placeholders for Tasks 7-8)
+    from .color_transforms import (
+        HSLTransform,
+        OKLabTransform,
+        PackedPalette,
+        RGBTransform,
+    )
+    from .contrast import (
+        ContrastMatrix,
+        ContrastPair,
+        ContrastResult,
+    )
+    from .font_tokens import (
+        FontTokenRegistry,
+        create_qfont_from_token,
+        resolve_font_family,
+        resolve_font_size,
+        resolve_font_weight,
+    )
+    from .introspection import (
+        PluginAvailability,
+        WidgetMetadata,
+        extract_theme_tokens,
+        validate_metadata,
+    )
+    from .manager import (
+        ThemeManager,
+        create_theme_manager,
+    )
+    from .provider import (
+        CachedThemeProvider,
+        CompositeThemeProvider,
+        DefaultThemeProvider,
+        create_cached_provider,
+        create_composite_provider,
+        create_default_provider,
+    )
+    from .registry import (
+        DefaultRegistryEventHandler,
+        RegistryEntry,
+        RegistryEventHandler,
+        RegistryEventType,
+        ThemeWidgetRegistry,
+        create_widget_registry,
+    )
+    from .theme import (
+        CompiledProperties,
+        PropertyResolver,
+        Theme,
+        ThemeBuilder,
+        ThemeCollection,
+        ThemeComposer,
+        ThemeValidator,
+        create_theme_from_dict,
+        load_theme_from_file,
+        save_theme_to_file,
+        validate_theme_data,
+    )
+    from .theme_diff import (
+        SectionDiff,
+        ThemeDiff,
+    )
+    from .token_scopes import (
+        TokenScopeResolver,
+        TokenStyle,
+    )
+    from .token_types import (
+        TOKEN_RESOLVERS,
+        ColorTokenResolver,
+        FontTokenResolver,
+        GenericTokenResolver,
+        SizeTokenResolver,
+        TokenResolver,
+        TokenType,
+        get_resolver,
+    )
+
 
 __all__ = [
     # Core data models
@@ -74,6 +181,22 @@ __all__ = [
     "ThemeCollection",
     "validate_theme_data",
     "create_theme_from_dict",
+    "CompiledProperties",
+    # Theme comparison
+    "ThemeDiff",
+    "SectionDiff",
+    # Token color scope resolution
+    "TokenScopeResolver",
+    "TokenStyle",
+    # Bulk color transforms
+    "HSLTransform",
+    "OKLabTransform",
+    "PackedPalette",
+    "RGBTransform",
+    # Accessibility
+    "ContrastMatrix",
+    "ContrastPair",
+    "ContrastResult",
     # Core management
     "ThemeManager",
     "ThemeLoader",
@@ -10,7 +10,7 @@ Key Classes:
 - ApplicationThemeApplicator: Applies themes at application level
 - BatchThemeUpdater: Efficient bulk theme updates
 - StyleInvalidator: Manages style cache invalidation
-- AsyncThemeApplicator: Non-blocking theme application
+- AsyncThemeApplicator: Off-thread stylesheet computation, GUI-thread batch apply
 - PlatformThemeAdapter: Platform-specific adaptations
 
 Design Principles:
@@ -28,10 +28,13 @@ Performance Requirements:
 """
 
 import platform
+import re
 import threading
 import time
 import weakref
+from collections.abc import Iterable
 from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
@@ -77,11 +80,87 @@ except ImportError:
 
 # Import foundation modules
 from ..logging import get_debug_logger
+from ..tracing import trace_span, traced
 from .registry import ThemeWidgetRegistry
 from .theme import PropertyResolver, Theme
 
 logger = get_debug_logger(__name__)
 
+# Color references in style strings, e.g. "@colors.primary" or "@colors.button.background"
+COLOR_REFERENCE_PATTERN = re.compile(r"@colors\.([\w.]+)")
+
+
+class StyleReferenceResolver:
+    """Resolves @colors references in theme style strings.
+
+    Each style is scanned once with a compiled pattern and references are
+    looked up in the color dictionary. Results are memoised per
+    (theme hash, style key), so the same selector is only resolved once per
+    theme generation no matter how many widgets ask for it.
+    """
+
+    def __init__(self):
+        """Initialize resolver with an empty memo."""
+        self._cache: dict[tuple[int, str], str] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def resolve(style: str, colors: dict[str, str]) -> str:
+        """Resolve color references in a style string in a single pass.
+
+        Args:
+            style: Style string containing @colors.<key> references
+            colors: Resolved colors, keyed with or without the "colors." prefix
+
+        Returns:
+            Style string with known references replaced
+
+        """
+
+        def replace(match: re.Match) -> str:
+            key = match.group(1)
+            # Longest key wins; trailing segments may be plain text ("@colors.bg.")
+            while key:
+                value = colors.get(key)
+                if value is None:
+                    value = colors.get(f"colors.{key}")
+                if value is not None:
+                    return value + match.group(1)[len(key):]
+                key = key.rpartition(".")[0]
+            return match.group(0)
+
+        if "@colors." not in style:
+            return style
+        return COLOR_REFERENCE_PATTERN.sub(replace, style)
+
+    def resolve_style(
+        self, theme: Theme, style_key: str, style: str, colors: dict[str, str]
+    ) -> str:
+        """Resolve a theme style, memoised per theme generation and style key.
+
+        Args:
+            theme: Theme the style belongs to
+            style_key: Selector the style is registered under in theme.styles
+            style: Style string to resolve
+            colors: Resolved theme colors
+
+        Returns:
+            Resolved style string
+
+        """
+        cache_key = (hash(theme), style_key)
+        with self._lock:
+            resolved = self._cache.get(cache_key)
+            if resolved is None:
+                resolved = self.resolve(style, colors)
+                self._cache[cache_key] = resolved
+            return resolved
+
+    def clear(self) -> None:
+        """Drop all memoised styles."""
+        with self._lock:
+            self._cache.clear()
+
 
 @dataclass
 class ApplicationStats:
@@ -96,6 +175,25 @@ class ApplicationStats:
     total_time: float = 0.0
 
 
+@dataclass
+class PreparedTheme:
+    """Theme output computed off the GUI thread, ready to be applied.
+
+    Attributes:
+        theme: Theme the output was computed for
+        stylesheets: Stylesheet per widget class name
+        palette_colors: Palette color table (see PaletteGenerator.color_table),
+            or None when palettes are not available
+        compute_time: Seconds spent computing in the worker
+
+    """
+
+    theme: Theme
+    stylesheets: dict[str, str]
+    palette_colors: Optional[dict[Any, str]] = None
+    compute_time: float = 0.0
+
+
 class WidgetThemeApplicator:
     """Applies themes to individual widgets.
 
@@ -116,6 +214,8 @@ class WidgetThemeApplicator:
         self._registry = registry
         self._property_resolver: Optional[PropertyResolver] = None
         self._style_cache: dict[str, str] = {}
+        self._base_styles_cache: dict[tuple[str, int], dict[str, Any]] = {}
+        self._reference_resolver = StyleReferenceResolver()
         self._lock = threading.RLock()
         logger.debug("WidgetThemeApplicator initialized")
 
@@ -178,12 +278,16 @@ class WidgetThemeApplicator:
             logger.error(f"Error applying theme to widget {widget_id}: {e}")
             return False
 
-    def apply_theme_batch(self, widget_ids: list[str], theme: Theme) -> dict[str, bool]:
+    def apply_theme_batch(
+        self, widget_ids: list[str], theme: Theme, previous: Optional[Theme] = None
+    ) -> dict[str, bool]:
         """Apply theme to batch of widgets efficiently.
 
         Args:
             widget_ids: List of widget IDs
             theme: Theme to apply
+            previous: Theme the widgets currently have; widgets whose stylesheet
+                is the same under both themes are left untouched
 
         Returns:
             Dictionary mapping widget ID to success status
@@ -198,6 +302,12 @@ class WidgetThemeApplicator:
         # Pre-generate common stylesheet components
         with self._lock:
             base_styles = self._generate_base_styles(theme)
+            previous_styles = (
+                self._generate_base_styles(previous) if previous is not None else None
+            )
+
+        # Per widget class: whether its stylesheet differs from the previous theme
+        class_changed: dict[type, bool] = {}
 
         for widget_id in widget_ids:
             try:
@@ -207,9 +317,27 @@ class WidgetThemeApplicator:
                     continue
 
                 widget = entry.widget
-                stylesheet = self._generate_widget_specific_stylesheet(widget, theme, base_styles)
-
-                widget.setStyleSheet(stylesheet)
+                with trace_span("generate_stylesheet", "style", widget):
+                    stylesheet = self._generate_widget_specific_stylesheet(
+                        widget, theme, base_styles
+                    )
+
+                if previous_styles is not None:
+                    widget_class = type(widget)
+                    changed = class_changed.get(widget_class)
+                    if changed is None:
+                        changed = stylesheet != self._generate_widget_specific_stylesheet(
+                            widget, previous, previous_styles
+                        )
+                        class_changed[widget_class] = changed
+                    if not changed:
+                        # Re-setting an identical stylesheet forces a re-polish
+                        self._registry.apply_theme_to_widget(widget_id, theme.name)
+                        results[widget_id] = True
+                        continue
+
+                with trace_span("setStyleSheet", "polish", widget):
+                    widget.setStyleSheet(stylesheet)
                 self._registry.apply_theme_to_widget(widget_id, theme.name)
 
                 results[widget_id] = True
@@ -221,13 +349,130 @@ class WidgetThemeApplicator:
         logger.debug(f"Batch applied theme '{theme.name}' to {len(widget_ids)} widgets")
         return results
 
+    def compute_stylesheets(self, theme: Theme, class_names: Iterable[str]) -> dict[str, str]:
+        """Compute stylesheets per widget class without touching any widget.
+
+        Only reads the immutable theme, so it can run in a worker thread.
+
+        Args:
+            theme: Theme to compute stylesheets for
+            class_names: Widget class names to compute
+
+        Returns:
+            Dictionary mapping class name to stylesheet
+
+        """
+        base_styles = self._generate_base_styles(theme)
+        return {
+            class_name: self._generate_class_stylesheet(class_name, theme, base_styles)
+            for class_name in class_names
+        }
+
+    def apply_prepared(
+        self, prepared: PreparedTheme, widget_ids: list[str]
+    ) -> dict[str, bool]:
+        """Apply precomputed theme output to widgets; must run on the GUI thread.
+
+        Top-level windows of the widgets have updates disabled for the whole
+        batch, so they repaint once instead of after every restyle.
+
+        Args:
+            prepared: Output of a worker computation
+            widget_ids: Widget IDs to apply it to
+
+        Returns:
+            Dictionary mapping widget ID to success status
+
+        """
+        results = {}
+
+        if not self._registry:
+            logger.error("No registry available for batch widget application")
+            return dict.fromkeys(widget_ids, False)
+
+        theme = prepared.theme
+        entries = []
+        for widget_id in widget_ids:
+            entry = self._registry.get_entry(widget_id)
+            if not entry or not entry.is_alive:
+                results[widget_id] = False
+            else:
+                entries.append((widget_id, entry.widget))
+
+        if prepared.palette_colors is not None and QApplication.instance() is not None:
+            try:
+                from ..widgets.palette_generator import PaletteGenerator
+
+                with trace_span("application_palette", "palette"):
+                    PaletteGenerator.apply_to_application(theme, prepared.palette_colors)
+            except Exception as e:
+                logger.error(f"Error applying prepared palette: {e}")
+
+        frozen = self._suspend_updates(widget for _, widget in entries)
+        try:
+            for widget_id, widget in entries:
+                try:
+                    widget_class = type(widget).__name__
+                    stylesheet = prepared.stylesheets.get(widget_class)
+                    if stylesheet is None:
+                        # Registered after the computation started
+                        stylesheet = self.compute_stylesheets(theme, [widget_class])[widget_class]
+                        prepared.stylesheets[widget_class] = stylesheet
+
+                    # Re-setting an identical stylesheet forces a re-polish
+                    if widget.styleSheet() != stylesheet:
+                        with trace_span("setStyleSheet", "polish", widget):
+                            widget.setStyleSheet(stylesheet)
+                    self._registry.apply_theme_to_widget(widget_id, theme.name)
+                    results[widget_id] = True
+
+                except Exception as e:
+                    logger.error(f"Error applying theme to widget {widget_id}: {e}")
+                    results[widget_id] = False
+        finally:
+            for window in frozen:
+                window.setUpdatesEnabled(True)
+
+        logger.debug(f"Applied prepared theme '{theme.name}' to {len(widget_ids)} widgets")
+        return results
+
+    @staticmethod
+    def _suspend_updates(widgets: Iterable[QWidget]) -> list[QWidget]:
+        """Disable updates on the top-level windows of widgets.
+
+        Args:
+            widgets: Widgets about to be restyled
+
+        Returns:
+            Windows whose updates were disabled and must be re-enabled
+
+        """
+        if not QT_AVAILABLE:
+            return []
+
+        frozen = []
+        seen = set()
+        for widget in widgets:
+            try:
+                window = widget.window()
+                if id(window) in seen:
+                    continue
+                seen.add(id(window))
+                if window.updatesEnabled():
+                    window.setUpdatesEnabled(False)
+                    frozen.append(window)
+            except Exception as e:
+                logger.debug(f"Could not suspend updates: {e}")
+        return frozen
+
     def _generate_widget_stylesheet(self, widget: QWidget, theme: Theme) -> str:
         """Generate complete stylesheet for widget."""
         # Create property resolver for this theme if needed
         if self._property_resolver is None or self._property_resolver.theme != theme:
             self._property_resolver = PropertyResolver(theme)
 
-        cache_key = f"{theme.name}:{type(widget).__name__}"
+        # Reloaded themes keep their name, so the content hash is part of the key
+        cache_key = f"{theme.name}:{hash(theme)}:{type(widget).__name__}"
 
         with self._lock:
             if cache_key in self._style_cache:
@@ -242,60 +487,66 @@ class WidgetThemeApplicator:
             return stylesheet
 
     def _generate_base_styles(self, theme: Theme) -> dict[str, Any]:
-        """Generate base style components from theme."""
-        # Create property resolver for this theme if needed
-        if self._property_resolver is None or self._property_resolver.theme != theme:
-            self._property_resolver = PropertyResolver(theme)
+        """Generate base style components from theme, cached per theme generation."""
+        cache_key = (theme.name, hash(theme))
+        with self._lock:
+            base_styles = self._base_styles_cache.get(cache_key)
+            if base_styles is not None:
+                return base_styles
+
+            # Create property resolver for this theme if needed
+            if self._property_resolver is None or self._property_resolver.theme != theme:
+                self._property_resolver = PropertyResolver(theme)
 
-        # Resolve all color references once
-        resolved_colors = {}
-        for key, value in theme.colors.items():
-            resolved_colors[key] = self._property_resolver.resolve_reference(value, theme.to_dict())
+            # All color references are resolved once when the theme is compiled
+            resolved_colors = dict(self._property_resolver.compiled.colors)
 
-        return {"colors": resolved_colors, "resolved_styles": {}}
+            base_styles = {"colors": resolved_colors, "resolved_styles": {}}
+            self._base_styles_cache[cache_key] = base_styles
+            return base_styles
 
     def _generate_widget_specific_stylesheet(
         self, widget: QWidget, theme: Theme, base_styles: dict[str, Any]
     ) -> str:
         """Generate stylesheet specific to widget type."""
-        widget_class = type(widget).__name__
+        return self._generate_class_stylesheet(type(widget).__name__, theme, base_styles)
+
+    def _generate_class_stylesheet(
+        self, widget_class: str, theme: Theme, base_styles: dict[str, Any]
+    ) -> str:
+        """Generate the stylesheet for a widget class name; safe to call off the GUI thread."""
+        colors = base_styles["colors"]
+        resolve = self._reference_resolver.resolve_style
         stylesheet_parts = []
 
         # Add global styles (apply to all widgets)
         if "*" in theme.styles:
-            global_style = theme.styles["*"]
-            resolved_style = self._resolve_style_references(global_style, base_styles["colors"])
+            resolved_style = resolve(theme, "*", theme.styles["*"], colors)
             stylesheet_parts.append(f"* {{ {resolved_style} }}")
 
         # Add widget-specific styles
         if widget_class in theme.styles:
-            widget_style = theme.styles[widget_class]
-            resolved_style = self._resolve_style_references(widget_style, base_styles["colors"])
+            resolved_style = resolve(theme, widget_class, theme.styles[widget_class], colors)
             stylesheet_parts.append(f"{widget_class} {{ {resolved_style} }}")
 
         # Add state-specific styles (hover, active, etc.)
         for style_key, style_value in theme.styles.items():
             if style_key.startswith(f"{widget_class}:"):
-                resolved_style = self._resolve_style_references(style_value, base_styles["colors"])
+                resolved_style = resolve(theme, style_key, style_value, colors)
                 stylesheet_parts.append(f"{style_key} {{ {resolved_style} }}")
 
         return "\n".join(stylesheet_parts)
 
     def _resolve_style_references(self, style: str, colors: dict[str, str]) -> str:
         """Resolve color references in style string."""
-        resolved_style = style
-
-        # Replace color references (@colors.key)
-        for color_key, color_value in colors.items():
-            reference = f"@colors.{color_key}"
-            resolved_style = resolved_style.replace(reference, color_value)
-
-        return resolved_style
+        return StyleReferenceResolver.resolve(style, colors)
 
     def clear_cache(self) -> None:
         """Clear style cache."""
         with self._lock:
             self._style_cache.clear()
+            self._base_styles_cache.clear()
+            self._reference_resolver.clear()
             logger.debug("Cleared widget style cache")
 
 
@@ -312,8 +563,29 @@ class ApplicationThemeApplicator:
         """Initialize application theme applicator."""
         self._current_theme: Optional[str] = None
         self._property_resolver: Optional[PropertyResolver] = None
+        self._scoped_stylesheet_factory: Optional[Callable[[Theme], str]] = None
+        self._reference_resolver = StyleReferenceResolver()
         logger.debug("ApplicationThemeApplicator initialized")
 
+    @property
+    def scoped_stylesheet_enabled(self) -> bool:
+        """Whether widget styling is consolidated into the application stylesheet."""
+        return self._scoped_stylesheet_factory is not None
+
+    def set_scoped_stylesheet_factory(self, factory: Optional[Callable[[Theme], str]]) -> None:
+        """Install a generator for the consolidated widget stylesheet.
+
+        When set, the factory output (widget rules scoped by selector) is
+        appended to the application stylesheet, so themed widgets no longer
+        need their own full stylesheet. Pass None to return to per-widget
+        stylesheets.
+
+        Args:
+            factory: Callable producing scoped QSS for a theme, or None
+
+        """
+        self._scoped_stylesheet_factory = factory
+
     def apply_theme(self, theme: Theme) -> bool:
         """Apply theme to entire application.
 
@@ -337,8 +609,10 @@ class ApplicationThemeApplicator:
             # Generate global stylesheet
             stylesheet = self._generate_application_stylesheet(theme)
 
-            # Apply to application
-            app.setStyleSheet(stylesheet)
+            # Apply to application; an identical stylesheet would only re-polish
+            # every widget
+            if stylesheet != app.styleSheet():
+                app.setStyleSheet(stylesheet)
 
             self._current_theme = theme.name
             logger.debug(f"Applied theme '{theme.name}' to application")
@@ -389,28 +663,25 @@ class ApplicationThemeApplicator:
         """Generate application-wide stylesheet."""
         stylesheet_parts = []
 
-        # Resolve colors once
-        resolved_colors = {}
-        for key, value in theme.colors.items():
-            resolved_colors[key] = self._property_resolver.resolve_reference(value, theme.to_dict())
+        # Colors are resolved once when the theme is compiled
+        resolved_colors = self._property_resolver.compiled.colors
 
         # Add all styles from theme
         for selector, style in theme.styles.items():
-            resolved_style = self._resolve_style_references(style, resolved_colors)
+            resolved_style = self._reference_resolver.resolve_style(
+                theme, selector, style, resolved_colors
+            )
             stylesheet_parts.append(f"{selector} {{ {resolved_style} }}")
 
+        # Consolidated widget rules replace per-widget stylesheets
+        if self._scoped_stylesheet_factory is not None:
+            stylesheet_parts.append(self._scoped_stylesheet_factory(theme))
+
         return "\n".join(stylesheet_parts)
 
     def _resolve_style_references(self, style: str, colors: dict[str, str]) -> str:
         """Resolve references in style string."""
-        resolved_style = style
-
-        # Replace color references
-        for color_key, color_value in colors.items():
-            reference = f"@colors.{color_key}"
-            resolved_style = resolved_style.replace(reference, color_value)
-
-        return resolved_style
+        return StyleReferenceResolver.resolve(style, colors)
 
 
 class BatchThemeUpdater:
@@ -433,12 +704,15 @@ class BatchThemeUpdater:
         self._widget_applicator = WidgetThemeApplicator(registry)
         logger.debug("BatchThemeUpdater initialized")
 
-    def update_widgets(self, widget_ids: list[str], theme: Theme) -> dict[str, bool]:
+    def update_widgets(
+        self, widget_ids: list[str], theme: Theme, previous: Optional[Theme] = None
+    ) -> dict[str, bool]:
         """Update multiple widgets with theme efficiently.
 
         Args:
             widget_ids: List of widget IDs to update
             theme: Theme to apply
+            previous: Theme the widgets currently have, for incremental updates
 
         Returns:
             Dictionary mapping widget ID to success status
@@ -449,7 +723,7 @@ class BatchThemeUpdater:
 
         try:
             # Use batch application for efficiency
-            results = self._widget_applicator.apply_theme_batch(widget_ids, theme)
+            results = self._widget_applicator.apply_theme_batch(widget_ids, theme, previous)
 
             update_time = time.time() - start_time
             success_count = sum(1 for success in results.values() if success)
@@ -465,18 +739,21 @@ class BatchThemeUpdater:
 
         return results
 
-    def update_all_widgets(self, theme: Theme) -> dict[str, bool]:
+    def update_all_widgets(
+        self, theme: Theme, previous: Optional[Theme] = None
+    ) -> dict[str, bool]:
         """Update all registered widgets with theme.
 
         Args:
             theme: Theme to apply
+            previous: Theme the widgets currently have, for incremental updates
 
         Returns:
             Dictionary mapping widget ID to success status
 
         """
         widget_ids = self._registry.list_widgets(include_dead=False)
-        return self.update_widgets(widget_ids, theme)
+        return self.update_widgets(widget_ids, theme, previous)
 
 
 class StyleInvalidator:
@@ -560,13 +837,118 @@ class StyleInvalidator:
             self._widget_theme_associations[widget_ref] = theme_name
 
 
+if QT_AVAILABLE:
+
+    class _GuiInvoker(QObject):
+        """Runs callables on the thread the invoker lives in."""
+
+        invoke = Signal(object)
+
+        def __init__(self):
+            """Connect the invoke signal; emits from other threads are queued."""
+            super().__init__()
+            self.invoke.connect(self._run)
+
+        def _run(self, func: Callable[[], None]) -> None:
+            func()
+
+
+class _PendingApply:
+    """GUI-thread half of a pipelined theme application.
+
+    Runs once: either from the queued GUI-thread callback, or directly when
+    the GUI thread waits on the result before the event loop got to it.
+    """
+
+    def __init__(
+        self,
+        prepared: "Future[PreparedTheme]",
+        apply: Callable[[PreparedTheme], dict[str, bool]],
+        future: "Future[dict[str, bool]]",
+        fallback: dict[str, bool],
+        callback: Optional[Callable[[dict[str, bool]], None]] = None,
+    ):
+        self._prepared = prepared
+        self._apply = apply
+        self._future = future
+        self._fallback = fallback
+        self._callback = callback
+        self._done = False
+        self._lock = threading.Lock()
+
+    def run(self, timeout: Optional[float] = None) -> None:
+        """Wait for the computation and apply it, unless that already happened."""
+        try:
+            prepared = self._prepared.result(timeout)
+        except FutureTimeoutError:
+            raise
+        except Exception as e:
+            logger.error(f"Error computing theme output: {e}")
+            prepared = None
+
+        with self._lock:
+            if self._done:
+                return
+            self._done = True
+
+        if not self._future.set_running_or_notify_cancel():
+            return
+
+        results = self._fallback
+        if prepared is not None:
+            try:
+                results = self._apply(prepared)
+            except Exception as e:
+                logger.error(f"Error applying prepared theme: {e}")
+
+        if self._callback:
+            try:
+                self._callback(results)
+            except Exception as e:
+                logger.error(f"Error in theme application callback: {e}")
+        self._future.set_result(results)
+
+
+class _GuiApplyFuture(Future):
+    """Future for pipelined application that cannot deadlock the GUI thread.
+
+    Waiting on it from the GUI thread applies the pending result directly
+    instead of blocking the event loop that would otherwise deliver it.
+    """
+
+    def __init__(self):
+        """Initialize without a pending application."""
+        super().__init__()
+        self.pending: Optional[_PendingApply] = None
+
+    def result(self, timeout: Optional[float] = None):
+        """Get the result, applying it first when called on the GUI thread."""
+        if self.pending is not None and not self.done() and _on_gui_thread():
+            self.pending.run(timeout)
+        return super().result(timeout)
+
+
+def _on_gui_thread() -> bool:
+    """Check whether the calling thread is the GUI thread (or there is none)."""
+    if not QT_AVAILABLE:
+        return True
+    app = QApplication.instance()
+    return app is None or QThread.currentThread() == app.thread()
+
+
 class AsyncThemeApplicator:
     """Non-blocking theme application.
 
     Provides asynchronous theme application using:
-    - Thread pool for parallel processing
+    - Thread pool computing stylesheets and palette colors per widget class
+    - Batched stylesheet application on the GUI thread
     - Future objects for async operations
     - Callback support for completion notification
+
+    Qt widgets may only be restyled on the GUI thread, but the stylesheet
+    and palette computation only reads the immutable theme. Batch
+    application therefore computes in the pool while the GUI thread keeps
+    rendering, and then applies everything in one batch.
     """
 
     def __init__(self, registry: ThemeWidgetRegistry, max_workers: int = 4):
@@ -580,8 +962,68 @@ class AsyncThemeApplicator:
         self._registry = registry
         self._widget_applicator = WidgetThemeApplicator(registry)
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._invoker = None
+        self._invoker_lock = threading.Lock()
         logger.debug(f"AsyncThemeApplicator initialized with {max_workers} workers")
 
+    def prepare_theme(
+        self, theme: Theme, widget_ids: Optional[list[str]] = None
+    ) -> Future[PreparedTheme]:
+        """Compute stylesheets and palette colors for a theme in the pool.
+
+        Args:
+            theme: Theme to prepare
+            widget_ids: Widgets whose classes need stylesheets (None for all)
+
+        Returns:
+            Future resolving to the prepared theme output
+
+        """
+        if widget_ids is None:
+            entries = [entry for entry in self._registry.snapshot() if entry.is_alive]
+        else:
+            entries = [self._registry.get_entry(widget_id) for widget_id in widget_ids]
+
+        class_names = set()
+        for entry in entries:
+            widget = entry.widget if entry is not None else None
+            if widget is not None:
+                class_names.add(type(widget).__name__)
+
+        def prepare_worker() -> PreparedTheme:
+            """Worker function computing the theme output."""
+            start_time = time.time()
+            with trace_span(
+                "prepare_theme", "style", theme=theme.name, classes=len(class_names)
+            ):
+                stylesheets = self._widget_applicator.compute_stylesheets(theme, class_names)
+                palette_colors = self._compute_palette_colors(theme)
+            return PreparedTheme(
+                theme=theme,
+                stylesheets=stylesheets,
+                palette_colors=palette_colors,
+                compute_time=time.time() - start_time,
+            )
+
+        return self._executor.submit(prepare_worker)
+
+    def apply_prepared(
+        self, prepared: PreparedTheme, widget_ids: Optional[list[str]] = None
+    ) -> dict[str, bool]:
+        """Apply a prepared theme on the GUI thread in one batch.
+
+        Args:
+            prepared: Output of prepare_theme()
+            widget_ids: Widgets to apply it to (None for all)
+
+        Returns:
+            Dictionary mapping widget ID to success status
+
+        """
+        if widget_ids is None:
+            widget_ids = self._registry.list_widgets(include_dead=False)
+        return self._widget_applicator.apply_prepared(prepared, widget_ids)
+
     def apply_theme_async(
         self, widget_id: str, theme: Theme, callback: Optional[Callable[[bool, str], None]] = None
     ) -> Future[bool]:
@@ -625,6 +1067,10 @@ class AsyncThemeApplicator:
     ) -> Future[dict[str, bool]]:
         """Apply theme to batch of widgets asynchronously.
 
+        Stylesheets are computed in the pool, then applied on the GUI thread
+        in one batch; the callback also runs on the GUI thread. Waiting on
+        the returned future from the GUI thread applies the batch directly.
+
         Args:
             widget_ids: List of widget IDs
             theme: Theme to apply
@@ -634,28 +1080,57 @@ class AsyncThemeApplicator:
             Future object for async batch operation
 
         """
+        future = _GuiApplyFuture()
+        try:
+            prepared = self.prepare_theme(theme, widget_ids)
+        except Exception as e:
+            logger.error(f"Error in async batch theme application: {e}")
+            error_results = dict.fromkeys(widget_ids, False)
+            if callback:
+                callback(error_results)
+            future.set_result(error_results)
+            return future
+
+        pending = _PendingApply(
+            prepared,
+            lambda output: self.apply_prepared(output, widget_ids),
+            future,
+            dict.fromkeys(widget_ids, False),
+            callback,
+        )
+        future.pending = pending
+        prepared.add_done_callback(lambda _: self._run_on_gui_thread(pending.run))
 
-        def batch_worker():
-            """Worker function for async batch theme application."""
-            try:
-                results = self._widget_applicator.apply_theme_batch(widget_ids, theme)
-
-                if callback:
-                    callback(results)
-
-                return results
-
-            except Exception as e:
-                logger.error(f"Error in async batch theme application: {e}")
-                error_results = dict.fromkeys(widget_ids, False)
-                if callback:
-                    callback(error_results)
-                return error_results
-
-        future = self._executor.submit(batch_worker)
         logger.debug(f"Started async batch theme application for {len(widget_ids)} widgets")
         return future
 
+    def _run_on_gui_thread(self, func: Callable[[], None]) -> None:
+        """Run a callable on the GUI thread, queueing it when called from elsewhere."""
+        if _on_gui_thread():
+            func()
+            return
+
+        with self._invoker_lock:
+            if self._invoker is None:
+                invoker = _GuiInvoker()
+                invoker.moveToThread(QApplication.instance().thread())
+                self._invoker = invoker
+            invoker = self._invoker
+        invoker.invoke.emit(func)
+
+    @staticmethod
+    def _compute_palette_colors(theme: Theme) -> Optional[dict[Any, str]]:
+        """Compute the palette color table, or None if palettes are unavailable."""
+        if not QT_AVAILABLE:
+            return None
+        try:
+            from ..widgets.palette_generator import PaletteGenerator
+
+            return PaletteGenerator(theme).color_table()
+        except Exception as e:
+            logger.error(f"Error computing palette colors: {e}")
+            return None
+
     def shutdown(self, wait: bool = True) -> None:
         """Shutdown async executor.
 
@@ -826,11 +1301,16 @@ class ThemeApplicator:
                 self._stats.errors += 1
             return False
 
-    def apply_theme_globally(self, theme: Theme) -> dict[str, bool]:
+    @traced("apply_theme_globally", "applicator")
+    def apply_theme_globally(
+        self, theme: Theme, previous: Optional[Theme] = None
+    ) -> dict[str, bool]:
         """Apply theme to all registered widgets and application.
 
         Args:
             theme: Theme to apply globally
+            previous: Currently applied theme; when given, only widgets whose
+                stylesheet changed are restyled
 
         Returns:
             Dictionary mapping widget ID to success status
@@ -841,12 +1321,21 @@ class ThemeApplicator:
         try:
             # Adapt theme for current platform
             adapted_theme = self._platform_adapter.adapt_theme_for_platform(theme)
+            adapted_previous = None
+            if previous is not None:
+                adapted_previous = self._platform_adapter.adapt_theme_for_platform(previous)
 
             # Apply to application first
-            app_success = self._app_applicator.apply_theme(adapted_theme)
+            with trace_span("application_stylesheet", "polish", theme=theme.name):
+                app_success = self._app_applicator.apply_theme(adapted_theme)
 
             # Apply to all widgets using batch updater
-            widget_results = self._batch_updater.update_all_widgets(adapted_theme)
+            with trace_span("update_widgets", "applicator", theme=theme.name) as span:
+                widget_results = self._batch_updater.update_all_widgets(
+                    adapted_theme, adapted_previous
+                )
+                if span is not None:
+                    span.set_arg("widgets", len(widget_results))
 
             # Update statistics
             with self._lock:
@@ -872,6 +1361,61 @@ class ThemeApplicator:
                 self._stats.errors += 1
             return {}
 
+    def apply_theme_globally_async(
+        self, theme: Theme, callback: Optional[Callable[[dict[str, bool]], None]] = None
+    ) -> Future[dict[str, bool]]:
+        """Apply theme to all widgets, computing stylesheets off the GUI thread.
+
+        The GUI thread keeps rendering the current frame while workers
+        compute; the application stylesheet and widget stylesheets are then
+        applied together on the GUI thread.
+
+        Args:
+            theme: Theme to apply globally
+            callback: Optional completion callback, run on the GUI thread
+
+        Returns:
+            Future resolving to a dictionary mapping widget ID to success status
+
+        """
+        start_time = time.time()
+        adapted_theme = self._platform_adapter.adapt_theme_for_platform(theme)
+        widget_ids = self._registry.list_widgets(include_dead=False)
+
+        def finish(widget_results: dict[str, bool]) -> None:
+            app_success = self._app_applicator.apply_theme(adapted_theme)
+
+            with self._lock:
+                self._stats.global_updates += 1
+                self._stats.widgets_themed += sum(
+                    1 for success in widget_results.values() if success
+                )
+                self._stats.errors += sum(1 for success in widget_results.values() if not success)
+                if not app_success:
+                    self._stats.errors += 1
+                self._stats.total_time += time.time() - start_time
+
+            if callback:
+                callback(widget_results)
+
+        return self._async_applicator.apply_theme_batch_async(
+            widget_ids, adapted_theme, callback=finish
+        )
+
+    @property
+    def scoped_stylesheet_enabled(self) -> bool:
+        """Whether widget styling is consolidated into the application stylesheet."""
+        return self._app_applicator.scoped_stylesheet_enabled
+
+    def set_scoped_stylesheet_factory(self, factory: Optional[Callable[[Theme], str]]) -> None:
+        """Install or remove the consolidated widget stylesheet generator.
+
+        Args:
+            factory: Callable producing scoped QSS for a theme, or None
+
+        """
+        self._app_applicator.set_scoped_stylesheet_factory(factory)
+
     def apply_theme_to_application(self, theme: Theme) -> bool:
         """Apply theme at application level only.
 
@@ -1025,6 +1569,7 @@ __all__ = [
     "BatchThemeUpdater",
     "StyleInvalidator",
     "AsyncThemeApplicator",
+    "PreparedTheme",
     "PlatformThemeAdapter",
     "ApplicationStats",
     "create_theme_applicator",
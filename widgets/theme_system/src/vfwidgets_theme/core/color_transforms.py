@@ -0,0 +1,431 @@
+"""Bulk color transforms over a theme's packed palette.
+
+PackedPalette parses the colors of a theme once into packed RGB channels
+(0-255 floats, one row per token). Transforms then run over all rows at
+once and to_colors() writes the result back to hex in a single pass, so
+generating many variants of a large theme parses each color only once.
+
+Transforms work in one color space each:
+
+- RGBTransform: byte arithmetic on the channels (scale, then offset),
+  truncated like ``int()``
+- HSLTransform: hue rotation, saturation scaling, lightness offset
+- OKLabTransform: perceptual lightness offset, contrast around mid grey
+  and chroma scaling; the space for contrast and dimmed variants
+
+Every transform can be limited to some tokens with ``where``, a predicate
+on the token name. Colors that can't be parsed (and alpha) are kept as is.
+
+NumPy is used when installed (``pip install vfwidgets-theme[accessibility]``);
+otherwise each transform runs color by color in pure Python.
+
+Example:
+    palette = PackedPalette.from_colors(theme.colors)
+    dimmed = palette.transform(OKLabTransform(lightness=-0.05, chroma=0.8))
+    accent_swap = palette.transform(
+        HSLTransform(hue=120, where=lambda token: "accent" in token)
+    )
+    colors = dimmed.to_colors()
+
+"""
+
+import colorsys
+import math
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+_HEX_COLOR = re.compile(r"#([0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})")
+_RGB_COLOR = re.compile(
+    r"rgba?\(\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)\s*,\s*(\d+(?:\.\d+)?)"
+    r"\s*(?:,\s*(\d+(?:\.\d+)?)\s*)?\)"
+)
+
+# OKLab conversion matrices (Björn Ottosson), linear sRGB -> LMS -> OKLab
+_RGB_TO_LMS = (
+    (0.4122214708, 0.5363325363, 0.0514459929),
+    (0.2119034982, 0.6806995451, 0.1073969566),
+    (0.0883024619, 0.2817188376, 0.6299787005),
+)
+_LMS_TO_OKLAB = (
+    (0.2104542553, 0.7936177850, -0.0040720468),
+    (1.9779984951, -2.4285922050, 0.4505937099),
+    (0.0259040371, 0.7827717662, -0.8086757660),
+)
+_OKLAB_TO_LMS = (
+    (1.0, 0.3963377774, 0.2158037573),
+    (1.0, -0.1055613458, -0.0638541728),
+    (1.0, -0.0894841775, -1.2914855480),
+)
+_LMS_TO_RGB = (
+    (4.0767416621, -3.3077115913, 0.2309699292),
+    (-1.2684380046, 2.6097574011, -0.3413193965),
+    (-0.0041960863, -0.7034186147, 1.7076147010),
+)
+
+
+def parse_color(color: Any) -> Optional[tuple[float, float, float, Optional[int]]]:
+    """Parse a hex or rgb()/rgba() color.
+
+    Args:
+        color: Color value (#rgb, #rrggbb, #rrggbbaa, rgb(...) or rgba(...))
+
+    Returns:
+        Red, green and blue (0-255) plus the alpha byte (None without
+        alpha), or None if the color can't be parsed
+
+    """
+    if not isinstance(color, str):
+        return None
+    color = color.strip()
+
+    match = _HEX_COLOR.fullmatch(color)
+    if match is not None:
+        digits = match.group(1)
+        if len(digits) == 3:
+            digits = "".join(c * 2 for c in digits)
+        value = int(digits[:6], 16)
+        alpha = int(digits[6:8], 16) if len(digits) == 8 else None
+        return (value >> 16, (value >> 8) & 0xFF, value & 0xFF, alpha)
+
+    match = _RGB_COLOR.fullmatch(color)
+    if match is not None:
+        red, green, blue, alpha = match.groups()
+        return (
+            min(float(red), 255.0),
+            min(float(green), 255.0),
+            min(float(blue), 255.0),
+            None if alpha is None else round(min(float(alpha), 1.0) * 255),
+        )
+    return None
+
+
+def format_hex(red: float, green: float, blue: float, alpha: Optional[int] = None) -> str:
+    """Format 0-255 channels (and an alpha byte) as a hex color."""
+    channels = [min(255, max(0, round(channel))) for channel in (red, green, blue)]
+    if alpha is not None:
+        channels.append(alpha)
+    return "#" + "".join(f"{channel:02x}" for channel in channels)
+
+
+def _to_linear(channel: float) -> float:
+    """Convert an sRGB channel in 0..1 to linear light."""
+    if channel <= 0.04045:
+        return channel / 12.92
+    return ((channel + 0.055) / 1.055) ** 2.4
+
+
+def _from_linear(channel: float) -> float:
+    """Convert a linear light channel to sRGB, clipped to 0..1."""
+    channel = min(1.0, max(0.0, channel))
+    if channel <= 0.0031308:
+        return channel * 12.92
+    return 1.055 * channel ** (1 / 2.4) - 0.055
+
+
+def _multiply(matrix: tuple, vector: Sequence[float]) -> tuple[float, float, float]:
+    """Multiply a 3x3 matrix with a vector."""
+    return tuple(sum(m * v for m, v in zip(row, vector)) for row in matrix)
+
+
+def _rgb_to_oklab(rgb: Sequence[float]) -> tuple[float, float, float]:
+    """Convert 0-255 sRGB channels to OKLab."""
+    lms = _multiply(_RGB_TO_LMS, [_to_linear(channel / 255.0) for channel in rgb])
+    return _multiply(_LMS_TO_OKLAB, [math.copysign(abs(c) ** (1 / 3), c) for c in lms])
+
+
+def _oklab_to_rgb(lab: Sequence[float]) -> tuple[float, float, float]:
+    """Convert OKLab to 0-255 sRGB channels, clipped to the sRGB gamut."""
+    lms = [c**3 for c in _multiply(_OKLAB_TO_LMS, lab)]
+    return tuple(_from_linear(channel) * 255.0 for channel in _multiply(_LMS_TO_RGB, lms))
+
+
+class ColorTransform:
+    """Transform of packed 0-255 RGB channels.
+
+    Subclasses implement apply_rgb() for one color and, for NumPy,
+    apply_array() for an ``(n, 3)`` array of colors. Results stay within
+    0-255.
+    """
+
+    where: Optional[Callable[[str], bool]] = None
+
+    def apply_rgb(self, rgb: Sequence[float]) -> tuple[float, float, float]:
+        """Transform the channels of one color."""
+        raise NotImplementedError
+
+    def apply_array(self, rgb: Any) -> Any:
+        """Transform an ``(n, 3)`` NumPy array of channels."""
+        return np.array([self.apply_rgb(row) for row in rgb]).reshape(-1, 3)
+
+
+@dataclass(frozen=True)
+class RGBTransform(ColorTransform):
+    """Scale then offset the channel bytes, like ``int(c * scale) + offset``."""
+
+    scale: float = 1.0
+    offset: int = 0
+    where: Optional[Callable[[str], bool]] = None
+
+    def apply_rgb(self, rgb: Sequence[float]) -> tuple[float, float, float]:
+        """Transform the channels of one color."""
+        scale, offset = self.scale, self.offset
+        red, green, blue = rgb
+        return (
+            min(255, max(0, int(round(red) * scale) + offset)),
+            min(255, max(0, int(round(green) * scale) + offset)),
+            min(255, max(0, int(round(blue) * scale) + offset)),
+        )
+
+    def apply_array(self, rgb: Any) -> Any:
+        """Transform an ``(n, 3)`` NumPy array of channels."""
+        return np.clip(np.trunc(np.rint(rgb) * self.scale) + self.offset, 0, 255)
+
+
+@dataclass(frozen=True)
+class HSLTransform(ColorTransform):
+    """Rotate the hue, scale the saturation and offset the lightness."""
+
+    hue: float = 0.0
+    saturation: float = 1.0
+    lightness: float = 0.0
+    where: Optional[Callable[[str], bool]] = None
+
+    def apply_rgb(self, rgb: Sequence[float]) -> tuple[float, float, float]:
+        """Transform the channels of one color."""
+        hue, lightness, saturation = colorsys.rgb_to_hls(*(channel / 255.0 for channel in rgb))
+        red, green, blue = colorsys.hls_to_rgb(
+            (hue + self.hue / 360.0) % 1.0,
+            min(1.0, max(0.0, lightness + self.lightness)),
+            min(1.0, max(0.0, saturation * self.saturation)),
+        )
+        return (red * 255.0, green * 255.0, blue * 255.0)
+
+    def apply_array(self, rgb: Any) -> Any:
+        """Transform an ``(n, 3)`` NumPy array of channels."""
+        rgb = rgb / 255.0
+        red, green, blue = rgb[:, 0], rgb[:, 1], rgb[:, 2]
+        high = rgb.max(axis=1)
+        low = rgb.min(axis=1)
+        delta = high - low
+        lightness = (high + low) / 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            saturation = np.where(delta == 0, 0.0, delta / (1 - np.abs(2 * lightness - 1)))
+            hue = np.select(
+                [delta == 0, high == red, high == green],
+                [0.0, ((green - blue) / delta) % 6, (blue - red) / delta + 2],
+                (red - green) / delta + 4,
+            )
+
+        hue = (hue / 6 + self.hue / 360.0) % 1.0
+        lightness = np.clip(lightness + self.lightness, 0.0, 1.0)
+        saturation = np.clip(saturation * self.saturation, 0.0, 1.0)
+
+        # Branchless HSL to RGB: f(n) = l - a * max(-1, min(k - 3, 9 - k, 1))
+        chroma = saturation * np.minimum(lightness, 1 - lightness)
+        k = (np.array([0.0, 8.0, 4.0]) + hue[:, np.newaxis] * 12) % 12
+        offsets = np.clip(np.minimum(k - 3, 9 - k), -1, 1)
+        return np.clip(lightness[:, np.newaxis] - chroma[:, np.newaxis] * offsets, 0.0, 1.0) * 255.0
+
+
+@dataclass(frozen=True)
+class OKLabTransform(ColorTransform):
+    """Adjust perceptual lightness, contrast and chroma in OKLab.
+
+    Lightness becomes ``(L - 0.5) * contrast + 0.5 + lightness``; the a/b
+    axes are multiplied by ``chroma``.
+    """
+
+    lightness: float = 0.0
+    contrast: float = 1.0
+    chroma: float = 1.0
+    where: Optional[Callable[[str], bool]] = None
+
+    def apply_rgb(self, rgb: Sequence[float]) -> tuple[float, float, float]:
+        """Transform the channels of one color."""
+        lab_l, lab_a, lab_b = _rgb_to_oklab(rgb)
+        lab_l = min(1.0, max(0.0, (lab_l - 0.5) * self.contrast + 0.5 + self.lightness))
+        return _oklab_to_rgb((lab_l, lab_a * self.chroma, lab_b * self.chroma))
+
+    def apply_array(self, rgb: Any) -> Any:
+        """Transform an ``(n, 3)`` NumPy array of channels."""
+        rgb = rgb / 255.0
+        linear = np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+        lab = np.cbrt(linear @ np.array(_RGB_TO_LMS).T) @ np.array(_LMS_TO_OKLAB).T
+
+        lab[:, 0] = np.clip((lab[:, 0] - 0.5) * self.contrast + 0.5 + self.lightness, 0.0, 1.0)
+        lab[:, 1:] *= self.chroma
+
+        lms = (lab @ np.array(_OKLAB_TO_LMS).T) ** 3
+        linear = np.clip(lms @ np.array(_LMS_TO_RGB).T, 0.0, 1.0)
+        rgb = np.where(linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1 / 2.4) - 0.055)
+        return rgb * 255.0
+
+
+class PackedPalette:
+    """Colors of a palette parsed once into packed RGB channels.
+
+    Palettes are immutable; transform() returns a new palette sharing the
+    token table.
+    """
+
+    def __init__(self, tokens: Sequence[str], values: Sequence[Any]):
+        """Parse colors.
+
+        Args:
+            tokens: Token names
+            values: Color values, in token order
+
+        """
+        self._tokens = tuple(tokens)
+        self._values = tuple(values)
+        parsed = [parse_color(value) for value in self._values]
+        self._valid = tuple(color is not None for color in parsed)
+        self._alpha = tuple(color[3] if color is not None else None for color in parsed)
+        rows = [color[:3] if color is not None else (0.0, 0.0, 0.0) for color in parsed]
+        if np is None:
+            self._rgb: Any = rows
+        else:
+            self._rgb = np.array(rows, dtype=np.float64).reshape(len(rows), 3)
+
+    @classmethod
+    def from_colors(cls, colors: Mapping[str, Any]) -> "PackedPalette":
+        """Pack a token to color mapping, such as Theme.colors."""
+        return cls(list(colors), list(colors.values()))
+
+    def _with_channels(self, rgb: Any) -> "PackedPalette":
+        """Create a palette sharing this one's tokens with other channels."""
+        palette = object.__new__(PackedPalette)
+        palette._tokens = self._tokens
+        palette._values = self._values
+        palette._valid = self._valid
+        palette._alpha = self._alpha
+        palette._rgb = rgb
+        return palette
+
+    @property
+    def tokens(self) -> tuple[str, ...]:
+        """Token names, in palette order."""
+        return self._tokens
+
+    def __len__(self) -> int:
+        """Get the number of colors."""
+        return len(self._tokens)
+
+    def light_mask(self, threshold: float = 0.5) -> list[bool]:
+        """Flag the colors whose perceived brightness exceeds a threshold.
+
+        Args:
+            threshold: Brightness (0.299 R + 0.587 G + 0.114 B) in 0..1
+
+        Returns:
+            One flag per token; False for colors that can't be parsed
+
+        """
+        threshold *= 255
+        if np is None:
+            brightness = [0.299 * r + 0.587 * g + 0.114 * b for r, g, b in self._rgb]
+        else:
+            brightness = (self._rgb @ np.array([0.299, 0.587, 0.114])).tolist()
+        return [valid and value > threshold for valid, value in zip(self._valid, brightness)]
+
+    def transform(
+        self, *transforms: ColorTransform, mask: Optional[Sequence[bool]] = None
+    ) -> "PackedPalette":
+        """Apply transforms to all colors in bulk.
+
+        Args:
+            *transforms: Transforms, applied in order
+            mask: Flags limiting the transforms to some tokens
+
+        Returns:
+            New palette with the transformed colors
+
+        """
+        rgb = self._rgb
+        for color_transform in transforms:
+            rows = [
+                index
+                for index, valid in enumerate(self._valid)
+                if valid
+                and (mask is None or mask[index])
+                and (color_transform.where is None or color_transform.where(self._tokens[index]))
+            ]
+            if not rows:
+                continue
+            if np is None:
+                rgb = list(rgb)
+                for index in rows:
+                    rgb[index] = color_transform.apply_rgb(rgb[index])
+            else:
+                rgb = rgb.copy()
+                rgb[rows] = color_transform.apply_array(rgb[rows])
+        return self._with_channels(rgb)
+
+    def to_colors(self) -> dict[str, Any]:
+        """Write the palette back to a token to color mapping.
+
+        Returns:
+            Lowercase hex colors; values that couldn't be parsed unchanged
+
+        """
+        rgb = self._rgb
+        if np is not None:
+            rgb = np.rint(rgb).astype(np.int64).tolist()
+        else:
+            # Transforms keep channels within 0-255
+            rgb = [(round(red), round(green), round(blue)) for red, green, blue in rgb]
+
+        colors = {}
+        for token, value, valid, alpha, (red, green, blue) in zip(
+            self._tokens, self._values, self._valid, self._alpha, rgb
+        ):
+            if not valid:
+                colors[token] = value
+            elif alpha is None:
+                colors[token] = f"#{red:02x}{green:02x}{blue:02x}"
+            else:
+                colors[token] = f"#{red:02x}{green:02x}{blue:02x}{alpha:02x}"
+        return colors
+
+
+def transform_color(color: Any, *transforms: ColorTransform) -> Any:
+    """Apply transforms to a single color.
+
+    Args:
+        color: Color value
+        *transforms: Transforms, applied in order
+
+    Returns:
+        Transformed hex color, or the color unchanged if it can't be parsed
+
+    """
+    parsed = parse_color(color)
+    if parsed is None:
+        return color
+    rgb = parsed[:3]
+    for color_transform in transforms:
+        rgb = color_transform.apply_rgb(rgb)
+    return format_hex(*rgb, parsed[3])
+
+
+__all__ = [
+    "NUMPY_AVAILABLE",
+    "ColorTransform",
+    "HSLTransform",
+    "OKLabTransform",
+    "PackedPalette",
+    "RGBTransform",
+    "format_hex",
+    "parse_color",
+    "transform_color",
+]
@@ -0,0 +1,498 @@
+"""WCAG contrast validation of every foreground/background token pair.
+
+ContrastMatrix parses each color of a theme once into a table of relative
+luminances and computes the contrast ratio of all foreground/background
+relationships in one pass. Editing a token only re-evaluates the pairs that
+use it, so an editor can validate the whole registry on every keystroke.
+
+Pairs are derived from the token names of ColorTokenRegistry and the theme:
+a foreground token is checked against the background of the same element
+(``button.hoverForeground`` against ``button.hoverBackground``), else the
+element's ``background``, else ``colors.background``. Further pairs can be
+registered with add_pair().
+
+NumPy is used when installed (``pip install vfwidgets-theme[accessibility]``);
+otherwise the same computation runs in pure Python.
+
+Example:
+    matrix = ContrastMatrix.from_theme(theme)
+    for result in matrix.failures():
+        print(f"{result.foreground} on {result.background}: {result.ratio:.2f}:1")
+
+    changed = matrix.update_color("button.background", "#0e639c")
+
+"""
+
+import math
+import re
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional
+
+from .tokens import ColorTokenRegistry
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from .theme import Theme
+
+# WCAG 2.1 minimum contrast for normal text (AA)
+MINIMUM_TEXT_CONTRAST = 4.5
+
+# Minimum for inactive, disabled and placeholder text, held to the
+# non-text contrast level since WCAG exempts inactive components
+MINIMUM_INACTIVE_CONTRAST = 3.0
+
+# Token name parts marking inactive text
+_INACTIVE_MARKERS = ("disabled", "inactive", "placeholder")
+
+# Background every unmatched foreground falls back to
+_DEFAULT_BACKGROUND = "colors.background"
+
+_HEX_COLOR = re.compile(r"#([0-9a-fA-F]{3}|[0-9a-fA-F]{6}|[0-9a-fA-F]{8})")
+
+# sRGB channel weights of relative luminance
+_CHANNEL_WEIGHTS = (0.2126, 0.7152, 0.0722)
+
+
+def _parse_rgb(color: Any) -> Optional[tuple[float, float, float]]:
+    """Parse a hex color (#rgb, #rrggbb, #rrggbbaa) into channels in 0..1."""
+    if not isinstance(color, str):
+        return None
+    match = _HEX_COLOR.fullmatch(color.strip())
+    if match is None:
+        return None
+    digits = match.group(1)
+    if len(digits) == 3:
+        digits = "".join(c * 2 for c in digits)
+    return (
+        int(digits[0:2], 16) / 255.0,
+        int(digits[2:4], 16) / 255.0,
+        int(digits[4:6], 16) / 255.0,
+    )
+
+
+def _linearize(channel: float) -> float:
+    """Convert an sRGB channel to linear light."""
+    if channel <= 0.03928:
+        return channel / 12.92
+    return ((channel + 0.055) / 1.055) ** 2.4
+
+
+def relative_luminance(color: Any) -> Optional[float]:
+    """Calculate the WCAG relative luminance of a hex color.
+
+    Args:
+        color: Hex color string (e.g., "#ff0000"); alpha is ignored
+
+    Returns:
+        Relative luminance (0.0 to 1.0), or None if the color can't be parsed
+
+    Reference:
+        https://www.w3.org/TR/WCAG21/#dfn-relative-luminance
+
+    """
+    rgb = _parse_rgb(color)
+    if rgb is None:
+        return None
+    return _rgb_luminance(rgb)
+
+
+def _rgb_luminance(rgb: tuple[float, float, float]) -> float:
+    """Calculate the relative luminance of sRGB channels in 0..1."""
+    return sum(weight * _linearize(channel) for weight, channel in zip(_CHANNEL_WEIGHTS, rgb))
+
+
+def contrast_ratio(luminance1: float, luminance2: float) -> float:
+    """Calculate the WCAG contrast ratio (1.0 to 21.0) of two luminances.
+
+    NaN luminances, as used for unparseable colors, give a NaN ratio.
+    """
+    if math.isnan(luminance1) or math.isnan(luminance2):
+        return math.nan
+    lighter, darker = max(luminance1, luminance2), min(luminance1, luminance2)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def _luminances(colors: list[Any]) -> list[float]:
+    """Relative luminances of many colors; NaN for unparseable colors."""
+    parsed = [_parse_rgb(color) for color in colors]
+    if np is None:
+        return [math.nan if rgb is None else _rgb_luminance(rgb) for rgb in parsed]
+
+    rgb = np.array([channels or (math.nan,) * 3 for channels in parsed], dtype=np.float64)
+    rgb = rgb.reshape(len(parsed), 3)
+    with np.errstate(invalid="ignore"):
+        linear = np.where(rgb <= 0.03928, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+    return linear @ np.array(_CHANNEL_WEIGHTS)
+
+
+def minimum_contrast_for(foreground: str) -> float:
+    """Get the WCAG minimum contrast required of a foreground token."""
+    name = foreground.lower()
+    if any(marker in name for marker in _INACTIVE_MARKERS):
+        return MINIMUM_INACTIVE_CONTRAST
+    return MINIMUM_TEXT_CONTRAST
+
+
+def background_for(foreground: str, tokens: Mapping[str, Any]) -> Optional[str]:
+    """Find the background token a foreground token is drawn on.
+
+    Args:
+        foreground: Foreground token name
+        tokens: Known token names
+
+    Returns:
+        Background token name, or None if the token is not a foreground
+
+    """
+    if foreground.endswith("Foreground"):
+        candidate = foreground[: -len("Foreground")] + "Background"
+    elif foreground.endswith(".foreground"):
+        candidate = foreground[: -len("foreground")] + "background"
+    else:
+        return None
+    if candidate in tokens:
+        return candidate
+
+    element, _, _ = foreground.rpartition(".")
+    candidate = f"{element}.background"
+    if candidate in tokens:
+        return candidate
+    if _DEFAULT_BACKGROUND in tokens and foreground != "colors.foreground":
+        return _DEFAULT_BACKGROUND
+    return None
+
+
+class ContrastPair(NamedTuple):
+    """A foreground token drawn on a background token."""
+
+    foreground: str
+    background: str
+    minimum: float = MINIMUM_TEXT_CONTRAST
+
+
+class ContrastResult(NamedTuple):
+    """Contrast of one foreground/background pair."""
+
+    foreground: str
+    background: str
+    ratio: Optional[float]
+    minimum: float
+
+    @property
+    def passes(self) -> bool:
+        """Whether the pair meets its minimum; unparseable colors pass."""
+        return self.ratio is None or self.ratio >= self.minimum
+
+
+class ContrastMatrix:
+    """Contrast ratios of all foreground/background token pairs of a theme.
+
+    Every color is parsed once into a luminance table indexed by token;
+    ratios are computed for all pairs together and kept up to date
+    incrementally by update_color().
+    """
+
+    def __init__(
+        self,
+        colors: Mapping[str, Any],
+        pairs: Optional[Iterable[ContrastPair]] = None,
+    ):
+        """Build the luminance table and compute all ratios.
+
+        Args:
+            colors: Token name to color value
+            pairs: Pairs to validate; derived from the token names if None
+
+        """
+        self._tokens: dict[str, int] = {}
+        self._colors: list[Any] = []
+        for token, value in colors.items():
+            self._tokens[token] = len(self._colors)
+            self._colors.append(value)
+        self._luminance = _luminances(self._colors)
+
+        self._pairs: list[ContrastPair] = []
+        self._pair_index: dict[tuple[str, str], int] = {}
+        # Pair positions by token, the rows and columns an edit touches
+        self._pairs_of_token: dict[int, list[int]] = {}
+        self._foreground_index: list[int] = []
+        self._background_index: list[int] = []
+        self._minimums: list[float] = []
+        self._ratios: Any = []
+
+        if pairs is None:
+            pairs = derive_pairs(self._tokens)
+        for pair in pairs:
+            self._register_pair(pair)
+        self._ratios = self._compute(range(len(self._pairs)))
+
+    @classmethod
+    def from_theme(
+        cls, theme: "Theme", extra_pairs: Optional[Iterable[ContrastPair]] = None
+    ) -> "ContrastMatrix":
+        """Build the matrix of a theme over all registry tokens.
+
+        Tokens the theme doesn't define take the registry default for its
+        type (dark/light), as they do when the theme is applied.
+
+        Args:
+            theme: Theme to validate
+            extra_pairs: Pairs to validate besides the derived ones
+
+        Returns:
+            Contrast matrix of the theme
+
+        Raises:
+            KeyError: If an extra pair uses an unknown token
+
+        """
+        is_dark = ColorTokenRegistry._is_dark_theme(theme)
+        colors = {
+            token: ColorTokenRegistry.get_default_value(token, is_dark)
+            for token in ColorTokenRegistry.get_all_token_names()
+        }
+        colors.update(theme.colors)
+
+        pairs = derive_pairs(colors)
+        if extra_pairs is not None:
+            pairs.extend(extra_pairs)
+        return cls(colors, pairs)
+
+    def _register_pair(self, pair: ContrastPair) -> int:
+        """Add a pair to the index tables; returns its position."""
+        key = (pair.foreground, pair.background)
+        position = self._pair_index.get(key)
+        if position is not None:
+            self._pairs[position] = pair
+            self._minimums[position] = pair.minimum
+            return position
+
+        foreground = self._tokens[pair.foreground]
+        background = self._tokens[pair.background]
+        position = len(self._pairs)
+        self._pair_index[key] = position
+        self._pairs.append(pair)
+        self._foreground_index.append(foreground)
+        self._background_index.append(background)
+        self._minimums.append(pair.minimum)
+        self._pairs_of_token.setdefault(foreground, []).append(position)
+        if background != foreground:
+            self._pairs_of_token.setdefault(background, []).append(position)
+        return position
+
+    def _compute(self, positions: Iterable[int]) -> Any:
+        """Compute the ratios of the pairs at some positions."""
+        positions = list(positions)
+        if np is None:
+            luminance = self._luminance
+            return [
+                contrast_ratio(
+                    luminance[self._foreground_index[position]],
+                    luminance[self._background_index[position]],
+                )
+                for position in positions
+            ]
+
+        foreground = self._luminance[self._indices(self._foreground_index, positions)]
+        background = self._luminance[self._indices(self._background_index, positions)]
+        return (np.maximum(foreground, background) + 0.05) / (
+            np.minimum(foreground, background) + 0.05
+        )
+
+    @staticmethod
+    def _indices(index: list[int], positions: list[int]) -> Any:
+        """Gather token indices of pairs into an index array."""
+        return np.fromiter((index[p] for p in positions), dtype=np.intp, count=len(positions))
+
+    @property
+    def pairs(self) -> tuple[ContrastPair, ...]:
+        """Validated pairs, in registration order."""
+        return tuple(self._pairs)
+
+    @property
+    def tokens(self) -> list[str]:
+        """Tokens of the luminance table."""
+        return list(self._tokens)
+
+    def add_pair(
+        self, foreground: str, background: str, minimum: float = MINIMUM_TEXT_CONTRAST
+    ) -> ContrastResult:
+        """Validate another foreground/background pair.
+
+        Args:
+            foreground: Foreground token name
+            background: Background token name
+            minimum: Minimum contrast ratio of the pair
+
+        Returns:
+            Contrast of the pair
+
+        Raises:
+            KeyError: If either token is unknown
+
+        """
+        position = self._register_pair(ContrastPair(foreground, background, minimum))
+        ratio = self._compute([position])[0]
+        if np is None:
+            if position == len(self._ratios):
+                self._ratios.append(ratio)
+            else:
+                self._ratios[position] = ratio
+        elif position == len(self._ratios):
+            self._ratios = np.append(self._ratios, ratio)
+        else:
+            self._ratios[position] = ratio
+        return self._result(position)
+
+    def update_color(self, token: str, value: Any) -> list[ContrastResult]:
+        """Change the color of a token and re-evaluate the pairs using it.
+
+        Args:
+            token: Token name; unknown tokens are added to the table
+            value: New color value
+
+        Returns:
+            Contrast of every pair using the token
+
+        """
+        index = self._tokens.get(token)
+        if index is None:
+            index = self._tokens[token] = len(self._colors)
+            self._colors.append(value)
+            luminance = _luminances([value])
+            if np is None:
+                self._luminance.extend(luminance)
+            else:
+                self._luminance = np.append(self._luminance, luminance)
+            return []
+
+        self._colors[index] = value
+        self._luminance[index] = _luminances([value])[0]
+
+        positions = self._pairs_of_token.get(index, [])
+        if positions:
+            ratios = self._compute(positions)
+            for position, ratio in zip(positions, ratios):
+                self._ratios[position] = ratio
+        return [self._result(position) for position in positions]
+
+    def _result(self, position: int) -> ContrastResult:
+        """Build the result of the pair at a position."""
+        pair = self._pairs[position]
+        ratio = float(self._ratios[position])
+        return ContrastResult(
+            pair.foreground,
+            pair.background,
+            None if math.isnan(ratio) else ratio,
+            pair.minimum,
+        )
+
+    def ratio(self, foreground: str, background: str) -> Optional[float]:
+        """Get the contrast ratio of two tokens.
+
+        Args:
+            foreground: Foreground token name
+            background: Background token name
+
+        Returns:
+            Contrast ratio, or None if either color can't be parsed
+
+        Raises:
+            KeyError: If either token is unknown
+
+        """
+        position = self._pair_index.get((foreground, background))
+        if position is not None:
+            return self._result(position).ratio
+        ratio = contrast_ratio(
+            self._luminance[self._tokens[foreground]],
+            self._luminance[self._tokens[background]],
+        )
+        return None if math.isnan(ratio) else ratio
+
+    def results(self) -> list[ContrastResult]:
+        """Get the contrast of every pair."""
+        return [self._result(position) for position in range(len(self._pairs))]
+
+    def failures(self) -> list[ContrastResult]:
+        """Get the pairs below their minimum contrast, lowest ratio first."""
+        if np is None:
+            positions = [
+                position
+                for position, ratio in enumerate(self._ratios)
+                if ratio < self._minimums[position]
+            ]
+        else:
+            # NaN compares False, so unparseable colors never fail
+            positions = np.flatnonzero(self._ratios < np.asarray(self._minimums)).tolist()
+        failing = [self._result(position) for position in positions]
+        failing.sort(key=lambda result: result.ratio)
+        return failing
+
+    def matrix(
+        self,
+        foregrounds: Optional[Iterable[str]] = None,
+        backgrounds: Optional[Iterable[str]] = None,
+    ) -> Any:
+        """Compute the contrast of every foreground against every background.
+
+        Args:
+            foregrounds: Row tokens; the foregrounds of all pairs if None
+            backgrounds: Column tokens; the backgrounds of all pairs if None
+
+        Returns:
+            Ratios as a 2-D NumPy array when NumPy is installed, else a list
+            of rows; NaN where a color can't be parsed
+
+        """
+        if foregrounds is None:
+            foregrounds = dict.fromkeys(pair.foreground for pair in self._pairs)
+        if backgrounds is None:
+            backgrounds = dict.fromkeys(pair.background for pair in self._pairs)
+        rows = [self._luminance[self._tokens[token]] for token in foregrounds]
+        columns = [self._luminance[self._tokens[token]] for token in backgrounds]
+
+        if np is None:
+            return [[contrast_ratio(row, column) for column in columns] for row in rows]
+
+        rows = np.asarray(rows, dtype=np.float64)[:, np.newaxis]
+        columns = np.asarray(columns, dtype=np.float64)[np.newaxis, :]
+        return (np.maximum(rows, columns) + 0.05) / (np.minimum(rows, columns) + 0.05)
+
+
+def derive_pairs(tokens: Mapping[str, Any]) -> list[ContrastPair]:
+    """Derive the foreground/background pairs of a set of tokens.
+
+    Args:
+        tokens: Known token names
+
+    Returns:
+        One pair per foreground token that has a background
+
+    """
+    pairs = []
+    for token in tokens:
+        background = background_for(token, tokens)
+        if background is not None:
+            pairs.append(ContrastPair(token, background, minimum_contrast_for(token)))
+    return pairs
+
+
+__all__ = [
+    "MINIMUM_INACTIVE_CONTRAST",
+    "MINIMUM_TEXT_CONTRAST",
+    "NUMPY_AVAILABLE",
+    "ContrastMatrix",
+    "ContrastPair",
+    "ContrastResult",
+    "contrast_ratio",
+    "derive_pairs",
+    "relative_luminance",
+]
@@ -7,27 +7,36 @@ Key Features:
 - Hierarchical resolution (terminal.fontSize → fonts.size → default)
 - Platform font availability detection
 - LRU caching for performance (<100μs resolution)
-- QFont creation from tokens
+- QFont creation from tokens, cached per token prefix and theme
 - Cross-platform font fallbacks
 
 Design:
 - Immutable resolution chains defined in HIERARCHY_MAP
 - Static methods for stateless resolution
-- Cache invalidation support for theme changes
+- Cache invalidation support for theme changes, font installation and
+  font override changes
 
 Phase 2 Implementation - Font Token Resolution
 """
 
+import threading
+from collections import OrderedDict
 from functools import lru_cache
 from typing import Optional
 
-from PySide6.QtGui import QFont, QFontDatabase
+from PySide6.QtGui import QFont, QFontDatabase, QGuiApplication
 
 from .theme import Theme
 
 # Type alias for the theme parameter to avoid circular imports in type hints
 ThemeType = Theme
 
+# Prebuilt fonts kept by FontTokenRegistry.get_qfont
+QFONT_CACHE_SIZE = 256
+
+# Generic families, always considered available
+GENERIC_FONT_FAMILIES = frozenset({"monospace", "sans-serif", "serif", "cursive", "fantasy"})
+
 
 class FontTokenRegistry:
     """Central registry for font token resolution with hierarchical fallbacks.
@@ -42,14 +51,25 @@ class FontTokenRegistry:
 
     Performance:
         - LRU cached resolution: <100μs per lookup
-        - First resolution: ~1ms (font database query)
+        - First resolution: ~1ms (font database query, once per process)
         - Cache size: 256 entries per method
+        - get_qfont returns copies of prebuilt fonts keyed by
+          (token prefix, theme, font generation)
 
     Thread Safety:
-        - All methods are thread-safe (no shared mutable state)
+        - All methods are thread-safe; the font cache is guarded by a lock
         - LRU cache is thread-safe in Python 3.2+
     """
 
+    # Lowercased families of the font database, probed once per process
+    _available_families: Optional[frozenset[str]] = None
+    _font_database_hooked = False
+
+    # Bumped whenever fonts may resolve differently for the same theme
+    _font_generation = 0
+    _qfont_cache: "OrderedDict[tuple[str, Theme, int], QFont]" = OrderedDict()
+    _qfont_cache_lock = threading.Lock()
+
     # Hierarchical resolution chains
     # Each token maps to a list of fallback tokens to try in order
     HIERARCHY_MAP = {
@@ -324,7 +344,28 @@ class FontTokenRegistry:
             (Qt doesn't support these on QFont directly). Widgets must
             apply these separately if needed.
 
+            Fonts are built once per (token prefix, theme, font generation)
+            and each call returns a copy, so callers may modify it.
+
         """
+        cls = FontTokenRegistry
+        key = (token_prefix, theme, cls._font_generation)
+        with cls._qfont_cache_lock:
+            font = cls._qfont_cache.get(key)
+            if font is not None:
+                cls._qfont_cache.move_to_end(key)
+                return QFont(font)
+
+        font = cls._build_qfont(token_prefix, theme)
+        with cls._qfont_cache_lock:
+            cls._qfont_cache[key] = font
+            if len(cls._qfont_cache) > QFONT_CACHE_SIZE:
+                cls._qfont_cache.popitem(last=False)
+        return QFont(font)
+
+    @staticmethod
+    def _build_qfont(token_prefix: str, theme: Theme) -> QFont:
+        """Resolve the font tokens of a prefix and build the QFont."""
         # Resolve font properties
         families = FontTokenRegistry.get_font_family(f"{token_prefix}.fontFamily", theme)
         size = FontTokenRegistry.get_font_size(f"{token_prefix}.fontSize", theme)
@@ -386,18 +427,13 @@ class FontTokenRegistry:
             considered available and will be returned if reached.
 
         """
-        # Get all available fonts (cached by Qt)
-        db = QFontDatabase()
-        available_fonts = {f.lower() for f in db.families()}
-
-        # Generic families are always available
-        generic_families = {"monospace", "sans-serif", "serif", "cursive", "fantasy"}
+        available_fonts = FontTokenRegistry._font_families()
 
         for family in families:
             family_lower = family.lower()
 
             # Check if it's a generic family (always available)
-            if family_lower in generic_families:
+            if family_lower in GENERIC_FONT_FAMILIES:
                 return family
 
             # Check if font is available on system
@@ -407,9 +443,62 @@ class FontTokenRegistry:
         # No fonts available
         return None
 
+    @staticmethod
+    def _font_families() -> frozenset[str]:
+        """Get the lowercased families of the font database, probed once.
+
+        The probe is dropped when the font database changes (fonts
+        installed or removed), see invalidate_font_database().
+        """
+        cls = FontTokenRegistry
+        families = cls._available_families
+        if families is None:
+            families = frozenset(family.lower() for family in QFontDatabase.families())
+            cls._available_families = families
+            cls._hook_font_database()
+        return families
+
+    @staticmethod
+    def _hook_font_database() -> None:
+        """Invalidate font caches whenever the application's fonts change."""
+        cls = FontTokenRegistry
+        app = QGuiApplication.instance()
+        if cls._font_database_hooked or not isinstance(app, QGuiApplication):
+            return
+        app.fontDatabaseChanged.connect(cls.invalidate_font_database)
+        cls._font_database_hooked = True
+
+    @staticmethod
+    def invalidate_font_database() -> None:
+        """Drop everything derived from the installed fonts.
+
+        Called automatically when the application's font database changes;
+        call it after installing fonts the application isn't notified of.
+
+        Examples:
+            >>> QFontDatabase.addApplicationFont("JetBrainsMono.ttf")
+            >>> FontTokenRegistry.invalidate_font_database()
+
+        """
+        FontTokenRegistry._available_families = None
+        FontTokenRegistry.get_available_font.cache_clear()
+        FontTokenRegistry.invalidate_font_overrides()
+
+    @staticmethod
+    def invalidate_font_overrides() -> None:
+        """Start a new font generation, so get_qfont builds fonts afresh.
+
+        Call this when something other than the theme changes how fonts
+        resolve, such as user font preferences or override layers.
+        """
+        cls = FontTokenRegistry
+        with cls._qfont_cache_lock:
+            cls._font_generation += 1
+            cls._qfont_cache.clear()
+
     @staticmethod
     def clear_cache() -> None:
-        """Clear all LRU caches.
+        """Clear all LRU caches and prebuilt fonts.
 
         Call this when theme changes to ensure fresh resolution.
         Cache will be repopulated on next access.
@@ -424,7 +513,7 @@ class FontTokenRegistry:
         FontTokenRegistry.get_font_weight.cache_clear()
         FontTokenRegistry.get_line_height.cache_clear()
         FontTokenRegistry.get_letter_spacing.cache_clear()
-        FontTokenRegistry.get_available_font.cache_clear()
+        FontTokenRegistry.invalidate_font_database()
 
 
 # Convenience functions for common operations
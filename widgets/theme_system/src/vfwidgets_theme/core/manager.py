@@ -24,15 +24,17 @@ Performance Requirements:
 - Concurrent access: Thread-safe with minimal locking
 """
 
+import itertools
 import threading
 import time
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional, Union
+from typing import Any, Callable, Optional, Union
 
 # Import Qt components with fallback for headless testing
 try:
-    from PySide6.QtCore import QObject
+    from PySide6.QtCore import QObject, QTimer
     from PySide6.QtWidgets import QApplication, QWidget
 
     QT_AVAILABLE = True
@@ -54,6 +56,7 @@ from ..lifecycle import LifecycleManager
 from ..logging import get_debug_logger
 from ..protocols import ThemeChangeCallback
 from ..threading import ThreadSafeThemeManager
+from ..tracing import trace_span
 from .applicator import ThemeApplicator, create_theme_applicator
 from .notifier import ThemeNotifier, create_theme_notifier
 from .override_registry import OverrideRegistry
@@ -63,16 +66,22 @@ from .repository import ThemeRepository, create_theme_repository
 
 # Import core components
 from .theme import Theme
+from .theme_diff import ThemeDiff
 from .token_types import TokenType, get_resolver
 
 logger = get_debug_logger(__name__)
 
+# Theme generations are unique across ThemeManager instances, so caches keyed
+# by generation never mix values of different managers
+_theme_generations = itertools.count()
+
 
 @dataclass
 class ThemeManagerStats:
     """Statistics for theme manager operations."""
 
     theme_switches: int = 0
+    coalesced_switches: int = 0
     themes_loaded: int = 0
     themes_saved: int = 0
     widgets_registered: int = 0
@@ -135,9 +144,17 @@ class ThemeManager:
 
         # Internal state
         self._current_theme: Optional[Theme] = None
+        self._last_theme_diff: Optional[ThemeDiff] = None
+        # Changes whenever token resolution may change (theme switch, overrides)
+        self._theme_generation = next(_theme_generations)
         self._stats = ThemeManagerStats()
         self._lock = threading.RLock()
 
+        # Coalesced theme switching (opt-in, see set_coalescing_enabled)
+        self._coalesce_theme_changes = False
+        self._pending_theme_name: Optional[str] = None
+        self._flush_scheduled = False
+
         # Initialize overlay system
         self._override_registry = OverrideRegistry()
 
@@ -169,12 +186,16 @@ class ThemeManager:
         try:
             builtin_themes = self._repository.list_themes()
             for theme_name in builtin_themes:
+                # Discovered themes load lazily and reach the provider when set
+                if not self._repository.is_theme_loaded(theme_name):
+                    continue
                 theme = self._repository.get_theme(theme_name)
                 self._provider.add_theme(theme)
 
             # Set default theme as current
             if "default" in builtin_themes:
                 self._current_theme = self._repository.get_theme("default")
+                self._theme_generation = next(_theme_generations)
                 self._provider.set_current_theme("default")
 
             logger.debug(f"Initialized {len(builtin_themes)} built-in themes")
@@ -188,6 +209,25 @@ class ThemeManager:
         with self._lock:
             return self._current_theme
 
+    @property
+    def theme_generation(self) -> int:
+        """Counter that changes whenever resolved token values may change.
+
+        Caches of resolved tokens can key on it instead of being invalidated
+        one by one.
+        """
+        return self._theme_generation
+
+    @property
+    def last_theme_diff(self) -> Optional[ThemeDiff]:
+        """Diff between the previous and the current theme of the last switch.
+
+        None before the first switch and after overrides changed, since
+        overrides are not part of the diff.
+        """
+        with self._lock:
+            return self._last_theme_diff
+
     def add_theme(self, theme: Theme) -> None:
         """Add theme to manager.
 
@@ -266,7 +306,7 @@ class ThemeManager:
         builtin_themes = ["default", "dark", "light", "minimal"]
         return [name for name in builtin_themes if name in all_themes]
 
-    def set_theme(self, theme_name: str) -> None:
+    def set_theme(self, theme_name: str, immediate: bool = False) -> None:
         """Set active theme system-wide.
 
         This method coordinates theme switching across all components:
@@ -276,8 +316,113 @@ class ThemeManager:
         4. Notifies all registered callbacks
         5. Updates current theme state
 
+        When coalescing is enabled (see ``set_coalescing_enabled``), steps 2-5
+        are deferred to the next event loop iteration and calls made within
+        the same tick collapse to the last requested theme.
+
         Args:
             theme_name: Name of theme to set
+            immediate: Apply synchronously even when coalescing is enabled
+
+        Raises:
+            ThemeNotFoundError: If theme doesn't exist
+            ThemeApplicationError: If theme application fails
+
+        """
+        # Validate up front so callers still get errors synchronously
+        if not self.has_theme(theme_name):
+            raise ThemeNotFoundError(f"Theme '{theme_name}' not found")
+
+        if immediate or not self._should_coalesce():
+            with self._lock:
+                # A direct switch supersedes anything still queued
+                self._pending_theme_name = None
+            self._apply_theme_now(theme_name)
+            return
+
+        with self._lock:
+            if self._pending_theme_name is not None:
+                self._stats.coalesced_switches += 1
+            self._pending_theme_name = theme_name
+
+            if self._flush_scheduled:
+                return
+            self._flush_scheduled = True
+
+        QTimer.singleShot(0, self._on_flush_timer)
+        logger.debug(f"Queued coalesced theme switch to '{theme_name}'")
+
+    def set_coalescing_enabled(self, enabled: bool) -> None:
+        """Enable or disable event-loop coalescing of ``set_theme`` calls.
+
+        Disabling coalescing flushes any pending theme switch immediately.
+        ThemedApplication.set_theme() always applies synchronously, since it
+        notifies widgets through its theme_changed signal right away.
+
+        Args:
+            enabled: Whether rapid ``set_theme`` calls should be coalesced
+
+        """
+        with self._lock:
+            self._coalesce_theme_changes = enabled
+
+        if not enabled:
+            self.flush_pending_theme()
+
+    @property
+    def coalescing_enabled(self) -> bool:
+        """Whether ``set_theme`` calls are coalesced per event loop tick."""
+        return self._coalesce_theme_changes
+
+    @property
+    def pending_theme_name(self) -> Optional[str]:
+        """Name of the theme waiting to be applied, if any."""
+        with self._lock:
+            return self._pending_theme_name
+
+    def flush_pending_theme(self) -> bool:
+        """Apply a pending coalesced theme switch synchronously.
+
+        This is the escape hatch for tests and for code that must observe the
+        new theme before returning to the event loop.
+
+        Returns:
+            True if a pending theme was applied
+
+        """
+        with self._lock:
+            theme_name = self._pending_theme_name
+            self._pending_theme_name = None
+
+        if theme_name is None:
+            return False
+
+        self._apply_theme_now(theme_name)
+        return True
+
+    def _should_coalesce(self) -> bool:
+        """Check whether set_theme should defer to the event loop."""
+        if not self._coalesce_theme_changes or not QT_AVAILABLE:
+            return False
+        # Without a running application nothing would ever fire the timer
+        return QApplication.instance() is not None
+
+    def _on_flush_timer(self) -> None:
+        """Flush the pending theme from the zero-timer."""
+        with self._lock:
+            self._flush_scheduled = False
+
+        try:
+            self.flush_pending_theme()
+        except Exception as e:
+            # No caller to propagate to from the event loop
+            logger.error(f"Error applying coalesced theme switch: {e}")
+
+    def _apply_theme_now(self, theme_name: str) -> None:
+        """Run the full theme application pass for a theme.
+
+        Args:
+            theme_name: Name of theme to apply
 
         Raises:
             ThemeNotFoundError: If theme doesn't exist
@@ -287,24 +432,35 @@ class ThemeManager:
         start_time = time.time()
 
         try:
-            with self._lock:
-                # Validate theme exists
-                if not self.has_theme(theme_name):
-                    raise ThemeNotFoundError(f"Theme '{theme_name}' not found")
+            with self._lock, trace_span("set_theme", "manager", theme=theme_name):
+                with trace_span("repository_lookup", "repository", theme=theme_name):
+                    # Validate theme exists
+                    if not self.has_theme(theme_name):
+                        raise ThemeNotFoundError(f"Theme '{theme_name}' not found")
 
-                theme = self.get_theme(theme_name)
+                    theme = self.get_theme(theme_name)
+                previous = self._current_theme
+                diff = ThemeDiff.compare(previous, theme)
 
-                # Apply theme globally through applicator
-                results = self._applicator.apply_theme_globally(theme)
+                # Apply theme globally; widgets whose styles are unchanged by the
+                # diff are skipped
+                results = self._applicator.apply_theme_globally(theme, previous)
 
                 # Update provider state
+                if not self._provider.has_theme(theme_name):
+                    self._provider.add_theme(theme)
                 self._provider.set_current_theme(theme_name)
 
+                # Widgets consult the diff to skip updates they do not depend on
+                self._last_theme_diff = diff
+
                 # Notify all registered callbacks
-                self._notifier.notify_theme_changed(theme_name)
+                with trace_span("notify_theme_changed", "notifier", theme=theme_name):
+                    self._notifier.notify_theme_changed(theme_name)
 
                 # Update current theme
                 self._current_theme = theme
+                self._theme_generation = next(_theme_generations)
 
                 # Update statistics
                 self._stats.theme_switches += 1
@@ -323,6 +479,30 @@ class ThemeManager:
                 self._stats.errors += 1
             raise ThemeApplicationError(f"Failed to set theme '{theme_name}': {e}")
 
+    @property
+    def application_stylesheet_enabled(self) -> bool:
+        """Whether widgets are styled by one consolidated application stylesheet."""
+        return self._applicator.scoped_stylesheet_enabled
+
+    def set_application_stylesheet_factory(
+        self, factory: Optional[Callable[[Theme], str]]
+    ) -> None:
+        """Switch between per-widget and application-level stylesheets.
+
+        With a factory installed, the applicator installs one consolidated QSS
+        on QApplication and themed widgets only keep their custom overrides.
+        The current theme is re-applied so the change takes effect immediately.
+
+        Args:
+            factory: Callable producing scoped QSS for a theme, or None to
+                return to per-widget stylesheets
+
+        """
+        with self._lock:
+            self._applicator.set_scoped_stylesheet_factory(factory)
+            if self._current_theme:
+                self._applicator.apply_theme_to_application(self._current_theme)
+
     def reset_to_default(self) -> None:
         """Reset to default theme."""
         if self.has_theme("default"):
@@ -430,6 +610,45 @@ class ThemeManager:
                 self._stats.errors += 1
             raise ThemeLoadError(f"Failed to load theme from {file_path}: {e}")
 
+    def reload_theme(self, theme: Theme) -> ThemeDiff:
+        """Replace a theme with a new version, updating only what changed.
+
+        Used by hot reload and theme editors. Reloading identical content is
+        a no-op; if the theme is current, it is re-applied and widgets that
+        do not depend on the changed tokens skip their update.
+
+        Args:
+            theme: New version of the theme (matched by name)
+
+        Returns:
+            Diff between the stored and the new version
+
+        Raises:
+            ThemeApplicationError: If re-applying the current theme fails
+
+        """
+        with self._lock:
+            old = None
+            if self._repository.has_theme(theme.name):
+                old = self._repository.get_theme(theme.name)
+
+            diff = ThemeDiff.compare(old, theme)
+            if old is not None and diff.is_empty:
+                logger.debug(f"Reloaded theme '{theme.name}' is unchanged")
+                return diff
+
+            self._repository.add_theme(theme)
+            self._provider.add_theme(theme)
+            self._stats.themes_loaded += 1
+
+            is_current = self._current_theme is not None and self._current_theme.name == theme.name
+
+        if is_current:
+            self._apply_theme_now(theme.name)
+
+        logger.debug(f"Reloaded theme '{theme.name}': {diff.summary()}")
+        return diff
+
     def save_theme_to_file(self, theme_name: str, file_path: Union[str, Path]) -> None:
         """Save theme to file.
 
@@ -492,6 +711,21 @@ class ThemeManager:
                 self._stats.errors += 1
             raise ThemeLoadError(f"Failed to discover themes in {directory}: {e}")
 
+    def preload_themes(self, max_workers: Optional[int] = None) -> "Future[int]":
+        """Load discovered themes in the background.
+
+        Startup only indexes theme files; this loads and validates them on a
+        thread pool so the first switch to each theme does not touch disk.
+
+        Args:
+            max_workers: Thread pool size (default: repository default)
+
+        Returns:
+            Future resolving to the number of themes loaded
+
+        """
+        return self._repository.load_pending_themes(max_workers)
+
     def register_theme_change_callback(self, callback: ThemeChangeCallback) -> str:
         """Register callback for theme change notifications.
 
@@ -552,9 +786,11 @@ class ThemeManager:
             # Reset to default theme if available
             if self.has_theme("default"):
                 self._current_theme = self.get_theme("default")
+                self._theme_generation = next(_theme_generations)
                 self._provider.set_current_theme("default")
             else:
                 self._current_theme = None
+                self._theme_generation = next(_theme_generations)
 
             logger.debug("Cleared all custom themes, preserved built-ins")
 
@@ -579,6 +815,8 @@ class ThemeManager:
                 "widgets_registered": self._stats.widgets_registered,
                 "callbacks_registered": self._stats.callbacks_registered,
                 "theme_switches": self._stats.theme_switches,
+                "coalesced_switches": self._stats.coalesced_switches,
+                "pending_theme": self._pending_theme_name,
                 "themes_loaded": self._stats.themes_loaded,
                 "themes_saved": self._stats.themes_saved,
                 "errors": self._stats.errors,
@@ -639,6 +877,8 @@ class ThemeManager:
         """
         with self._lock:
             self._override_registry.set_override("app", token, value, validate=validate)
+            self._last_theme_diff = None
+            self._theme_generation = next(_theme_generations)
 
             if notify:
                 # Get effective color and notify widgets
@@ -673,6 +913,8 @@ class ThemeManager:
         """
         with self._lock:
             self._override_registry.set_override("user", token, value, validate=validate)
+            self._last_theme_diff = None
+            self._theme_generation = next(_theme_generations)
 
             if notify:
                 # Get effective color and notify widgets
@@ -693,6 +935,8 @@ class ThemeManager:
         """
         with self._lock:
             removed = self._override_registry.remove_override("app", token)
+            self._last_theme_diff = None
+            self._theme_generation = next(_theme_generations)
 
             if removed and notify and self._current_theme:
                 self._notifier.notify_theme_changed(self._current_theme)
@@ -712,6 +956,8 @@ class ThemeManager:
         """
         with self._lock:
             removed = self._override_registry.remove_override("user", token)
+            self._last_theme_diff = None
+            self._theme_generation = next(_theme_generations)
 
             if removed and notify and self._current_theme:
                 self._notifier.notify_theme_changed(self._current_theme)
@@ -730,6 +976,8 @@ class ThemeManager:
         """
         with self._lock:
             count = self._override_registry.clear_layer("app")
+            self._last_theme_diff = None
+            self._theme_generation = next(_theme_generations)
 
             if count > 0 and notify and self._current_theme:
                 self._notifier.notify_theme_changed(self._current_theme)
@@ -748,6 +996,8 @@ class ThemeManager:
         """
         with self._lock:
             count = self._override_registry.clear_layer("user")
+            self._last_theme_diff = None
+            self._theme_generation = next(_theme_generations)
 
             if count > 0 and notify and self._current_theme:
                 self._notifier.notify_theme_changed(self._current_theme)
@@ -820,6 +1070,8 @@ class ThemeManager:
         """
         with self._lock:
             self._override_registry.set_overrides_bulk("app", overrides, validate=validate)
+            self._last_theme_diff = None
+            self._theme_generation = next(_theme_generations)
 
             if notify and self._current_theme:
                 self._notifier.notify_theme_changed(self._current_theme)
@@ -850,6 +1102,8 @@ class ThemeManager:
         """
         with self._lock:
             self._override_registry.set_overrides_bulk("user", overrides, validate=validate)
+            self._last_theme_diff = None
+            self._theme_generation = next(_theme_generations)
 
             if notify and self._current_theme:
                 self._notifier.notify_theme_changed(self._current_theme)
@@ -13,6 +13,7 @@ Key Classes:
 - EventFilter: Filters notifications for performance
 - CrossThreadNotifier: Handles cross-thread notifications
 - NotificationBatcher: Batches notifications for efficiency
+- FrameBudgetDispatcher: Delivers notifications in time-boxed event loop slices
 
 Design Principles:
 - Single Responsibility: Notifier focuses only on notification delivery
@@ -28,6 +29,8 @@ Performance Requirements:
 - Batch processing: Configurable batch sizes and intervals
 """
 
+import heapq
+import itertools
 import threading
 import time
 import uuid
@@ -82,6 +85,7 @@ except ImportError:
 # Import foundation modules
 from ..logging import get_debug_logger
 from ..protocols import ThemeChangeCallback
+from ..tracing import trace_span
 
 logger = get_debug_logger(__name__)
 
@@ -115,7 +119,7 @@ class WidgetNotificationManager:
     Handles registration and notification of individual widgets with:
     - Weak reference storage to prevent memory leaks
     - Thread-safe widget registration
-    - Efficient notification delivery
+    - Lock-free notification delivery from immutable snapshots
     - Automatic cleanup of dead references
     """
 
@@ -123,9 +127,30 @@ class WidgetNotificationManager:
         """Initialize widget notification manager."""
         self._widgets: dict[str, weakref.ref] = {}
         self._widget_signals: dict[str, Signal] = {}
+        # Immutable (widget_id, widget_ref, signal) tuples, invalidated on
+        # every write so notification iterates without taking the lock
+        self._snapshot: Optional[tuple[tuple[str, weakref.ref, Any], ...]] = ()
         self._lock = threading.RLock()
         logger.debug("WidgetNotificationManager initialized")
 
+    def snapshot(self) -> tuple[tuple[str, weakref.ref, Any], ...]:
+        """Get the published snapshot of registered widgets.
+
+        Returns:
+            Tuple of (widget_id, widget_ref, signal) entries
+
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = tuple(
+                        (widget_id, widget_ref, self._widget_signals.get(widget_id))
+                        for widget_id, widget_ref in self._widgets.items()
+                    )
+        return snapshot
+
     def register_widget(self, widget: QObject) -> bool:
         """Register widget for notifications.
 
@@ -154,6 +179,7 @@ class WidgetNotificationManager:
                 else:
                     # Create signal if widget doesn't have one
                     self._widget_signals[widget_id] = Signal(str)
+                self._snapshot = None
 
                 logger.debug(f"Registered widget {widget_id} for notifications")
                 return True
@@ -173,21 +199,14 @@ class WidgetNotificationManager:
 
         """
         try:
-            with self._lock:
-                widget_id_to_remove = None
-
-                # Find widget ID by reference
-                for widget_id, widget_ref in self._widgets.items():
-                    if widget_ref() is widget:
-                        widget_id_to_remove = widget_id
-                        break
-
-                if widget_id_to_remove:
-                    self._remove_widget(widget_id_to_remove)
-                    logger.debug(f"Unregistered widget {widget_id_to_remove}")
+            # Find widget ID by reference
+            for widget_id, widget_ref, _signal in self.snapshot():
+                if widget_ref() is widget:
+                    self._remove_widget(widget_id)
+                    logger.debug(f"Unregistered widget {widget_id}")
                     return True
 
-                return False
+            return False
 
         except Exception as e:
             logger.error(f"Error unregistering widget: {e}")
@@ -203,11 +222,7 @@ class WidgetNotificationManager:
             True if widget is registered
 
         """
-        with self._lock:
-            for widget_ref in self._widgets.values():
-                if widget_ref() is widget:
-                    return True
-            return False
+        return any(widget_ref() is widget for _id, widget_ref, _signal in self.snapshot())
 
     def notify_widget(self, widget: QObject, theme_name: str) -> bool:
         """Notify specific widget of theme change.
@@ -221,18 +236,16 @@ class WidgetNotificationManager:
 
         """
         try:
-            with self._lock:
-                # Find widget signal
-                for widget_id, widget_ref in self._widgets.items():
-                    if widget_ref() is widget:
-                        signal = self._widget_signals.get(widget_id)
-                        if signal:
-                            signal.emit(theme_name)
-                            logger.debug(f"Notified widget {widget_id} of theme '{theme_name}'")
-                            return True
-                        break
+            # Find widget signal
+            for widget_id, widget_ref, signal in self.snapshot():
+                if widget_ref() is widget:
+                    if signal:
+                        signal.emit(theme_name)
+                        logger.debug(f"Notified widget {widget_id} of theme '{theme_name}'")
+                        return True
+                    break
 
-                return False
+            return False
 
         except Exception as e:
             logger.error(f"Error notifying widget: {e}")
@@ -250,28 +263,27 @@ class WidgetNotificationManager:
         """
         results = {}
 
-        with self._lock:
-            for widget_id, widget_ref in list(self._widgets.items()):
-                widget = widget_ref()
-                if widget is None:
-                    # Widget was garbage collected, clean up
-                    self._remove_widget(widget_id)
-                    results[widget_id] = False
-                    continue
-
-                try:
-                    signal = self._widget_signals.get(widget_id)
-                    if signal:
-                        signal.emit(theme_name)
-                        results[widget_id] = True
-                        logger.debug(f"Notified widget {widget_id} of theme '{theme_name}'")
-                    else:
-                        results[widget_id] = False
+        # Emit from the snapshot: handlers may register or unregister widgets
+        for widget_id, widget_ref, signal in self.snapshot():
+            widget = widget_ref()
+            if widget is None:
+                # Widget was garbage collected, clean up
+                self._remove_widget(widget_id)
+                results[widget_id] = False
+                continue
 
-                except Exception as e:
-                    logger.error(f"Error notifying widget {widget_id}: {e}")
+            try:
+                if signal:
+                    signal.emit(theme_name)
+                    results[widget_id] = True
+                    logger.debug(f"Notified widget {widget_id} of theme '{theme_name}'")
+                else:
                     results[widget_id] = False
 
+            except Exception as e:
+                logger.error(f"Error notifying widget {widget_id}: {e}")
+                results[widget_id] = False
+
         return results
 
     def get_registered_count(self) -> int:
@@ -283,25 +295,23 @@ class WidgetNotificationManager:
         """Clean up dead widget references manually."""
         cleaned_count = 0
 
-        with self._lock:
-            dead_ids = []
-            for widget_id, widget_ref in self._widgets.items():
-                if widget_ref() is None:
-                    dead_ids.append(widget_id)
-
-            for widget_id in dead_ids:
-                self._remove_widget(widget_id)
-                cleaned_count += 1
+        dead_ids = [
+            widget_id for widget_id, widget_ref, _signal in self.snapshot() if widget_ref() is None
+        ]
+        for widget_id in dead_ids:
+            self._remove_widget(widget_id)
+            cleaned_count += 1
 
         logger.debug(f"Cleaned up {cleaned_count} dead widget references")
         return cleaned_count
 
     def _remove_widget(self, widget_id: str) -> None:
         """Internal method to remove widget."""
-        if widget_id in self._widgets:
-            del self._widgets[widget_id]
-        if widget_id in self._widget_signals:
-            del self._widget_signals[widget_id]
+        # Also reached from weakref callbacks, which run outside the lock
+        with self._lock:
+            self._widgets.pop(widget_id, None)
+            self._widget_signals.pop(widget_id, None)
+            self._snapshot = None
 
 
 class CallbackRegistry:
@@ -855,6 +865,219 @@ class NotificationBatcher:
         self._flush_timer.start()
 
 
+class FrameBudgetDispatcher:
+    """Delivers widget notifications in time-boxed slices of the Qt event loop.
+
+    Notifying thousands of widgets in one pass freezes the UI. The dispatcher
+    instead queues one entry per widget and delivers them from the event loop
+    in slices of at most ``budget_ms``, yielding between slices so input and
+    painting keep up. Entries are processed in priority order (widgets in
+    the active window, then other visible widgets, then hidden ones), and a
+    newer notification for a widget supersedes a pending older one.
+
+    Without a running Qt application on the calling thread, notifications
+    are delivered immediately.
+    """
+
+    # Priority ranks, lower is delivered first
+    RANK_ACTIVE = 0
+    RANK_VISIBLE = 1
+    RANK_HIDDEN = 2
+
+    def __init__(self, budget_ms: float = 8.0, min_widgets: int = 200):
+        """Initialize frame budget dispatcher.
+
+        Args:
+            budget_ms: Time budget per event loop slice in milliseconds
+            min_widgets: Smallest widget count worth slicing; smaller
+                notifications are delivered synchronously
+
+        """
+        self.budget_ms = budget_ms
+        self.min_widgets = min_widgets
+        self._deliver: Optional[Callable[[str, str, QObject, Any], None]] = None
+        # (rank, sequence, widget_id) heap; entries are skipped when superseded
+        self._heap: list[tuple[int, int, str]] = []
+        # widget_id -> (sequence, theme_name, widget_ref, signal) of the latest entry
+        self._pending: dict[str, tuple[int, str, weakref.ref, Any]] = {}
+        self._sequence = itertools.count()
+        self._slice_scheduled = False
+        self._lock = threading.RLock()
+        self._stats = {
+            "scheduled": 0,
+            "delivered": 0,
+            "coalesced": 0,
+            "slices": 0,
+            "max_slice_ms": 0.0,
+        }
+        logger.debug(f"FrameBudgetDispatcher initialized: budget_ms={budget_ms}")
+
+    def set_delivery(self, deliver: Callable[[str, str, QObject, Any], None]) -> None:
+        """Set the function delivering one notification.
+
+        Args:
+            deliver: Called with (theme_name, widget_id, widget, signal)
+
+        """
+        self._deliver = deliver
+
+    def should_defer(self, widget_count: int) -> bool:
+        """Check whether a notification of this size should be sliced."""
+        return widget_count >= self.min_widgets
+
+    def schedule(self, theme_name: str, entries: tuple[tuple[str, weakref.ref, Any], ...]) -> int:
+        """Queue notifications and schedule delivery on the event loop.
+
+        Args:
+            theme_name: Theme name to deliver
+            entries: (widget_id, widget_ref, signal) entries, as published by
+                WidgetNotificationManager.snapshot()
+
+        Returns:
+            Number of notifications queued
+
+        """
+        queued = 0
+        with self._lock:
+            for widget_id, widget_ref, signal in entries:
+                widget = widget_ref()
+                if widget is None:
+                    continue
+
+                sequence = next(self._sequence)
+                if widget_id in self._pending:
+                    self._stats["coalesced"] += 1
+                self._pending[widget_id] = (sequence, theme_name, widget_ref, signal)
+                heapq.heappush(self._heap, (self._rank(widget), sequence, widget_id))
+                queued += 1
+
+            self._stats["scheduled"] += queued
+
+        self._schedule_slice()
+        return queued
+
+    def pending_count(self) -> int:
+        """Get the number of notifications waiting for delivery."""
+        with self._lock:
+            return len(self._pending)
+
+    def process_slice(self, budget_ms: Optional[float] = None) -> int:
+        """Deliver pending notifications until the time budget is used up.
+
+        At least one notification is delivered per call so delivery always
+        progresses.
+
+        Args:
+            budget_ms: Time budget in milliseconds, None for no limit
+
+        Returns:
+            Number of notifications delivered
+
+        """
+        start_time = time.perf_counter()
+        deadline = start_time + budget_ms / 1000 if budget_ms is not None else None
+        delivered = 0
+
+        while True:
+            with self._lock:
+                item = self._pop_next()
+            if item is None:
+                break
+
+            widget_id, theme_name, widget_ref, signal = item
+            widget = widget_ref()
+            if widget is not None and self._deliver is not None:
+                try:
+                    with trace_span("deliver_notification", "notifier", widget):
+                        self._deliver(theme_name, widget_id, widget, signal)
+                except Exception as e:
+                    logger.error(f"Error delivering notification to {widget_id}: {e}")
+                delivered += 1
+
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+
+        slice_ms = (time.perf_counter() - start_time) * 1000
+        with self._lock:
+            self._stats["delivered"] += delivered
+            self._stats["slices"] += 1
+            self._stats["max_slice_ms"] = max(self._stats["max_slice_ms"], slice_ms)
+
+        return delivered
+
+    def flush(self) -> int:
+        """Deliver all pending notifications now.
+
+        Returns:
+            Number of notifications delivered
+
+        """
+        return self.process_slice(None)
+
+    def clear(self) -> None:
+        """Drop all pending notifications."""
+        with self._lock:
+            self._heap.clear()
+            self._pending.clear()
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get dispatch statistics."""
+        with self._lock:
+            stats = self._stats.copy()
+            stats["pending"] = len(self._pending)
+            stats["budget_ms"] = self.budget_ms
+            return stats
+
+    def _pop_next(self) -> Optional[tuple[str, str, weakref.ref, Any]]:
+        """Pop the highest priority entry that has not been superseded."""
+        while self._heap:
+            _rank, sequence, widget_id = heapq.heappop(self._heap)
+            entry = self._pending.get(widget_id)
+            if entry is None or entry[0] != sequence:
+                continue  # Superseded by a newer notification
+            del self._pending[widget_id]
+            _sequence, theme_name, widget_ref, signal = entry
+            return widget_id, theme_name, widget_ref, signal
+        return None
+
+    def _rank(self, widget: QObject) -> int:
+        """Rank a widget for delivery order."""
+        try:
+            if not widget.isVisible():
+                return self.RANK_HIDDEN
+            if widget.window().isActiveWindow():
+                return self.RANK_ACTIVE
+            return self.RANK_VISIBLE
+        except Exception:
+            # Not a QWidget: no visibility to go by
+            return self.RANK_VISIBLE
+
+    def _schedule_slice(self) -> None:
+        """Schedule the next slice on the event loop, or deliver everything now."""
+        with self._lock:
+            if self._slice_scheduled or not self._pending:
+                return
+
+            app = QApplication.instance() if QT_AVAILABLE else None
+            if app is None or QThread.currentThread() is not app.thread():
+                can_yield = False
+            else:
+                can_yield = True
+                self._slice_scheduled = True
+
+        if can_yield:
+            QTimer.singleShot(0, self._run_slice)
+        else:
+            self.flush()
+
+    def _run_slice(self) -> None:
+        """Event loop entry point: deliver one slice and reschedule."""
+        with self._lock:
+            self._slice_scheduled = False
+        self.process_slice(self.budget_ms)
+        self._schedule_slice()
+
+
 class ThemeNotifier:
     """Main coordinator for theme change notifications.
 
@@ -865,6 +1088,7 @@ class ThemeNotifier:
     - Event filtering via EventFilter
     - Cross-thread delivery via CrossThreadNotifier
     - Batch processing via NotificationBatcher
+    - Optional time-sliced delivery via FrameBudgetDispatcher
 
     Follows Single Responsibility Principle by acting as a facade
     that delegates to specialized notification components.
@@ -878,6 +1102,7 @@ class ThemeNotifier:
         event_filter: Optional[EventFilter] = None,
         cross_thread_notifier: Optional[CrossThreadNotifier] = None,
         batcher: Optional[NotificationBatcher] = None,
+        dispatcher: Optional[FrameBudgetDispatcher] = None,
     ):
         """Initialize theme notifier with dependency injection.
 
@@ -888,6 +1113,8 @@ class ThemeNotifier:
             event_filter: Event filter for performance
             cross_thread_notifier: Cross-thread notifier
             batcher: Notification batcher
+            dispatcher: Frame budget dispatcher for time-sliced delivery
+                (None delivers all notifications synchronously)
 
         """
         self._widget_manager = widget_manager or WidgetNotificationManager()
@@ -896,6 +1123,7 @@ class ThemeNotifier:
         self._event_filter = event_filter or EventFilter()
         self._cross_thread_notifier = cross_thread_notifier or CrossThreadNotifier()
         self._batcher = batcher or NotificationBatcher()
+        self._dispatcher: Optional[FrameBudgetDispatcher] = None
 
         self._stats = NotificationStats()
         self._lock = threading.RLock()
@@ -906,6 +1134,9 @@ class ThemeNotifier:
         # Set up batcher processor
         self._batcher.set_batch_processor(self._process_notification_batch)
 
+        if dispatcher is not None:
+            self.set_dispatcher(dispatcher)
+
         logger.debug("ThemeNotifier initialized with all components")
 
     def register_widget(self, widget: QObject) -> bool:
@@ -1013,6 +1244,17 @@ class ThemeNotifier:
         start_time = time.time()
 
         try:
+            dispatcher = self._dispatcher
+            if dispatcher is not None:
+                entries = self._widget_manager.snapshot()
+                if dispatcher.should_defer(len(entries)):
+                    dispatcher.schedule(theme_name, entries)
+                    logger.debug(f"Scheduled sliced notification of theme change: {theme_name}")
+                    return
+                # Delivering synchronously supersedes every sliced notification
+                # still queued, which would otherwise land after this one
+                dispatcher.clear()
+
             # Notify all widgets
             widget_results = self._widget_manager.notify_all_widgets(theme_name)
 
@@ -1095,6 +1337,47 @@ class ThemeNotifier:
 
         return results
 
+    def set_dispatcher(self, dispatcher: Optional[FrameBudgetDispatcher]) -> None:
+        """Set the dispatcher used for time-sliced global notifications.
+
+        Args:
+            dispatcher: Frame budget dispatcher, or None for synchronous delivery
+
+        """
+        previous = self._dispatcher
+        if previous is not None and previous is not dispatcher:
+            # Don't leave widgets on the old theme
+            previous.flush()
+
+        if dispatcher is not None:
+            dispatcher.set_delivery(self._deliver_notification)
+        self._dispatcher = dispatcher
+
+    def set_frame_budget(self, budget_ms: Optional[float], min_widgets: int = 200) -> None:
+        """Enable or disable time-sliced delivery of global notifications.
+
+        Args:
+            budget_ms: Time budget per event loop slice in milliseconds, or
+                None to deliver synchronously
+            min_widgets: Smallest widget count worth slicing
+
+        """
+        if budget_ms is None:
+            self.set_dispatcher(None)
+        else:
+            self.set_dispatcher(FrameBudgetDispatcher(budget_ms, min_widgets))
+
+    def flush_pending_notifications(self) -> int:
+        """Deliver all notifications still queued for time-sliced delivery.
+
+        Returns:
+            Number of notifications delivered
+
+        """
+        if self._dispatcher is None:
+            return 0
+        return self._dispatcher.flush()
+
     def set_notification_filter(self, filter_func: Callable[[str], bool]) -> None:
         """Set theme name filter for notifications.
 
@@ -1132,9 +1415,33 @@ class ThemeNotifier:
                     "filter_stats": self._event_filter.get_statistics(),
                 }
             )
+            if self._dispatcher is not None:
+                base_stats["dispatch_stats"] = self._dispatcher.get_statistics()
 
             return base_stats
 
+    def _deliver_notification(
+        self, theme_name: str, widget_id: str, widget: QObject, signal: Any
+    ) -> None:
+        """Deliver one time-sliced notification to a widget and the callbacks."""
+        try:
+            if signal:
+                signal.emit(theme_name)
+        except Exception as e:
+            logger.error(f"Error notifying widget {widget_id}: {e}")
+            with self._lock:
+                self._stats.errors += 1
+
+        # Callbacks run regardless, as in notify_theme_changed
+        if self._event_filter.should_notify(theme_name, widget_id):
+            self._callback_registry.call_all_callbacks(theme_name, widget_id)
+        else:
+            with self._lock:
+                self._stats.filtered_notifications += 1
+
+        with self._lock:
+            self._stats.notifications_sent += 1
+
     def _process_notification(self, theme_name: str, widget_id: str) -> None:
         """Process single notification from queue."""
         try:
@@ -1158,6 +1465,8 @@ class ThemeNotifier:
     def shutdown(self) -> None:
         """Shutdown notifier and clean up resources."""
         try:
+            if self._dispatcher is not None:
+                self._dispatcher.clear()
             self._queue.stop_async_processing()
             self._cross_thread_notifier.shutdown()
             logger.debug("ThemeNotifier shutdown completed")
@@ -1167,7 +1476,10 @@ class ThemeNotifier:
 
 
 def create_theme_notifier(
-    max_queue_size: int = 1000, batch_size: int = 10, flush_interval: float = 0.1
+    max_queue_size: int = 1000,
+    batch_size: int = 10,
+    flush_interval: float = 0.1,
+    frame_budget_ms: Optional[float] = None,
 ) -> ThemeNotifier:
     """Factory function for creating theme notifier with defaults.
 
@@ -1175,6 +1487,8 @@ def create_theme_notifier(
         max_queue_size: Maximum notification queue size
         batch_size: Notification batch size
         flush_interval: Batch flush interval in seconds
+        frame_budget_ms: Per-slice time budget for delivering global
+            notifications from the event loop (None delivers synchronously)
 
     Returns:
         Configured theme notifier
@@ -1187,6 +1501,7 @@ def create_theme_notifier(
     event_filter = EventFilter()
     cross_thread_notifier = CrossThreadNotifier()
     batcher = NotificationBatcher(batch_size=batch_size, flush_interval=flush_interval)
+    dispatcher = FrameBudgetDispatcher(frame_budget_ms) if frame_budget_ms is not None else None
 
     notifier = ThemeNotifier(
         widget_manager=widget_manager,
@@ -1195,6 +1510,7 @@ def create_theme_notifier(
         event_filter=event_filter,
         cross_thread_notifier=cross_thread_notifier,
         batcher=batcher,
+        dispatcher=dispatcher,
     )
 
     logger.debug("Created theme notifier with default configuration")
@@ -1209,6 +1525,7 @@ __all__ = [
     "EventFilter",
     "CrossThreadNotifier",
     "NotificationBatcher",
+    "FrameBudgetDispatcher",
     "NotificationStats",
     "NotificationItem",
     "create_theme_notifier",
@@ -11,7 +11,7 @@ Key Classes:
 
 Design Principles:
 - Automatic Memory Management: WeakRefs prevent memory leaks
-- Thread Safety: All operations are thread-safe
+- Thread Safety: All operations are thread-safe; reads use lock-free snapshots
 - Event Driven: Registry operations emit events for coordination
 - Metadata Tracking: Rich metadata for each registered widget
 
@@ -59,6 +59,16 @@ class RegistryEntry:
     - Event callbacks
     """
 
+    # One entry per themed widget, so no per-instance __dict__
+    __slots__ = (
+        "widget_ref",
+        "widget_id",
+        "widget_type",
+        "registration_time",
+        "theme_metadata",
+        "callbacks",
+    )
+
     widget_ref: weakref.ReferenceType
     widget_id: str
     widget_type: str
@@ -77,6 +87,22 @@ class RegistryEntry:
         return self.widget is not None
 
 
+class _WidgetRef(weakref.ref):
+    """Weak reference carrying the widget id for the cleanup callback.
+
+    Cheaper per widget than a closure capturing the id.
+    """
+
+    __slots__ = ("widget_id",)
+
+    def __new__(cls, widget: Any, callback: Callable[["_WidgetRef"], None], widget_id: str):
+        return super().__new__(cls, widget, callback)
+
+    def __init__(self, widget: Any, callback: Callable[["_WidgetRef"], None], widget_id: str):
+        super().__init__(widget, callback)
+        self.widget_id = widget_id
+
+
 class RegistryEventHandler(Protocol):
     """Protocol for handling registry events."""
 
@@ -114,7 +140,10 @@ class ThemeWidgetRegistry:
         """
         self._base_registry = base_registry
         self._entries: dict[str, RegistryEntry] = {}
-        self._event_handlers: list[RegistryEventHandler] = []
+        # Immutable copy of the entries for iteration, swapped on every write
+        # (lazily rebuilt) so theme application never takes the lock
+        self._snapshot: Optional[tuple[RegistryEntry, ...]] = ()
+        self._event_handlers: tuple[RegistryEventHandler, ...] = ()
         self._lock = threading.RLock()
         logger.debug("ThemeWidgetRegistry initialized")
 
@@ -138,12 +167,7 @@ class ThemeWidgetRegistry:
         with self._lock:
             widget_id = f"widget_{id(widget)}_{int(time.time() * 1000000)}"
 
-            def cleanup_callback(ref):
-                """Called when widget is garbage collected."""
-                logger.debug(f"Widget {widget_id} garbage collected, cleaning up")
-                self._remove_entry(widget_id)
-
-            widget_ref = weakref.ref(widget, cleanup_callback)
+            widget_ref = _WidgetRef(widget, self._on_widget_collected, widget_id)
 
             entry = RegistryEntry(
                 widget_ref=widget_ref,
@@ -155,6 +179,7 @@ class ThemeWidgetRegistry:
             )
 
             self._entries[widget_id] = entry
+            self._snapshot = None
 
             # Emit registration event
             for handler in self._event_handlers:
@@ -180,21 +205,38 @@ class ThemeWidgetRegistry:
 
     def get_widget(self, widget_id: str) -> Optional[ThemeableWidget]:
         """Get widget by ID (may be None if collected)."""
-        with self._lock:
-            entry = self._entries.get(widget_id)
-            return entry.widget if entry else None
+        # Single dict lookups are atomic, no lock needed
+        entry = self._entries.get(widget_id)
+        return entry.widget if entry else None
 
     def get_entry(self, widget_id: str) -> Optional[RegistryEntry]:
         """Get registry entry by widget ID."""
-        with self._lock:
-            return self._entries.get(widget_id)
+        return self._entries.get(widget_id)
+
+    def snapshot(self) -> tuple[RegistryEntry, ...]:
+        """Get an immutable snapshot of all registry entries.
+
+        The snapshot is shared between readers and replaced on registration
+        changes, so iterating it needs no locking. Entries may refer to
+        widgets collected after the snapshot was taken; check is_alive.
+
+        Returns:
+            Tuple of registry entries in registration order
+
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = tuple(self._entries.values())
+        return snapshot
 
     def list_widgets(self, include_dead: bool = False) -> list[str]:
         """List all registered widget IDs."""
-        with self._lock:
-            if include_dead:
-                return list(self._entries.keys())
-            return [wid for wid, entry in self._entries.items() if entry.is_alive]
+        if include_dead:
+            return [entry.widget_id for entry in self.snapshot()]
+        return [entry.widget_id for entry in self.snapshot() if entry.is_alive]
 
     def get_widget_count(self, include_dead: bool = False) -> int:
         """Get count of registered widgets."""
@@ -207,7 +249,7 @@ class ThemeWidgetRegistry:
     def cleanup_dead_references(self) -> int:
         """Clean up dead widget references manually."""
         with self._lock:
-            dead_ids = [wid for wid, entry in self._entries.items() if not entry.is_alive]
+            dead_ids = [entry.widget_id for entry in self.snapshot() if not entry.is_alive]
             for widget_id in dead_ids:
                 self._remove_entry(widget_id)
             logger.debug(f"Cleaned up {len(dead_ids)} dead widget references")
@@ -215,53 +257,64 @@ class ThemeWidgetRegistry:
 
     def add_event_handler(self, handler: RegistryEventHandler) -> None:
         """Add an event handler."""
-        self._event_handlers.append(handler)
+        with self._lock:
+            self._event_handlers = (*self._event_handlers, handler)
         logger.debug(f"Added event handler: {type(handler).__name__}")
 
     def remove_event_handler(self, handler: RegistryEventHandler) -> bool:
         """Remove an event handler."""
-        try:
-            self._event_handlers.remove(handler)
-            logger.debug(f"Removed event handler: {type(handler).__name__}")
-            return True
-        except ValueError:
-            return False
+        with self._lock:
+            if handler not in self._event_handlers:
+                return False
+            handlers = list(self._event_handlers)
+            handlers.remove(handler)
+            self._event_handlers = tuple(handlers)
+        logger.debug(f"Removed event handler: {type(handler).__name__}")
+        return True
 
     def apply_theme_to_widget(self, widget_id: str, theme_name: str) -> bool:
         """Apply theme to specific widget and track it.
 
-        Implementation will be added in Task 8.
+        Called once per widget during theme application, so it works on the
+        published entries and handlers without taking the registry lock.
         """
-        with self._lock:
-            entry = self._entries.get(widget_id)
-            if not entry or not entry.is_alive:
-                return False
+        entry = self._entries.get(widget_id)
+        if not entry or not entry.is_alive:
+            return False
 
-            # Update theme metadata
-            entry.theme_metadata["current_theme"] = theme_name
-            entry.theme_metadata["last_theme_applied"] = time.time()
+        # Update theme metadata
+        entry.theme_metadata["current_theme"] = theme_name
+        entry.theme_metadata["last_theme_applied"] = time.time()
 
-            # Emit theme application event
-            for handler in self._event_handlers:
-                try:
-                    handler.on_theme_applied(widget_id, theme_name)
-                except Exception as e:
-                    logger.error(f"Error in theme application event handler: {e}")
+        # Emit theme application event
+        for handler in self._event_handlers:
+            try:
+                handler.on_theme_applied(widget_id, theme_name)
+            except Exception as e:
+                logger.error(f"Error in theme application event handler: {e}")
 
-            logger.debug(f"Applied theme '{theme_name}' to widget {widget_id}")
-            return True
+        logger.debug(f"Applied theme '{theme_name}' to widget {widget_id}")
+        return True
+
+    def _on_widget_collected(self, ref: "_WidgetRef") -> None:
+        """Remove the entry of a garbage collected widget."""
+        logger.debug(f"Widget {ref.widget_id} garbage collected, cleaning up")
+        self._remove_entry(ref.widget_id)
 
     def _remove_entry(self, widget_id: str) -> None:
         """Internal method to remove an entry."""
-        if widget_id in self._entries:
-            del self._entries[widget_id]
-
-            # Emit unregistration event
-            for handler in self._event_handlers:
-                try:
-                    handler.on_widget_unregistered(widget_id)
-                except Exception as e:
-                    logger.error(f"Error in unregistration event handler: {e}")
+        # Also reached from weakref callbacks, which run outside the lock
+        with self._lock:
+            if self._entries.pop(widget_id, None) is None:
+                return
+            self._snapshot = None
+
+        # Emit unregistration event
+        for handler in self._event_handlers:
+            try:
+                handler.on_widget_unregistered(widget_id)
+            except Exception as e:
+                logger.error(f"Error in unregistration event handler: {e}")
 
 
 class DefaultRegistryEventHandler:
@@ -11,6 +11,7 @@ Key Classes:
 - BuiltinThemeManager: Manages built-in themes
 - ThemeCache: LRU cache for theme performance optimization
 - ThemeDiscovery: Discovers themes in directories
+- ThemeDiscoveryCache: On-disk cache of discovered theme files
 
 Design Principles:
 - Single Responsibility: Repository focuses only on theme storage/retrieval
@@ -25,10 +26,16 @@ Performance Requirements:
 - Memory overhead: < 2KB per managed theme
 """
 
+import hashlib
 import json
+import marshal
+import os
+import re
+import sys
 import threading
 import time
 from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional, Union
@@ -170,6 +177,58 @@ class ThemeCache:
             }
 
 
+# Characters of a JSON theme file read to index it. Fields are read up to the
+# first nested value; files without a name there are parsed in full
+INDEX_HEADER_SIZE = 4096
+
+_JSON_WHITESPACE = re.compile(r"\s*")
+_json_decoder = json.JSONDecoder()
+
+
+def _read_json_header(text: str) -> dict[str, Any]:
+    """Read the top-level scalar fields at the start of a JSON object.
+
+    Scanning stops at the first nested object or array, at the end of the
+    object, or where the text is cut off.
+
+    Args:
+        text: Start of a JSON document
+
+    Returns:
+        Fields read, empty if the text does not start with an object
+
+    """
+    skip = _JSON_WHITESPACE.match
+    fields: dict[str, Any] = {}
+    pos = skip(text).end()
+    if not text.startswith("{", pos):
+        return fields
+
+    pos += 1
+    try:
+        while True:
+            key, pos = _json_decoder.raw_decode(text, skip(text, pos).end())
+            pos = skip(text, pos).end()
+            if not isinstance(key, str) or not text.startswith(":", pos):
+                break
+            pos = skip(text, pos + 1).end()
+            if text.startswith(("{", "["), pos):
+                break
+            value, pos = _json_decoder.raw_decode(text, pos)
+            if pos >= len(text):
+                # A number may continue past the cut
+                break
+            fields[key] = value
+            pos = skip(text, pos).end()
+            if not text.startswith(",", pos):
+                break
+            pos += 1
+    except ValueError:
+        # Cut off inside a key or value, or not valid JSON
+        pass
+    return fields
+
+
 class FileThemeLoader:
     """Loader for file-based themes.
 
@@ -249,6 +308,46 @@ class FileThemeLoader:
         except Exception as e:
             raise ThemeLoadError(f"Error loading theme from {path}: {e}") from e
 
+    def read_index(self, file_path: Union[str, Path]) -> dict[str, Any]:
+        """Read the identifying fields of a theme file without validating it.
+
+        JSON files are indexed from their first INDEX_HEADER_SIZE characters
+        when the name is found there; a type or version that only follows a
+        nested value is left at its default until the theme is loaded.
+
+        Args:
+            file_path: Path to theme file
+
+        Returns:
+            Dictionary with the theme name, type and version
+
+        Raises:
+            ThemeLoadError: If file cannot be parsed or has no theme name
+
+        """
+        path = Path(file_path)
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                if path.suffix.lower() == ".json":
+                    data = _read_json_header(f.read(INDEX_HEADER_SIZE))
+                    if not isinstance(data.get("name"), str):
+                        f.seek(0)
+                        data = json.load(f)
+                else:
+                    data = yaml.safe_load(f)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError, yaml.YAMLError) as e:
+            raise ThemeLoadError(f"Failed to parse theme file {path}: {e}") from e
+
+        if not isinstance(data, dict) or not isinstance(data.get("name"), str):
+            raise ThemeLoadError(f"No theme name in {path}")
+
+        return {
+            "name": data["name"],
+            "type": data.get("type"),
+            "version": str(data.get("version", "1.0.0")),
+        }
+
 
 class BuiltinThemeManager:
     """Manager for built-in themes.
@@ -548,13 +647,19 @@ class ThemeDiscovery:
         logger.debug("ThemeDiscovery initialized")
 
     def discover_in_directory(
-        self, directory: Union[str, Path], recursive: bool = True
+        self,
+        directory: Union[str, Path],
+        recursive: bool = True,
+        max_workers: Optional[int] = None,
     ) -> list[Theme]:
         """Discover themes in directory.
 
+        Theme files are loaded and validated in parallel on a thread pool.
+
         Args:
             directory: Directory to scan
             recursive: Whether to scan subdirectories
+            max_workers: Thread pool size (default: DISCOVERY_MAX_WORKERS)
 
         Returns:
             List of discovered themes
@@ -569,26 +674,305 @@ class ThemeDiscovery:
 
         logger.debug(f"Discovering themes in: {dir_path} (recursive={recursive})")
 
+        files = self.find_theme_files(dir_path, recursive)
+        workers = min(len(files), max_workers or DISCOVERY_MAX_WORKERS)
+        if workers > 1:
+            with ThreadPoolExecutor(workers, thread_name_prefix="theme-discovery") as executor:
+                results = list(executor.map(self._try_load_theme_file, files))
+        else:
+            results = [self._try_load_theme_file(file_path) for file_path in files]
+
+        for file_path, theme in zip(files, results):
+            if theme is not None:
+                themes.append(theme)
+                logger.debug(f"Discovered theme: {theme.name} from {file_path}")
+
+        logger.debug(f"Discovered {len(themes)} themes in {dir_path}")
+        return themes
+
+    def find_theme_files(self, directory: Union[str, Path], recursive: bool = True) -> list[Path]:
+        """Find loadable theme files in directory without loading them.
+
+        Args:
+            directory: Directory to scan
+            recursive: Whether to scan subdirectories
+
+        Returns:
+            List of theme file paths
+
+        """
+        dir_path = Path(directory)
+        files = []
+
         # Get file pattern based on supported extensions
         patterns = ["*.json", "*.yaml", "*.yml"]
 
         for pattern in patterns:
-            if recursive:
-                files = dir_path.rglob(pattern)
+            matches = dir_path.rglob(pattern) if recursive else dir_path.glob(pattern)
+            files.extend(path for path in matches if self._loader.can_load(path))
+
+        return files
+
+    def load_theme_file(self, file_path: Union[str, Path]) -> Theme:
+        """Load and validate a single theme file.
+
+        Args:
+            file_path: Path to theme file
+
+        Returns:
+            Loaded Theme object
+
+        """
+        return self._loader.load_theme(file_path)
+
+    def read_theme_index(self, file_path: Union[str, Path]) -> dict[str, Any]:
+        """Read the name, type and version of a theme file without validating it.
+
+        Args:
+            file_path: Path to theme file
+
+        Returns:
+            Dictionary with the theme name, type and version
+
+        """
+        return self._loader.read_index(file_path)
+
+    def _try_load_theme_file(self, file_path: Path) -> Optional[Theme]:
+        """Load a theme file, logging instead of raising on failure."""
+        try:
+            return self.load_theme_file(file_path)
+        except Exception as e:
+            logger.warning(f"Failed to load theme from {file_path}: {e}")
+            return None
+
+
+# Upper bound for theme loading thread pools
+DISCOVERY_MAX_WORKERS = min(8, (os.cpu_count() or 1) + 2)
+
+# Bump when the cache layout changes; files with another version are ignored
+DISCOVERY_CACHE_VERSION = 1
+DISCOVERY_CACHE_MAGIC = b"VFTHEMEC"
+
+
+def default_discovery_cache_path() -> Path:
+    """Get the per-user location of the theme discovery cache file."""
+    cache_home = os.environ.get("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "vfwidgets" / "theme_discovery.cache"
+
+
+class ThemeDiscoveryCache:
+    """Versioned on-disk cache of discovered theme files.
+
+    Holds one entry per theme file, keyed by its absolute path and checked
+    against the file size, mtime_ns and a content digest, so an edited file
+    only invalidates its own entry. Entries store the already-validated theme
+    data; Theme objects are only built from it when a theme is requested.
+
+    The file is a short header (magic, format version, Python version)
+    followed by a marshal payload, which loads much faster than QSettings.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """Initialize discovery cache.
+
+        Args:
+            path: Cache file location (default: per-user cache directory)
+
+        """
+        self._path = Path(path) if path else default_discovery_cache_path()
+        self._entries: Optional[dict[str, dict[str, Any]]] = None
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    @property
+    def path(self) -> Path:
+        """Get the cache file location."""
+        return self._path
+
+    def _header(self) -> bytes:
+        """Build the file header; marshal is only stable per Python version."""
+        version = f"{DISCOVERY_CACHE_VERSION}:{sys.version_info[0]}.{sys.version_info[1]}\n"
+        return DISCOVERY_CACHE_MAGIC + version.encode("ascii")
+
+    def _load_entries(self) -> dict[str, dict[str, Any]]:
+        """Read the cache file on first use."""
+        if self._entries is not None:
+            return self._entries
+
+        entries = {}
+        try:
+            data = self._path.read_bytes()
+            header = self._header()
+            if data.startswith(header):
+                payload = marshal.loads(data[len(header) :])
+                if isinstance(payload, dict):
+                    entries = payload
             else:
-                files = dir_path.glob(pattern)
+                logger.debug(f"Ignoring discovery cache with other format: {self._path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to read theme discovery cache {self._path}: {e}")
 
-            for file_path in files:
-                try:
-                    if self._loader.can_load(file_path):
-                        theme = self._loader.load_theme(file_path)
-                        themes.append(theme)
-                        logger.debug(f"Discovered theme: {theme.name} from {file_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to load theme from {file_path}: {e}")
+        self._entries = entries
+        return entries
 
-        logger.debug(f"Discovered {len(themes)} themes in {dir_path}")
-        return themes
+    @staticmethod
+    def _key(file_path: Path) -> str:
+        """Get the entry key for a theme file."""
+        return os.path.abspath(file_path)
+
+    @staticmethod
+    def file_digest(file_path: Union[str, Path]) -> str:
+        """Get the content digest of a theme file."""
+        return hashlib.blake2b(Path(file_path).read_bytes(), digest_size=16).hexdigest()
+
+    def lookup(
+        self, file_path: Union[str, Path], stat: Optional[os.stat_result] = None
+    ) -> Optional[dict[str, Any]]:
+        """Get cached theme data for a file if the file is unchanged.
+
+        Args:
+            file_path: Theme file path
+            stat: Result of stat() for the file, if already available
+
+        Returns:
+            Theme data as produced by Theme.to_dict(), or None on a miss
+
+        """
+        path = Path(file_path)
+        with self._lock:
+            key = self._key(path)
+            entry = self._load_entries().get(key)
+            if entry is None:
+                return None
+
+            try:
+                stat = stat or path.stat()
+                if entry["size"] == stat.st_size:
+                    if entry["mtime_ns"] == stat.st_mtime_ns:
+                        return entry["theme"]
+
+                    # Touched or rewritten with the same content
+                    if self.file_digest(path) == entry["digest"]:
+                        entry["mtime_ns"] = stat.st_mtime_ns
+                        self._dirty = True
+                        return entry["theme"]
+            except (OSError, KeyError):
+                pass
+
+            self.invalidate(path)
+            return None
+
+    def store(
+        self, file_path: Union[str, Path], theme: Theme, stat: Optional[os.stat_result] = None
+    ) -> bool:
+        """Cache a theme loaded from a file.
+
+        Args:
+            file_path: Theme file path
+            theme: Theme loaded (and validated) from the file
+            stat: Result of stat() for the file taken before loading
+
+        Returns:
+            True if the theme was cached
+
+        """
+        path = Path(file_path)
+        try:
+            stat = stat or path.stat()
+            entry = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "digest": self.file_digest(path),
+                "theme": theme.to_dict(),
+            }
+            # Only plain data can be cached (e.g. not YAML timestamps)
+            marshal.dumps(entry)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Not caching theme from {path}: {e}")
+            return False
+
+        with self._lock:
+            self._load_entries()[self._key(path)] = entry
+            self._dirty = True
+        return True
+
+    def invalidate(self, file_path: Union[str, Path]) -> bool:
+        """Drop the entry for a theme file.
+
+        Args:
+            file_path: Theme file path
+
+        Returns:
+            True if an entry was removed
+
+        """
+        with self._lock:
+            removed = self._load_entries().pop(self._key(Path(file_path)), None) is not None
+            self._dirty = self._dirty or removed
+            return removed
+
+    def prune_directory(self, directory: Union[str, Path], keep: set[str]) -> int:
+        """Drop entries of files in directory that no longer exist.
+
+        Args:
+            directory: Directory that was scanned
+            keep: Absolute paths of the files still present
+
+        Returns:
+            Number of entries removed
+
+        """
+        prefix = os.path.join(os.path.abspath(directory), "")
+        with self._lock:
+            entries = self._load_entries()
+            stale = [key for key in entries if key.startswith(prefix) and key not in keep]
+            for key in stale:
+                del entries[key]
+            self._dirty = self._dirty or bool(stale)
+            return len(stale)
+
+    def save(self) -> bool:
+        """Write the cache file if it changed.
+
+        Returns:
+            True if the file was written
+
+        """
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return False
+
+            try:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+                tmp_path.write_bytes(self._header() + marshal.dumps(self._entries))
+                os.replace(tmp_path, self._path)
+                self._dirty = False
+                logger.debug(f"Saved {len(self._entries)} entries to {self._path}")
+                return True
+            except Exception as e:
+                logger.warning(f"Failed to save theme discovery cache {self._path}: {e}")
+                return False
+
+    def clear(self) -> None:
+        """Drop all entries and remove the cache file."""
+        with self._lock:
+            self._entries = {}
+            self._dirty = False
+            try:
+                self._path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Failed to remove theme discovery cache {self._path}: {e}")
+
+    def __len__(self) -> int:
+        """Get the number of cached theme files."""
+        with self._lock:
+            return len(self._load_entries())
 
 
 class ThemeRepository:
@@ -612,6 +996,7 @@ class ThemeRepository:
         discovery: Optional[ThemeDiscovery] = None,
         builtin_manager: Optional[BuiltinThemeManager] = None,
         use_discovery_cache: bool = True,
+        discovery_cache: Optional[ThemeDiscoveryCache] = None,
     ):
         """Initialize theme repository.
 
@@ -620,6 +1005,7 @@ class ThemeRepository:
             discovery: Theme discovery service
             builtin_manager: Built-in theme manager
             use_discovery_cache: Whether to cache theme discovery results
+            discovery_cache: Discovery cache to use (creates default if None)
 
         """
         self._themes: dict[str, Theme] = {}
@@ -631,6 +1017,18 @@ class ThemeRepository:
         self._lock = threading.RLock()
         self._aliases: dict[str, str] = {}  # Theme name aliases
         self._use_discovery_cache = use_discovery_cache
+        self._discovery_cache: Optional[ThemeDiscoveryCache] = None
+        if use_discovery_cache:
+            self._discovery_cache = (
+                discovery_cache if discovery_cache is not None else ThemeDiscoveryCache()
+            )
+        # Discovered themes not built yet: cached theme data or an unloaded theme file
+        self._pending_themes: dict[str, Union[dict[str, Any], Path]] = {}
+        # Themes hidden by a pending theme of the same name, oldest first; the
+        # latest is restored if the pending theme fails to load
+        self._shadowed_themes: dict[
+            str, list[tuple[Union[Theme, dict[str, Any], Path], ThemeMetadata]]
+        ] = {}
 
         # Load built-in themes
         self._load_builtin_themes()
@@ -638,142 +1036,213 @@ class ThemeRepository:
         # Auto-discover package and user themes
         self._discover_package_themes()
         self._discover_user_themes()
+        if self._discovery_cache is not None:
+            self._discovery_cache.save()
 
         logger.debug("ThemeRepository initialized")
 
-    def _get_discovery_cache_key(self, directory: Path) -> str:
-        """Get QSettings key for directory discovery cache.
-
-        Args:
-            directory: Directory path
-
-        Returns:
-            QSettings key string
-
-        """
-        return f"theme_discovery/{directory.as_posix()}"
+    def _discover_directory(
+        self, directory: Path
+    ) -> list[tuple[str, Union[dict[str, Any], Path], Path, str]]:
+        """Index theme files in directory without loading them.
 
-    def _is_discovery_cache_valid(self, directory: Path) -> bool:
-        """Check if discovery cache is valid for directory.
+        Unchanged files are served from the discovery cache. Other files only
+        get a quick index read for their name; loading and validation happen
+        on first get_theme() or in load_pending_themes().
 
         Args:
-            directory: Directory to check
+            directory: Directory to scan (not recursive)
 
         Returns:
-            True if cache is valid (directory unchanged since last scan)
+            List of (theme name, cached theme data or file path, file path, version)
 
         """
-        if not self._use_discovery_cache:
-            return False
-
-        if not directory.exists():
-            return False
+        cache = self._discovery_cache
+        discovered = []
+        seen = set()
 
-        try:
-            from PySide6.QtCore import QSettings
-
-            settings = QSettings("VFWidgets", "ThemeSystem")
-            cache_key = self._get_discovery_cache_key(directory)
+        for file_path in self._discovery.find_theme_files(directory, recursive=False):
+            seen.add(os.path.abspath(file_path))
+            try:
+                data = cache.lookup(file_path) if cache is not None else None
+                if data is not None:
+                    name = data.get("name", "unnamed")
+                    discovered.append((name, data, file_path, data.get("version", "1.0.0")))
+                    continue
 
-            # Get cached mtime
-            cached_mtime = settings.value(f"{cache_key}/mtime", type=float)
-            if cached_mtime is None:
-                return False
+                index = self._discovery.read_theme_index(file_path)
+                discovered.append((index["name"], file_path, file_path, index["version"]))
+            except Exception as e:
+                logger.warning(f"Failed to index theme file {file_path}: {e}")
 
-            # Get current directory mtime
-            current_mtime = directory.stat().st_mtime
+        if cache is not None:
+            cache.prune_directory(directory, seen)
 
-            # Cache is valid if mtime matches
-            is_valid = abs(current_mtime - cached_mtime) < 1.0  # 1 second tolerance
-            if is_valid:
-                logger.debug(f"Discovery cache valid for: {directory}")
-            else:
-                logger.debug(
-                    f"Discovery cache stale for: {directory} "
-                    f"(cached={cached_mtime}, current={current_mtime})"
-                )
+        return discovered
 
-            return is_valid
+    def _register_discovered_theme(
+        self, name: str, source: Union[dict[str, Any], Path], file_path: Path, version: str
+    ) -> None:
+        """Register a discovered theme, overriding any theme with the same name.
 
-        except Exception as e:
-            logger.warning(f"Failed to check discovery cache for {directory}: {e}")
-            return False
+        Args:
+            name: Theme name
+            source: Cached theme data or theme file, built on first use
+            file_path: File the theme was discovered in
+            version: Theme version
 
-    def _load_themes_from_cache(self, directory: Path) -> list[Theme]:
-        """Load themes from discovery cache.
+        """
+        previous = self._themes.pop(name, None)
+        if previous is None:
+            previous = self._pending_themes.get(name)
+        if previous is not None and name in self._metadata:
+            self._shadowed_themes.setdefault(name, []).append((previous, self._metadata[name]))
+
+        self._pending_themes[name] = source
+        self._cache.invalidate(name)
+
+        self._metadata[name] = ThemeMetadata(
+            name=name,
+            version=version,
+            file_path=file_path,
+            loaded_time=time.time(),
+            access_count=0,
+            last_accessed=0.0,
+        )
+
+    def _materialize_pending_theme(self, name: str) -> Optional[Theme]:
+        """Build a discovered theme that has not been loaded yet.
 
         Args:
-            directory: Directory to load cached themes for
+            name: Theme name
 
         Returns:
-            List of themes loaded from cache
+            Theme, or None if the theme is not pending or fails to load
 
         """
+        source = self._pending_themes.get(name)
+        if source is None:
+            return None
+
         try:
-            from PySide6.QtCore import QSettings
+            if isinstance(source, Path):
+                theme = self._discovery.load_theme_file(source)
+            else:
+                # Cached data was validated when the theme file was first loaded
+                theme = Theme.from_dict(source, trusted=True)
+        except Exception as e:
+            logger.warning(f"Failed to load discovered theme '{name}': {e}")
+            self._drop_pending_theme(name, source)
+            # Fall back to the theme it shadowed, if any
+            return self._themes.get(name) or self._materialize_pending_theme(name)
+
+        self._install_pending_theme(name, source, theme)
+        if self._discovery_cache is not None and isinstance(source, Path):
+            self._discovery_cache.save()
+        return theme
 
-            settings = QSettings("VFWidgets", "ThemeSystem")
-            cache_key = self._get_discovery_cache_key(directory)
+    def _install_pending_theme(
+        self, name: str, source: Union[dict[str, Any], Path], theme: Theme
+    ) -> bool:
+        """Replace a pending theme with its loaded theme.
 
-            # Get cached theme data
-            cached_data = settings.value(f"{cache_key}/themes", type=list)
-            if not cached_data:
-                return []
+        Args:
+            name: Theme name
+            source: Pending source the theme was loaded from
+            theme: Loaded theme
 
-            themes = []
-            for theme_dict in cached_data:
-                try:
-                    theme = Theme.from_dict(theme_dict)
-                    themes.append(theme)
-                except Exception as e:
-                    logger.warning(f"Failed to load cached theme: {e}")
+        Returns:
+            True if the theme was still pending from the same source
 
-            logger.debug(f"Loaded {len(themes)} themes from cache for: {directory}")
-            return themes
+        """
+        if self._pending_themes.get(name) is not source:
+            return False
 
-        except Exception as e:
-            logger.warning(f"Failed to load themes from cache for {directory}: {e}")
-            return []
+        del self._pending_themes[name]
+        self._shadowed_themes.pop(name, None)
+        self._themes[name] = theme
+        if name in self._metadata:
+            # The index may not have had the version
+            self._metadata[name].version = theme.version
+        if self._discovery_cache is not None and isinstance(source, Path):
+            self._discovery_cache.store(source, theme)
+        return True
+
+    def _drop_pending_theme(self, name: str, source: Union[dict[str, Any], Path]) -> None:
+        """Forget a pending theme that failed to load, restoring what it shadowed."""
+        if self._pending_themes.get(name) is not source:
+            return
+        del self._pending_themes[name]
+        self._metadata.pop(name, None)
 
-    def _save_themes_to_cache(
-        self, directory: Path, themes: list[Theme], dir_mtime: Optional[float] = None
-    ) -> None:
-        """Save themes to discovery cache.
+        shadowed = self._shadowed_themes.get(name)
+        if not shadowed:
+            return
+        previous, metadata = shadowed.pop()
+        if not shadowed:
+            del self._shadowed_themes[name]
+        if isinstance(previous, Theme):
+            self._themes[name] = previous
+        else:
+            self._pending_themes[name] = previous
+        self._metadata[name] = metadata
+        logger.debug(f"Restored theme '{name}' shadowed by an invalid theme file")
+
+    def load_pending_themes(self, max_workers: Optional[int] = None) -> "Future[int]":
+        """Load discovered theme files in the background.
+
+        Theme files found by the startup index scan are loaded and validated
+        on a thread pool, so later get_theme() calls are served from memory.
+        Themes requested before their background load finishes are simply
+        loaded on demand.
 
         Args:
-            directory: Directory to cache themes for
-            themes: List of themes to cache
-            dir_mtime: Directory mtime to cache (uses current if None)
+            max_workers: Thread pool size (default: DISCOVERY_MAX_WORKERS)
+
+        Returns:
+            Future resolving to the number of themes loaded
 
         """
-        if not self._use_discovery_cache:
-            return
+        result: Future[int] = Future()
+        with self._lock:
+            pending = [
+                (name, source)
+                for name, source in self._pending_themes.items()
+                if isinstance(source, Path)
+            ]
 
-        try:
-            from PySide6.QtCore import QSettings
+        if not pending:
+            result.set_result(0)
+            return result
 
-            settings = QSettings("VFWidgets", "ThemeSystem")
-            cache_key = self._get_discovery_cache_key(directory)
+        progress = {"remaining": len(pending), "loaded": 0}
 
-            # Save directory mtime (use provided or get current)
-            if dir_mtime is not None:
-                mtime_to_save = dir_mtime
-            elif directory.exists():
-                mtime_to_save = directory.stat().st_mtime
-            else:
-                return  # Can't cache non-existent directory
+        def finished(name: str, source: Path, future: "Future[Theme]") -> None:
+            with self._lock:
+                try:
+                    if self._install_pending_theme(name, source, future.result()):
+                        progress["loaded"] += 1
+                except Exception as e:
+                    logger.warning(f"Failed to load theme from {source}: {e}")
+                    self._drop_pending_theme(name, source)
 
-            settings.setValue(f"{cache_key}/mtime", mtime_to_save)
+                progress["remaining"] -= 1
+                if progress["remaining"]:
+                    return
+                if self._discovery_cache is not None:
+                    self._discovery_cache.save()
 
-            # Save theme data (as list of dicts)
-            theme_data = [theme.to_dict() for theme in themes]
-            settings.setValue(f"{cache_key}/themes", theme_data)
-            settings.sync()
+            logger.debug(f"Loaded {progress['loaded']} discovered themes in background")
+            result.set_result(progress["loaded"])
 
-            logger.debug(f"Saved {len(themes)} themes to cache for: {directory}")
+        workers = min(len(pending), max_workers or DISCOVERY_MAX_WORKERS)
+        executor = ThreadPoolExecutor(workers, thread_name_prefix="theme-loader")
+        for name, source in pending:
+            future = executor.submit(self._discovery.load_theme_file, source)
+            future.add_done_callback(lambda f, n=name, s=source: finished(n, s, f))
+        executor.shutdown(wait=False)
 
-        except Exception as e:
-            logger.warning(f"Failed to save themes to cache for {directory}: {e}")
+        return result
 
     def _load_builtin_themes(self) -> None:
         """Load built-in themes into repository."""
@@ -803,37 +1272,17 @@ class ThemeRepository:
                 logger.debug(f"Package themes directory not found: {package_dir}")
                 return
 
-            # Check if we can use cached discovery results
-            if self._is_discovery_cache_valid(package_dir):
-                logger.debug(f"Using cached package themes from: {package_dir}")
-                themes = self._load_themes_from_cache(package_dir)
-            else:
-                # Capture directory mtime BEFORE discovery
-                dir_mtime = package_dir.stat().st_mtime
-                logger.debug(f"Discovering package themes in: {package_dir}")
-                themes = self._discovery.discover_in_directory(package_dir, recursive=False)
-                # Save to cache with pre-discovery mtime
-                self._save_themes_to_cache(package_dir, themes, dir_mtime)
-
-            for theme in themes:
+            logger.debug(f"Discovering package themes in: {package_dir}")
+            for name, source, file_path, version in self._discover_directory(package_dir):
                 # Package themes override built-in themes with same name
-                self._themes[theme.name] = theme
-                self._metadata[theme.name] = ThemeMetadata(
-                    name=theme.name,
-                    version=theme.version,
-                    file_path=str(package_dir),
-                    loaded_time=time.time(),
-                    access_count=0,
-                    last_accessed=0.0,
-                )
-                self._cache.put(theme.name, theme)
-                logger.debug(f"Loaded package theme: {theme.name}")
+                self._register_discovered_theme(name, source, file_path, version)
+                logger.debug(f"Loaded package theme: {name}")
 
                 # Create aliases for package themes
                 # "dark-default.json" -> alias: "dark-default"
-                theme_filename = Path(theme.name).stem if "." in theme.name else theme.name
-                if theme_filename != theme.name:
-                    self._add_alias(theme_filename, theme.name)
+                theme_filename = Path(name).stem if "." in name else name
+                if theme_filename != name:
+                    self._add_alias(theme_filename, name)
 
         except Exception as e:
             logger.error(f"Error discovering package themes: {e}")
@@ -850,31 +1299,11 @@ class ThemeRepository:
                 if not theme_dir.exists():
                     continue
 
-                # Check if we can use cached discovery results
-                if self._is_discovery_cache_valid(theme_dir):
-                    logger.debug(f"Using cached user themes from: {theme_dir}")
-                    themes = self._load_themes_from_cache(theme_dir)
-                else:
-                    # Capture directory mtime BEFORE discovery
-                    dir_mtime = theme_dir.stat().st_mtime
-                    logger.debug(f"Discovering user themes in: {theme_dir}")
-                    themes = self._discovery.discover_in_directory(theme_dir, recursive=False)
-                    # Save to cache with pre-discovery mtime
-                    self._save_themes_to_cache(theme_dir, themes, dir_mtime)
-
-                for theme in themes:
+                logger.debug(f"Discovering user themes in: {theme_dir}")
+                for name, source, file_path, version in self._discover_directory(theme_dir):
                     # User themes have highest priority, override everything
-                    self._themes[theme.name] = theme
-                    self._metadata[theme.name] = ThemeMetadata(
-                        name=theme.name,
-                        version=theme.version,
-                        file_path=str(theme_dir),
-                        loaded_time=time.time(),
-                        access_count=0,
-                        last_accessed=0.0,
-                    )
-                    self._cache.put(theme.name, theme)
-                    logger.debug(f"Loaded user theme: {theme.name} from {theme_dir}")
+                    self._register_discovered_theme(name, source, file_path, version)
+                    logger.debug(f"Loaded user theme: {name} from {theme_dir}")
 
             except Exception as e:
                 logger.error(f"Error discovering themes in {theme_dir}: {e}")
@@ -916,6 +1345,8 @@ class ThemeRepository:
         """
         with self._lock:
             self._themes[theme.name] = theme
+            self._pending_themes.pop(theme.name, None)
+            self._shadowed_themes.pop(theme.name, None)
             self._metadata[theme.name] = ThemeMetadata(
                 name=theme.name,
                 version=theme.version,
@@ -953,9 +1384,11 @@ class ThemeRepository:
                 self._update_access_metadata(resolved_name)
                 return cached_theme
 
-            # Check repository
-            if resolved_name in self._themes:
-                theme = self._themes[resolved_name]
+            # Check repository, building themes restored from the discovery cache
+            theme = self._themes.get(resolved_name) or self._materialize_pending_theme(
+                resolved_name
+            )
+            if theme is not None:
                 self._cache.put(resolved_name, theme)
                 self._update_access_metadata(resolved_name)
                 return theme
@@ -975,7 +1408,20 @@ class ThemeRepository:
         with self._lock:
             # Resolve alias if present
             resolved_name = self._aliases.get(name, name)
-            return resolved_name in self._themes
+            return resolved_name in self._themes or resolved_name in self._pending_themes
+
+    def is_theme_loaded(self, name: str) -> bool:
+        """Check if a theme is built, as opposed to discovered but not loaded yet.
+
+        Args:
+            name: Theme name or alias
+
+        Returns:
+            True if the theme exists and has been loaded
+
+        """
+        with self._lock:
+            return self._aliases.get(name, name) in self._themes
 
     def remove_theme(self, name: str) -> bool:
         """Remove theme from repository.
@@ -988,8 +1434,10 @@ class ThemeRepository:
 
         """
         with self._lock:
-            if name in self._themes:
-                del self._themes[name]
+            if name in self._themes or name in self._pending_themes:
+                self._themes.pop(name, None)
+                self._pending_themes.pop(name, None)
+                self._shadowed_themes.pop(name, None)
                 if name in self._metadata:
                     del self._metadata[name]
                 self._cache.invalidate(name)
@@ -1005,7 +1453,9 @@ class ThemeRepository:
 
         """
         with self._lock:
-            return list(self._themes.keys())
+            return list(self._themes.keys()) + [
+                name for name in self._pending_themes if name not in self._themes
+            ]
 
     def clear_themes(self) -> None:
         """Clear all themes from repository (except built-ins)."""
@@ -1021,6 +1471,8 @@ class ThemeRepository:
                     builtin_metadata[name] = self._metadata[name]
 
             self._themes = builtin_themes
+            self._pending_themes = {}
+            self._shadowed_themes = {}
             self._metadata = builtin_metadata
             self._cache.clear()
 
@@ -1043,6 +1495,8 @@ class ThemeRepository:
 
         with self._lock:
             self._themes[theme.name] = theme
+            self._pending_themes.pop(theme.name, None)
+            self._shadowed_themes.pop(theme.name, None)
             self._metadata[theme.name] = ThemeMetadata(
                 name=theme.name,
                 version=theme.version,
@@ -1106,7 +1560,7 @@ class ThemeRepository:
         # Add discovered themes to repository
         with self._lock:
             for theme in themes:
-                if theme.name not in self._themes:
+                if not self.has_theme(theme.name):
                     self._themes[theme.name] = theme
                     self._metadata[theme.name] = ThemeMetadata(
                         name=theme.name,
@@ -1133,11 +1587,13 @@ class ThemeRepository:
 
             total_access_count = sum(meta.access_count for meta in self._metadata.values())
             builtin_count = sum(1 for meta in self._metadata.values() if meta.file_path is None)
+            total_themes = len(self._themes) + len(self._pending_themes)
 
             return {
-                "total_themes": len(self._themes),
+                "total_themes": total_themes,
                 "builtin_themes": builtin_count,
-                "loaded_themes": len(self._themes) - builtin_count,
+                "loaded_themes": total_themes - builtin_count,
+                "pending_themes": len(self._pending_themes),
                 "total_access_count": total_access_count,
                 "cache_stats": cache_stats,
             }
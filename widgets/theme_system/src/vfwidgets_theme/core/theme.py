@@ -10,6 +10,7 @@ Key Classes:
 - ThemeValidator: JSON schema validation
 - ThemeComposer: Intelligent theme merging
 - PropertyResolver: Fast property lookup with caching
+- CompiledProperties: Frozen, fully resolved theme properties
 - TokenColors: Syntax highlighting token support
 
 Design Principles:
@@ -23,13 +24,19 @@ Design Principles:
 Implemented in Task 7.
 """
 
+import hashlib
 import json
 import re
 import threading
+import warnings
+import weakref
+from collections import OrderedDict
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
 
 from ..errors import (
     FontPropertyError,
@@ -43,6 +50,9 @@ from ..logging import get_debug_logger
 # Import foundation modules
 from ..protocols import ColorValue, PropertyKey, PropertyValue
 
+if TYPE_CHECKING:
+    from .token_scopes import TokenScopeResolver
+
 # Type aliases for clarity
 ColorPalette = dict[str, ColorValue]
 StyleProperties = dict[str, Any]
@@ -89,6 +99,28 @@ NAMED_COLORS = {
 
 logger = get_debug_logger(__name__)
 
+# Compiled token color scope selectors per theme, built on first use. Kept off
+# the dataclass so themes stay copyable and picklable (the resolver holds a lock).
+_TOKEN_SCOPES: "weakref.WeakKeyDictionary[Theme, TokenScopeResolver]" = weakref.WeakKeyDictionary()
+
+# Set while constructing themes from already-validated data (see Theme.from_trusted)
+_TRUSTED_CONSTRUCTION: ContextVar[bool] = ContextVar("trusted_theme_construction", default=False)
+
+
+def _structural_hash(value: Any) -> int:
+    """Order-independent hash of nested theme data (dicts, lists, scalars)."""
+    if isinstance(value, dict):
+        try:
+            return hash(frozenset(value.items()))
+        except TypeError:
+            return hash(frozenset((k, _structural_hash(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return hash(tuple(_structural_hash(v) for v in value))
+    try:
+        return hash(value)
+    except TypeError:
+        return hash(repr(value))
+
 
 @dataclass(frozen=True)
 class Theme:
@@ -105,6 +137,9 @@ class Theme:
     - JSON serialization/deserialization support
     - Hash-based equality for performance
     - VSCode theme format compatibility
+
+    Themes built from data that has already been validated (discovery cache,
+    composition of existing themes) can skip validation with from_trusted().
     """
 
     name: str
@@ -116,11 +151,14 @@ class Theme:
     fonts: FontPalette = field(default_factory=dict)
     type: str = "light"  # light, dark, or high-contrast
 
-    # Cached hash for performance
+    # Hash computed on first use and cached
     _hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate theme data after creation."""
+        if _TRUSTED_CONSTRUCTION.get():
+            return
+
         logger.debug(f"Creating theme: {self.name}")
 
         # Validate name
@@ -154,9 +192,6 @@ class Theme:
         # Validate fonts
         self._validate_fonts()
 
-        # Cache hash for performance
-        object.__setattr__(self, "_hash", self._compute_hash())
-
         logger.debug(f"Successfully created theme: {self.name} v{self.version}")
 
     def _is_valid_color(self, color: str) -> bool:
@@ -288,23 +323,60 @@ class Theme:
                 if not isinstance(value, (int, float)):
                     raise FontPropertyError(key, "Must be a number (int or float)", type(value).__name__)
 
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> "Theme":
+        """Create a theme from already-validated data without re-validating it.
+
+        Only use this for data that came out of a validated Theme, e.g. the
+        discovery cache or a composition of existing themes.
+
+        Args:
+            **fields: Theme fields, as accepted by the constructor
+
+        Returns:
+            New theme
+
+        """
+        token = _TRUSTED_CONSTRUCTION.set(True)
+        try:
+            return cls(**fields)
+        finally:
+            _TRUSTED_CONSTRUCTION.reset(token)
+
     def _compute_hash(self) -> int:
         """Compute consistent hash for the theme."""
-        # Create deterministic hash from theme content
-        content = {
-            "name": self.name,
-            "version": self.version,
-            "colors": sorted(self.colors.items()),
-            "styles": sorted(self.styles.items()),
-            "metadata": sorted(self.metadata.items()),
-            "type": self.type,
-        }
-        content_str = json.dumps(content, sort_keys=True)
-        return hash(content_str)
+        # Structural digest of the theme content, independent of key order
+        return hash(
+            (
+                self.name,
+                self.version,
+                self.type,
+                _structural_hash(self.colors),
+                _structural_hash(self.styles),
+                _structural_hash(self.metadata),
+            )
+        )
 
     def __hash__(self) -> int:
-        """Return cached hash."""
-        return self._hash or 0
+        """Return cached hash, computing it on first use."""
+        if self._hash is None:
+            object.__setattr__(self, "_hash", self._compute_hash())
+        return self._hash
+
+    @property
+    def token_scopes(self) -> "TokenScopeResolver":
+        """Scope selector engine for token_colors, compiled on first use.
+
+        Resolves the style of a TextMate scope stack without scanning the
+        token color list, e.g.
+        ``theme.token_scopes.resolve(["source.python", "comment.line"])``.
+        """
+        resolver = _TOKEN_SCOPES.get(self)
+        if resolver is None:
+            from .token_scopes import TokenScopeResolver
+
+            resolver = _TOKEN_SCOPES.setdefault(self, TokenScopeResolver(self.token_colors))
+        return resolver
 
     def get_color(self, key: str, fallback: Optional[ColorValue] = None) -> ColorValue:
         """Get color value with fallback support."""
@@ -356,9 +428,19 @@ class Theme:
         }
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "Theme":
-        """Create theme from dictionary."""
-        return cls(
+    def from_dict(cls, data: dict[str, Any], trusted: bool = False) -> "Theme":
+        """Create theme from dictionary.
+
+        Args:
+            data: Theme data, as produced by to_dict()
+            trusted: Skip validation for data from an already-validated theme
+
+        Returns:
+            New theme
+
+        """
+        factory = cls.from_trusted if trusted else cls
+        return factory(
             name=data.get("name", "unnamed"),
             version=data.get("version", "1.0.0"),
             type=data.get("type", "light"),
@@ -598,15 +680,24 @@ class ThemeBuilder:
         logger.debug("Rolled back to checkpoint")
         return self
 
-    def build(self) -> Theme:
-        """Build immutable theme with validation."""
+    def build(self, trusted: bool = False) -> Theme:
+        """Build immutable theme with validation.
+
+        Args:
+            trusted: Skip validation when all data comes from validated themes
+
+        Returns:
+            New theme
+
+        """
         try:
             # Add parent reference to metadata if exists
             metadata = dict(self.metadata)
             if self._parent is not None:
                 metadata["parent_theme"] = self._parent.name
 
-            theme = Theme(
+            factory = Theme.from_trusted if trusted else Theme
+            theme = factory(
                 name=self.name,
                 version=self.version,
                 type=self.type,
@@ -1053,45 +1144,10 @@ class ThemeValidator:
             https://www.w3.org/TR/WCAG21/#dfn-relative-luminance
 
         """
-        # Parse hex color
-        if not color or not isinstance(color, str):
-            return 0.5  # Default for invalid colors
-
-        color = color.strip()
-        if not color.startswith("#"):
-            return 0.5  # Default for invalid colors
-
-        hex_color = color.lstrip("#")
-
-        if len(hex_color) == 3:
-            # Expand shorthand: #abc -> #aabbcc
-            hex_color = "".join(c * 2 for c in hex_color)
-
-        if len(hex_color) not in (6, 8):  # Allow 8 for rgba
-            return 0.5  # Default for invalid colors
-
-        try:
-            r = int(hex_color[0:2], 16) / 255.0
-            g = int(hex_color[2:4], 16) / 255.0
-            b = int(hex_color[4:6], 16) / 255.0
-        except (ValueError, IndexError):
-            return 0.5
-
-        # Apply gamma correction
-        def gamma_correct(c):
-            if c <= 0.03928:
-                return c / 12.92
-            else:
-                return ((c + 0.055) / 1.055) ** 2.4
-
-        r = gamma_correct(r)
-        g = gamma_correct(g)
-        b = gamma_correct(b)
+        from .contrast import relative_luminance
 
-        # Calculate luminance
-        luminance = 0.2126 * r + 0.7152 * g + 0.0722 * b
-
-        return luminance
+        luminance = relative_luminance(color)
+        return 0.5 if luminance is None else luminance  # Default for invalid colors
 
     def get_available_properties(self, prefix: str) -> list[str]:
         """Get list of available properties with given prefix.
@@ -1228,7 +1284,7 @@ class ThemeComposer:
             name = f"composed_{'_'.join(theme_names)}"
 
         # Check cache
-        cache_key = f"{name}_{'_'.join(str(t._hash) for t in themes)}"
+        cache_key = f"{name}_{'_'.join(str(hash(t)) for t in themes)}"
         with self._cache_lock:
             if cache_key in self._composition_cache:
                 logger.debug(f"Returning cached composition: {cache_key}")
@@ -1264,8 +1320,8 @@ class ThemeComposer:
         builder.add_metadata("composed_from", [t.name for t in themes])
         builder.add_metadata("composition_order", [t.name for t in themes])
 
-        # Build composed theme
-        composed = builder.build()
+        # Build composed theme; every value comes from an already-validated theme
+        composed = builder.build(trusted=True)
 
         # Cache result
         with self._cache_lock:
@@ -1368,6 +1424,46 @@ class ThemeComposer:
             logger.debug("Cleared composition cache")
 
 
+@dataclass(frozen=True)
+class CompiledProperties:
+    """Fully resolved theme properties produced by PropertyResolver.compile().
+
+    Every color and string style of the theme is resolved once, in reference
+    order, so lookups are plain dictionary reads. Keys that take part in a
+    reference cycle (or depend on one) are listed in ``circular`` instead.
+
+    The result is keyed by a stable content digest and can be persisted with
+    to_dict() and restored with from_dict() in a later session.
+    """
+
+    theme_name: str
+    digest: str
+    colors: MappingProxyType
+    styles: MappingProxyType
+    circular: frozenset = frozenset()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "theme_name": self.theme_name,
+            "digest": self.digest,
+            "colors": dict(self.colors),
+            "styles": dict(self.styles),
+            "circular": sorted(list(node) for node in self.circular),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CompiledProperties":
+        """Create from a dictionary produced by to_dict()."""
+        return cls(
+            theme_name=data["theme_name"],
+            digest=data["digest"],
+            colors=MappingProxyType(dict(data["colors"])),
+            styles=MappingProxyType(dict(data["styles"])),
+            circular=frozenset(tuple(node) for node in data.get("circular", ())),
+        )
+
+
 class PropertyResolver:
     """Fast property lookup with caching and reference resolution.
 
@@ -1379,17 +1475,35 @@ class PropertyResolver:
     - Property reference resolution (@property syntax)
     - Computed property support (calc() expressions)
     - Inheritance chain resolution
-    - LRU caching for performance
+    - Whole-theme compilation into frozen lookup tables
     - Circular reference detection
     """
 
-    def __init__(self, theme: Theme, max_cache_size: int = 1000):
-        """Initialize resolver with theme and cache size."""
+    # Compiled themes shared by all resolvers, keyed by theme generation
+    _compiled_cache: "OrderedDict[tuple[str, int], CompiledProperties]" = OrderedDict()
+    _compiled_cache_size = 32
+    _compiled_cache_lock = threading.RLock()
+
+    def __init__(self, theme: Theme, max_cache_size: Optional[int] = None):
+        """Initialize resolver with theme.
+
+        Args:
+            theme: Theme to resolve properties of
+            max_cache_size: Deprecated and ignored. Resolved values live in
+                the compiled tables, which hold the whole theme; the number
+                of compiled themes kept is bounded by the class attribute
+                ``_compiled_cache_size``.
+
+        """
+        if max_cache_size is not None:
+            warnings.warn(
+                "PropertyResolver(max_cache_size=...) is deprecated and ignored: "
+                "properties are resolved from compiled tables of the whole theme",
+                DeprecationWarning,
+                stacklevel=2,
+            )
         self.theme = theme
-        self._cache: dict[str, Any] = {}
-        self._resolving: set[str] = set()  # Circular reference detection
-        self._cache_lock = threading.RLock()
-        self._max_cache_size = max_cache_size
+        self._compiled: Optional[CompiledProperties] = None
 
         # Precompile reference patterns
         self._ref_pattern = re.compile(r"@([a-zA-Z][a-zA-Z0-9_.-]*)")
@@ -1397,122 +1511,270 @@ class PropertyResolver:
 
         logger.debug(f"Created PropertyResolver for theme: {theme.name}")
 
-    @lru_cache(maxsize=1000)
-    def get_color(self, key: str, fallback: Optional[str] = None) -> str:
-        """Get color with caching and reference resolution."""
-        cache_key = f"color:{key}"
+    @staticmethod
+    def theme_digest(theme: Theme) -> str:
+        """Get a content digest of the theme that is stable across sessions."""
+        content = {
+            "name": theme.name,
+            "colors": theme.colors,
+            "styles": theme.styles,
+            "metadata": theme.metadata,
+        }
+        data = json.dumps(content, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
 
-        with self._cache_lock:
-            if cache_key in self._cache:
-                return self._cache[cache_key]
+    @property
+    def compiled(self) -> CompiledProperties:
+        """Get the compiled properties, compiling the theme on first use."""
+        return self._compiled or self.compile()
 
-        try:
-            # Check for circular references
-            if cache_key in self._resolving:
-                raise InvalidThemeFormatError(f"Circular reference detected for color '{key}'")
+    def compile(self) -> CompiledProperties:
+        """Resolve every color and style of the theme in one pass.
 
-            self._resolving.add(cache_key)
+        Builds the reference graph of the whole theme, detects cycles once,
+        and resolves values in topological order (including calc()
+        expressions), so each value is computed exactly once. The frozen
+        result is shared by resolvers of the same theme generation.
 
-            # Get raw value
-            if key in self.theme.colors:
-                value = self.theme.colors[key]
-            else:
-                if fallback is None:
-                    raise PropertyNotFoundError(f"Color '{key}' not found")
-                value = fallback
+        Returns:
+            Compiled, immutable property tables
 
-            # Resolve references
-            resolved = self._resolve_references(value)
+        """
+        key = (self.theme.name, hash(self.theme))
+        with self._compiled_cache_lock:
+            compiled = self._compiled_cache.get(key)
+            if compiled is not None:
+                self._compiled_cache.move_to_end(key)
+                self._compiled = compiled
+                return compiled
+
+        compiled = self._compile_theme()
+        self._store_compiled(key, compiled)
+        logger.debug(
+            f"Compiled theme '{self.theme.name}': {len(compiled.colors)} colors, "
+            f"{len(compiled.styles)} styles, {len(compiled.circular)} circular"
+        )
+        return compiled
 
-            # Cache result
-            with self._cache_lock:
-                if len(self._cache) >= self._max_cache_size:
-                    # Simple cache eviction - remove oldest 10%
-                    items_to_remove = len(self._cache) // 10
-                    for _ in range(items_to_remove):
-                        self._cache.pop(next(iter(self._cache)))
+    def load_compiled(self, data: dict[str, Any]) -> bool:
+        """Install compiled properties persisted by an earlier session.
 
-                self._cache[cache_key] = resolved
+        Args:
+            data: Dictionary produced by CompiledProperties.to_dict()
 
-            return resolved
+        Returns:
+            True if the data matches this theme and was installed
 
-        finally:
-            self._resolving.discard(cache_key)
+        """
+        try:
+            compiled = CompiledProperties.from_dict(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Ignoring invalid compiled properties: {e}")
+            return False
 
-    @lru_cache(maxsize=1000)
-    def get_style(self, key: str, fallback: Optional[Any] = None) -> Any:
-        """Get style with caching and reference resolution."""
-        cache_key = f"style:{key}"
+        if compiled.digest != self.theme_digest(self.theme):
+            return False
 
-        with self._cache_lock:
-            if cache_key in self._cache:
-                return self._cache[cache_key]
+        self._store_compiled((self.theme.name, hash(self.theme)), compiled)
+        return True
 
-        try:
-            # Check for circular references
-            if cache_key in self._resolving:
-                raise InvalidThemeFormatError(f"Circular reference detected for style '{key}'")
+    def _store_compiled(self, key: tuple[str, int], compiled: CompiledProperties) -> None:
+        """Remember compiled properties for this resolver and the shared cache."""
+        with self._compiled_cache_lock:
+            self._compiled_cache[key] = compiled
+            while len(self._compiled_cache) > self._compiled_cache_size:
+                self._compiled_cache.popitem(last=False)
+        self._compiled = compiled
+
+    def _compile_theme(self) -> CompiledProperties:
+        """Build the reference graph and resolve it in topological order."""
+        raw: dict[tuple[str, str], Any] = {}
+        for key, value in self.theme.colors.items():
+            raw[("color", key)] = value
+        for key, value in self.theme.styles.items():
+            raw[("style", key)] = value
+
+        # Edges: node -> nodes its value references
+        graph: dict[tuple[str, str], list[tuple[str, str]]] = {}
+        for node, value in raw.items():
+            deps = []
+            if isinstance(value, str) and "@" in value:
+                for ref in self._ref_pattern.findall(value):
+                    target = self._reference_target(ref)
+                    if target[0] in ("color", "style") and target[:2] in raw:
+                        deps.append(target[:2])
+            graph[node] = deps
+
+        order, circular = self._topological_order(graph)
+
+        resolved: dict[tuple[str, str], Any] = {}
+
+        def lookup(ref: str) -> str:
+            target = self._reference_target(ref)
+            kind = target[0]
+            if kind in ("color", "style"):
+                node = target[:2]
+                if node in resolved:
+                    return str(resolved[node])
+                return target[2]
+            if kind == "metadata":
+                return target[1]
+            logger.warning(f"Unresolved reference: @{ref}")
+            return f"@{ref}"
+
+        for node in order:
+            resolved[node] = self._substitute_references(raw[node], lookup)
+
+        colors = {key: value for (kind, key), value in resolved.items() if kind == "color"}
+        styles = {key: value for (kind, key), value in resolved.items() if kind == "style"}
+        return CompiledProperties(
+            theme_name=self.theme.name,
+            digest=self.theme_digest(self.theme),
+            colors=MappingProxyType(colors),
+            styles=MappingProxyType(styles),
+            circular=frozenset(circular),
+        )
 
-            self._resolving.add(cache_key)
+    @staticmethod
+    def _topological_order(graph: dict) -> tuple[list, set]:
+        """Order nodes so that dependencies come first.
 
-            # Get raw value
-            if key in self.theme.styles:
-                value = self.theme.styles[key]
-            else:
-                if fallback is None:
-                    raise PropertyNotFoundError(f"Style '{key}' not found")
-                value = fallback
+        Args:
+            graph: Mapping of node to the nodes it depends on
 
-            # Resolve references if string
-            if isinstance(value, str):
-                resolved = self._resolve_references(value)
-            else:
-                resolved = value
+        Returns:
+            Tuple of (resolvable nodes in dependency order, circular nodes).
+            Circular nodes include every node that depends on a cycle.
 
-            # Cache result
-            with self._cache_lock:
-                if len(self._cache) >= self._max_cache_size:
-                    # Simple cache eviction
-                    items_to_remove = len(self._cache) // 10
-                    for _ in range(items_to_remove):
-                        self._cache.pop(next(iter(self._cache)))
+        """
+        order = []
+        circular = set()
+        state: dict = {}  # node -> 1 while on the DFS path, 2 when finished
+
+        for root in graph:
+            if root in state:
+                continue
+            state[root] = 1
+            path = [root]
+            stack = [iter(graph[root])]
+            while stack:
+                for dep in stack[-1]:
+                    if dep not in state:
+                        state[dep] = 1
+                        path.append(dep)
+                        stack.append(iter(graph[dep]))
+                        break
+                    if state[dep] == 1:
+                        # Back edge: every node on the path from dep is in the cycle
+                        circular.update(path[path.index(dep) :])
+                else:
+                    node = path.pop()
+                    stack.pop()
+                    state[node] = 2
+                    if node in circular or any(dep in circular for dep in graph[node]):
+                        circular.add(node)
+                    else:
+                        order.append(node)
 
-                self._cache[cache_key] = resolved
+        return order, circular
 
-            return resolved
+    def _reference_target(self, ref: str) -> tuple:
+        """Map a reference name to what it points at.
 
-        finally:
-            self._resolving.discard(cache_key)
+        Returns:
+            ("color" | "style", key, fallback), ("metadata", value) or
+            ("unresolved",)
+
+        """
+        # Handle path references (colors.primary)
+        if "." in ref:
+            parts = ref.split(".")
+            if parts[0] == "colors" and len(parts) == 2:
+                return ("color", parts[1], f"#{parts[1]}")
+            elif parts[0] == "styles" and len(parts) == 2:
+                return ("style", parts[1], f"value-{parts[1]}")
+
+        # Simple reference - try colors first, then styles, then metadata
+        if ref in self.theme.colors:
+            return ("color", ref, None)
+        elif ref in self.theme.styles:
+            return ("style", ref, None)
+        elif ref in self.theme.metadata:
+            return ("metadata", str(self.theme.metadata[ref]))
+        return ("unresolved",)
+
+    def _check_circular(self, kind: str, key: str) -> None:
+        """Raise if a key is part of, or depends on, a reference cycle."""
+        if (kind, key) in self.compiled.circular:
+            raise InvalidThemeFormatError(
+                f"{kind.capitalize()} '{key}' depends on a circular reference"
+            )
+
+    @lru_cache(maxsize=1000)
+    def get_color(self, key: str, fallback: Optional[str] = None) -> str:
+        """Get color with caching and reference resolution."""
+        compiled = self.compiled
+        if key in compiled.colors:
+            return compiled.colors[key]
+        self._check_circular("color", key)
+
+        if key in self.theme.colors:
+            return self._resolve_references(self.theme.colors[key])
+        if fallback is None:
+            raise PropertyNotFoundError(f"Color '{key}' not found")
+        return self._resolve_references(fallback)
+
+    @lru_cache(maxsize=1000)
+    def get_style(self, key: str, fallback: Optional[Any] = None) -> Any:
+        """Get style with caching and reference resolution."""
+        compiled = self.compiled
+        if key in compiled.styles:
+            return compiled.styles[key]
+        self._check_circular("style", key)
+
+        if key in self.theme.styles:
+            value = self.theme.styles[key]
+        else:
+            if fallback is None:
+                raise PropertyNotFoundError(f"Style '{key}' not found")
+            value = fallback
+
+        # Resolve references if string
+        if isinstance(value, str):
+            return self._resolve_references(value)
+        return value
 
     def _resolve_references(self, value: str) -> str:
         """Resolve property references in value."""
-        if not isinstance(value, str) or "@" not in value:
-            return value
 
-        def replace_reference(match):
-            ref = match.group(1)
-
-            # Handle path references (colors.primary)
-            if "." in ref:
-                parts = ref.split(".")
-                if parts[0] == "colors" and len(parts) == 2:
-                    return self.get_color(parts[1], f"#{parts[1]}")
-                elif parts[0] == "styles" and len(parts) == 2:
-                    return str(self.get_style(parts[1], f"value-{parts[1]}"))
-
-            # Simple reference - try colors first, then styles, then metadata
-            if ref in self.theme.colors:
-                return self.get_color(ref)
-            elif ref in self.theme.styles:
-                return str(self.get_style(ref))
-            elif ref in self.theme.metadata:
-                return str(self.theme.metadata[ref])
+        def replace_reference(ref: str) -> str:
+            target = self._reference_target(ref)
+            kind = target[0]
+            if kind == "color":
+                return self.get_color(target[1], target[2])
+            elif kind == "style":
+                return str(self.get_style(target[1], target[2]))
+            elif kind == "metadata":
+                return target[1]
             else:
                 logger.warning(f"Unresolved reference: @{ref}")
                 return f"@{ref}"  # Return unresolved
 
+        return self._substitute_references(value, replace_reference)
+
+    def _substitute_references(self, value: Any, replace: Callable[[str], str]) -> Any:
+        """Replace all references in value, then evaluate calc() expressions.
+
+        Args:
+            value: Raw property value
+            replace: Callable returning the replacement for a reference name
+
+        """
+        if not isinstance(value, str) or "@" not in value:
+            return value
+
         # Replace all references
-        resolved = self._ref_pattern.sub(replace_reference, value)
+        resolved = self._ref_pattern.sub(lambda match: replace(match.group(1)), value)
 
         # Handle calc() expressions
         if "calc(" in resolved:
@@ -1576,9 +1838,10 @@ class PropertyResolver:
         return self._resolve_references(value)
 
     def clear_cache(self) -> None:
-        """Clear property cache."""
-        with self._cache_lock:
-            self._cache.clear()
+        """Clear property cache, including the compiled theme."""
+        with self._compiled_cache_lock:
+            self._compiled_cache.pop((self.theme.name, hash(self.theme)), None)
+        self._compiled = None
         self.get_color.cache_clear()
         self.get_style.cache_clear()
         logger.debug("Cleared property resolver cache")
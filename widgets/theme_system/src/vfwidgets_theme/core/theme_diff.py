@@ -0,0 +1,238 @@
+"""Structural comparison of themes.
+
+ThemeDiff reports which tokens changed between two versions of a theme (or
+two related themes) so updates can be propagated only to the widgets that
+depend on them:
+
+- Hot reload skips files whose content did not change
+- ThemeManager records the diff of every switch for ThemedWidget
+- Widgets whose tokens are untouched skip stylesheet regeneration
+
+Example:
+    diff = ThemeDiff.compare(old_theme, new_theme)
+    if diff.affects({"button.background", "button.foreground"}):
+        restyle_buttons()
+
+"""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Optional
+
+from .theme import Theme
+
+# Prefix of token_colors keys, which live in their own namespace
+TOKEN_COLORS_PREFIX = "tokenColors:"
+
+
+@dataclass(frozen=True)
+class SectionDiff:
+    """Added, removed and changed keys of one theme section."""
+
+    added: frozenset[str] = frozenset()
+    removed: frozenset[str] = frozenset()
+    changed: frozenset[str] = frozenset()
+
+    @classmethod
+    def compare(cls, old: Mapping[str, Any], new: Mapping[str, Any]) -> "SectionDiff":
+        """Compare two section mappings.
+
+        Args:
+            old: Section of the previous theme
+            new: Section of the new theme
+
+        Returns:
+            Section diff
+
+        """
+        if old is new or old == new:
+            return EMPTY_SECTION
+
+        old_keys = old.keys()
+        new_keys = new.keys()
+        return cls(
+            added=frozenset(new_keys - old_keys),
+            removed=frozenset(old_keys - new_keys),
+            changed=frozenset(key for key in old_keys & new_keys if old[key] != new[key]),
+        )
+
+    @property
+    def keys(self) -> frozenset[str]:
+        """All keys that differ, whether added, removed or changed."""
+        return self.added | self.removed | self.changed
+
+    def __bool__(self) -> bool:
+        """Whether any key differs."""
+        return bool(self.added or self.removed or self.changed)
+
+
+EMPTY_SECTION = SectionDiff()
+
+
+def _token_color_entries(token_colors: list[dict[str, Any]]) -> dict[str, Any]:
+    """Key token color rules by their scope so they can be compared as a mapping."""
+    entries = {}
+    for index, rule in enumerate(token_colors):
+        if not isinstance(rule, dict):
+            key = f"#{index}"
+        else:
+            scope = rule.get("scope")
+            if isinstance(scope, (list, tuple)):
+                scope = ",".join(str(part) for part in scope)
+            key = scope or rule.get("name") or f"#{index}"
+
+        # Rules repeating a scope are told apart by occurrence
+        unique_key = key
+        occurrence = 1
+        while unique_key in entries:
+            occurrence += 1
+            unique_key = f"{key}#{occurrence}"
+        entries[unique_key] = rule
+    return entries
+
+
+@dataclass(frozen=True)
+class ThemeDiff:
+    """Token-level differences between two themes.
+
+    Colors, styles and metadata share one token namespace (see
+    ColorTokenRegistry.get), fonts use their own ``fonts.*``-style keys and
+    token color rules are keyed by scope under ``tokenColors:``.
+    """
+
+    old_name: Optional[str]
+    new_name: str
+    colors: SectionDiff = EMPTY_SECTION
+    fonts: SectionDiff = EMPTY_SECTION
+    styles: SectionDiff = EMPTY_SECTION
+    metadata: SectionDiff = EMPTY_SECTION
+    token_colors: SectionDiff = EMPTY_SECTION
+    type_changed: bool = False
+    version_changed: bool = False
+    # The compared themes, for consumers checking which step the diff describes
+    old_theme: Optional[Theme] = field(default=None, compare=False, repr=False)
+    new_theme: Optional[Theme] = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def compare(cls, old: Optional[Theme], new: Theme) -> "ThemeDiff":
+        """Compare two themes.
+
+        Args:
+            old: Previous theme, or None when there was none
+            new: New theme
+
+        Returns:
+            Diff from old to new
+
+        """
+        if old is None:
+            return cls(
+                old_name=None,
+                new_name=new.name,
+                colors=SectionDiff(added=frozenset(new.colors)),
+                fonts=SectionDiff(added=frozenset(new.fonts)),
+                styles=SectionDiff(added=frozenset(new.styles)),
+                metadata=SectionDiff(added=frozenset(new.metadata)),
+                token_colors=SectionDiff(
+                    added=frozenset(_token_color_entries(new.token_colors))
+                ),
+                type_changed=True,
+                version_changed=True,
+                new_theme=new,
+            )
+
+        if old is new:
+            return cls(old_name=old.name, new_name=new.name, old_theme=old, new_theme=new)
+
+        token_colors = EMPTY_SECTION
+        if old.token_colors != new.token_colors:
+            token_colors = SectionDiff.compare(
+                _token_color_entries(old.token_colors), _token_color_entries(new.token_colors)
+            )
+
+        return cls(
+            old_name=old.name,
+            new_name=new.name,
+            colors=SectionDiff.compare(old.colors, new.colors),
+            fonts=SectionDiff.compare(old.fonts, new.fonts),
+            styles=SectionDiff.compare(old.styles, new.styles),
+            metadata=SectionDiff.compare(old.metadata, new.metadata),
+            token_colors=token_colors,
+            type_changed=old.type != new.type,
+            version_changed=old.version != new.version,
+            old_theme=old,
+            new_theme=new,
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the themes have identical content (names aside)."""
+        return not (self.has_visual_changes or self.version_changed)
+
+    @property
+    def has_visual_changes(self) -> bool:
+        """Whether any token or the theme type changed."""
+        return bool(
+            self.type_changed
+            or self.colors
+            or self.fonts
+            or self.styles
+            or self.metadata
+            or self.token_colors
+        )
+
+    @cached_property
+    def changed_tokens(self) -> frozenset[str]:
+        """All changed keys; token color scopes carry the ``tokenColors:`` prefix."""
+        tokens = self.colors.keys | self.fonts.keys | self.styles.keys | self.metadata.keys
+        if self.token_colors:
+            tokens |= {TOKEN_COLORS_PREFIX + key for key in self.token_colors.keys}
+        return frozenset(tokens)
+
+    def affects(self, tokens: Optional[Iterable[str]]) -> bool:
+        """Check whether a set of token dependencies is touched by this diff.
+
+        A token is also affected through its dotted parents (``editor`` for
+        ``editor.background``), which resolvers fall back to for nested data.
+        A theme type change affects everything because defaults depend on it.
+
+        Args:
+            tokens: Token names a consumer depends on, or None for "everything"
+
+        Returns:
+            True if the consumer has to be updated
+
+        """
+        if not self.has_visual_changes:
+            return False
+        if tokens is None or self.type_changed:
+            return True
+
+        changed = self.changed_tokens
+        for token in tokens:
+            if token in changed:
+                return True
+            parent = token
+            while "." in parent:
+                parent = parent.rsplit(".", 1)[0]
+                if parent in changed:
+                    return True
+        return False
+
+    def summary(self) -> dict[str, Any]:
+        """Get counts of added, removed and changed keys per section."""
+        summary: dict[str, Any] = {}
+        for section in ("colors", "fonts", "styles", "metadata", "token_colors"):
+            diff = getattr(self, section)
+            summary[section] = {
+                "added": len(diff.added),
+                "removed": len(diff.removed),
+                "changed": len(diff.changed),
+            }
+        summary["type_changed"] = self.type_changed
+        summary["version_changed"] = self.version_changed
+        return summary
+
+
+__all__ = ["SectionDiff", "ThemeDiff", "TOKEN_COLORS_PREFIX"]
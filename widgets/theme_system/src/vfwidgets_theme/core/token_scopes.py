@@ -0,0 +1,307 @@
+"""TextMate scope resolution for theme token colors.
+
+Theme.token_colors is a flat list of ``{"scope": ..., "settings": ...}``
+rules as found in VS Code themes. TokenScopeResolver compiles the rules once
+into a trie over dotted scope segments and resolves the style of a scope
+stack (outermost scope first, e.g. ``["source.python", "string.quoted"]``)
+the way VS Code does:
+
+- A selector scope matches a token scope at a segment boundary:
+  ``string.quoted`` matches ``string.quoted.double`` but not ``string.quotedx``
+- A selector path (``meta.function string``) matches when its last scope
+  matches the current scope and the other scopes match enclosing scopes,
+  in order
+- The rules matching a scope are applied least specific first, so each
+  setting comes from the most specific rule that sets it: the deepest
+  scope match wins, then the more specific parent scopes, then the later
+  rule
+- Settings are inherited: each scope of the stack overrides the settings
+  its matching rules set on top of the style of the enclosing scopes
+
+Resolved stacks are kept in an LRU cache. Themes build their resolver once,
+on first use of Theme.token_scopes.
+
+Example:
+    style = theme.token_scopes.resolve(["source.python", "string.quoted.double"])
+    if style.foreground:
+        text_format.setForeground(QColor(style.foreground))
+
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from typing import Any, NamedTuple, Optional, Union
+
+# Resolved scope stacks kept per resolver
+DEFAULT_SCOPE_CACHE_SIZE = 4096
+
+# Separator of excluded selectors ("source - comment")
+_EXCLUSION_SEPARATOR = re.compile(r"\s+-\s*")
+
+
+class TokenStyle(NamedTuple):
+    """Resolved style of a scope stack; None for settings no rule sets."""
+
+    foreground: Optional[str] = None
+    background: Optional[str] = None
+    font_style: Optional[str] = None
+
+    def to_settings(self) -> dict[str, str]:
+        """Convert to a token_colors ``settings`` dictionary."""
+        settings = {}
+        if self.foreground is not None:
+            settings["foreground"] = self.foreground
+        if self.background is not None:
+            settings["background"] = self.background
+        if self.font_style is not None:
+            settings["fontStyle"] = self.font_style
+        return settings
+
+
+EMPTY_STYLE = TokenStyle()
+
+
+class _ScopeRule(NamedTuple):
+    """One selector of a token color rule, compiled."""
+
+    # Specificity: (scope depth, parent scope lengths, parent count, rule index)
+    rank: tuple
+    parents: tuple[str, ...]
+    exclusions: tuple[tuple[str, ...], ...]
+    style: TokenStyle
+
+
+class _TrieNode:
+    """Node of the scope trie; one per dotted scope segment."""
+
+    __slots__ = ("children", "rules")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        # Rules whose selector ends at this node, least specific first
+        self.rules: list[_ScopeRule] = []
+
+
+def _scope_matches(selector: str, scope: str) -> bool:
+    """Check if a selector scope matches a scope at a segment boundary."""
+    return scope == selector or (scope.startswith(selector) and scope[len(selector)] == ".")
+
+
+def _path_matches(path: Sequence[str], stack: Sequence[str], end: int) -> bool:
+    """Check if selector scopes match scopes of stack[:end] in order."""
+    index = end - 1
+    for selector in reversed(path):
+        while index >= 0 and not _scope_matches(selector, stack[index]):
+            index -= 1
+        if index < 0:
+            return False
+        index -= 1
+    return True
+
+
+def _style_of(settings: Any) -> TokenStyle:
+    """Build a style from a token color rule's settings."""
+    if not isinstance(settings, dict):
+        return EMPTY_STYLE
+    return TokenStyle(
+        settings.get("foreground"), settings.get("background"), settings.get("fontStyle")
+    )
+
+
+def _merge(base: TokenStyle, override: TokenStyle) -> TokenStyle:
+    """Apply the settings an override sets on top of a base style."""
+    if base is EMPTY_STYLE:
+        return override
+    return TokenStyle(
+        override.foreground if override.foreground is not None else base.foreground,
+        override.background if override.background is not None else base.background,
+        override.font_style if override.font_style is not None else base.font_style,
+    )
+
+
+def _selectors(scope: Any) -> list[str]:
+    """Split a rule's scope (string, comma list or list of strings) into selectors."""
+    if isinstance(scope, str):
+        parts = scope.split(",")
+    elif isinstance(scope, (list, tuple)):
+        parts = [part for item in scope if isinstance(item, str) for part in item.split(",")]
+    else:
+        return []
+    return [part.strip() for part in parts if part.strip()]
+
+
+class TokenScopeResolver:
+    """Compiled TextMate scope selector engine for a theme's token colors.
+
+    Thread-safe; the trie is immutable after construction and the cache is
+    guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        token_colors: Iterable[dict[str, Any]],
+        max_cache_size: int = DEFAULT_SCOPE_CACHE_SIZE,
+    ):
+        """Compile token color rules.
+
+        Args:
+            token_colors: Rules in theme order; later rules win ties
+            max_cache_size: Resolved scope stacks kept in the LRU cache
+
+        """
+        self._root = _TrieNode()
+        self._default = EMPTY_STYLE
+        self._rule_count = 0
+        self._max_cache_size = max_cache_size
+        self._cache: OrderedDict[tuple[str, ...], TokenStyle] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        for index, rule in enumerate(token_colors):
+            if isinstance(rule, dict):
+                self._add_rule(index, rule)
+
+        self._sort_rules(self._root)
+
+    def _add_rule(self, index: int, rule: dict[str, Any]) -> None:
+        """Insert the selectors of one token color rule into the trie."""
+        style = _style_of(rule.get("settings"))
+        selectors = _selectors(rule.get("scope"))
+        if not selectors:
+            # A rule without scope sets the theme's default token style
+            if not rule.get("scope"):
+                self._default = _merge(self._default, style)
+            return
+
+        for selector in selectors:
+            included, *excluded = _EXCLUSION_SEPARATOR.split(selector)
+            path = [scope for scope in included.split() if scope != ">"]
+            if not path:
+                continue
+
+            *parents, scope = path
+            node = self._root
+            for segment in scope.split("."):
+                node = node.children.setdefault(segment, _TrieNode())
+
+            rank = (
+                scope.count(".") + 1,
+                tuple(len(parent) for parent in reversed(parents)),
+                len(parents),
+                index,
+            )
+            exclusions = tuple(
+                tuple(part for part in exclusion.split() if part != ">")
+                for exclusion in excluded
+                if exclusion.strip()
+            )
+            node.rules.append(_ScopeRule(rank, tuple(parents), exclusions, style))
+            self._rule_count += 1
+
+    def _sort_rules(self, node: _TrieNode) -> None:
+        """Order the rules of every node least specific first."""
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            current.rules.sort(key=lambda rule: rule.rank)
+            stack.extend(current.children.values())
+
+    @property
+    def rule_count(self) -> int:
+        """Number of compiled selectors."""
+        return self._rule_count
+
+    @property
+    def default_style(self) -> TokenStyle:
+        """Style of rules without a scope, applied to every stack."""
+        return self._default
+
+    def resolve(self, scopes: Union[str, Sequence[str]]) -> TokenStyle:
+        """Get the style of a scope stack.
+
+        Args:
+            scopes: Scope stack, outermost scope first; a string is split on
+                whitespace
+
+        Returns:
+            Resolved style, including inherited settings
+
+        """
+        stack = tuple(scopes.split()) if isinstance(scopes, str) else tuple(scopes)
+        return self._resolve(stack)
+
+    def _resolve(self, stack: tuple[str, ...]) -> TokenStyle:
+        """Resolve a stack through the cache; enclosing stacks are cached too."""
+        cache = self._cache
+        with self._cache_lock:
+            style = cache.get(stack)
+            if style is not None:
+                cache.move_to_end(stack)
+                self._hits += 1
+                return style
+            self._misses += 1
+
+        if not stack:
+            style = self._default
+        else:
+            style = self._resolve(stack[:-1])
+            level_style = self._level_style(stack, len(stack) - 1)
+            if level_style is not None:
+                style = _merge(style, level_style)
+
+        with self._cache_lock:
+            cache[stack] = style
+            if len(cache) > self._max_cache_size:
+                cache.popitem(last=False)
+        return style
+
+    def _level_style(self, stack: tuple[str, ...], level: int) -> Optional[TokenStyle]:
+        """Merge the rules matching the scope at one stack level.
+
+        Rules are applied least specific first, so a specific rule that sets
+        only some settings keeps the others of less specific matches.
+
+        Returns:
+            Merged style, or None if no rule matches
+
+        """
+        style = None
+        # Nodes along the scope's segments; deeper nodes match more specifically
+        node = self._root
+        for segment in stack[level].split("."):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            for rule in node.rules:
+                if rule.parents and not _path_matches(rule.parents, stack, level):
+                    continue
+                if any(_path_matches(path, stack, level + 1) for path in rule.exclusions):
+                    continue
+                style = rule.style if style is None else _merge(style, rule.style)
+        return style
+
+    def clear_cache(self) -> None:
+        """Drop resolved scope stacks."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def cache_info(self) -> dict[str, int]:
+        """Get cache size and hit statistics."""
+        with self._cache_lock:
+            return {
+                "size": len(self._cache),
+                "max_size": self._max_cache_size,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+__all__ = [
+    "DEFAULT_SCOPE_CACHE_SIZE",
+    "EMPTY_STYLE",
+    "TokenScopeResolver",
+    "TokenStyle",
+]
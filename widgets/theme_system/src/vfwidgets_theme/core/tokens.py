@@ -29,10 +29,46 @@ Categories:
 Total: ~190 tokens
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
+# Set while recording which tokens a computation reads (see record_token_reads)
+_TOKEN_READS: ContextVar[Optional[set[str]]] = ContextVar("token_reads", default=None)
+
+
+@contextmanager
+def record_token_reads() -> Iterator[set[str]]:
+    """Record the tokens looked up through ColorTokenRegistry.get.
+
+    Used to find out which tokens a computation such as stylesheet
+    generation depends on, so it can be skipped when none of them change.
+
+    Yields:
+        Set that collects the token names as they are read
+
+    Example:
+        with record_token_reads() as tokens:
+            generator.generate_comprehensive_stylesheet()
+
+    """
+    reads: set[str] = set()
+    token = _TOKEN_READS.set(reads)
+    try:
+        yield reads
+    finally:
+        _TOKEN_READS.reset(token)
+
+
+def note_token_read(token: str) -> None:
+    """Add a token read outside ColorTokenRegistry.get to the active recording."""
+    reads = _TOKEN_READS.get()
+    if reads is not None:
+        reads.add(token)
+
 
 class TokenCategory(Enum):
     """Token categories for organization."""
@@ -1677,6 +1713,10 @@ class ColorTokenRegistry:
             >>> # Returns '#0e639c' (dark default) instead of hardcoded light blue
 
         """
+        reads = _TOKEN_READS.get()
+        if reads is not None:
+            reads.add(token)
+
         # 1. Check ThemeManager overrides FIRST (v2.0.0)
         # This allows runtime color customization without modifying themes
         try:
@@ -9,10 +9,12 @@ Features:
 - QFileSystemWatcher for file monitoring
 - Debounced reload to prevent rapid reloads
 - Error recovery on bad reload attempts
+- Content hashing so saves without changes do not reload
 - Development mode toggle
 - Integration with ThemedApplication
 """
 
+import hashlib
 import logging
 import os
 import time
@@ -87,6 +89,7 @@ class ReloadEvent:
     success: bool
     error: Optional[str] = None
     reload_time_ms: Optional[float] = None
+    unchanged: bool = False  # Content was identical, nothing was reloaded
 
 
 class HotReloader(QObject):
@@ -133,11 +136,14 @@ class HotReloader(QObject):
         self.pending_reloads: set[Path] = set()
         self.reload_callback: Optional[Callable[[Path], bool]] = None
         self.last_reload_times: dict[Path, float] = {}
+        # Content digest of each watched file as last loaded
+        self.file_hashes: dict[str, str] = {}
 
         # Statistics
         self.reload_events: list[ReloadEvent] = []
         self.total_reloads = 0
         self.successful_reloads = 0
+        self.skipped_reloads = 0
 
         self.logger.info(f"HotReloader initialized with {debounce_ms}ms debounce")
 
@@ -190,6 +196,10 @@ class HotReloader(QObject):
         success = self.watcher.addPath(file_str)
         if success:
             self.watched_files[file_str] = file_path
+            # Watched files are already loaded, only later edits reload them
+            digest = self._content_hash(file_path)
+            if digest is not None:
+                self.file_hashes[file_str] = digest
             self.logger.info(f"Now watching file: {file_path}")
         else:
             self.logger.error(f"Failed to watch file: {file_path}")
@@ -259,6 +269,7 @@ class HotReloader(QObject):
         success = self.watcher.removePath(file_str)
         if success:
             del self.watched_files[file_str]
+            self.file_hashes.pop(file_str, None)
             self.logger.info(f"Stopped watching file: {file_path}")
         else:
             self.logger.error(f"Failed to stop watching file: {file_path}")
@@ -346,6 +357,8 @@ class HotReloader(QObject):
             if str(theme_file.absolute()) not in self.watched_files:
                 self.logger.info(f"New theme file detected: {theme_file}")
                 self.watch_file(theme_file)
+                # Not loaded yet, so the queued reload must not be skipped
+                self.file_hashes.pop(str(theme_file.absolute()), None)
                 self._queue_reload(theme_file)
 
     def _queue_reload(self, file_path: Path):
@@ -377,9 +390,20 @@ class HotReloader(QObject):
         for file_path in files_to_reload:
             self._reload_single_file(file_path)
 
+    def _content_hash(self, file_path: Path) -> Optional[str]:
+        """Get the digest of a file's content, or None if it cannot be read."""
+        try:
+            return hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+        except OSError as e:
+            self.logger.debug(f"Cannot hash {file_path}: {e}")
+            return None
+
     def _reload_single_file(self, file_path: Path):
         """Reload a single theme file.
 
+        Files whose content did not change since they were last loaded (saves
+        without edits, touch, editors writing twice) are skipped.
+
         Args:
             file_path: Path to theme file to reload
 
@@ -388,6 +412,22 @@ class HotReloader(QObject):
         success = False
         error_msg = None
 
+        file_str = str(file_path.absolute())
+        digest = self._content_hash(file_path)
+        if digest is not None and self.file_hashes.get(file_str) == digest:
+            self.skipped_reloads += 1
+            self._record_event(
+                ReloadEvent(
+                    file_path=file_path,
+                    timestamp=time.time(),
+                    success=True,
+                    reload_time_ms=(time.perf_counter() - start_time) * 1000,
+                    unchanged=True,
+                )
+            )
+            self.logger.debug(f"Skipped reload, content unchanged: {file_path}")
+            return
+
         try:
             if self.reload_callback:
                 self.logger.debug(f"Reloading theme: {file_path}")
@@ -396,6 +436,8 @@ class HotReloader(QObject):
                 if success:
                     self.logger.info(f"Successfully reloaded: {file_path}")
                     self.successful_reloads += 1
+                    if digest is not None:
+                        self.file_hashes[file_str] = digest
                 else:
                     error_msg = "Reload callback returned False"
                     self.logger.warning(f"Reload failed: {file_path}")
@@ -424,11 +466,7 @@ class HotReloader(QObject):
             error=error_msg,
             reload_time_ms=reload_time_ms,
         )
-        self.reload_events.append(event)
-
-        # Keep only last 100 events
-        if len(self.reload_events) > 100:
-            self.reload_events = self.reload_events[-100:]
+        self._record_event(event)
 
         # Emit signals
         self.theme_reloaded.emit(str(file_path), success)
@@ -441,6 +479,12 @@ class HotReloader(QObject):
         else:
             self.logger.debug(f"Reload time: {reload_time_ms:.2f}ms for {file_path}")
 
+    def _record_event(self, event: ReloadEvent):
+        """Record a reload event, keeping only the last 100."""
+        self.reload_events.append(event)
+        if len(self.reload_events) > 100:
+            self.reload_events = self.reload_events[-100:]
+
     def get_statistics(self) -> dict[str, Any]:
         """Get hot reload statistics."""
         success_rate = (
@@ -459,6 +503,7 @@ class HotReloader(QObject):
             "enabled": self.enabled,
             "total_reloads": self.total_reloads,
             "successful_reloads": self.successful_reloads,
+            "skipped_reloads": self.skipped_reloads,
             "success_rate": success_rate,
             "watched_files": len(self.watched_files),
             "watched_directories": len(self.watched_directories),
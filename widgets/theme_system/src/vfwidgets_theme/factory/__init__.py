@@ -7,6 +7,6 @@ This module provides flexible theme construction and composition tools:
 - Template theme system
 """
 
-from .builder import ThemeBuilder, ThemeComposer, ThemeFactory, ThemeVariantGenerator
+from .builder import ThemeBuilder, ThemeComposer, ThemeFactory, ThemeVariantGenerator, VariantSpec
 
-__all__ = ["ThemeFactory", "ThemeBuilder", "ThemeComposer", "ThemeVariantGenerator"]
+__all__ = ["ThemeFactory", "ThemeBuilder", "ThemeComposer", "ThemeVariantGenerator", "VariantSpec"]
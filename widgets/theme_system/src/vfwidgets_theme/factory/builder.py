@@ -19,10 +19,12 @@ Features:
 import copy
 import logging
 import time
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional, Union
 
 # Import core theme system
+from ..core.color_transforms import ColorTransform, PackedPalette, RGBTransform, transform_color
 from ..core.theme import Theme
 from ..core.theme import ThemeBuilder as CoreThemeBuilder
 from ..errors import ThemeError, ThemeValidationError
@@ -30,6 +32,9 @@ from ..protocols import ColorValue
 
 logger = logging.getLogger(__name__)
 
+# Channel step (0-255) by which light/dark variants lighten or darken colors
+VARIANT_COLOR_STEP = 40
+
 
 @dataclass
 class ThemeTemplate:
@@ -521,6 +526,16 @@ class ThemeComposer:
         return composed_theme
 
 
+@dataclass
+class VariantSpec:
+    """Recipe of a theme variant for ThemeVariantGenerator.create_variants()."""
+
+    name_suffix: str
+    transforms: Sequence[ColorTransform]
+    variant_type: Optional[str] = None  # None keeps the base theme's type
+    description: str = ""
+
+
 class ThemeVariantGenerator:
     """Generate theme variants (light/dark) from base themes.
 
@@ -577,8 +592,67 @@ class ThemeVariantGenerator:
         self._color_transformers[color_key] = transformer
         logger.debug(f"Registered color transformer for: {color_key}")
 
+    def create_variants(self, base_theme: Theme, specs: Iterable[VariantSpec]) -> list[Theme]:
+        """Create several variants of a theme at once.
+
+        The base theme's colors are parsed once; each variant then applies
+        its transforms to the packed palette in bulk.
+
+        Args:
+            base_theme: Base theme to create variants from
+            specs: Recipes of the variants
+
+        Returns:
+            One new theme per spec, in order
+
+        Example:
+            dimmed, high_contrast = generator.create_variants(theme, [
+                VariantSpec("_dimmed", [OKLabTransform(lightness=-0.05, chroma=0.8)]),
+                VariantSpec("_contrast", [OKLabTransform(contrast=1.3)]),
+            ])
+
+        """
+        palette = PackedPalette.from_colors(base_theme.colors)
+        return [
+            self._build_variant(
+                base_theme,
+                palette.transform(*spec.transforms).to_colors(),
+                spec.variant_type or base_theme.type,
+                spec.name_suffix,
+                spec.description,
+            )
+            for spec in specs
+        ]
+
     def _create_variant(self, base_theme: Theme, variant_type: str, name_suffix: str) -> Theme:
-        """Create a theme variant."""
+        """Create a light or dark variant."""
+        palette = PackedPalette.from_colors(base_theme.colors)
+        light = palette.light_mask()
+        dark = [not flag for flag in light]
+
+        # Dark variants push colors away from mid grey, light variants toward it
+        lighten = RGBTransform(offset=VARIANT_COLOR_STEP)
+        darken = RGBTransform(offset=-VARIANT_COLOR_STEP)
+        if variant_type == "dark":
+            palette = palette.transform(lighten, mask=light).transform(darken, mask=dark)
+        else:
+            palette = palette.transform(darken, mask=light).transform(lighten, mask=dark)
+
+        colors = palette.to_colors()
+        for key in self._color_transformers.keys() & colors.keys():
+            colors[key] = self._color_transformers[key](str(base_theme.colors[key]))
+
+        return self._build_variant(base_theme, colors, variant_type, name_suffix)
+
+    def _build_variant(
+        self,
+        base_theme: Theme,
+        colors: dict[str, ColorValue],
+        variant_type: str,
+        name_suffix: str,
+        description: str = "",
+    ) -> Theme:
+        """Build a variant theme from its transformed colors."""
         start_time = time.perf_counter()
 
         new_name = f"{base_theme.name}{name_suffix}"
@@ -586,13 +660,10 @@ class ThemeVariantGenerator:
 
         # Set variant type
         builder.set_type(variant_type)
-        builder.set_description(f"{variant_type.title()} variant of {base_theme.name}")
-
-        # Transform colors
-        if hasattr(base_theme, "colors"):
-            for key, value in base_theme.colors.items():
-                transformed_color = self._transform_color(key, value, variant_type)
-                builder.add_color(key, transformed_color)
+        builder.set_description(
+            description or f"{variant_type.title()} variant of {base_theme.name}"
+        )
+        builder.add_colors(colors)
 
         # Copy styles (they usually don't need transformation)
         if hasattr(base_theme, "styles"):
@@ -616,31 +687,6 @@ class ThemeVariantGenerator:
 
         return variant_theme
 
-    def _transform_color(
-        self, color_key: str, color_value: ColorValue, variant_type: str
-    ) -> ColorValue:
-        """Transform a color for the variant."""
-        # Use custom transformer if available
-        if color_key in self._color_transformers:
-            return self._color_transformers[color_key](str(color_value))
-
-        # Default color transformations
-        color_str = str(color_value)
-
-        # Simple transformation logic - in practice, this would be more sophisticated
-        if variant_type == "dark":
-            return (
-                self._lighten_color(color_str)
-                if self._is_light_color(color_str)
-                else self._darken_color(color_str)
-            )
-        else:  # light variant
-            return (
-                self._darken_color(color_str)
-                if self._is_light_color(color_str)
-                else self._lighten_color(color_str)
-            )
-
     def _setup_default_transformers(self):
         """Setup default color transformers."""
 
@@ -680,22 +726,12 @@ class ThemeVariantGenerator:
         return True
 
     def _lighten_color(self, color: str) -> str:
-        """Lighten a color (simplified implementation)."""
-        if color.startswith("#") and len(color) == 7:
-            r = min(255, int(color[1:3], 16) + 40)
-            g = min(255, int(color[3:5], 16) + 40)
-            b = min(255, int(color[5:7], 16) + 40)
-            return f"#{r:02x}{g:02x}{b:02x}"
-        return color
+        """Lighten a color by the variant color step."""
+        return transform_color(color, RGBTransform(offset=VARIANT_COLOR_STEP))
 
     def _darken_color(self, color: str) -> str:
-        """Darken a color (simplified implementation)."""
-        if color.startswith("#") and len(color) == 7:
-            r = max(0, int(color[1:3], 16) - 40)
-            g = max(0, int(color[3:5], 16) - 40)
-            b = max(0, int(color[5:7], 16) - 40)
-            return f"#{r:02x}{g:02x}{b:02x}"
-        return color
+        """Darken a color by the variant color step."""
+        return transform_color(color, RGBTransform(offset=-VARIANT_COLOR_STEP))
 
 
 class ThemeFactory:
@@ -825,6 +861,19 @@ class ThemeFactory:
         else:
             raise ThemeError(f"Unknown variant type: {variant_type}")
 
+    def create_variants(self, base_theme: Theme, specs: Iterable[VariantSpec]) -> list[Theme]:
+        """Create several variants of a theme at once.
+
+        Args:
+            base_theme: Base theme to create variants from
+            specs: Recipes of the variants (color transforms, suffix, type)
+
+        Returns:
+            One new theme per spec, in order
+
+        """
+        return self._variant_generator.create_variants(base_theme, specs)
+
     def compose_themes(
         self, *themes: Union[Theme, tuple[Theme, int]], name: str, description: str = ""
     ) -> Theme:
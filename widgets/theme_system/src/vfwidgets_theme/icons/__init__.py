@@ -4,15 +4,40 @@ This module provides support for icon themes including file type icons,
 folder icons, and custom icon sets. Supports both SVG icons and icon fonts.
 """
 
-from .file_associations import FileAssociationManager
-from .font_loader import IconFontLoader
-from .svg_handler import SVGIconHandler
-from .theme import IconProvider, IconTheme
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_exports
+
+# Public names are imported from their submodules on first access
+_LAZY_IMPORTS = {
+    ".file_associations": ("FileAssociationManager",),
+    ".font_loader": ("IconFontLoader",),
+    ".pixmap_cache": (
+        "IconPixmapCache",
+        "get_shared_pixmap_cache",
+    ),
+    ".svg_handler": ("SVGIconHandler",),
+    ".theme": (
+        "IconProvider",
+        "IconTheme",
+    ),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    from .file_associations import FileAssociationManager
+    from .font_loader import IconFontLoader
+    from .pixmap_cache import IconPixmapCache, get_shared_pixmap_cache
+    from .svg_handler import SVGIconHandler
+    from .theme import IconProvider, IconTheme
 
 __all__ = [
     "IconTheme",
     "IconProvider",
     "IconFontLoader",
     "SVGIconHandler",
+    "IconPixmapCache",
+    "get_shared_pixmap_cache",
     "FileAssociationManager",
 ]
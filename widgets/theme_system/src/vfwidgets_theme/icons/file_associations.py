@@ -5,13 +5,26 @@ for the icon theme system.
 """
 
 import json
+import os
 import re
+from collections.abc import Iterable
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
-from ..logging import get_logger
+from ..logging import get_debug_logger
 
-logger = get_logger(__name__)
+logger = get_debug_logger(__name__)
+
+# Resolved (filename, extension) pairs kept; the oldest are dropped first
+MAX_RESOLUTION_CACHE_SIZE = 65536
+
+
+def _extension_of(filename: str) -> str:
+    """Get the lowercased extension of a filename, as Path.suffix would."""
+    index = filename.rfind(".")
+    if 0 < index < len(filename) - 1:
+        return filename[index + 1 :].lower()
+    return ""
 
 
 class FileAssociationManager:
@@ -19,6 +32,11 @@ class FileAssociationManager:
 
     Maps file extensions and filenames to icon names, supporting
     pattern matching and priority-based resolution.
+
+    Resolutions are memoised per (filename, extension) and all patterns are
+    matched with one combined regex. The add/remove/load methods invalidate
+    both; code that edits the mapping attributes or ``resolution_order``
+    directly must call ``invalidate_cache()``.
     """
 
     def __init__(self):
@@ -38,6 +56,13 @@ class FileAssociationManager:
         # Priority order for resolution
         self.resolution_order = ["exact_filename", "pattern_match", "extension", "language"]
 
+        # Memoised resolutions ((filename, extension) -> icon_name)
+        self._resolution_cache: dict[tuple[str, str], Optional[str]] = {}
+
+        # All patterns as one alternation, built lazily; False when the
+        # patterns cannot be combined and are matched one by one
+        self._combined_pattern: Union[re.Pattern, bool, None] = None
+
         # Initialize with common defaults
         self._load_default_associations()
 
@@ -225,6 +250,7 @@ class FileAssociationManager:
         """
         ext = extension.lower().lstrip(".")
         self.extension_mappings[ext] = icon_name
+        self.invalidate_cache()
         logger.debug(f"Added extension mapping: .{ext} -> {icon_name}")
 
     def add_filename_mapping(self, filename: str, icon_name: str) -> None:
@@ -236,6 +262,7 @@ class FileAssociationManager:
 
         """
         self.filename_mappings[filename] = icon_name
+        self.invalidate_cache()
         logger.debug(f"Added filename mapping: {filename} -> {icon_name}")
 
     def add_pattern_mapping(self, pattern: str, icon_name: str) -> None:
@@ -249,6 +276,7 @@ class FileAssociationManager:
         try:
             compiled_pattern = re.compile(pattern, re.IGNORECASE)
             self.pattern_mappings.append((compiled_pattern, icon_name))
+            self.invalidate_cache()
             logger.debug(f"Added pattern mapping: {pattern} -> {icon_name}")
         except re.error as e:
             logger.error(f"Invalid regex pattern '{pattern}': {e}")
@@ -262,8 +290,18 @@ class FileAssociationManager:
 
         """
         self.language_mappings[language.lower()] = icon_name
+        self.invalidate_cache()
         logger.debug(f"Added language mapping: {language} -> {icon_name}")
 
+    def invalidate_cache(self) -> None:
+        """Drop memoised resolutions and the combined pattern.
+
+        Called by the mapping methods; call it after changing the mapping
+        attributes or ``resolution_order`` directly.
+        """
+        self._resolution_cache.clear()
+        self._combined_pattern = None
+
     def get_icon_for_file(self, file_path: Path) -> Optional[str]:
         """Get icon name for file path using resolution order.
 
@@ -277,6 +315,45 @@ class FileAssociationManager:
         filename = file_path.name
         extension = file_path.suffix.lstrip(".").lower()
 
+        key = (filename, extension)
+        try:
+            return self._resolution_cache[key]
+        except KeyError:
+            pass
+
+        icon_name = self._resolve(file_path, filename, extension)
+        self._remember(key, icon_name)
+        return icon_name
+
+    def resolve_many(self, paths: Iterable[Union[str, Path]]) -> list[Optional[str]]:
+        """Get icon names for many files in one pass.
+
+        Meant for file explorers annotating a whole directory listing: the
+        filename and extension are taken from strings without building Path
+        objects, and repeated names are resolved once.
+
+        Args:
+            paths: File paths or names
+
+        Returns:
+            Icon name (or None) per path, in input order
+
+        """
+        cache = self._resolution_cache
+        icon_names = []
+        for path in paths:
+            filename = path.name if isinstance(path, Path) else os.path.basename(path)
+            key = (filename, _extension_of(filename))
+            icon_name = cache.get(key, cache)
+            if icon_name is cache:
+                file_path = path if isinstance(path, Path) else Path(path)
+                icon_name = self._resolve(file_path, *key)
+                self._remember(key, icon_name)
+            icon_names.append(icon_name)
+        return icon_names
+
+    def _resolve(self, file_path: Path, filename: str, extension: str) -> Optional[str]:
+        """Resolve an icon name following the resolution order."""
         for method in self.resolution_order:
             icon_name = None
 
@@ -296,6 +373,13 @@ class FileAssociationManager:
 
         return None
 
+    def _remember(self, key: tuple[str, str], icon_name: Optional[str]) -> None:
+        """Memoise a resolution, dropping the oldest once the cache is full."""
+        cache = self._resolution_cache
+        if len(cache) >= MAX_RESOLUTION_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = icon_name
+
     def get_icon_for_filename(self, filename: str) -> Optional[str]:
         """Get icon name for exact filename.
 
@@ -331,11 +415,44 @@ class FileAssociationManager:
             Icon name or None
 
         """
+        if not self.pattern_mappings:
+            return None
+
+        combined = self._combined_pattern
+        if combined is None:
+            combined = self._combined_pattern = self._combine_patterns()
+        if combined is not False:
+            match = combined.match(filename)
+            return self.pattern_mappings[match.lastindex - 1][1] if match else None
+
         for pattern, icon_name in self.pattern_mappings:
             if pattern.match(filename):
                 return icon_name
         return None
 
+    def _combine_patterns(self) -> Union[re.Pattern, bool]:
+        """Build one regex trying every pattern in order.
+
+        Alternatives are tried left to right, so the first matching pattern
+        wins as in a linear scan; the matching alternative is identified by
+        its group number. Patterns with groups of their own (which would
+        shift group numbers and backreferences) are not combined.
+
+        Returns:
+            Combined regex, or False to match patterns one by one
+
+        """
+        if any(pattern.groups for pattern, _ in self.pattern_mappings):
+            return False
+        try:
+            return re.compile(
+                "|".join(f"({pattern.pattern})" for pattern, _ in self.pattern_mappings),
+                re.IGNORECASE,
+            )
+        except re.error as e:
+            logger.debug(f"Matching patterns one by one, cannot combine them: {e}")
+            return False
+
     def detect_language(self, file_path: Path) -> Optional[str]:
         """Detect programming language from file.
 
@@ -484,6 +601,7 @@ class FileAssociationManager:
         ext = extension.lower().lstrip(".")
         if ext in self.extension_mappings:
             del self.extension_mappings[ext]
+            self.invalidate_cache()
             logger.debug(f"Removed extension mapping: .{ext}")
             return True
         return False
@@ -500,6 +618,7 @@ class FileAssociationManager:
         """
         if filename in self.filename_mappings:
             del self.filename_mappings[filename]
+            self.invalidate_cache()
             logger.debug(f"Removed filename mapping: {filename}")
             return True
         return False
@@ -510,6 +629,7 @@ class FileAssociationManager:
         self.filename_mappings.clear()
         self.pattern_mappings.clear()
         self.language_mappings.clear()
+        self.invalidate_cache()
         logger.info("Cleared all file associations")
 
     def get_statistics(self) -> dict[str, int]:
@@ -520,4 +640,5 @@ class FileAssociationManager:
             "pattern_mappings": len(self.pattern_mappings),
             "language_mappings": len(self.language_mappings),
             "total_unique_icons": len(self.get_all_icon_names()),
+            "cached_resolutions": len(self._resolution_cache),
         }
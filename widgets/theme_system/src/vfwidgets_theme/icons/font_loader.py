@@ -6,12 +6,12 @@ Handles loading icon fonts and creating QIcon objects from font characters.
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import QSize, Qt
-from PyQt6.QtGui import QColor, QFont, QFontDatabase, QIcon, QPainter, QPen, QPixmap
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QColor, QFont, QFontDatabase, QIcon, QPainter, QPen, QPixmap
 
-from ..logging import get_logger
+from ..logging import get_debug_logger
 
-logger = get_logger(__name__)
+logger = get_debug_logger(__name__)
 
 
 class IconFontLoader:
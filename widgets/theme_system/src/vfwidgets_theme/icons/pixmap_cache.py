@@ -0,0 +1,191 @@
+"""Memory-bounded LRU cache of rendered icons.
+
+Rendered icons are keyed by everything that affects their pixels: the
+source file and its modification time, the logical size, the device pixel
+ratio and the recolor applied. Editing an icon on disk changes its mtime,
+so stale renders are never returned; they simply age out of the cache.
+
+Entries are stored as QImage when they were rendered off the GUI thread
+(QPixmap may only be created on the GUI thread) and converted to QPixmap
+the first time they are requested.
+
+One cache is shared by all SVG icon handlers, so icon theme providers that
+load the same file reuse each other's renders.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple, Optional, Union
+
+from PySide6.QtGui import QImage, QPixmap
+
+from ..logging import get_debug_logger
+
+logger = get_debug_logger(__name__)
+
+# Default memory budget of the shared cache
+DEFAULT_PIXMAP_CACHE_BYTES = 32 * 1024 * 1024
+
+
+class IconCacheKey(NamedTuple):
+    """Identity of one rendered icon."""
+
+    path: str
+    mtime_ns: int
+    width: int
+    height: int
+    device_pixel_ratio: float
+    color: Optional[str]
+
+
+def _entry_bytes(image: Union[QImage, QPixmap]) -> int:
+    """Estimate the memory of a rendered icon (32-bit ARGB)."""
+    return image.width() * image.height() * 4
+
+
+class IconPixmapCache:
+    """Thread-safe LRU cache of rendered icons with a byte budget.
+
+    ``put`` may be called from any thread; ``get`` converts images to
+    pixmaps and must be called from the GUI thread.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_PIXMAP_CACHE_BYTES):
+        """Initialize an empty cache.
+
+        Args:
+            max_bytes: Memory budget; least recently used icons are evicted
+                once it is exceeded
+
+        """
+        self._entries: OrderedDict[IconCacheKey, Union[QImage, QPixmap]] = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """Memory budget in bytes."""
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        with self._lock:
+            self._max_bytes = value
+            self._evict()
+
+    def get(self, key: IconCacheKey) -> Optional[QPixmap]:
+        """Get a rendered icon, marking it recently used.
+
+        Args:
+            key: Icon identity
+
+        Returns:
+            Pixmap or None if the icon is not cached
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            if isinstance(entry, QPixmap):
+                return entry
+
+        # Converted outside the lock; a racing conversion just does it twice
+        pixmap = QPixmap.fromImage(entry)
+        with self._lock:
+            if self._entries.get(key) is entry:
+                self._entries[key] = pixmap
+        return pixmap
+
+    def contains(self, key: IconCacheKey) -> bool:
+        """Check if an icon is cached without affecting its recency."""
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key: IconCacheKey, image: Union[QImage, QPixmap]) -> None:
+        """Cache a rendered icon.
+
+        Args:
+            key: Icon identity
+            image: Rendered icon; a QImage when rendered off the GUI thread
+
+        """
+        size = _entry_bytes(image)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= _entry_bytes(previous)
+            if size > self._max_bytes:
+                return
+            self._entries[key] = image
+            self._bytes += size
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used icons until the budget is met; lock held."""
+        while self._bytes > self._max_bytes and self._entries:
+            _, image = self._entries.popitem(last=False)
+            self._bytes -= _entry_bytes(image)
+            self._evictions += 1
+
+    def invalidate_path(self, path: Any) -> int:
+        """Drop every render of one source file.
+
+        Args:
+            path: Source file path
+
+        Returns:
+            Number of dropped icons
+
+        """
+        path = str(path)
+        with self._lock:
+            keys = [key for key in self._entries if key.path == path]
+            for key in keys:
+                self._bytes -= _entry_bytes(self._entries.pop(key))
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached icons."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        logger.debug("Icon pixmap cache cleared")
+
+    def get_statistics(self) -> dict[str, int]:
+        """Get cache size and hit statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    def __len__(self) -> int:
+        """Get the number of cached icons."""
+        return len(self._entries)
+
+
+# Cache shared by all SVG icon handlers
+_shared_cache: Optional[IconPixmapCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_pixmap_cache() -> IconPixmapCache:
+    """Get the process-wide icon cache shared by icon providers."""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = IconPixmapCache()
+    return _shared_cache
@@ -3,32 +3,69 @@
 Provides SVG loading, color customization, and caching capabilities.
 """
 
+import threading
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import QByteArray, QSize, Qt
-from PyQt6.QtGui import QIcon, QPainter, QPixmap
-from PyQt6.QtSvg import QSvgRenderer
+from PySide6.QtCore import QByteArray, QSize, Qt
+from PySide6.QtGui import QGuiApplication, QIcon, QImage, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
 
-from ..logging import get_logger
+from ..logging import get_debug_logger
+from .pixmap_cache import IconCacheKey, IconPixmapCache, get_shared_pixmap_cache
 
-logger = get_logger(__name__)
+logger = get_debug_logger(__name__)
+
+# Recolored SVG sources kept; each is a few KB of XML
+MAX_RECOLORED_SOURCES = 512
+
+# Worker threads rendering icons in preload_icons()
+PRELOAD_MAX_WORKERS = 4
+
+
+def _default_device_pixel_ratio() -> float:
+    """Get the device pixel ratio of the running application."""
+    app = QGuiApplication.instance()
+    return float(app.devicePixelRatio()) if app is not None else 1.0
 
 
 class SVGIconHandler:
     """Handles loading and rendering SVG icons.
 
     Provides SVG icon loading with color customization and caching.
+    Rendered icons are cached by (path, mtime, size, device pixel ratio,
+    color) in an IconPixmapCache, shared by all handlers unless one is
+    passed in, so a repeated request neither parses nor renders the SVG.
     """
 
-    def __init__(self):
-        """Initialize SVG icon handler."""
-        self._svg_cache: dict[str, QByteArray] = {}
-        self._renderer_cache: dict[str, QSvgRenderer] = {}
+    def __init__(self, pixmap_cache: Optional[IconPixmapCache] = None):
+        """Initialize SVG icon handler.
+
+        Args:
+            pixmap_cache: Cache for rendered icons (default: the shared cache)
+
+        """
+        self._svg_cache: dict[str, tuple[int, QByteArray]] = {}
+        self._recolored_cache: OrderedDict[tuple[str, int, str], QByteArray] = OrderedDict()
+        self._source_lock = threading.Lock()
+        # An empty cache is falsy (__len__), so compare against None
+        self._pixmap_cache = pixmap_cache if pixmap_cache is not None else get_shared_pixmap_cache()
+
+    @property
+    def pixmap_cache(self) -> IconPixmapCache:
+        """Cache rendered icons are stored in."""
+        return self._pixmap_cache
 
     def load_svg_icon(
-        self, svg_path: Path, size: Optional[QSize] = None, color: Optional[str] = None
+        self,
+        svg_path: Path,
+        size: Optional[QSize] = None,
+        color: Optional[str] = None,
+        device_pixel_ratio: Optional[float] = None,
     ) -> Optional[QIcon]:
         """Load SVG icon from file.
 
@@ -36,61 +73,146 @@ class SVGIconHandler:
             svg_path: Path to SVG file
             size: Desired icon size
             color: Color to apply to icon (hex format)
+            device_pixel_ratio: Render scale (default: the application's)
 
         Returns:
             QIcon object or None if loading fails
 
         """
-        if not svg_path.exists():
-            logger.error(f"SVG file not found: {svg_path}")
-            return None
-
         if size is None:
             size = QSize(16, 16)
 
         try:
-            # Load SVG content
-            svg_content = self._load_svg_content(svg_path)
-            if not svg_content:
-                return None
+            pixmap = self._get_pixmap(svg_path, size, color, device_pixel_ratio)
+            return QIcon(pixmap) if pixmap is not None else None
+
+        except Exception as e:
+            logger.error(f"Error loading SVG icon {svg_path}: {e}")
+            return None
 
-            # Apply color modification if requested
-            if color:
-                svg_content = self._modify_svg_color(svg_content, color)
+    def _cache_key(
+        self,
+        svg_path: Path,
+        size: QSize,
+        color: Optional[str],
+        device_pixel_ratio: Optional[float],
+    ) -> Optional[IconCacheKey]:
+        """Build the cache key of a render, or None if the file is missing."""
+        try:
+            mtime_ns = svg_path.stat().st_mtime_ns
+        except OSError:
+            logger.error(f"SVG file not found: {svg_path}")
+            return None
 
-            # Create cache key
-            cache_key = f"{svg_path}_{size.width()}x{size.height()}_{color or 'default'}"
+        if device_pixel_ratio is None:
+            device_pixel_ratio = _default_device_pixel_ratio()
+        return IconCacheKey(
+            str(svg_path), mtime_ns, size.width(), size.height(), device_pixel_ratio, color
+        )
+
+    def _get_pixmap(
+        self,
+        svg_path: Path,
+        size: QSize,
+        color: Optional[str],
+        device_pixel_ratio: Optional[float],
+    ) -> Optional[QPixmap]:
+        """Get a rendered icon from the cache, rendering it on a miss."""
+        key = self._cache_key(svg_path, size, color, device_pixel_ratio)
+        if key is None:
+            return None
 
-            # Get or create renderer
-            renderer = self._get_renderer(cache_key, svg_content)
-            if not renderer or not renderer.isValid():
-                logger.error(f"Invalid SVG content in: {svg_path}")
-                return None
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is not None:
+            return pixmap
 
-            # Render to pixmap
-            pixmap = self._render_to_pixmap(renderer, size)
-            if pixmap.isNull():
-                logger.error(f"Failed to render SVG: {svg_path}")
-                return None
+        image = self._render_image(key)
+        if image is None:
+            return None
 
-            return QIcon(pixmap)
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.isNull():
+            logger.error(f"Failed to render SVG: {svg_path}")
+            return None
 
-        except Exception as e:
-            logger.error(f"Error loading SVG icon {svg_path}: {e}")
+        self._pixmap_cache.put(key, pixmap)
+        return pixmap
+
+    def _render_image(self, key: IconCacheKey) -> Optional[QImage]:
+        """Render an icon to an image; safe to call from worker threads."""
+        svg_content = self._get_svg_data(Path(key.path), key.mtime_ns, key.color)
+        if not svg_content:
             return None
 
-    def _load_svg_content(self, svg_path: Path) -> Optional[QByteArray]:
-        """Load SVG content from file."""
+        renderer = QSvgRenderer(svg_content)
+        if not renderer.isValid():
+            logger.error(f"Invalid SVG content in: {key.path}")
+            return None
+
+        ratio = key.device_pixel_ratio
+        image = QImage(
+            max(1, round(key.width * ratio)),
+            max(1, round(key.height * ratio)),
+            QImage.Format.Format_ARGB32_Premultiplied,
+        )
+        image.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        renderer.render(painter)
+        painter.end()
+
+        image.setDevicePixelRatio(ratio)
+        return image
+
+    def _get_svg_data(
+        self, svg_path: Path, mtime_ns: int, color: Optional[str]
+    ) -> Optional[QByteArray]:
+        """Get SVG content, recolored if a color is given."""
+        svg_content = self._load_svg_content(svg_path, mtime_ns)
+        if not svg_content or not color:
+            return svg_content
+
+        key = (str(svg_path), mtime_ns, color)
+        with self._source_lock:
+            recolored = self._recolored_cache.get(key)
+            if recolored is not None:
+                self._recolored_cache.move_to_end(key)
+                return recolored
+
+        recolored = self._modify_svg_color(svg_content, color)
+        with self._source_lock:
+            self._recolored_cache[key] = recolored
+            while len(self._recolored_cache) > MAX_RECOLORED_SOURCES:
+                self._recolored_cache.popitem(last=False)
+        return recolored
+
+    def _load_svg_content(
+        self, svg_path: Path, mtime_ns: Optional[int] = None
+    ) -> Optional[QByteArray]:
+        """Load SVG content from file.
+
+        Args:
+            svg_path: Path to SVG file
+            mtime_ns: Known modification time; cached content from another
+                modification time is reloaded
+
+        """
         cache_key = str(svg_path)
-        if cache_key in self._svg_cache:
-            return self._svg_cache[cache_key]
+        with self._source_lock:
+            cached = self._svg_cache.get(cache_key)
+        if cached is not None and (mtime_ns is None or cached[0] == mtime_ns):
+            return cached[1]
 
         try:
+            if mtime_ns is None:
+                mtime_ns = svg_path.stat().st_mtime_ns
             with open(svg_path, "rb") as f:
                 content = f.read()
 
             svg_content = QByteArray(content)
-            self._svg_cache[cache_key] = svg_content
+            with self._source_lock:
+                self._svg_cache[cache_key] = (mtime_ns, svg_content)
             return svg_content
 
         except Exception as e:
@@ -171,36 +293,12 @@ class SVGIconHandler:
 
         return ";".join(modified_parts)
 
-    def _get_renderer(self, cache_key: str, svg_content: QByteArray) -> Optional[QSvgRenderer]:
-        """Get or create SVG renderer."""
-        if cache_key in self._renderer_cache:
-            return self._renderer_cache[cache_key]
-
-        try:
-            renderer = QSvgRenderer(svg_content)
-            if renderer.isValid():
-                self._renderer_cache[cache_key] = renderer
-                return renderer
-
-        except Exception as e:
-            logger.error(f"Error creating SVG renderer: {e}")
-
-        return None
-
-    def _render_to_pixmap(self, renderer: QSvgRenderer, size: QSize) -> QPixmap:
-        """Render SVG to pixmap."""
-        pixmap = QPixmap(size)
-        pixmap.fill(Qt.GlobalColor.transparent)
-
-        painter = QPainter(pixmap)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        renderer.render(painter)
-        painter.end()
-
-        return pixmap
-
     def create_multi_size_icon(
-        self, svg_path: Path, sizes: list, color: Optional[str] = None
+        self,
+        svg_path: Path,
+        sizes: list,
+        color: Optional[str] = None,
+        device_pixel_ratio: Optional[float] = None,
     ) -> Optional[QIcon]:
         """Create icon with multiple sizes from SVG.
 
@@ -208,19 +306,20 @@ class SVGIconHandler:
             svg_path: Path to SVG file
             sizes: List of QSize objects
             color: Color to apply
+            device_pixel_ratio: Render scale (default: the application's)
 
         Returns:
             QIcon with multiple sizes
 
         """
         if not sizes:
-            return self.load_svg_icon(svg_path, QSize(16, 16), color)
+            return self.load_svg_icon(svg_path, QSize(16, 16), color, device_pixel_ratio)
 
         try:
             icon = QIcon()
 
             for size in sizes:
-                pixmap = self._create_pixmap_from_svg(svg_path, size, color)
+                pixmap = self._get_pixmap(svg_path, size, color, device_pixel_ratio)
                 if pixmap and not pixmap.isNull():
                     icon.addPixmap(pixmap)
 
@@ -230,22 +329,75 @@ class SVGIconHandler:
             logger.error(f"Error creating multi-size icon: {e}")
             return None
 
-    def _create_pixmap_from_svg(
-        self, svg_path: Path, size: QSize, color: Optional[str]
-    ) -> Optional[QPixmap]:
-        """Create single pixmap from SVG."""
-        svg_content = self._load_svg_content(svg_path)
-        if not svg_content:
-            return None
+    def preload_icons(
+        self,
+        icons: Iterable[tuple[Path, Optional[str]]],
+        sizes: Optional[list] = None,
+        device_pixel_ratio: Optional[float] = None,
+        max_workers: Optional[int] = None,
+    ) -> "Future[int]":
+        """Render icons into the cache on worker threads.
 
-        if color:
-            svg_content = self._modify_svg_color(svg_content, color)
+        Meant for an incoming icon theme: its icons are rendered to QImage
+        in the background, so the switch itself only converts cached images
+        to pixmaps. Icons already cached are skipped.
 
-        renderer = QSvgRenderer(svg_content)
-        if not renderer.isValid():
-            return None
+        Args:
+            icons: (SVG path, color or None) pairs
+            sizes: Sizes to render each icon at (default: 16x16)
+            device_pixel_ratio: Render scale (default: the application's)
+            max_workers: Thread pool size (default: PRELOAD_MAX_WORKERS)
+
+        Returns:
+            Future resolving to the number of icons rendered
 
-        return self._render_to_pixmap(renderer, size)
+        """
+        if device_pixel_ratio is None:
+            device_pixel_ratio = _default_device_pixel_ratio()
+
+        keys = []
+        for svg_path, color in icons:
+            for size in sizes or [QSize(16, 16)]:
+                key = self._cache_key(Path(svg_path), size, color, device_pixel_ratio)
+                if key is not None and not self._pixmap_cache.contains(key):
+                    keys.append(key)
+        keys = list(dict.fromkeys(keys))
+
+        result: Future[int] = Future()
+        if not keys:
+            result.set_result(0)
+            return result
+
+        progress = {"remaining": len(keys), "rendered": 0}
+        progress_lock = threading.Lock()
+
+        def finished(key: IconCacheKey, future: "Future[Optional[QImage]]") -> None:
+            try:
+                image = future.result()
+            except Exception as e:
+                logger.warning(f"Failed to preload SVG icon {key.path}: {e}")
+                image = None
+            if image is not None:
+                self._pixmap_cache.put(key, image)
+
+            with progress_lock:
+                if image is not None:
+                    progress["rendered"] += 1
+                progress["remaining"] -= 1
+                if progress["remaining"]:
+                    return
+
+            logger.debug(f"Preloaded {progress['rendered']} SVG icons")
+            result.set_result(progress["rendered"])
+
+        workers = min(len(keys), max_workers or PRELOAD_MAX_WORKERS)
+        executor = ThreadPoolExecutor(workers, thread_name_prefix="icon-preload")
+        for key in keys:
+            future = executor.submit(self._render_image, key)
+            future.add_done_callback(lambda f, k=key: finished(k, f))
+        executor.shutdown(wait=False)
+
+        return result
 
     def get_svg_size(self, svg_path: Path) -> Optional[QSize]:
         """Get default size of SVG file.
@@ -293,16 +445,21 @@ class SVGIconHandler:
             return False
 
     def clear_cache(self) -> None:
-        """Clear SVG and renderer caches."""
-        self._svg_cache.clear()
-        self._renderer_cache.clear()
+        """Clear SVG source caches and the rendered icon cache."""
+        with self._source_lock:
+            self._svg_cache.clear()
+            self._recolored_cache.clear()
+        self._pixmap_cache.clear()
         logger.info("SVG caches cleared")
 
     def get_cache_info(self) -> dict[str, int]:
         """Get cache information."""
+        pixmap_stats = self._pixmap_cache.get_statistics()
         return {
             "svg_cache_size": len(self._svg_cache),
-            "renderer_cache_size": len(self._renderer_cache),
+            "recolored_cache_size": len(self._recolored_cache),
+            "pixmap_cache_size": pixmap_stats["entries"],
+            "pixmap_cache_bytes": pixmap_stats["bytes"],
         }
 
     def preload_svg(self, svg_path: Path) -> bool:
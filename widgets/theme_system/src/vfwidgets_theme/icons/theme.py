@@ -6,20 +6,21 @@ both SVG and font-based icons.
 
 import json
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional, Union
 
-from PyQt6.QtCore import QSize, Qt
-from PyQt6.QtGui import QIcon, QPixmap
+from PySide6.QtCore import QSize, Qt
+from PySide6.QtGui import QIcon, QPixmap
 
-from ..errors import ThemeSystemError
-from ..logging import get_logger
+from ..errors import ThemeLoadError
+from ..logging import get_debug_logger
 from .file_associations import FileAssociationManager
 from .font_loader import IconFontLoader
 from .svg_handler import SVGIconHandler
 
-logger = get_logger(__name__)
+logger = get_debug_logger(__name__)
 
 
 @dataclass
@@ -68,6 +69,7 @@ class SVGIconProvider(IconProvider):
         self.base_path = base_path
         self.svg_handler = SVGIconHandler()
         self._icon_cache: dict[str, QIcon] = {}
+        self._svg_files: dict[str, Path] = {}
         self._discover_icons()
 
     def _discover_icons(self):
@@ -110,6 +112,10 @@ class SVGIconProvider(IconProvider):
         """List available SVG icons."""
         return list(self._svg_files.keys())
 
+    def list_icon_files(self) -> list[Path]:
+        """List the SVG files of available icons."""
+        return list(self._svg_files.values())
+
 
 class FontIconProvider(IconProvider):
     """Icon provider for font-based icons."""
@@ -194,6 +200,10 @@ class IconTheme:
         # File associations
         self.file_associations = FileAssociationManager()
 
+        # Renders SVG icon definitions; its rendered icons are shared with
+        # the providers through the shared pixmap cache
+        self._svg_handler = SVGIconHandler()
+
         # Icon cache
         self._icon_cache: dict[str, QIcon] = {}
 
@@ -208,13 +218,13 @@ class IconTheme:
             theme_path: Path to theme directory or JSON file
 
         Raises:
-            ThemeSystemError: If theme loading fails
+            ThemeLoadError: If theme loading fails
 
         """
         logger.info(f"Loading icon theme from: {theme_path}")
 
         if not theme_path.exists():
-            raise ThemeSystemError(f"Icon theme path not found: {theme_path}")
+            raise ThemeLoadError(f"Icon theme path not found: {theme_path}")
 
         try:
             if theme_path.is_file() and theme_path.suffix == ".json":
@@ -222,13 +232,13 @@ class IconTheme:
             elif theme_path.is_dir():
                 self._load_from_directory(theme_path)
             else:
-                raise ThemeSystemError(f"Unsupported icon theme format: {theme_path}")
+                raise ThemeLoadError(f"Unsupported icon theme format: {theme_path}")
 
             logger.info(f"Successfully loaded icon theme: {self.name}")
 
         except Exception as e:
             logger.error(f"Failed to load icon theme: {e}")
-            raise ThemeSystemError(f"Icon theme loading failed: {e}")
+            raise ThemeLoadError(f"Icon theme loading failed: {e}")
 
     def _load_from_json(self, json_path: Path) -> None:
         """Load icon theme from JSON file."""
@@ -250,7 +260,7 @@ class IconTheme:
                 break
 
         if not theme_file:
-            raise ThemeSystemError("No icon theme definition file found")
+            raise ThemeLoadError("No icon theme definition file found")
 
         self._load_from_json(theme_file)
 
@@ -482,8 +492,7 @@ class IconTheme:
                 icon_path = Path(icon_def.path)
                 if icon_path.exists():
                     if icon_path.suffix.lower() == ".svg":
-                        svg_handler = SVGIconHandler()
-                        return svg_handler.load_svg_icon(icon_path, size, icon_def.color)
+                        return self._svg_handler.load_svg_icon(icon_path, size, icon_def.color)
                     else:
                         # Raster image
                         pixmap = QPixmap(str(icon_path))
@@ -587,6 +596,38 @@ class IconTheme:
 
         return False
 
+    def preload_icons(
+        self, sizes: Optional[list[QSize]] = None, device_pixel_ratio: Optional[float] = None
+    ) -> "Future[int]":
+        """Render the theme's SVG icons in the background.
+
+        Call this for an incoming icon theme before switching to it; the
+        icons are rendered on worker threads into the shared pixmap cache,
+        so the first paint after the switch does not render them.
+
+        Args:
+            sizes: Sizes to render each icon at (default: 16x16)
+            device_pixel_ratio: Render scale (default: the application's)
+
+        Returns:
+            Future resolving to the number of icons rendered
+
+        """
+        icons: dict[tuple[Path, Optional[str]], None] = {}
+        for definitions in (self.file_icons, self.folder_icons, self.language_icons):
+            for icon_def in definitions.values():
+                if icon_def.path and icon_def.path.lower().endswith(".svg"):
+                    icons[(Path(icon_def.path), icon_def.color)] = None
+        for icon_def in (self.default_file_icon, self.default_folder_icon):
+            if icon_def and icon_def.path and icon_def.path.lower().endswith(".svg"):
+                icons[(Path(icon_def.path), icon_def.color)] = None
+        for provider in self.providers:
+            if isinstance(provider, SVGIconProvider):
+                for svg_path in provider.list_icon_files():
+                    icons[(svg_path, None)] = None
+
+        return self._svg_handler.preload_icons(list(icons), sizes, device_pixel_ratio)
+
     def reload(self) -> None:
         """Reload icon theme from disk."""
         if self.theme_path:
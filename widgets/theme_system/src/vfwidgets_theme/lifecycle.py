@@ -27,7 +27,7 @@ import threading
 import time
 import weakref
 from abc import abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
 from collections.abc import Iterator
 from contextlib import contextmanager
 from enum import Enum, auto
@@ -48,6 +48,12 @@ from .protocols import ThemeableWidget, ThemeProvider
 T = TypeVar("T")
 WidgetType = TypeVar("WidgetType", bound=ThemeableWidget)
 
+# Lifecycle events kept per widget; older events are dropped
+MAX_LIFECYCLE_EVENTS_PER_WIDGET = 8
+
+# Histories of destroyed widgets kept for debugging before the oldest go
+MAX_RETAINED_HISTORIES = 1000
+
 
 class WidgetLifecycleState(Enum):
     """Widget lifecycle states for tracking."""
@@ -140,9 +146,15 @@ class WidgetRegistry:
     def __init__(self):
         """Initialize enhanced widget registry."""
         self._widgets: dict[int, weakref.ReferenceType] = {}
+        # Immutable copy of the widget references for iteration. Writers only
+        # invalidate it; the next reader rebuilds it once, so iteration during
+        # theme application takes no lock
+        self._snapshot: Optional[tuple[weakref.ReferenceType, ...]] = ()
         self._metadata: dict[int, dict[str, Any]] = {}
         self._lifecycle_events: dict[int, list[WidgetLifecycleEvent]] = {}
         self._widget_states: dict[int, WidgetLifecycleState] = {}
+        # Destroyed widgets whose history is still kept, oldest first
+        self._retired_histories: deque[int] = deque()
         self._lock = threading.RLock()  # Reentrant lock for nested calls
         self._cleanup_callbacks: list[Callable[[int], None]] = []
         self._lifecycle_callbacks: list[Callable[[WidgetLifecycleEvent], None]] = []
@@ -206,6 +218,7 @@ class WidgetRegistry:
 
                     weak_ref = weakref.ref(widget, cleanup_callback)
                     self._widgets[widget_id] = weak_ref
+                    self._snapshot = None
 
                     # Store metadata
                     if metadata:
@@ -260,6 +273,7 @@ class WidgetRegistry:
 
                 # Remove from all tracking structures
                 del self._widgets[widget_id]
+                self._snapshot = None
                 self._metadata.pop(widget_id, None)
                 self._widget_states.pop(widget_id, None)
                 self._lifecycle_events.pop(widget_id, None)
@@ -281,15 +295,9 @@ class WidgetRegistry:
             True if widget is registered and still alive.
 
         """
-        with self._lock:
-            widget_id = id(widget)
-
-            if widget_id not in self._widgets:
-                return False
-
-            # Check if weak reference is still valid
-            weak_ref = self._widgets[widget_id]
-            return weak_ref() is not None
+        # Single dict lookups are atomic, no lock needed
+        weak_ref = self._widgets.get(id(widget))
+        return weak_ref is not None and weak_ref() is not None
 
     def get_metadata(self, widget: ThemeableWidget) -> Optional[dict[str, Any]]:
         """Get metadata for a registered widget.
@@ -336,12 +344,7 @@ class WidgetRegistry:
             Dead references are automatically skipped.
 
         """
-        with self._lock:
-            # Get snapshot of current widgets
-            widget_refs = list(self._widgets.values())
-
-        # Iterate without lock to avoid blocking other operations
-        for weak_ref in widget_refs:
+        for weak_ref in self._widget_refs():
             widget = weak_ref()
             if widget is not None:
                 yield widget
@@ -453,6 +456,7 @@ class WidgetRegistry:
 
                     weak_ref = weakref.ref(widget, cleanup_callback)
                     self._widgets[widget_id] = weak_ref
+                    self._snapshot = None
 
                     if metadata:
                         self._metadata[widget_id] = metadata.copy()
@@ -544,7 +548,7 @@ class WidgetRegistry:
 
         with self._lock:
             widget_id = id(widget)
-            return self._lifecycle_events.get(widget_id, []).copy()
+            return list(self._lifecycle_events.get(widget_id, ()))
 
     def get_widget_state(self, widget: ThemeableWidget) -> Optional[WidgetLifecycleState]:
         """Get current lifecycle state of a widget.
@@ -582,6 +586,7 @@ class WidgetRegistry:
                         len(events) for events in self._lifecycle_events.values()
                     ),
                     "memory_overhead_bytes": self._estimate_memory_overhead(),
+                    "retained_histories": len(self._retired_histories),
                     "uptime_seconds": time.time() - self._start_time,
                 }
             )
@@ -678,10 +683,13 @@ class WidgetRegistry:
             widget_id=widget_id, state=state, timestamp=timestamp, metadata=metadata
         )
 
-        if widget_id not in self._lifecycle_events:
-            self._lifecycle_events[widget_id] = []
+        events = self._lifecycle_events.get(widget_id)
+        if events is None:
+            events = self._lifecycle_events[widget_id] = []
 
-        self._lifecycle_events[widget_id].append(event)
+        events.append(event)
+        if len(events) > MAX_LIFECYCLE_EVENTS_PER_WIDGET:
+            del events[:-MAX_LIFECYCLE_EVENTS_PER_WIDGET]
 
         # Update statistics
         self._stats["lifecycle_events"] += 1
@@ -693,9 +701,24 @@ class WidgetRegistry:
             except Exception as e:
                 print(f"Warning: Lifecycle callback failed: {e}")
 
+    def _retire_history(self, widget_id: int) -> None:
+        """Keep the history of a destroyed widget, dropping the oldest kept ones."""
+        self._retired_histories.append(widget_id)
+        while len(self._retired_histories) > MAX_RETAINED_HISTORIES:
+            old_id = self._retired_histories.popleft()
+            # Ids are reused; keep the history if a new widget took the id
+            if old_id not in self._widgets:
+                self._lifecycle_events.pop(old_id, None)
+                self._widget_states.pop(old_id, None)
+
     def _estimate_memory_overhead(self) -> int:
         """Estimate memory overhead of the registry.
 
+        Counts the containers, the weak references held per widget, the
+        per-widget theming state of themed widgets, metadata and the
+        (bounded) lifecycle histories. Event metadata dictionaries are shared
+        with the caller and not counted.
+
         Returns:
             Estimated memory overhead in bytes.
 
@@ -708,8 +731,18 @@ class WidgetRegistry:
             total_size += sys.getsizeof(self._metadata)
             total_size += sys.getsizeof(self._lifecycle_events)
             total_size += sys.getsizeof(self._widget_states)
+            total_size += sys.getsizeof(self._retired_histories)
+
+            # Estimate content sizes; themed widgets report their own state
+            for weak_ref in self._widgets.values():
+                total_size += sys.getsizeof(weak_ref)
+                widget = weak_ref()
+                state_size = getattr(widget, "_theme_state_size", None)
+                if callable(state_size):
+                    size = state_size()
+                    if isinstance(size, int):
+                        total_size += size
 
-            # Estimate content sizes
             for metadata in self._metadata.values():
                 total_size += sys.getsizeof(metadata)
 
@@ -725,6 +758,21 @@ class WidgetRegistry:
             widget_count = len(self._widgets)
             return widget_count * 100  # 100 bytes per widget estimate
 
+    def _widget_refs(self) -> tuple[weakref.ReferenceType, ...]:
+        """Get the published snapshot of widget references.
+
+        Returns:
+            Immutable tuple of weak references, possibly including dead ones.
+
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._snapshot = tuple(self._widgets.values())
+        return snapshot
+
     def _cleanup_dead_references(self) -> int:
         """Clean up dead weak references.
 
@@ -742,6 +790,9 @@ class WidgetRegistry:
             del self._widgets[widget_id]
             self._metadata.pop(widget_id, None)
 
+        if dead_ids:
+            self._snapshot = None
+
         return len(dead_ids)
 
     def _on_widget_destroyed(self, widget_id: int) -> None:
@@ -757,11 +808,14 @@ class WidgetRegistry:
                 self._update_lifecycle_state(widget_id, WidgetLifecycleState.DESTROYED)
 
             # Remove from registry
-            self._widgets.pop(widget_id, None)
+            if self._widgets.pop(widget_id, None) is not None:
+                self._snapshot = None
             self._metadata.pop(widget_id, None)
 
-            # Keep lifecycle data for a while for debugging/analysis
-            # It will be cleaned up eventually by validate_integrity or manual cleanup
+            # Keep lifecycle data for a while for debugging/analysis, bounded
+            # to the most recently destroyed widgets
+            if widget_id in self._lifecycle_events:
+                self._retire_history(widget_id)
 
             # Notify cleanup callbacks
             for callback in self._cleanup_callbacks:
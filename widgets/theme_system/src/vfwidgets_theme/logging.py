@@ -31,6 +31,8 @@ from contextlib import contextmanager
 from datetime import datetime, timezone
 from typing import Any, Callable, Optional
 
+from .tracing import trace_span
+
 
 class ThemeLogger:
     """Theme-specific logger with structured logging support.
@@ -183,7 +185,8 @@ class ThemeLogger:
         """
         start_time = time.perf_counter()
         try:
-            yield
+            with trace_span(operation, "measure"):
+                yield
         finally:
             end_time = time.perf_counter()
             duration_ms = (end_time - start_time) * 1000
@@ -430,7 +433,9 @@ class PerformanceTracker:
     """Performance tracking for theme operations.
 
     Provides detailed performance metrics for theme system operations
-    with minimal overhead when not in use.
+    with minimal overhead when not in use. While tracing is enabled,
+    measurements are also recorded as trace spans (see
+    vfwidgets_theme.tracing), so they line up with the theme pipeline.
 
     Example:
         tracker = PerformanceTracker()
@@ -454,7 +459,8 @@ class PerformanceTracker:
         """
         start_time = time.perf_counter()
         try:
-            yield
+            with trace_span(operation, "measure"):
+                yield
         finally:
             end_time = time.perf_counter()
             duration_ms = (end_time - start_time) * 1000
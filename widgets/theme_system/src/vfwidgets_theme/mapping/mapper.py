@@ -5,6 +5,7 @@ resolution, composition support, visual debugging, and comprehensive validation.
 
 Key Features:
 - CSS selector parsing for precise widget targeting
+- Rules indexed by their rightmost selector for fast candidate lookup
 - Priority-based conflict resolution
 - Mapping composition and inheritance
 - Visual debugging and inspection tools
@@ -496,6 +497,90 @@ class ConflictResolver:
         return result
 
 
+class RuleIndex:
+    """Mapping rules bucketed by their rightmost simple selector.
+
+    Like a browser style engine, a widget only needs to be matched against
+    the rules whose rightmost selector can apply to it: the buckets for its
+    type name, widget ID, theme classes and attribute names, plus the rules
+    that cannot be keyed (universal and pseudo-class-only selectors).
+    """
+
+    def __init__(self, rules: list[Optional[MappingRule]]):
+        """Build the index from a rule list.
+
+        Args:
+            rules: Rule storage of a ThemeMapping (None for removed rules)
+
+        """
+        self._buckets: dict[tuple[str, str], list[tuple[int, MappingRule]]] = defaultdict(list)
+        self._unkeyed: list[tuple[int, MappingRule]] = []
+
+        for position, rule in enumerate(rules):
+            if rule is None:
+                continue
+            key = self._key(rule.selector)
+            if key is None:
+                self._unkeyed.append((position, rule))
+            else:
+                self._buckets[key].append((position, rule))
+
+        self._buckets = dict(self._buckets)
+
+    @staticmethod
+    def _key(selector: ParsedSelector) -> Optional[tuple[str, str]]:
+        """Get the bucket key of a selector's rightmost part (None if unkeyed)."""
+        if not selector.parts:
+            return None
+
+        # SelectorMatcher matches combinator selectors by their last part too
+        part = selector.parts[-1]
+        if part.type == SelectorType.ID:
+            return ("id", part.value)
+        if part.type == SelectorType.CLASS:
+            return ("class", part.value)
+        if part.type == SelectorType.TYPE and part.value != "*":
+            return ("type", part.value)
+        if part.type == SelectorType.ATTRIBUTE and part.attributes:
+            # All attributes must match, so any one of them is a valid key
+            return ("attribute", next(iter(part.attributes)))
+        return None
+
+    def candidates(self, widget: "ThemedWidget") -> list[tuple[int, MappingRule]]:
+        """Get the rules that may match a widget.
+
+        Args:
+            widget: Widget to find candidate rules for
+
+        Returns:
+            (position, rule) pairs in rule order
+
+        """
+        buckets = self._buckets
+        keys = [("type", type(widget).__name__)]
+
+        widget_id = getattr(widget, "_widget_id", None)
+        if widget_id is not None:
+            keys.append(("id", widget_id))
+        keys.extend(("class", name) for name in getattr(widget, "_theme_classes", ()))
+        keys.extend(("attribute", name) for name in getattr(widget, "_theme_attributes", {}))
+
+        candidates = list(self._unkeyed)
+        for key in keys:
+            bucket = buckets.get(key)
+            if bucket:
+                candidates.extend(bucket)
+
+        # Resolution strategies such as FIRST_MATCH depend on rule order
+        candidates.sort(key=lambda item: item[0])
+        return candidates
+
+    @property
+    def bucket_count(self) -> int:
+        """Number of keyed buckets."""
+        return len(self._buckets)
+
+
 class ThemeMapping:
     """Advanced theme mapping system with CSS selector support.
 
@@ -530,13 +615,15 @@ class ThemeMapping:
         # Mapping storage
         self._rules: list[MappingRule] = []
         self._rules_lock = threading.RLock()
+        # Rules bucketed by rightmost selector, rebuilt lazily after rule changes
+        self._rule_index: Optional[RuleIndex] = None
 
         # Widget registry for tracking
         self._widget_mappings: dict[str, set[int]] = defaultdict(set)  # widget_id -> rule indices
         self._widget_refs: dict[str, weakref.ReferenceType] = {}
 
         # Performance tracking
-        self._mapping_cache: dict[str, dict[PropertyKey, PropertyValue]] = {}
+        self._mapping_cache: dict[tuple, dict[PropertyKey, PropertyValue]] = {}
         self._cache_lock = threading.RLock()
         self._stats = {
             "rules_applied": 0,
@@ -652,30 +739,25 @@ class ThemeMapping:
         start_time = time.perf_counter()
 
         try:
-            # Find matching rules first to check if any have conditions
-            matching_rules = self._find_matching_rules(widget)
-
-            # Check if any rules have conditions (can't cache these)
-            has_conditions = any(rule.conditions for rule in matching_rules)
-
-            widget_signature = None
-            if not has_conditions:
-                # Generate cache key only if no conditional rules
-                widget_signature = self._get_widget_signature(widget)
-
-                # Check cache first
+            # The signature covers every input of selector matching, so a
+            # cache hit needs no rule evaluation at all
+            widget_signature = self._get_widget_signature(widget)
+            if widget_signature is not None:
                 with self._cache_lock:
-                    if widget_signature in self._mapping_cache:
-                        self._stats["cache_hits"] += 1
-                        return self._mapping_cache[widget_signature].copy()
+                    cached_mapping = self._mapping_cache.get(widget_signature)
+                if cached_mapping is not None:
+                    self._stats["cache_hits"] += 1
+                    return cached_mapping.copy()
 
-                self._stats["cache_misses"] += 1
+            self._stats["cache_misses"] += 1
+
+            matching_rules, cacheable = self._match_rules(widget)
 
             # Resolve conflicts
             resolved_mapping = self._resolver.resolve(matching_rules, self.conflict_resolution)
 
-            # Cache result only if no conditional rules
-            if widget_signature is not None:
+            # Cache result only if no selector-matched rule has runtime conditions
+            if widget_signature is not None and cacheable:
                 with self._cache_lock:
                     self._mapping_cache[widget_signature] = resolved_mapping.copy()
 
@@ -747,6 +829,7 @@ class ThemeMapping:
                 "total_rules": len(self._rules),
                 "active_rules": active_rules,
                 "cached_mappings": len(self._mapping_cache),
+                "indexed_buckets": self._get_rule_index().bucket_count,
                 "conflict_resolution": self.conflict_resolution.value,
                 "matcher_stats": self._matcher.get_cache_stats(),
                 "performance_stats": self._stats.copy(),
@@ -756,30 +839,55 @@ class ThemeMapping:
 
     def _find_matching_rules(self, widget: "ThemedWidget") -> list[MappingRule]:
         """Find all rules that match the widget."""
+        return self._match_rules(widget)[0]
+
+    def _match_rules(self, widget: "ThemedWidget") -> tuple[list[MappingRule], bool]:
+        """Find all rules that match the widget.
+
+        Args:
+            widget: Widget to match
+
+        Returns:
+            Tuple of (matching rules, whether the result may be cached). Results
+            are not cacheable once a rule with runtime conditions matched the
+            selector, whether or not its conditions held.
+
+        """
         matching_rules = []
+        cacheable = True
 
-        with self._rules_lock:
-            for rule in self._rules:
-                if rule is None or not rule.enabled:
+        for _position, rule in self._get_rule_index().candidates(widget):
+            if not rule.enabled:
+                continue
+
+            try:
+                # Check selector match
+                if not self._matcher.matches(rule.selector, widget):
                     continue
 
-                try:
-                    # Check selector match
-                    if not self._matcher.matches(rule.selector, widget):
+                # Check runtime conditions
+                if rule.conditions:
+                    cacheable = False
+                    if not all(condition(widget) for condition in rule.conditions):
                         continue
 
-                    # Check runtime conditions
-                    if rule.conditions:
-                        if not all(condition(widget) for condition in rule.conditions):
-                            continue
+                matching_rules.append(rule)
 
-                    matching_rules.append(rule)
+            except Exception as e:
+                if self.debug:
+                    logger.warning(f"Rule matching error: {e}")
 
-                except Exception as e:
-                    if self.debug:
-                        logger.warning(f"Rule matching error: {e}")
+        return matching_rules, cacheable
 
-        return matching_rules
+    def _get_rule_index(self) -> RuleIndex:
+        """Get the rule index, building it after rule changes."""
+        index = self._rule_index
+        if index is None:
+            with self._rules_lock:
+                index = self._rule_index
+                if index is None:
+                    index = self._rule_index = RuleIndex(self._rules)
+        return index
 
     def _validate_rule(self, rule: MappingRule) -> None:
         """Validate a mapping rule."""
@@ -797,31 +905,34 @@ class ThemeMapping:
             if not isinstance(key, str):
                 raise MappingError(f"Property key must be string, got {type(key)}")
 
-    def _get_widget_signature(self, widget: "ThemedWidget") -> str:
-        """Generate a signature for caching."""
-        parts = [
-            type(widget).__name__,
-            str(getattr(widget, "_widget_id", id(widget))),
-            str(getattr(widget, "_theme_classes", set())),
-            str(hash(frozenset(getattr(widget, "_theme_attributes", {}).items()))),
-        ]
+    def _get_widget_signature(self, widget: "ThemedWidget") -> Optional[tuple]:
+        """Generate a signature for caching.
 
-        # Include dynamic state for pseudo-class matching
+        Covers everything selector matching reads: type, ID, classes,
+        attributes and the state behind pseudo-classes.
+
+        Returns:
+            Hashable signature, or None if the widget state cannot be captured
+
+        """
         try:
-            dynamic_state = [
-                str(getattr(widget, "isEnabled", lambda: True)()),
-                str(getattr(widget, "isVisible", lambda: True)()),
-                str(getattr(widget, "hasFocus", lambda: False)()),
-            ]
-            parts.extend(dynamic_state)
+            return (
+                type(widget).__name__,
+                getattr(widget, "_widget_id", id(widget)),
+                frozenset(getattr(widget, "_theme_classes", ())),
+                frozenset(getattr(widget, "_theme_attributes", {}).items()),
+                # Dynamic state for pseudo-class matching
+                bool(getattr(widget, "isEnabled", lambda: True)()),
+                bool(getattr(widget, "isVisible", lambda: True)()),
+                bool(getattr(widget, "hasFocus", lambda: False)()),
+            )
         except Exception:
-            # If getting dynamic state fails, still cache but less efficiently
-            parts.append(str(time.time()))  # Prevent caching in this case
-
-        return "::".join(parts)
+            # Unhashable attributes or failing state getters: don't cache
+            return None
 
     def _clear_mapping_cache(self) -> None:
-        """Clear the mapping cache."""
+        """Clear the mapping cache and the rule index."""
+        self._rule_index = None
         with self._cache_lock:
             self._mapping_cache.clear()
 
@@ -12,6 +12,7 @@ the CSS selector system from Task 13. It provides:
 
 Key Features:
 - LRU caching for sub-millisecond pattern matching
+- Glob and regex patterns compiled into one regex, matched in a single scan
 - Plugin system for custom pattern types
 - Priority system for conflict resolution
 - Seamless integration with existing ThemeMapping
@@ -19,13 +20,13 @@ Key Features:
 """
 
 import fnmatch
+import os
 import re
 import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
-from re import Pattern
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -187,6 +188,110 @@ class LRUCache:
             }
 
 
+class CompiledPatternSet:
+    """Glob and regex patterns combined into regular expressions.
+
+    Each pattern becomes an optional lookahead at the start of the target
+    that captures an empty named group when it matches, so one ``match()``
+    call reports every matching pattern. Globs are combined into one regex
+    matched against the ``os.path.normcase``'d target like fnmatch, regex
+    patterns into another matched against the target as is. Regex patterns
+    that cannot be embedded (capturing groups, backreferences, global flags)
+    are kept aside and matched individually.
+    """
+
+    def __init__(self, patterns: list[Optional[Pattern]]):
+        """Compile the glob and regex patterns of a pattern list.
+
+        Args:
+            patterns: Pattern storage of a PatternMatcher (None for removed)
+
+        """
+        # group name -> pattern index
+        self.group_indexes: dict[str, int] = {}
+        # Pattern indexes not covered by the combined regex
+        self.uncompiled: list[int] = []
+        # Specificity scores of glob patterns, which do not depend on the target
+        self.glob_scores: dict[int, float] = {}
+
+        glob_branches: dict[int, str] = {}
+        regex_branches: dict[int, str] = {}
+        for index, pattern in enumerate(patterns):
+            if pattern is None:
+                continue
+
+            if pattern.pattern_type == PatternType.GLOB:
+                # fnmatch semantics: translate() anchors at the end, match() at the start
+                glob_branches[index] = fnmatch.translate(os.path.normcase(pattern.pattern))
+                self.glob_scores[index] = _glob_score(pattern.pattern)
+            elif pattern.pattern_type == PatternType.REGEX and self._can_embed(pattern.pattern):
+                # search() semantics: the regex may start anywhere in the target
+                regex_branches[index] = f"(?s:.*?)(?:{pattern.pattern})"
+            else:
+                self.uncompiled.append(index)
+
+        self.glob_regex = self._combine(glob_branches)
+        self.regex = self._combine(regex_branches)
+
+    def _combine(self, branches: dict[int, str]) -> Optional[re.Pattern]:
+        """Combine pattern branches into one regex with a group per pattern."""
+        if not branches:
+            return None
+
+        groups = {f"_p{index}": index for index in branches}
+        try:
+            combined = re.compile(
+                "".join(
+                    f"(?:(?={branch})(?P<_p{index}>))?" for index, branch in branches.items()
+                )
+            )
+        except re.error as e:
+            logger.warning(f"Could not combine patterns, matching individually: {e}")
+            self.uncompiled.extend(branches)
+            return None
+
+        self.group_indexes.update(groups)
+        return combined
+
+    @staticmethod
+    def _can_embed(pattern: str) -> bool:
+        """Check whether a regex keeps its meaning inside the combined regex."""
+        try:
+            compiled = re.compile(pattern)
+        except re.error:
+            return False
+        return compiled.groups == 0 and not (compiled.flags & ~re.UNICODE)
+
+    def match(self, target: str) -> list[int]:
+        """Find the compiled patterns matching a target in one scan.
+
+        Args:
+            target: String to match against
+
+        Returns:
+            Indexes of matching patterns
+
+        """
+        matches = []
+        # The combined regexes always match; only participating groups count
+        for regex, text in (
+            (self.glob_regex, os.path.normcase(target)),
+            (self.regex, target),
+        ):
+            if regex is not None:
+                groups = regex.match(text).groupdict()
+                matches.extend(
+                    self.group_indexes[name] for name, value in groups.items() if value is not None
+                )
+        return matches
+
+
+def _glob_score(pattern: str) -> float:
+    """Score a glob pattern by specificity (fewer wildcards is better)."""
+    wildcards = pattern.count("*") + pattern.count("?")
+    return max(0, len(pattern) - wildcards) / len(pattern) if pattern else 0
+
+
 class PatternMatcher:
     """High-performance pattern matching engine with caching.
 
@@ -216,6 +321,9 @@ class PatternMatcher:
         # Pattern storage
         self._patterns: list[Pattern] = []
         self._patterns_lock = threading.RLock()
+        # Combined regex of all glob and regex patterns, rebuilt lazily after
+        # pattern changes
+        self._compiled: Optional[CompiledPatternSet] = None
 
         # High-performance caching
         self._match_cache = LRUCache(cache_size)
@@ -486,11 +594,26 @@ class PatternMatcher:
         total_time = (time.perf_counter() - start_time) * 1000  # Convert to ms
         avg_time = total_time / iterations
 
+        # Cache misses: compiled single scan against one match per pattern
+        uncached_iterations = max(1, iterations // 10)
+        start_time = time.perf_counter()
+        for i in range(uncached_iterations):
+            self._match_patterns_uncached(test_targets[i % len(test_targets)], test_widget)
+        compiled_time = (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        for i in range(uncached_iterations):
+            self._match_patterns_individually(test_targets[i % len(test_targets)], test_widget)
+        individual_time = (time.perf_counter() - start_time) * 1000
+
         return {
             "total_time_ms": total_time,
             "average_time_ms": avg_time,
             "iterations": iterations,
             "patterns_per_second": iterations / (total_time / 1000),
+            "uncached_compiled_ms": compiled_time / uncached_iterations,
+            "uncached_individual_ms": individual_time / uncached_iterations,
+            "compiled_speedup": individual_time / compiled_time if compiled_time > 0 else 0.0,
         }
 
     # Private methods
@@ -499,6 +622,61 @@ class PatternMatcher:
         self, target: str, widget: "ThemedWidget", context: Optional[dict[str, Any]] = None
     ) -> list[tuple[int, Pattern, MatchResult]]:
         """Perform actual pattern matching without caching."""
+        compiled = self._get_compiled_patterns()
+        patterns = self._patterns
+        matches = []
+
+        # Glob and regex patterns: one scan finds all candidates
+        try:
+            candidates = compiled.match(target)
+        except Exception as e:
+            logger.warning(f"Combined pattern matching failed, matching individually: {e}")
+            return self._match_patterns_individually(target, widget, context)
+
+        for i in candidates:
+            pattern = patterns[i]
+            if pattern is None or not pattern.enabled:
+                continue
+            if i in compiled.glob_scores:
+                result = MatchResult(True, compiled.glob_scores[i])
+            else:
+                # Re-run the matching regex alone for its score and match object
+                result = self._match_regex_pattern(pattern.pattern, target)
+            if result.matched:
+                matches.append((i, pattern, result))
+
+        # Custom, plugin and non-embeddable regex patterns
+        for i in compiled.uncompiled:
+            pattern = patterns[i]
+            if pattern is None or not pattern.enabled:
+                continue
+            try:
+                result = self._match_single_pattern(pattern, target, widget, context)
+                if result.matched:
+                    matches.append((i, pattern, result))
+
+            except Exception as e:
+                if self.debug:
+                    logger.warning(f"Pattern {i} matching error: {e}")
+
+        # Report matches in pattern order, like the per-pattern scan
+        matches.sort(key=lambda m: m[0])
+        return matches
+
+    def _get_compiled_patterns(self) -> CompiledPatternSet:
+        """Get the combined pattern regex, compiling it after pattern changes."""
+        compiled = self._compiled
+        if compiled is None:
+            with self._patterns_lock:
+                compiled = self._compiled
+                if compiled is None:
+                    compiled = self._compiled = CompiledPatternSet(self._patterns)
+        return compiled
+
+    def _match_patterns_individually(
+        self, target: str, widget: "ThemedWidget", context: Optional[dict[str, Any]] = None
+    ) -> list[tuple[int, Pattern, MatchResult]]:
+        """Match every enabled pattern on its own (reference for the compiled scan)."""
         matches = []
 
         # Pre-filter enabled patterns for better performance
@@ -559,13 +737,8 @@ class PatternMatcher:
         """Match using shell-style glob patterns."""
         matched = fnmatch.fnmatch(target, pattern)
 
-        # Calculate match score based on specificity
-        score = 0.0
-        if matched:
-            # Higher score for more specific patterns (fewer wildcards)
-            wildcards = pattern.count("*") + pattern.count("?")
-            specificity = max(0, len(pattern) - wildcards) / len(pattern) if pattern else 0
-            score = specificity
+        # Higher score for more specific patterns (fewer wildcards)
+        score = _glob_score(pattern) if matched else 0.0
 
         return MatchResult(matched, score)
 
@@ -645,6 +818,7 @@ class PatternMatcher:
 
     def _clear_caches(self) -> None:
         """Clear all caches."""
+        self._compiled = None
         self._match_cache.clear()
         self._pattern_cache.clear()
 
@@ -704,6 +878,7 @@ def button_pattern() -> str:
 
 __all__ = [
     "PatternMatcher",
+    "CompiledPatternSet",
     "PatternType",
     "PatternPriority",
     "Pattern",
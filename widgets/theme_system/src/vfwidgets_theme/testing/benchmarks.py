@@ -456,6 +456,90 @@ class ThemeBenchmark:
         total_operations = len(widget_types) * iterations
         return self._create_benchmark_result(operation_name, data, total_operations)
 
+    def benchmark_stylesheet_modes(
+        self, theme: Any, widget_count: int = 100, iterations: int = 5
+    ) -> dict[str, BenchmarkResult]:
+        """Compare per-widget stylesheets against one application stylesheet.
+
+        Builds ``widget_count`` nested containers with a few child controls
+        each, then measures stylesheet application plus polish in both modes.
+        Requires a running QApplication.
+
+        Args:
+            theme: Theme object to generate stylesheets from.
+            widget_count: Number of themed containers to style.
+            iterations: Number of full application passes per mode.
+
+        Returns:
+            Dictionary with "per_widget" and "application" results.
+
+        """
+        from PySide6.QtWidgets import QApplication, QLabel, QPushButton, QVBoxLayout, QWidget
+
+        from ..widgets.stylesheet_generator import (
+            APPLICATION_SCOPE_PROPERTY,
+            StylesheetGenerator,
+        )
+
+        app = QApplication.instance()
+        if app is None:
+            raise RuntimeError("benchmark_stylesheet_modes requires a QApplication")
+
+        root = QWidget()
+        containers = []
+        for _ in range(widget_count):
+            container = QWidget(root)
+            layout = QVBoxLayout(container)
+            layout.addWidget(QLabel("label", container))
+            layout.addWidget(QPushButton("button", container))
+            containers.append(container)
+
+        def polish_all() -> None:
+            for container in containers:
+                container.ensurePolished()
+                for child in container.findChildren(QWidget):
+                    child.ensurePolished()
+
+        previous_app_sheet = app.styleSheet()
+        results = {}
+
+        try:
+            operation_name = f"Per-Widget Stylesheets ({widget_count} widgets)"
+            with self._measure_performance(operation_name) as data:
+                for _i in range(iterations):
+                    start_time = time.perf_counter()
+                    for container in containers:
+                        generator = StylesheetGenerator(theme, type(container).__name__)
+                        container.setStyleSheet(generator.generate_comprehensive_stylesheet())
+                    polish_all()
+                    data["times"].append(time.perf_counter() - start_time)
+            results["per_widget"] = self._create_benchmark_result(operation_name, data, iterations)
+
+            for container in containers:
+                container.setStyleSheet("")
+                container.setProperty(APPLICATION_SCOPE_PROPERTY, True)
+
+            operation_name = f"Application Stylesheet ({widget_count} widgets)"
+            with self._measure_performance(operation_name) as data:
+                for _i in range(iterations):
+                    start_time = time.perf_counter()
+                    app.setStyleSheet(StylesheetGenerator.generate_application_stylesheet(theme))
+                    polish_all()
+                    data["times"].append(time.perf_counter() - start_time)
+            results["application"] = self._create_benchmark_result(
+                operation_name, data, iterations
+            )
+        finally:
+            app.setStyleSheet(previous_app_sheet)
+            root.deleteLater()
+
+        per_widget_time = results["per_widget"].average_time
+        app_time = results["application"].average_time
+        results["application"].metadata["speedup"] = (
+            per_widget_time / app_time if app_time > 0 else 0.0
+        )
+        return results
+
     def benchmark_concurrent_access(
         self, provider: Any, thread_count: int = 10, operations_per_thread: int = 100
     ) -> BenchmarkResult:
@@ -518,6 +602,45 @@ class ThemeBenchmark:
 
         return result
 
+    def benchmark_operation(
+        self,
+        operation_name: str,
+        operation: Callable[[Any], Any],
+        iterations: int = 10,
+        setup: Optional[Callable[[], Any]] = None,
+        warmup: int = 0,
+    ) -> BenchmarkResult:
+        """Benchmark an arbitrary operation.
+
+        Args:
+            operation_name: Name of the benchmarked operation.
+            operation: Callable to time; receives the setup result (or None).
+            iterations: Number of timed runs.
+            setup: Untimed callable run before every run, e.g. to build fixtures.
+            warmup: Number of untimed runs before measuring.
+
+        Returns:
+            BenchmarkResult with one timing per run.
+
+        """
+        for _i in range(warmup):
+            operation(setup() if setup else None)
+
+        with self._measure_performance(operation_name) as data:
+            for _i in range(iterations):
+                argument = setup() if setup else None
+
+                start_time = time.perf_counter()
+                try:
+                    operation(argument)
+                except Exception as e:
+                    data["errors"].append(f"{operation_name} error: {str(e)}")
+                end_time = time.perf_counter()
+
+                data["times"].append(end_time - start_time)
+
+        return self._create_benchmark_result(operation_name, data, iterations)
+
     def _create_benchmark_result(
         self, operation_name: str, measurement_data: dict[str, Any], iterations: int
     ) -> BenchmarkResult:
@@ -0,0 +1,427 @@
+"""Trace-event instrumentation for the theme application pipeline.
+
+Records timed spans for the stages of a theme switch (repository lookup,
+global application, per-widget stylesheet generation, setStyleSheet
+polish, palette propagation and user ``on_theme_changed`` handlers) so a
+slow switch can be broken down after the fact.
+
+Tracing is disabled by default. A disabled span costs one attribute check;
+nothing is timed or stored. Enable it from code::
+
+    from vfwidgets_theme.tracing import enable_tracing, get_tracer
+
+    enable_tracing()
+    app.set_theme("dark")
+    get_tracer().write_chrome_trace("theme-trace.json")
+    print(get_tracer().format_widget_class_costs())
+
+or from the environment: ``VFWIDGETS_THEME_TRACE=1`` enables tracing,
+``VFWIDGETS_THEME_TRACE=/tmp/theme-trace.json`` also writes the trace to that
+file when the process exits.
+
+Traces use the Chrome trace-event format and open in ``chrome://tracing``
+or https://ui.perfetto.dev. Spans with a widget carry its class name and
+widget id, which the per-widget-class cost table aggregates.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional, Union
+
+# Environment variable enabling tracing at import time
+TRACE_ENV_VAR = "VFWIDGETS_THEME_TRACE"
+
+# Events kept before the oldest are dropped
+DEFAULT_MAX_EVENTS = 1_000_000
+
+# Values of TRACE_ENV_VAR that enable or disable tracing without an output file
+_ENV_ENABLE = ("1", "true", "yes", "on")
+_ENV_DISABLE = ("", "0", "false", "no", "off")
+
+# Returned by span() while tracing is disabled; stateless, so it can be shared
+_NULL_SPAN = nullcontext()
+
+
+class TraceEvent(NamedTuple):
+    """One completed span."""
+
+    name: str
+    category: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    args: Optional[dict[str, Any]]
+
+
+@dataclass
+class WidgetClassCost:
+    """Aggregated cost of one operation for one widget class."""
+
+    widget_class: str
+    operation: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @property
+    def average_ms(self) -> float:
+        """Average duration per call in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+
+class _Span:
+    """Context manager timing one span while tracing is enabled."""
+
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start")
+
+    def __init__(
+        self, tracer: "Tracer", name: str, category: str, args: Optional[dict[str, Any]]
+    ):
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start = 0
+
+    def __enter__(self) -> "_Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        end = time.perf_counter_ns()
+        args = self._args
+        if exc_type is not None:
+            args = dict(args or {}, error=exc_type.__name__)
+        self._tracer._events.append(
+            TraceEvent(
+                self._name,
+                self._category,
+                self._start,
+                end - self._start,
+                threading.get_ident(),
+                args,
+            )
+        )
+
+    def set_arg(self, key: str, value: Any) -> None:
+        """Attach an argument to the span, e.g. a result count."""
+        if self._args is None:
+            self._args = {}
+        self._args[key] = value
+
+
+def _widget_args(widget: Any) -> dict[str, Any]:
+    """Describe a widget for span arguments."""
+    widget_id = getattr(widget, "_widget_id", None)
+    return {
+        "widget_class": type(widget).__name__,
+        "widget_id": widget_id if widget_id is not None else f"0x{id(widget):x}",
+    }
+
+
+class Tracer:
+    """Collects trace spans in memory.
+
+    Events are appended to a bounded deque, which is safe to append to from
+    several threads; the oldest events are dropped once ``max_events`` is
+    reached.
+
+    Example:
+        tracer = Tracer()
+        tracer.enable()
+        with tracer.span("load", category="repository", theme="dark"):
+            load_theme()
+        tracer.write_chrome_trace("trace.json")
+
+    """
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS):
+        """Initialize a disabled tracer.
+
+        Args:
+            max_events: Events kept before the oldest are dropped
+
+        """
+        self.enabled = False
+        self._events: deque[TraceEvent] = deque(maxlen=max_events)
+        self._origin_ns = time.perf_counter_ns()
+
+    def enable(self) -> None:
+        """Start recording spans."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stop recording spans; recorded events are kept."""
+        self.enabled = False
+
+    def clear(self) -> None:
+        """Drop all recorded events."""
+        self._events.clear()
+        self._origin_ns = time.perf_counter_ns()
+
+    def span(
+        self, name: str, category: str = "theme", widget: Any = None, **args: Any
+    ) -> Union[_Span, nullcontext]:
+        """Time a block of code as a span.
+
+        Args:
+            name: Span name, e.g. the operation
+            category: Trace category (pipeline stage)
+            widget: Widget the span applies to; adds its class and id
+            **args: Extra arguments stored with the span
+
+        Returns:
+            Context manager; a no-op while tracing is disabled
+
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        if widget is not None:
+            args.update(_widget_args(widget))
+        return _Span(self, name, category, args or None)
+
+    def events(self) -> list[TraceEvent]:
+        """Get a snapshot of the recorded events."""
+        return list(self._events)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Convert recorded events to the Chrome trace-event format.
+
+        Returns:
+            JSON-serializable trace with complete ("X") events
+
+        """
+        pid = os.getpid()
+        origin = self._origin_ns
+        trace_events = []
+        for event in self.events():
+            trace_event = {
+                "name": event.name,
+                "cat": event.category,
+                "ph": "X",
+                "ts": (event.start_ns - origin) / 1000,
+                "dur": event.duration_ns / 1000,
+                "pid": pid,
+                "tid": event.thread_id,
+            }
+            if event.args:
+                trace_event["args"] = {key: _json_value(value) for key, value in event.args.items()}
+            trace_events.append(trace_event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Union[str, Path]) -> Path:
+        """Write recorded events as a Chrome trace-event JSON file.
+
+        Args:
+            path: File to write
+
+        Returns:
+            Path of the written file
+
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        return path
+
+    def widget_class_costs(self) -> list[WidgetClassCost]:
+        """Aggregate span durations per widget class and operation.
+
+        Only spans recorded with a widget are included. Nested spans are
+        counted in full, so an operation's total includes its children.
+
+        Returns:
+            Costs sorted by total time, most expensive first
+
+        """
+        costs: dict[tuple[str, str], WidgetClassCost] = {}
+        for event in self.events():
+            if not event.args or "widget_class" not in event.args:
+                continue
+            key = (event.args["widget_class"], event.name)
+            cost = costs.get(key)
+            if cost is None:
+                cost = costs[key] = WidgetClassCost(*key)
+            duration_ms = event.duration_ns / 1_000_000
+            cost.count += 1
+            cost.total_ms += duration_ms
+            cost.max_ms = max(cost.max_ms, duration_ms)
+        return sorted(costs.values(), key=lambda cost: cost.total_ms, reverse=True)
+
+    def operation_totals(self) -> dict[str, float]:
+        """Sum span durations per span name, in milliseconds."""
+        totals: dict[str, float] = defaultdict(float)
+        for event in self.events():
+            totals[event.name] += event.duration_ns / 1_000_000
+        return dict(totals)
+
+    def format_widget_class_costs(self, limit: Optional[int] = None) -> str:
+        """Format the per-widget-class cost table as plain text.
+
+        Args:
+            limit: Maximum number of rows (None for all)
+
+        Returns:
+            Table with one row per widget class and operation
+
+        """
+        costs = self.widget_class_costs()[:limit]
+        if not costs:
+            return "No widget spans recorded."
+
+        class_width = max(len("widget class"), *(len(cost.widget_class) for cost in costs))
+        operation_width = max(len("operation"), *(len(cost.operation) for cost in costs))
+        lines = [
+            f"{'widget class':<{class_width}}  {'operation':<{operation_width}}  "
+            f"{'count':>7}  {'total ms':>10}  {'avg ms':>8}  {'max ms':>8}"
+        ]
+        for cost in costs:
+            lines.append(
+                f"{cost.widget_class:<{class_width}}  {cost.operation:<{operation_width}}  "
+                f"{cost.count:>7}  {cost.total_ms:>10.2f}  {cost.average_ms:>8.3f}  "
+                f"{cost.max_ms:>8.3f}"
+            )
+        return "\n".join(lines)
+
+
+def _json_value(value: Any) -> Any:
+    """Make a span argument JSON-serializable."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+# Process-wide tracer used by the theme system
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer."""
+    return _tracer
+
+
+def enable_tracing(clear: bool = True) -> Tracer:
+    """Start recording spans with the process-wide tracer.
+
+    Args:
+        clear: Drop previously recorded events
+
+    Returns:
+        The process-wide tracer
+
+    """
+    if clear:
+        _tracer.clear()
+    _tracer.enable()
+    return _tracer
+
+
+def disable_tracing() -> None:
+    """Stop recording spans; recorded events are kept."""
+    _tracer.disable()
+
+
+def is_tracing_enabled() -> bool:
+    """Check whether spans are being recorded."""
+    return _tracer.enabled
+
+
+def trace_span(
+    name: str, category: str = "theme", widget: Any = None, **args: Any
+) -> Union[_Span, nullcontext]:
+    """Time a block of code with the process-wide tracer.
+
+    Args:
+        name: Span name
+        category: Trace category (pipeline stage)
+        widget: Widget the span applies to; adds its class and id
+        **args: Extra arguments stored with the span
+
+    Returns:
+        Context manager; a no-op while tracing is disabled
+
+    """
+    if not _tracer.enabled:
+        return _NULL_SPAN
+    return _tracer.span(name, category, widget, **args)
+
+
+def traced(name: Optional[str] = None, category: str = "theme") -> Callable:
+    """Record each call of the decorated function as a span.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        category: Trace category
+
+    """
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return func(*args, **kwargs)
+            with _tracer.span(span_name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _write_trace_at_exit(path: str) -> None:
+    """Write the process-wide trace to a file; registered with atexit."""
+    try:
+        _tracer.write_chrome_trace(path)
+    except OSError:
+        # Nothing to report to during interpreter shutdown
+        pass
+
+
+def configure_from_environment() -> bool:
+    """Enable tracing according to the VFWIDGETS_THEME_TRACE variable.
+
+    A true value ("1", "true", "yes", "on") enables tracing. Any other
+    non-empty value is taken as a file path; tracing is enabled and the trace
+    is written there when the process exits.
+
+    Returns:
+        True if tracing was enabled
+
+    """
+    value = os.environ.get(TRACE_ENV_VAR, "").strip()
+    if value.lower() in _ENV_DISABLE:
+        return False
+
+    enable_tracing()
+    if value.lower() not in _ENV_ENABLE:
+        atexit.register(_write_trace_at_exit, value)
+    return True
+
+
+configure_from_environment()
+
+
+__all__ = [
+    "DEFAULT_MAX_EVENTS",
+    "TRACE_ENV_VAR",
+    "TraceEvent",
+    "Tracer",
+    "WidgetClassCost",
+    "configure_from_environment",
+    "disable_tracing",
+    "enable_tracing",
+    "get_tracer",
+    "is_tracing_enabled",
+    "trace_span",
+    "traced",
+]
@@ -0,0 +1,55 @@
+"""Lazy attribute exports for package ``__init__`` modules.
+
+Packages map their public names to the submodule defining them. The
+submodule is imported on first attribute access instead of when the
+package is imported, so applications only pay for what they use.
+
+Example:
+    _LAZY_IMPORTS = {".base": ("ThemedWidget",)}
+    __getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
+
+"""
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, imports: dict[str, tuple[str, ...]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create module ``__getattr__`` and ``__dir__`` functions for lazy exports.
+
+    Args:
+        package: Name of the package (its ``__name__``)
+        imports: Mapping of relative submodule name to the names it exports
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to install in the package module
+
+    """
+    exports = {name: module for module, names in imports.items() for name in names}
+    namespace = sys.modules[package].__dict__
+
+    def getattr_(name: str) -> Any:
+        module_name = exports.get(name)
+        if module_name is not None:
+            value = getattr(importlib.import_module(module_name, package), name)
+            # Cache in the package so later lookups skip __getattr__
+            namespace[name] = value
+            return value
+
+        # Plain attribute access to submodules keeps working, e.g. package.base
+        if not name.startswith("_"):
+            try:
+                return importlib.import_module(f"{package}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{package}.{name}":
+                    raise
+
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    def dir_() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return getattr_, dir_
@@ -10,6 +10,7 @@ import functools
 import time
 from typing import Any, Callable, Optional
 
+from ..tracing import is_tracing_enabled, trace_span
 from .framework import ValidationFramework, ValidationMode, ValidationType
 
 
@@ -279,6 +280,9 @@ def require_widget_state(expected_state: dict[str, Any]):
 def performance_monitor(operation_name: Optional[str] = None, threshold_ms: Optional[float] = None):
     """Decorator to monitor function performance and validate against thresholds.
 
+    Calls are recorded as trace spans while tracing is enabled, whether or
+    not performance validation is enabled.
+
     Args:
         operation_name: Name for the operation (defaults to function name)
         threshold_ms: Performance threshold in milliseconds
@@ -289,12 +293,14 @@ def performance_monitor(operation_name: Optional[str] = None, threshold_ms: Opti
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             framework = ValidationFramework.get_instance()
+            op_name = operation_name or func.__name__
 
             if not framework.is_validation_enabled(ValidationType.PERFORMANCE):
+                if is_tracing_enabled():
+                    with trace_span(op_name, "performance"):
+                        return func(*args, **kwargs)
                 return func(*args, **kwargs)
 
-            op_name = operation_name or func.__name__
-
             # Set threshold if provided
             if threshold_ms is not None:
                 framework.set_performance_threshold(op_name, threshold_ms / 1000)
@@ -302,7 +308,8 @@ def performance_monitor(operation_name: Optional[str] = None, threshold_ms: Opti
             # Monitor execution time
             start_time = time.perf_counter()
             try:
-                result = func(*args, **kwargs)
+                with trace_span(op_name, "performance"):
+                    result = func(*args, **kwargs)
                 return result
             finally:
                 end_time = time.perf_counter()
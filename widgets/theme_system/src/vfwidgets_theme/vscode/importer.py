@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
+from ..core.color_transforms import RGBTransform, format_hex, parse_color, transform_color
 from ..core.theme import Theme, ThemeColors, ThemeProperties
 from ..errors import ThemeSystemError
 from ..logging import get_logger
@@ -257,7 +258,8 @@ class VSCodeThemeImporter:
 
         # Handle rgba/rgb colors - convert to hex
         if color.startswith("rgba(") or color.startswith("rgb("):
-            return self._rgb_to_hex(color)
+            parsed = parse_color(color)
+            return format_hex(*parsed) if parsed is not None else self._rgb_to_hex(color)
 
         # Handle named colors (limited support)
         named_colors = {
@@ -317,28 +319,7 @@ class VSCodeThemeImporter:
 
     def _darken_color(self, color: str, factor: float) -> str:
         """Darken a color by the given factor."""
-        if not color.startswith("#"):
-            return color
-
-        try:
-            # Parse hex color
-            hex_color = color[1:]
-            if len(hex_color) == 6:
-                r = int(hex_color[0:2], 16)
-                g = int(hex_color[2:4], 16)
-                b = int(hex_color[4:6], 16)
-
-                # Darken
-                r = max(0, int(r * (1 - factor)))
-                g = max(0, int(g * (1 - factor)))
-                b = max(0, int(b * (1 - factor)))
-
-                return f"#{r:02x}{g:02x}{b:02x}"
-
-        except (ValueError, IndexError):
-            pass
-
-        return color
+        return transform_color(color, RGBTransform(scale=1 - factor))
 
     def _extract_token_colors(self, theme_data: dict[str, Any]) -> list[VSCodeTokenColor]:
         """Extract token color rules from theme."""
@@ -11,102 +11,190 @@ This is THE layer that developers interact with. All complexity from core,
 engine, and utils is hidden behind clean, simple APIs here.
 """
 
-# Widget components (placeholders for Tasks 7-9)
-from .application import (
-    ApplicationConfig,
-    ApplicationThemeManager,
-    ThemedApplication,
-    get_global_available_themes,
-    get_global_theme,
-    get_themed_application,
-    set_global_theme,
-)
-from .base import (
-    ThemedWidget,
-    create_themed_widget,
-)
-from .color_editor import (
-    ColorEditorWidget,
-)
+from typing import TYPE_CHECKING
+
+from ..utils.lazy_import import lazy_exports
+
+# Public names are imported from their submodules on first access, so the
+# editors and dialogs only load for applications that use them
+_LAZY_IMPORTS = {
+    ".application": (
+        "ApplicationConfig",
+        "ApplicationThemeManager",
+        "ThemedApplication",
+        "get_global_available_themes",
+        "get_global_theme",
+        "get_themed_application",
+        "set_global_theme",
+    ),
+    ".base": (
+        "ThemedWidget",
+        "create_themed_widget",
+    ),
+    ".color_editor": ("ColorEditorWidget",),
+    ".convenience": (
+        "ThemedDialog",
+        "ThemedMainWindow",
+        "ThemedQWidget",
+    ),
+    ".dialogs": (
+        "ThemePickerDialog",
+        "ThemeSettingsWidget",
+    ),
+    ".font_editor": ("FontEditorWidget",),
+    ".font_family_editor": ("FontFamilyListEditor",),
+    ".font_property_editor": ("FontPropertyEditorWidget",),
+    ".helpers": (
+        "ThemePreview",
+        "ThemeSettings",
+        "add_theme_menu",
+        "add_theme_toolbar",
+    ),
+    ".import_export": (
+        "ThemeExportDialog",
+        "ThemeImportDialog",
+        "ThemeMetadataEditor",
+    ),
+    ".metadata": (
+        "ThemeInfo",
+        "ThemeMetadataProvider",
+    ),
+    ".mixins": (
+        "CacheMixin",
+        "CompositeMixin",
+        "LifecycleMixin",
+        "NotificationMixin",
+        "PropertyMixin",
+        "ThemeableMixin",
+        "add_theming_to_widget",
+        "remove_theming_from_widget",
+        "themeable",
+    ),
+    ".palette_generator": ("PaletteGenerator",),
+    ".preview_samples": (
+        "PreviewSampleGenerator",
+        "ThemePreviewWidget",
+    ),
+    ".primitives": (
+        "ThemeButtonGroup",
+        "ThemeComboBox",
+        "ThemeListWidget",
+    ),
+    ".properties": (
+        "ColorProperty",
+        "FontProperty",
+        "ThemeProperty",
+    ),
+    ".shortcuts": ("ThemeShortcuts",),
+    ".theme_editor": (
+        "ThemeEditorDialog",
+        "ThemeEditorWidget",
+    ),
+    ".token_browser": ("TokenBrowserWidget",),
+    ".validation_panel": ("ValidationPanel",),
+    ".vf_themed_application": ("VFThemedApplication",),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_IMPORTS)
+
+if TYPE_CHECKING:
+    # Widget components (placeholders for Tasks 7-9)
+    from .application import (
+        ApplicationConfig,
+        ApplicationThemeManager,
+        ThemedApplication,
+        get_global_available_themes,
+        get_global_theme,
+        get_themed_application,
+        set_global_theme,
+    )
+    from .base import (
+        ThemedWidget,
+        create_themed_widget,
+    )
+    from .color_editor import (
+        ColorEditorWidget,
+    )
+
+    # Convenience themed widgets
+    from .convenience import (
+        ThemedDialog,
+        ThemedMainWindow,
+        ThemedQWidget,
+    )
+    from .dialogs import (
+        ThemePickerDialog,
+        ThemeSettingsWidget,
+    )
+    from .font_editor import (
+        FontEditorWidget,
+    )
+    from .font_family_editor import (
+        FontFamilyListEditor,
+    )
+    from .font_property_editor import (
+        FontPropertyEditorWidget,
+    )
+    from .helpers import (
+        ThemePreview,
+        ThemeSettings,
+        add_theme_menu,
+        add_theme_toolbar,
+    )
+    from .import_export import (
+        ThemeExportDialog,
+        ThemeImportDialog,
+        ThemeMetadataEditor,
+    )
+    from .metadata import (
+        ThemeInfo,
+        ThemeMetadataProvider,
+    )
+    from .mixins import (
+        CacheMixin,
+        CompositeMixin,
+        LifecycleMixin,
+        NotificationMixin,
+        PropertyMixin,
+        ThemeableMixin,
+        add_theming_to_widget,
+        remove_theming_from_widget,
+        themeable,
+    )
+    from .palette_generator import (
+        PaletteGenerator,
+    )
+    from .preview_samples import (
+        PreviewSampleGenerator,
+        ThemePreviewWidget,
+    )
+    from .primitives import (
+        ThemeButtonGroup,
+        ThemeComboBox,
+        ThemeListWidget,
+    )
+    from .properties import (
+        ColorProperty,
+        FontProperty,
+        ThemeProperty,
+    )
+    from .shortcuts import (
+        ThemeShortcuts,
+    )
+    from .theme_editor import (
+        ThemeEditorDialog,
+        ThemeEditorWidget,
+    )
+    from .token_browser import (
+        TokenBrowserWidget,
+    )
+    from .validation_panel import (
+        ValidationPanel,
+    )
+    from .vf_themed_application import (
+        VFThemedApplication,
+    )
 
-# Convenience themed widgets
-from .convenience import (
-    ThemedDialog,
-    ThemedMainWindow,
-    ThemedQWidget,
-)
-from .dialogs import (
-    ThemePickerDialog,
-    ThemeSettingsWidget,
-)
-from .font_editor import (
-    FontEditorWidget,
-)
-from .font_family_editor import (
-    FontFamilyListEditor,
-)
-from .font_property_editor import (
-    FontPropertyEditorWidget,
-)
-from .helpers import (
-    ThemePreview,
-    ThemeSettings,
-    add_theme_menu,
-    add_theme_toolbar,
-)
-from .import_export import (
-    ThemeExportDialog,
-    ThemeImportDialog,
-    ThemeMetadataEditor,
-)
-from .metadata import (
-    ThemeInfo,
-    ThemeMetadataProvider,
-)
-from .mixins import (
-    CacheMixin,
-    CompositeMixin,
-    LifecycleMixin,
-    NotificationMixin,
-    PropertyMixin,
-    ThemeableMixin,
-    add_theming_to_widget,
-    remove_theming_from_widget,
-    themeable,
-)
-from .palette_generator import (
-    PaletteGenerator,
-)
-from .preview_samples import (
-    PreviewSampleGenerator,
-    ThemePreviewWidget,
-)
-from .primitives import (
-    ThemeButtonGroup,
-    ThemeComboBox,
-    ThemeListWidget,
-)
-from .properties import (
-    ColorProperty,
-    FontProperty,
-    ThemeProperty,
-)
-from .shortcuts import (
-    ThemeShortcuts,
-)
-from .theme_editor import (
-    ThemeEditorDialog,
-    ThemeEditorWidget,
-)
-from .token_browser import (
-    TokenBrowserWidget,
-)
-from .validation_panel import (
-    ValidationPanel,
-)
-from .vf_themed_application import (
-    VFThemedApplication,
-)
 
 __all__ = [
     # Primary user-facing classes - THE API
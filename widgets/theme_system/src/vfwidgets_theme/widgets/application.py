@@ -101,6 +101,7 @@ from ..errors import ThemeError, ThemeNotFoundError, get_global_error_recovery_m
 from ..lifecycle import LifecycleManager
 from ..logging import get_debug_logger
 from ..threading import ThreadSafeThemeManager
+from ..tracing import enable_tracing
 from .metadata import ThemeInfo
 
 logger = get_debug_logger(__name__)
@@ -121,6 +122,10 @@ class ApplicationConfig:
     enable_hot_reload: bool = False
     hot_reload_debounce_ms: int = 100
     hot_reload_dev_mode_only: bool = True
+    # Install one consolidated QSS on QApplication instead of per-widget sheets
+    application_stylesheet: bool = False
+    # Load discovered theme files on a thread pool after startup
+    preload_themes: bool = True
 
 
 class ApplicationThemeManager:
@@ -155,10 +160,12 @@ class ApplicationThemeManager:
                 self._widget_count = widget_count
                 self._theme_switch_count += 1
 
-                # Notify theme manager to update all widgets
+                # Notify theme manager to update all widgets. Applied right away
+                # even with coalescing on: theme_changed is emitted as soon as
+                # this returns and widgets must see the new theme
                 theme_manager = ThemeManager.get_instance()
                 if theme_manager:
-                    theme_manager.set_theme(theme.name)
+                    theme_manager.set_theme(theme.name, immediate=True)
 
                 # Calculate performance metrics
                 switch_time = time.perf_counter() - start_time
@@ -434,6 +441,10 @@ class ThemedApplication(QApplication if QT_AVAILABLE else QObject):
         from the developer.
         """
         try:
+            # Record theme pipeline spans; see vfwidgets_theme.tracing
+            if self._config.performance_monitoring:
+                enable_tracing(clear=False)
+
             # Get singleton instance of ThemeManager
             self._theme_manager = ThemeManager.get_instance()
             # Optional components (not singletons)
@@ -443,10 +454,17 @@ class ThemedApplication(QApplication if QT_AVAILABLE else QObject):
             # Built-in themes are already loaded by ThemeManager/ThemeRepository
             # No need to duplicate theme initialization
 
+            if self._config.application_stylesheet:
+                self.set_application_stylesheet_enabled(True)
+
             # Load theme directories from config
             for theme_dir in self._config.theme_directories:
                 self.discover_themes_from_directory(theme_dir)
 
+            # Startup only indexed the theme files, finish loading them off the GUI thread
+            if self._config.preload_themes:
+                self._theme_manager.preload_themes()
+
             # Mark as initialized BEFORE theme setting so set_theme() can succeed
             # (set_theme() checks _is_initialized and rejects calls if False)
             self._is_initialized = True
@@ -547,8 +565,12 @@ class ThemedApplication(QApplication if QT_AVAILABLE else QObject):
             else:
                 theme_obj = theme
                 theme_name = theme.name
-                # Add to ThemeManager if not present
-                if not self._theme_manager.has_theme(theme_name):
+                # Add to ThemeManager if not present; an edited version of a known
+                # theme replaces it, and the switch only updates what changed
+                if (
+                    not self._theme_manager.has_theme(theme_name)
+                    or self._theme_manager.get_theme(theme_name) != theme_obj
+                ):
                     self._theme_manager.add_theme(theme_obj)
 
             logger.debug(f"Setting application theme to: {theme_name}")
@@ -640,15 +662,7 @@ class ThemedApplication(QApplication if QT_AVAILABLE else QObject):
 
             logger.debug(f"Loading theme from file: {path}")
 
-            # Load file content
-            with open(path, encoding="utf-8") as f:
-                if path.suffix.lower() == ".yaml" or path.suffix.lower() == ".yml":
-                    theme_data = yaml.safe_load(f)
-                else:
-                    theme_data = json.load(f)
-
-            # Create theme from data
-            theme = Theme.from_dict(theme_data)
+            theme = self._read_theme_file(path)
 
             # Add to ThemeManager
             self._theme_manager.add_theme(theme)
@@ -668,6 +682,24 @@ class ThemedApplication(QApplication if QT_AVAILABLE else QObject):
             logger.error(f"Error loading theme file '{file_path}': {e}")
             return False
 
+    def _read_theme_file(self, path: Path) -> Theme:
+        """Parse and validate a JSON or YAML theme file.
+
+        Args:
+            path: Path to theme file
+
+        Returns:
+            Theme from the file
+
+        """
+        with open(path, encoding="utf-8") as f:
+            if path.suffix.lower() == ".yaml" or path.suffix.lower() == ".yml":
+                theme_data = yaml.safe_load(f)
+            else:
+                theme_data = json.load(f)
+
+        return Theme.from_dict(theme_data)
+
     def save_current_theme(self, file_path: Union[str, Path]) -> bool:
         """Save current theme to file.
 
@@ -972,6 +1004,42 @@ class ThemedApplication(QApplication if QT_AVAILABLE else QObject):
             logger.error(f"Error reloading current theme: {e}")
             return False
 
+    def set_application_stylesheet_enabled(self, enabled: bool) -> bool:
+        """Switch between one application-level stylesheet and per-widget sheets.
+
+        In application stylesheet mode the comprehensive widget rules are
+        installed once on QApplication, scoped to themed widgets, and each
+        ThemedWidget only keeps the rules from _generate_custom_stylesheet().
+        This avoids re-parsing overlapping stylesheets on large UIs.
+
+        Args:
+            enabled: Whether to use the consolidated application stylesheet
+
+        Returns:
+            True if the mode was applied, False otherwise
+
+        """
+        try:
+            if not self._theme_manager:
+                logger.warning("Theme manager not initialized")
+                return False
+
+            from .stylesheet_generator import StylesheetGenerator
+
+            factory = StylesheetGenerator.generate_application_stylesheet if enabled else None
+            self._theme_manager.set_application_stylesheet_factory(factory)
+
+            # Let existing widgets drop or restore their own sheets
+            if self._current_theme:
+                self.theme_changed.emit(self._current_theme.name)
+
+            logger.debug(f"Application stylesheet mode {'enabled' if enabled else 'disabled'}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Error switching application stylesheet mode: {e}")
+            return False
+
     def get_performance_statistics(self) -> dict[str, Any]:
         """Get application-level performance statistics.
 
@@ -1457,21 +1525,16 @@ class ThemedApplication(QApplication if QT_AVAILABLE else QObject):
                     if self._theme_manager.has_theme(theme_name)
                     else None
                 )
-                if current_theme and hasattr(current_theme, "metadata"):
-                    metadata = current_theme.metadata
-                    if metadata.get("source") == "vscode":
-                        success = self.import_vscode_theme(file_path)
-                    else:
-                        success = self.load_theme_file(file_path)
-                else:
-                    success = self.load_theme_file(file_path)
+                metadata = getattr(current_theme, "metadata", None) or {}
+                if metadata.get("source") == "vscode":
+                    success = self.import_vscode_theme(file_path)
 
-                # If this is the current theme, re-apply it
-                if success and self._current_theme and self._current_theme.name == theme_name:
-                    # Re-apply the reloaded theme
-                    success = self.set_theme(theme_name, persist=False)
+                    # If this is the current theme, re-apply it
+                    if success and self._current_theme and self._current_theme.name == theme_name:
+                        success = self.set_theme(theme_name, persist=False)
+                    return success
 
-                return success
+                return self._reload_theme_incrementally(file_path)
 
             return False
 
@@ -1479,6 +1542,35 @@ class ThemedApplication(QApplication if QT_AVAILABLE else QObject):
             logger.error(f"Error in hot reload callback for {file_path}: {e}")
             return False
 
+    def _reload_theme_incrementally(self, file_path: Path) -> bool:
+        """Replace a theme from its changed file, updating only what changed.
+
+        Args:
+            file_path: Path to the changed theme file
+
+        Returns:
+            True if reload was successful
+
+        """
+        theme = self._read_theme_file(file_path)
+
+        # The manager re-applies the current theme, widgets skip unaffected updates
+        diff = self._theme_manager.reload_theme(theme)
+        if diff.is_empty:
+            logger.debug(f"Theme file {file_path} has no changes for '{theme.name}'")
+            return True
+
+        self._theme_file_paths[theme.name] = file_path
+        self.theme_loaded.emit(theme.name)
+
+        if self._current_theme and self._current_theme.name == theme.name:
+            self._current_theme = theme
+            if diff.has_visual_changes:
+                self.theme_changed.emit(theme.name)
+
+        logger.debug(f"Hot reloaded theme '{theme.name}': {diff.summary()}")
+        return True
+
     def _on_theme_hot_reloaded(self, file_path: str, success: bool):
         """Handle theme hot reload completion signal."""
         try:
@@ -30,6 +30,7 @@ Task 9 Implementation Features:
 - Performance optimization meeting all requirements
 """
 
+import sys
 import threading
 import uuid
 import weakref
@@ -37,8 +38,8 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
 try:
-    from PySide6.QtCore import QObject, QTimer, Signal
-    from PySide6.QtGui import QCloseEvent, QPalette
+    from PySide6.QtCore import QObject, Qt, QTimer, Signal
+    from PySide6.QtGui import QCloseEvent, QPalette, QShowEvent
     from PySide6.QtWidgets import QWidget
 
     QT_AVAILABLE = True
@@ -97,6 +98,9 @@ except ImportError:
     class QCloseEvent:
         pass
 
+    class QShowEvent:
+        pass
+
 
 # Import foundation modules
 from ..core.manager import ThemeManager
@@ -106,6 +110,7 @@ from ..errors import PropertyNotFoundError, ThemeError, get_global_error_recover
 from ..lifecycle import LifecycleManager
 from ..logging import get_debug_logger
 from ..threading import ThreadSafeThemeManager
+from ..tracing import trace_span
 
 if TYPE_CHECKING:
     pass
@@ -173,70 +178,153 @@ class ThemePropertyDescriptor:
                 del self._cache[cache_key]
 
 
+class _SharedProperties:
+    """Resolved theme properties of one widget class for one theme generation."""
+
+    __slots__ = ("generation", "values")
+
+    def __init__(self, generation: int):
+        self.generation = generation
+        self.values: dict[str, Any] = {}
+
+
+# Resolved properties shared by all widgets of a class. A table is only valid
+# for the ThemeManager generation it was filled in; the first read after a
+# theme switch or override change starts a new one.
+_shared_properties: "weakref.WeakKeyDictionary[type, _SharedProperties]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
 class ThemePropertiesManager:
-    """Manager for theme property access with caching and performance optimization."""
+    """Manager for theme property access with caching and performance optimization.
+
+    Kept small because every themed widget has one: resolved values live in
+    a table shared by all widgets of the same class, the lock is shared, and
+    per-widget containers are only allocated once they are needed.
+    """
+
+    __slots__ = (
+        "_widget",
+        "_local",
+        "_dependencies",
+        "_cache_hits",
+        "_cache_misses",
+        "__weakref__",
+    )
+
+    # Shared by all instances; only guards short bookkeeping, never resolution
+    _lock = threading.RLock()
 
     def __init__(self, widget: "ThemedWidget"):
         self._widget = weakref.ref(widget)
-        self._cache: dict[str, Any] = {}
-        self._lock = threading.RLock()
+        # Values set through set_property(), and the resolution cache of
+        # widgets that cannot use the shared table
+        self._local: Optional[dict[str, Any]] = None
+        # Token paths read so far, for incremental theme updates; a tuple is
+        # far smaller than a set for the handful of tokens a widget reads
+        self._dependencies: tuple[str, ...] = ()
         self._cache_hits = 0
         self._cache_misses = 0
 
+    @property
+    def dependencies(self) -> frozenset[str]:
+        """Token paths this widget has read through theme properties."""
+        with self._lock:
+            return frozenset(self._dependencies)
+
     @property
     def cache_hit_rate(self) -> float:
         """Get cache hit rate for performance monitoring."""
         total = self._cache_hits + self._cache_misses
         return self._cache_hits / total if total > 0 else 0.0
 
+    def _resolved_values(self, widget: "ThemedWidget", theme_manager: Any) -> dict[str, Any]:
+        """Get the table resolved values of the widget are cached in.
+
+        Widgets using their class's theme_config share one table per class
+        and theme generation; others (custom per-instance config, managers
+        without a generation) cache per instance.
+        """
+        generation = getattr(theme_manager, "theme_generation", None)
+        widget_class = type(widget)
+        config = getattr(widget_class, "_merged_theme_config", None)
+        if type(generation) is int and getattr(widget, "_theme_config", None) is config:
+            shared = _shared_properties.get(widget_class)
+            if shared is None or shared.generation != generation:
+                with self._lock:
+                    shared = _shared_properties.get(widget_class)
+                    if shared is None or shared.generation != generation:
+                        shared = _shared_properties[widget_class] = _SharedProperties(generation)
+            return shared.values
+
+        if self._local is None:
+            self._local = {}
+        return self._local
+
+    def _add_dependency(self, property_path: str) -> None:
+        """Record a token path read by the widget."""
+        if property_path in self._dependencies:
+            return
+        with self._lock:
+            if property_path not in self._dependencies:
+                self._dependencies += (property_path,)
+
     def get_property(self, property_name: str, default_value: Any = None) -> Any:
         """Get theme property with caching."""
         widget = self._widget()
         if widget is None:
             return default_value
 
-        with self._lock:
-            # Check cache first
-            if property_name in self._cache:
+        # Values set on this widget win over resolved ones
+        local = self._local
+        if local is not None and property_name in local:
+            self._cache_hits += 1
+            return local[property_name]
+
+        property_path = property_name
+        try:
+            # Get from theme system
+            theme_manager = widget._theme_manager
+            if not theme_manager:
+                self._cache_misses += 1
+                return default_value
+
+            # Look up the property path from theme_config
+            theme_config = getattr(widget, "_theme_config", None)
+            if theme_config and property_name in theme_config:
+                property_path = theme_config[property_name]
+            self._add_dependency(property_path)
+
+            values = self._resolved_values(widget, theme_manager)
+            value = values.get(property_name)
+            if value is not None:
                 self._cache_hits += 1
-                return self._cache[property_name]
+                return value
 
             self._cache_misses += 1
 
-            try:
-                # Get from theme system
-                theme_manager = widget._theme_manager
-                if not theme_manager:
-                    return default_value
-
-                # Look up the property path from theme_config
-                property_path = property_name
-                if hasattr(widget, "_theme_config") and property_name in widget._theme_config:
-                    property_path = widget._theme_config[property_name]
-
-                # ✅ NEW: Use ThemeManager.resolve_token() instead of direct navigation
-                # Infer token type from property name (heuristic)
-                token_type = self._infer_token_type(property_name, property_path)
-
-                # Resolve using unified API (with override support!)
-                value = theme_manager.resolve_token(
-                    property_path,
-                    token_type,
-                    fallback=default_value
-                )
+            # ✅ NEW: Use ThemeManager.resolve_token() instead of direct navigation
+            # Infer token type from property name (heuristic)
+            token_type = self._infer_token_type(property_name, property_path)
 
-                if value is not None:
-                    # Cache the value
-                    self._cache[property_name] = value
-                    return value
+            # Resolve using unified API (with override support!). The fallback
+            # is applied per call: the table is shared by every widget of the
+            # class and must only hold values that came from the theme
+            value = theme_manager.resolve_token(property_path, token_type)
 
-                return default_value
+            if value is not None:
+                # Cache the value
+                values[property_name] = value
+                return value
 
-            except PropertyNotFoundError:
-                return default_value
-            except Exception as e:
-                logger.error(f"Error getting theme property {property_path}: {e}")
-                return default_value
+            return default_value
+
+        except PropertyNotFoundError:
+            return default_value
+        except Exception as e:
+            logger.error(f"Error getting theme property {property_path}: {e}")
+            return default_value
 
     def set_property(self, property_path: str, value: Any) -> None:
         """Set theme property and invalidate cache."""
@@ -244,17 +332,19 @@ class ThemePropertiesManager:
         if widget is None:
             return
 
-        with self._lock:
-            try:
-                # Set the property (this would typically create a custom theme)
-                # For now, just store it locally
-                self._cache[property_path] = value
+        try:
+            # Set the property (this would typically create a custom theme)
+            # For now, just store it locally
+            with self._lock:
+                if self._local is None:
+                    self._local = {}
+                self._local[property_path] = value
 
-                # Notify widget of change
-                widget._on_property_changed(property_path, value)
+            # Notify widget of change
+            widget._on_property_changed(property_path, value)
 
-            except Exception as e:
-                logger.error(f"Error setting theme property {property_path}: {e}")
+        except Exception as e:
+            logger.error(f"Error setting theme property {property_path}: {e}")
 
     def _infer_token_type(self, property_name: str, property_path: str) -> TokenType:
         """Infer token type from property name or path.
@@ -335,14 +425,35 @@ class ThemePropertiesManager:
             return None
 
     def invalidate_cache(self) -> None:
-        """Invalidate all cached properties."""
-        with self._lock:
-            self._cache.clear()
+        """Invalidate all cached properties.
+
+        Drops values set on this widget and its own cache. The shared table
+        needs no invalidation, it is replaced when the theme generation
+        changes.
+        """
+        self._local = None
+
+    def memory_size(self) -> int:
+        """Estimate the bytes this widget's property state takes.
+
+        Shared tables are not included, they are paid once per class.
+        """
+        size = sys.getsizeof(self)
+        if self._local is not None:
+            size += sys.getsizeof(self._local)
+        if self._dependencies:
+            size += sys.getsizeof(self._dependencies)
+        return size
 
     def get_statistics(self) -> dict[str, Any]:
         """Get cache statistics for performance monitoring."""
+        cache_size = len(self._local or ())
+        widget = self._widget()
+        shared = _shared_properties.get(type(widget)) if widget is not None else None
+        if shared is not None:
+            cache_size += len(shared.values)
         return {
-            "cache_size": len(self._cache),
+            "cache_size": cache_size,
             "cache_hits": self._cache_hits,
             "cache_misses": self._cache_misses,
             "hit_rate": self.cache_hit_rate,
@@ -391,6 +502,8 @@ class ThemeAccess:
         "alpha": "1.0",
     }
 
+    __slots__ = ("_widget",)
+
     def __init__(self, widget: "ThemedWidget"):
         self._widget = weakref.ref(widget)
 
@@ -554,6 +667,38 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
         "font": "text.font",
     }
 
+    # Defer theme updates for widgets hidden inside a live UI (background tabs,
+    # collapsed panels, closed dialogs) until their next showEvent. Subclasses
+    # that render while hidden (e.g. grab() for thumbnails) can set this False.
+    lazy_theme_updates = True
+
+    # Skip stylesheet regeneration and on_theme_changed() when a theme change
+    # (hot reload, switching between related themes) touches none of the
+    # tokens this widget read. Opt-in: only reads through self.theme and
+    # get_current_theme() are tracked, so subclasses must not read theme data
+    # any other way (ThemeManager.current_theme, ThemedApplication) when
+    # setting this True.
+    incremental_theme_updates = False
+
+    # Per-widget state defaults. Kept on the class so widgets only store the
+    # values that differ, which matters with thousands of themed widgets
+    _lifecycle_manager: Optional[LifecycleManager] = None
+    _thread_manager: Optional[ThreadSafeThemeManager] = None
+    _current_theme_name: Optional[str] = None
+    _is_theme_registered = False
+    _is_theme_system_ready = False
+    _property_cache_enabled = True
+    _theme_applied = False  # Track if theme has been applied (for Polish event)
+    _theme_dirty = False  # Theme changed while hidden, apply on next show
+    _has_custom_palette = False  # Widget-level palette set by _generate_custom_palette
+    _rendered_theme: Optional[Theme] = None  # Theme of the last full update
+    _reads_whole_theme = False  # get_current_theme() was used
+
+    # Performance tracking
+    _theme_update_count = 0
+    _last_theme_update = 0.0
+    _deferred_theme_updates = 0
+
     # Qt signals for theme updates
     if QT_AVAILABLE:
         theme_changed = Signal(str)  # Emitted when theme changes
@@ -586,8 +731,6 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
 
         # Initialize managers (dependency injection)
         self._theme_manager: Optional[ThemeManager] = None
-        self._lifecycle_manager: Optional[LifecycleManager] = None
-        self._thread_manager: Optional[ThreadSafeThemeManager] = None
 
         # Initialize theme properties manager
         self._theme_properties = ThemePropertiesManager(self)
@@ -595,22 +738,11 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
         # Theme access object
         self.theme = ThemeAccess(self)
 
-        # Widget state
-        self._current_theme_name: Optional[str] = None
-        self._is_theme_registered = False
-        self._is_theme_system_ready = False
-        self._property_cache_enabled = True
-        self._theme_applied = False  # Track if theme has been applied (for Polish event)
-
         # Merge theme config from class hierarchy
         self._theme_config = getattr(
             self.__class__, "_merged_theme_config", self.theme_config.copy()
         )
 
-        # Performance tracking
-        self._theme_update_count = 0
-        self._last_theme_update = 0.0
-
         # Set up the widget
         self._initialize_theme_system()
 
@@ -629,9 +761,8 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
         try:
             # Get singleton instance of ThemeManager
             self._theme_manager = ThemeManager.get_instance()
-            # Optional components (not singletons)
-            self._lifecycle_manager = None  # Will be created if needed
-            self._thread_manager = None  # Will be created if needed
+            # Optional components (not singletons) stay at their class
+            # defaults until needed
 
             # Register widget with shared registry from ThemeManager
             if self._theme_manager and hasattr(self._theme_manager, "_widget_registry"):
@@ -698,12 +829,25 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
             # Call user-defined theme change handler if it exists
             if hasattr(self, "on_theme_changed") and callable(self.on_theme_changed):
                 try:
-                    self.on_theme_changed()
+                    with trace_span("on_theme_changed", "handler", self):
+                        self.on_theme_changed()
                 except Exception as e:
                     logger.error(f"Error in initial theme handler call: {e}")
 
             self._theme_applied = True
 
+    def _theme_state_size(self) -> int:
+        """Estimate the bytes of theming state this widget carries.
+
+        Counts the property manager, the theme access object and the
+        attribute dictionary of the Python wrapper; memory owned by Qt is
+        not included. Used by the lifecycle registry's memory estimate.
+        """
+        size = sys.getsizeof(self.__dict__) + sys.getsizeof(self.theme)
+        if isinstance(self._theme_properties, ThemePropertiesManager):
+            size += self._theme_properties.memory_size()
+        return size
+
     def _get_theme_property(self, property_path: str, default_value: Any = None) -> Any:
         """Get theme property through the properties manager."""
         return self._theme_properties.get_property(property_path, default_value)
@@ -727,6 +871,9 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
     def _on_global_theme_changed(self, theme_name: str) -> None:
         """Handle theme change signal from application.
 
+        Like _on_theme_changed(), theme_changed is emitted right away on every
+        path, including updates skipped by the diff or deferred while hidden.
+
         Args:
             theme_name: Name of the new theme
 
@@ -738,18 +885,39 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
             # Update current theme name
             self._current_theme_name = theme_name
 
+            # Tokens this widget uses are unchanged, only the palette may differ
+            if self._theme_change_is_irrelevant():
+                self._rendered_theme = self._theme_manager.current_theme
+                with trace_span("apply_palette", "palette", self):
+                    self._apply_theme_palette()
+                self._emit_theme_changed(theme_name)
+                return
+
             # Invalidate property cache
             self._theme_properties.invalidate_cache()
 
+            # Hidden widgets catch up in showEvent instead
+            if self._defer_theme_update_if_hidden():
+                self._emit_theme_changed(theme_name)
+                return
+
             # Apply theme update (regenerate and apply stylesheet)
             self._apply_theme_update()
 
             # Call the public on_theme_changed method
-            self.on_theme_changed()
+            with trace_span("on_theme_changed", "handler", self):
+                self.on_theme_changed()
+
+            self._emit_theme_changed(theme_name)
 
         except Exception as e:
             logger.error(f"Error handling theme change: {e}")
 
+    def _emit_theme_changed(self, theme_name: str) -> None:
+        """Emit theme_changed when Qt signals are available."""
+        if self.theme_changed is not None:
+            self.theme_changed.emit(theme_name)
+
     def _on_theme_changed(self, theme: Theme) -> None:
         """Handle global theme changes.
 
@@ -766,13 +934,19 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
             # Invalidate property cache
             self._theme_properties.invalidate_cache()
 
+            # Hidden widgets catch up in showEvent instead
+            if self._defer_theme_update_if_hidden():
+                self.theme_changed.emit(theme.name)
+                return
+
             # Apply theme update
             self._apply_theme_update()
 
             # Call user-defined handler if it exists
             if hasattr(self, "on_theme_changed") and callable(self.on_theme_changed):
                 try:
-                    self.on_theme_changed()
+                    with trace_span("on_theme_changed", "handler", self):
+                        self.on_theme_changed()
                 except Exception as e:
                     logger.error(f"Error in user theme change handler: {e}")
 
@@ -797,27 +971,130 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
                 context={"widget_id": self._widget_id, "theme": theme.name if theme else "unknown"},
             )
 
+    def _theme_change_is_irrelevant(self) -> bool:
+        """Check whether the last theme change leaves this widget's tokens untouched.
+
+        Only the manager's diff from exactly the theme this widget last
+        rendered to the current theme is trusted; anything else (overrides,
+        missed or deferred updates) takes the full update path.
+
+        Returns:
+            True if stylesheet and theme handlers can be skipped
+
+        """
+        if not self.incremental_theme_updates or self._reads_whole_theme or self._theme_dirty:
+            return False
+
+        manager = self._theme_manager
+        diff = getattr(manager, "last_theme_diff", None)
+        if diff is None or self._rendered_theme is None:
+            return False
+        if diff.old_theme is not self._rendered_theme:
+            return False
+        if diff.new_theme is not manager.current_theme:
+            return False
+
+        dependencies = set(self._theme_properties.dependencies)
+        if not self._uses_application_stylesheet() and not self.property("vftheme_disable"):
+            from .stylesheet_generator import StylesheetGenerator
+
+            dependencies |= StylesheetGenerator.token_dependencies()
+
+        return not diff.affects(dependencies)
+
+    def _defer_theme_update_if_hidden(self) -> bool:
+        """Mark the widget dirty instead of restyling it while it is hidden.
+
+        Only widgets hidden inside a live UI are deferred: their window is
+        visible, or they have been explicitly shown/hidden before. Widgets that
+        were never shown (still being constructed) are themed eagerly so they
+        come up styled.
+
+        Returns:
+            True if the update was deferred to the next showEvent
+
+        """
+        if not QT_AVAILABLE or not self.lazy_theme_updates:
+            return False
+
+        try:
+            if self.isVisible():
+                return False
+
+            explicitly_hidden = self.testAttribute(Qt.WidgetAttribute.WA_WState_ExplicitShowHide)
+            if not (self.window().isVisible() or explicitly_hidden):
+                return False
+        except Exception:
+            # Half-destroyed or non-QWidget hosts: fall back to eager update
+            return False
+
+        if not self._theme_dirty:
+            self._deferred_theme_updates += 1
+        self._theme_dirty = True
+        logger.debug(f"Deferred theme update for hidden widget {self._widget_id}")
+        return True
+
+    def _flush_deferred_theme_update(self) -> None:
+        """Apply a theme change that arrived while the widget was hidden."""
+        if not self._theme_dirty:
+            return
+        self._theme_dirty = False
+
+        self._apply_theme_update()
+
+        if hasattr(self, "on_theme_changed") and callable(self.on_theme_changed):
+            try:
+                with trace_span("on_theme_changed", "handler", self):
+                    self.on_theme_changed()
+            except Exception as e:
+                logger.error(f"Error in user theme change handler: {e}")
+
+        if self.theme_applied is not None:
+            self.theme_applied.emit()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Apply any theme update deferred while the widget was hidden."""
+        try:
+            self._flush_deferred_theme_update()
+        except Exception as e:
+            logger.error(f"Error applying deferred theme update: {e}")
+
+        super().showEvent(event)
+
     def _apply_theme_update(self) -> None:
         """Apply theme updates to the widget."""
         try:
             if not self._is_theme_system_ready:
                 return
 
-            # Generate and apply stylesheet
-            stylesheet = self._generate_stylesheet()
-            if stylesheet:
-                self.setStyleSheet(stylesheet)
+            with trace_span("apply_theme_update", "widget", self):
+                # A direct update supersedes any pending deferred one
+                self._theme_dirty = False
+
+                # Generate and apply stylesheet
+                with trace_span("generate_stylesheet", "style", self):
+                    stylesheet = self._generate_stylesheet()
+                if self._uses_application_stylesheet():
+                    # Only custom overrides live on the widget; skip the re-polish
+                    # when they did not change
+                    self._sync_application_stylesheet_scope()
+                    if stylesheet != self.styleSheet():
+                        with trace_span("setStyleSheet", "polish", self):
+                            self.setStyleSheet(stylesheet)
+                elif stylesheet:
+                    with trace_span("setStyleSheet", "polish", self):
+                        self.setStyleSheet(stylesheet)
+
+                # Apply palette (QPalette integration)
+                with trace_span("apply_palette", "palette", self):
+                    self._apply_theme_palette()
 
-            # Generate and apply palette (NEW: QPalette integration)
-            palette = self._generate_palette()
-            if palette:
-                self.setPalette(palette)
-                # Apply palette to all child widgets recursively
-                self._apply_palette_to_children(palette)
+                if self._theme_manager:
+                    self._rendered_theme = self._theme_manager.current_theme
 
-            # Force repaint
-            if hasattr(self, "update"):
-                self.update()
+                # Force repaint
+                if hasattr(self, "update"):
+                    self.update()
 
         except Exception as e:
             logger.error(f"Error applying theme update: {e}")
@@ -847,6 +1124,10 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
 
             theme = self._theme_manager.current_theme
 
+            # Base rules come from the application stylesheet in that mode
+            if self._uses_application_stylesheet():
+                return self._generate_custom_stylesheet()
+
             # Use StylesheetGenerator for comprehensive styling
             from .stylesheet_generator import StylesheetGenerator
 
@@ -872,6 +1153,25 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
             except Exception:
                 return ""
 
+    def _uses_application_stylesheet(self) -> bool:
+        """Check whether base styling comes from the application stylesheet."""
+        manager = self._theme_manager
+        return bool(manager and getattr(manager, "application_stylesheet_enabled", False))
+
+    def _sync_application_stylesheet_scope(self) -> None:
+        """Mark this widget as covered by the application stylesheet scope."""
+        from .stylesheet_generator import APPLICATION_SCOPE_PROPERTY
+
+        scoped = not self.property("vftheme_disable")
+        if bool(self.property(APPLICATION_SCOPE_PROPERTY)) == scoped:
+            return
+
+        self.setProperty(APPLICATION_SCOPE_PROPERTY, scoped)
+        # Property selectors are only re-evaluated on polish
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+
     def _generate_custom_stylesheet(self) -> str:
         """Generate custom stylesheet for this widget.
 
@@ -905,6 +1205,7 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
 
         Uses PaletteGenerator to create comprehensive QPalette that handles
         color roles QSS cannot control (alternating rows, selections, etc.).
+        The base palette is generated once per theme generation and cached.
         Subclasses can override _generate_custom_palette() to customize.
 
         Returns:
@@ -912,37 +1213,96 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
 
         """
         try:
-            if not self._is_theme_system_ready:
+            theme = self._palette_theme()
+            if theme is None:
                 return None
 
-            # Check if this widget has opted out of theming
-            if self.property("vftheme_disable"):
-                return None
+            # Allow subclasses to customize palette
+            # Custom colors replace the base palette
+            custom_palette = self._generate_custom_palette()
+            if custom_palette:
+                return custom_palette
 
-            # Get current theme
-            if not self._theme_manager or not self._theme_manager.current_theme:
-                return None
+            from .palette_generator import PaletteGenerator
 
-            theme = self._theme_manager.current_theme
+            return PaletteGenerator.cached_palette(theme)
+
+        except Exception as e:
+            logger.error(f"Error generating palette: {e}")
+            return None
+
+    def _palette_theme(self):
+        """Get the theme the palette should follow, or None if not themed."""
+        if not self._is_theme_system_ready:
+            return None
+
+        # Check if this widget has opted out of theming
+        if self.property("vftheme_disable"):
+            return None
+
+        if not self._theme_manager or not self._theme_manager.current_theme:
+            return None
+
+        return self._theme_manager.current_theme
+
+    def _apply_theme_palette(self) -> None:
+        """Apply the theme palette with a single PaletteChange per widget.
+
+        The base palette is installed once on QApplication, from where Qt
+        propagates it to every widget without a palette of its own. Only
+        widgets with a custom palette get a widget-level one.
+        """
+        try:
+            theme = self._palette_theme()
+            if theme is None:
+                return
 
-            # Use PaletteGenerator for automatic palette generation
             from .palette_generator import PaletteGenerator
 
-            generator = PaletteGenerator(theme)
-            base_palette = generator.generate_palette()
+            application_palette = PaletteGenerator.apply_to_application(theme)
 
-            # Allow subclasses to customize palette
             custom_palette = self._generate_custom_palette()
+            if not custom_palette and not application_palette:
+                custom_palette = PaletteGenerator.cached_palette(theme)
+
             if custom_palette:
-                # Merge custom palette into base palette
-                # Custom colors override base colors
-                return custom_palette
-            else:
-                return base_palette
+                self.setPalette(custom_palette)
+                self._apply_palette_to_children(custom_palette)
+                self._has_custom_palette = True
+            elif self._has_custom_palette:
+                # Drop the widget-level palettes and inherit the application one
+                self.setPalette(QPalette())
+                self._apply_palette_to_children(QPalette())
+                self._has_custom_palette = False
 
         except Exception as e:
-            logger.error(f"Error generating palette: {e}")
-            return None
+            logger.error(f"Error applying palette: {e}")
+
+    def _apply_palette_to_children(self, palette: QPalette) -> None:
+        """Apply a widget-level palette to all descendants in a single pass.
+
+        Stylesheet-styled children resolve their palette from the application
+        palette rather than from their parent, so widget-level palettes have to
+        be set explicitly. Subtrees of nested ThemedWidgets are skipped since
+        they apply their own palette.
+
+        Args:
+            palette: QPalette to apply to descendants
+
+        """
+        try:
+            if not hasattr(self, 'children'):
+                return
+
+            pending = list(self.children())
+            while pending:
+                child = pending.pop()
+                if isinstance(child, ThemedWidget) or not hasattr(child, 'setPalette'):
+                    continue
+                child.setPalette(palette)
+                pending.extend(child.children())
+        except Exception as e:
+            logger.debug(f"Error applying palette to children: {e}")
 
     def _generate_custom_palette(self) -> Optional[QPalette]:
         """Generate custom palette for this widget.
@@ -965,31 +1325,6 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
         """
         return None
 
-    def _apply_palette_to_children(self, palette: QPalette) -> None:
-        """Apply palette recursively to all child widgets.
-
-        Qt doesn't automatically propagate palette to children, so we need to
-        explicitly set it on all child widgets for proper theming.
-
-        Args:
-            palette: QPalette to apply to children
-
-        """
-        try:
-            if not hasattr(self, 'children'):
-                return
-
-            for child in self.children():
-                if hasattr(child, 'setPalette'):
-                    child.setPalette(palette)
-                    # Recursively apply to grandchildren
-                    if hasattr(child, 'children'):
-                        for grandchild in child.children():
-                            if hasattr(grandchild, 'setPalette'):
-                                grandchild.setPalette(palette)
-        except Exception as e:
-            logger.debug(f"Error applying palette to children: {e}")
-
     @property
     def theme_name(self) -> Optional[str]:
         """Get current theme name."""
@@ -1019,6 +1354,8 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
 
         """
         if hasattr(self, "_theme_manager") and self._theme_manager:
+            # Any token may be read from the theme object, so no update is skipped
+            self._reads_whole_theme = True
             return self._theme_manager.current_theme
         return None
 
@@ -1037,6 +1374,8 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
             "is_ready": self._is_theme_system_ready,
             "update_count": self._theme_update_count,
             "last_update": self._last_theme_update,
+            "theme_dirty": self._theme_dirty,
+            "deferred_updates": self._deferred_theme_updates,
         }
 
         # Add property manager statistics
@@ -1112,6 +1451,10 @@ class ThemedWidget(metaclass=ThemedWidgetMeta):
             if self.property("vftheme_disable"):
                 return
 
+            # Styling lives on QApplication, the widget sheet may be empty
+            if self._uses_application_stylesheet():
+                return
+
             # Check if stylesheet was applied
             stylesheet = self.styleSheet()
 
@@ -24,23 +24,41 @@ Usage:
     palette = generator.generate_palette()
     widget.setPalette(palette)
 
+    # Shared, cached palette installed once for the whole application
+    PaletteGenerator.apply_to_application(theme)
+
 Design Philosophy:
 PaletteGenerator completes the theming solution by handling the ~20% of Qt
 styling that QSS cannot control. Combined with StylesheetGenerator, widgets
 get complete, automatic theming without custom code.
 """
 
+from collections import OrderedDict
+from typing import Optional
+
 from PySide6.QtGui import QColor, QPalette
+from PySide6.QtWidgets import QApplication
 
 from ..core.theme import Theme
 from ..logging import get_debug_logger
 
 logger = get_debug_logger(__name__)
 
+# Number of theme generations whose palettes are kept around
+PALETTE_CACHE_SIZE = 8
+
+# Palette colors as hex strings keyed by (color group, color role)
+ColorTable = dict[tuple[QPalette.ColorGroup, QPalette.ColorRole], str]
+
 
 class PaletteGenerator:
     """Generates Qt QPalette from themes."""
 
+    # Palettes keyed by theme generation (name, content hash)
+    _palette_cache: "OrderedDict[tuple[str, int], QPalette]" = OrderedDict()
+    # Generation and application of the last application-level palette
+    _application_key: Optional[tuple[int, tuple[str, int]]] = None
+
     def __init__(self, theme: Theme):
         """Initialize palette generator.
 
@@ -57,17 +75,109 @@ class PaletteGenerator:
             QPalette configured with theme colors
 
         """
-        palette = QPalette()
+        palette = self.palette_from_table(self.color_table())
+        logger.debug(f"Generated QPalette for theme '{self.theme.name}'")
+        return palette
+
+    def color_table(self) -> ColorTable:
+        """Compute the palette colors without creating any Qt objects.
+
+        The table only reads the immutable theme, so it can be computed in a
+        worker thread and turned into a QPalette on the GUI thread.
+
+        Returns:
+            Hex color strings keyed by (color group, color role)
+
+        """
+        table: ColorTable = {}
 
         # Generate for all color groups
-        self._apply_active_colors(palette)
-        self._apply_inactive_colors(palette)
-        self._apply_disabled_colors(palette)
+        self._apply_active_colors(table)
+        self._apply_inactive_colors(table)
+        self._apply_disabled_colors(table)
+        return table
 
-        logger.debug(f"Generated QPalette for theme '{self.theme.name}'")
+    @staticmethod
+    def palette_from_table(table: ColorTable) -> QPalette:
+        """Build a QPalette from a color table.
+
+        Args:
+            table: Colors computed by color_table()
+
+        Returns:
+            QPalette with the table colors
+
+        """
+        palette = QPalette()
+        for (group, role), value in table.items():
+            palette.setColor(group, role, QColor(value))
         return palette
 
-    def _get_color(self, token_name: str, default: str) -> QColor:
+    @staticmethod
+    def _cache_key(theme: Theme) -> tuple[str, int]:
+        """Identify a theme generation; the hash changes with its content."""
+        return (theme.name, hash(theme))
+
+    @classmethod
+    def cached_palette(cls, theme: Theme, color_table: Optional[ColorTable] = None) -> QPalette:
+        """Get the palette for a theme, generating it once per theme generation.
+
+        Args:
+            theme: Theme to generate palette from
+            color_table: Colors precomputed for this theme, e.g. by a worker
+
+        Returns:
+            Copy of the cached QPalette (implicitly shared, so copying is cheap)
+
+        """
+        key = cls._cache_key(theme)
+        palette = cls._palette_cache.get(key)
+        if palette is None:
+            if color_table is not None:
+                palette = cls.palette_from_table(color_table)
+            else:
+                palette = cls(theme).generate_palette()
+            cls._palette_cache[key] = palette
+            while len(cls._palette_cache) > PALETTE_CACHE_SIZE:
+                cls._palette_cache.popitem(last=False)
+        else:
+            cls._palette_cache.move_to_end(key)
+        return QPalette(palette)
+
+    @classmethod
+    def apply_to_application(cls, theme: Theme, color_table: Optional[ColorTable] = None) -> bool:
+        """Install the theme palette on QApplication once per theme generation.
+
+        Qt propagates the application palette to every widget that has no
+        palette of its own, so themed widgets sharing the base palette don't
+        need to set it individually.
+
+        Args:
+            theme: Theme whose palette should be installed
+            color_table: Colors precomputed for this theme, e.g. by a worker
+
+        Returns:
+            True if the application palette matches the theme
+
+        """
+        app = QApplication.instance()
+        if app is None:
+            return False
+
+        key = (id(app), cls._cache_key(theme))
+        if cls._application_key != key:
+            app.setPalette(cls.cached_palette(theme, color_table))
+            cls._application_key = key
+            logger.debug(f"Applied application palette for theme '{theme.name}'")
+        return True
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop cached palettes and force the next application install."""
+        cls._palette_cache.clear()
+        cls._application_key = None
+
+    def _get_color(self, token_name: str, default: str) -> str:
         """Get color from theme with fallback to default.
 
         Args:
@@ -75,71 +185,70 @@ class PaletteGenerator:
             default: Default color hex string
 
         Returns:
-            QColor object
+            Color string
 
         """
-        value = self.theme.colors.get(token_name, default)
-        return QColor(value)
+        return self.theme.colors.get(token_name, default)
 
-    def _apply_active_colors(self, palette: QPalette) -> None:
+    def _apply_active_colors(self, table: ColorTable) -> None:
         """Apply colors for active (focused) widgets.
 
         Args:
-            palette: QPalette to modify
+            table: Color table to fill
 
         """
         # Window colors
         window_bg = self._get_color('window.background', '#1e1e1e')
         window_fg = self._get_color('window.foreground', '#cccccc')
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.Window, window_bg)
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.WindowText, window_fg)
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.Window)] = window_bg
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.WindowText)] = window_fg
 
         # Base colors (for item views - alternating rows)
         base_bg = self._get_color('list.background', '#252526')
         alternate_bg = self._get_color('list.hoverBackground', '#2a2d2e')
         text_fg = self._get_color('list.foreground', '#cccccc')
 
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.Base, base_bg)
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.AlternateBase, alternate_bg)
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.Text, text_fg)
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.Base)] = base_bg
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.AlternateBase)] = alternate_bg
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.Text)] = text_fg
 
         # Bright text (for contrast on dark backgrounds)
         bright_text = self._get_color('colors.foreground', '#ffffff')
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.BrightText, bright_text)
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.BrightText)] = bright_text
 
         # Button colors
         button_bg = self._get_color('button.background', '#2d2d2d')
         button_fg = self._get_color('button.foreground', '#cccccc')
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.Button, button_bg)
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.ButtonText, button_fg)
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.Button)] = button_bg
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.ButtonText)] = button_fg
 
         # Highlight colors (selections)
         highlight_bg = self._get_color('list.activeSelectionBackground', '#094771')
         highlight_fg = self._get_color('list.activeSelectionForeground', '#ffffff')
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.Highlight, highlight_bg)
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.HighlightedText, highlight_fg)
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.Highlight)] = highlight_bg
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.HighlightedText)] = highlight_fg
 
         # Link colors
         link = self._get_color('textLink.foreground', '#4080d0')
         link_visited = self._get_color('textLink.activeForeground', '#6060c0')
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.Link, link)
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.LinkVisited, link_visited)
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.Link)] = link
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.LinkVisited)] = link_visited
 
         # Tooltip colors
         tooltip_bg = self._get_color('editorWidget.background', '#252526')
         tooltip_fg = self._get_color('editorWidget.foreground', '#cccccc')
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.ToolTipBase, tooltip_bg)
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.ToolTipText, tooltip_fg)
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.ToolTipBase)] = tooltip_bg
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.ToolTipText)] = tooltip_fg
 
         # Placeholder text
         placeholder = self._get_color('input.placeholderForeground', '#666666')
-        palette.setColor(QPalette.ColorGroup.Active, QPalette.ColorRole.PlaceholderText, placeholder)
+        table[(QPalette.ColorGroup.Active, QPalette.ColorRole.PlaceholderText)] = placeholder
 
-    def _apply_inactive_colors(self, palette: QPalette) -> None:
+    def _apply_inactive_colors(self, table: ColorTable) -> None:
         """Apply colors for inactive (unfocused) widgets.
 
         Args:
-            palette: QPalette to modify
+            table: Color table to fill
 
         """
         # Most colors same as active, except selections
@@ -160,20 +269,22 @@ class PaletteGenerator:
             QPalette.ColorRole.ToolTipText,
             QPalette.ColorRole.PlaceholderText,
         ]:
-            color = palette.color(QPalette.ColorGroup.Active, role)
-            palette.setColor(QPalette.ColorGroup.Inactive, role, color)
+            table[(QPalette.ColorGroup.Inactive, role)] = table[
+                (QPalette.ColorGroup.Active, role)
+            ]
 
         # Different selection colors when unfocused
         inactive_highlight_bg = self._get_color('list.inactiveSelectionBackground', '#3a3d41')
         inactive_highlight_fg = self._get_color('list.inactiveSelectionForeground', '#cccccc')
-        palette.setColor(QPalette.ColorGroup.Inactive, QPalette.ColorRole.Highlight, inactive_highlight_bg)
-        palette.setColor(QPalette.ColorGroup.Inactive, QPalette.ColorRole.HighlightedText, inactive_highlight_fg)
+        inactive = QPalette.ColorGroup.Inactive
+        table[(inactive, QPalette.ColorRole.Highlight)] = inactive_highlight_bg
+        table[(inactive, QPalette.ColorRole.HighlightedText)] = inactive_highlight_fg
 
-    def _apply_disabled_colors(self, palette: QPalette) -> None:
+    def _apply_disabled_colors(self, table: ColorTable) -> None:
         """Apply colors for disabled widgets.
 
         Args:
-            palette: QPalette to modify
+            table: Color table to fill
 
         """
         # Disabled colors - dimmed versions
@@ -182,14 +293,14 @@ class PaletteGenerator:
         disabled_button_bg = self._get_color('button.background', '#2d2d2d')
         disabled_button_fg = self._get_color('disabledForeground', '#666666')
 
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Window, disabled_bg)
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText, disabled_fg)
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Base, disabled_bg)
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.AlternateBase, disabled_bg)
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text, disabled_fg)
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.BrightText, disabled_fg)
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Button, disabled_button_bg)
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText, disabled_button_fg)
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Highlight, disabled_bg)
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.HighlightedText, disabled_fg)
-        palette.setColor(QPalette.ColorGroup.Disabled, QPalette.ColorRole.PlaceholderText, disabled_fg)
+        table[(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Window)] = disabled_bg
+        table[(QPalette.ColorGroup.Disabled, QPalette.ColorRole.WindowText)] = disabled_fg
+        table[(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Base)] = disabled_bg
+        table[(QPalette.ColorGroup.Disabled, QPalette.ColorRole.AlternateBase)] = disabled_bg
+        table[(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Text)] = disabled_fg
+        table[(QPalette.ColorGroup.Disabled, QPalette.ColorRole.BrightText)] = disabled_fg
+        table[(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Button)] = disabled_button_bg
+        table[(QPalette.ColorGroup.Disabled, QPalette.ColorRole.ButtonText)] = disabled_button_fg
+        table[(QPalette.ColorGroup.Disabled, QPalette.ColorRole.Highlight)] = disabled_bg
+        table[(QPalette.ColorGroup.Disabled, QPalette.ColorRole.HighlightedText)] = disabled_fg
+        table[(QPalette.ColorGroup.Disabled, QPalette.ColorRole.PlaceholderText)] = disabled_fg
@@ -29,16 +29,25 @@ Usage:
     widget.setStyleSheet(stylesheet)
 """
 
+from typing import Optional
+
 from ..core.theme import Theme
-from ..core.tokens import ColorTokenRegistry
+from ..core.tokens import ColorTokenRegistry, note_token_read, record_token_reads
 from ..logging import get_debug_logger
 
 logger = get_debug_logger(__name__)
 
+# Dynamic property marking ThemedWidgets styled by the application-level sheet
+APPLICATION_SCOPE_PROPERTY = "vftheme_scope"
+APPLICATION_SCOPE_SELECTOR = f'*[{APPLICATION_SCOPE_PROPERTY}="true"]'
+
 
 class StylesheetGenerator:
     """Generates comprehensive Qt stylesheets from themes."""
 
+    # Tokens read by generate_comprehensive_stylesheet, see token_dependencies()
+    _token_dependencies: Optional[frozenset[str]] = None
+
     def __init__(self, theme: Theme, widget_class_name: str):
         """Initialize stylesheet generator.
 
@@ -62,6 +71,7 @@ class StylesheetGenerator:
             Font value from theme or default
 
         """
+        note_token_read(token_path)
         if hasattr(self.theme, 'fonts') and self.theme.fonts:
             return self.theme.fonts.get(token_path, default)
         return default
@@ -104,6 +114,42 @@ class StylesheetGenerator:
             return f"{value}px"
         return str(value)
 
+    @classmethod
+    def token_dependencies(cls) -> frozenset[str]:
+        """Get the tokens the comprehensive stylesheet is generated from.
+
+        The generator reads the same tokens for every theme, so they are
+        recorded once; a theme change that touches none of them (and keeps
+        the theme type) produces an identical stylesheet.
+
+        Returns:
+            Color and font token names
+
+        """
+        if cls._token_dependencies is None:
+            with record_token_reads() as tokens:
+                theme = Theme.from_trusted(name="token-dependencies")
+                cls(theme, "QWidget").generate_comprehensive_stylesheet()
+            cls._token_dependencies = frozenset(tokens)
+        return cls._token_dependencies
+
+    @classmethod
+    def generate_application_stylesheet(cls, theme: Theme) -> str:
+        """Generate the consolidated stylesheet installed on QApplication.
+
+        Rules are scoped to widgets carrying the ``vftheme_scope`` property
+        instead of a single widget class, so one stylesheet covers every
+        ThemedWidget in the application.
+
+        Args:
+            theme: Theme to generate stylesheet from
+
+        Returns:
+            Scoped Qt stylesheet as string
+
+        """
+        return cls(theme, APPLICATION_SCOPE_SELECTOR).generate_comprehensive_stylesheet()
+
     def generate_comprehensive_stylesheet(self) -> str:
         """Generate complete stylesheet targeting all child widgets.
 
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Import Time Benchmark for VFWidgets Theme System
+
+Measures package import cost with ``python -X importtime`` in a fresh
+interpreter and guards against regressions of the lazy import surface.
+Run directly for a report of the slowest modules.
+"""
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+
+# Cumulative import time budgets (seconds), generous enough for slow CI machines
+IMPORT_BUDGETS = {
+    "import vfwidgets_theme": 0.1,
+}
+
+# Modules only needed by theme editors and tooling, never by plain imports
+HEAVY_MODULES = (
+    "PySide6.QtWidgets",
+    "vfwidgets_theme.core.tokens",
+    "vfwidgets_theme.widgets.theme_editor",
+    "vfwidgets_theme.widgets.token_browser",
+    "vfwidgets_theme.widgets.import_export",
+    "vfwidgets_theme.importers",
+    "vfwidgets_theme.validation.framework",
+)
+
+# Modules the primary API must not drag in
+EDITOR_MODULES = HEAVY_MODULES[1:]
+
+
+@dataclass
+class ImportProfile:
+    """Import timings of one statement in a fresh interpreter."""
+
+    statement: str
+    total_time: float  # seconds, cumulative over top-level imports
+    modules: dict[str, float]  # module -> cumulative seconds
+
+    def slowest(self, count: int = 10) -> list[tuple[str, float]]:
+        """Get the modules with the highest cumulative import time."""
+        return sorted(self.modules.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+def profile_import(statement: str, runs: int = 3) -> ImportProfile:
+    """Profile an import statement with ``python -X importtime``.
+
+    Args:
+        statement: Python statement to run, e.g. "import vfwidgets_theme"
+        runs: Number of fresh interpreters; the fastest run is reported
+
+    Returns:
+        Import profile of the fastest run
+
+    """
+    best = None
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", statement],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+        )
+
+        modules = {}
+        total = 0
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative, name = line[len("import time:") :].split("|")
+            modules[name.strip()] = int(cumulative) / 1_000_000
+            # Top-level imports are not indented
+            if not name[1:].startswith(" "):
+                total += int(cumulative)
+
+        profile = ImportProfile(statement, total / 1_000_000, modules)
+        if best is None or profile.total_time < best.total_time:
+            best = profile
+
+    return best
+
+
+def test_package_import_is_lazy():
+    """Importing the package loads no Qt widgets, editors or validation frameworks."""
+    profile = profile_import("import vfwidgets_theme", runs=1)
+
+    loaded = [name for name in HEAVY_MODULES if name in profile.modules]
+    assert not loaded, f"Eagerly imported: {loaded}"
+
+
+def test_primary_api_skips_editors():
+    """ThemedWidget and ThemedApplication do not load editor tooling."""
+    profile = profile_import("from vfwidgets_theme import ThemedApplication, ThemedWidget", runs=1)
+
+    loaded = [name for name in EDITOR_MODULES if name in profile.modules]
+    assert not loaded, f"Eagerly imported: {loaded}"
+
+
+def test_import_time_budgets():
+    """Import times stay within their budgets."""
+    for statement, budget in IMPORT_BUDGETS.items():
+        profile = profile_import(statement)
+        assert profile.total_time < budget, (
+            f"'{statement}' took {profile.total_time * 1000:.1f}ms "
+            f"(budget {budget * 1000:.0f}ms), slowest: {profile.slowest(5)}"
+        )
+
+
+if __name__ == "__main__":
+    for statement in (
+        "import vfwidgets_theme",
+        "from vfwidgets_theme import ThemedApplication, ThemedWidget",
+        "from vfwidgets_theme.widgets import ThemeEditorDialog",
+    ):
+        profile = profile_import(statement)
+        print(f"{statement}: {profile.total_time * 1000:.1f}ms")
+        for name, seconds in profile.slowest(8):
+            print(f"    {seconds * 1000:8.1f}ms  {name}")
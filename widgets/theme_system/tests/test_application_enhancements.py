@@ -12,9 +12,11 @@ This module tests:
 from unittest.mock import Mock
 
 import pytest
+from PySide6.QtWidgets import QApplication, QWidget
 
 from vfwidgets_theme.core.theme import Theme
 from vfwidgets_theme.widgets.application import ThemedApplication
+from vfwidgets_theme.widgets.base import ThemedWidget
 from vfwidgets_theme.widgets.metadata import ThemeInfo
 
 
@@ -387,3 +389,32 @@ class TestMetadataIntegration:
         assert len(all_info) >= 2
         assert "dark" in all_info
         assert "light" in all_info
+
+
+class TestCoalescedThemeSwitching:
+    """Test set_theme() with ThemeManager coalescing enabled."""
+
+    def test_widgets_see_new_theme_when_coalescing(self, app):
+        """Widgets notified by theme_changed observe the new theme."""
+        seen = []
+
+        class RecordingWidget(ThemedWidget, QWidget):
+            def on_theme_changed(self):
+                seen.append(self._theme_manager.current_theme.name)
+
+        app.set_theme("light")
+        widget = RecordingWidget()
+        widget.show()
+        QApplication.processEvents()
+        seen.clear()
+
+        app._theme_manager.set_coalescing_enabled(True)
+        try:
+            assert app.set_theme("dark")
+
+            assert app._theme_manager.current_theme.name == "dark"
+            assert app._theme_manager.pending_theme_name is None
+            assert seen and seen[-1] == "dark"
+        finally:
+            app._theme_manager.set_coalescing_enabled(False)
+            widget.deleteLater()
@@ -0,0 +1,87 @@
+"""Tests for the runnable benchmark suite and its baseline checks."""
+
+import json
+
+from vfwidgets_theme.benchmarks import (
+    DEFAULT_BASELINE_PATH,
+    SuiteConfig,
+    compare_to_baseline,
+    load_report,
+    main,
+    run_scenarios,
+)
+
+
+def make_report(**min_times):
+    return {
+        "format_version": 1,
+        "results": {name: {"min_time": value} for name, value in min_times.items()},
+    }
+
+
+def test_compare_applies_thresholds_in_order():
+    baseline = make_report(fast=1.0, slow=1.0, tolerant=1.0, skipped=1.0)
+    baseline["default_threshold"] = 0.2
+    baseline["thresholds"] = {"tolerant": 1.0}
+
+    comparisons = compare_to_baseline(
+        make_report(fast=1.1, slow=1.5, tolerant=1.9, extra=5.0), baseline
+    )
+
+    assert {c.name: c.is_regression for c in comparisons} == {
+        "fast": False,
+        "slow": True,
+        "tolerant": False,
+    }
+
+    # Explicit thresholds override the baseline's own
+    comparisons = compare_to_baseline(
+        make_report(slow=1.5, tolerant=1.9),
+        baseline,
+        thresholds={"tolerant": 0.5},
+        default_threshold=0.6,
+    )
+    assert {c.name: c.is_regression for c in comparisons} == {"slow": False, "tolerant": True}
+
+
+def test_packaged_baseline_is_loadable():
+    baseline = load_report(DEFAULT_BASELINE_PATH)
+
+    assert "theme_switch_100" in baseline["results"]
+    assert baseline["results"]["theme_switch_100"]["min_time"] > 0
+
+
+def test_scenarios_run_at_small_scale(qapp):
+    config = SuiteConfig(scales=(5,), iterations=1, theme_files=3, override_widgets=2)
+
+    results = run_scenarios(["widgets", "override_churn", "discovery"], config)
+
+    assert set(results) == {
+        "create_widgets_5",
+        "theme_switch_5",
+        "override_churn",
+        "repository_discovery_3",
+    }
+    for result in results.values():
+        assert result.errors == []
+        assert result.min_time > 0
+
+
+def test_main_writes_results_and_detects_regressions(qapp, tmp_path, capsys):
+    output = tmp_path / "results.json"
+    baseline = tmp_path / "baseline.json"
+    args = ["--scenario", "style_generation", "--iterations", "1", "--output", str(output)]
+
+    assert main([*args, "--baseline", str(baseline), "--update-baseline"]) == 0
+    assert json.loads(output.read_text())["results"]["style_generation"]["iterations"] == 1
+
+    # A baseline far faster than this run must fail the check
+    data = json.loads(baseline.read_text())
+    data["results"]["style_generation"]["min_time"] = 1e-9
+    baseline.write_text(json.dumps(data))
+    assert main([*args, "--baseline", str(baseline)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+    tolerant = ["--threshold-for", "style_generation=1e12"]
+    assert main([*args, "--baseline", str(baseline), *tolerant]) == 0
+    assert main([*args, "--baseline", str(tmp_path / "missing.json")]) == 2
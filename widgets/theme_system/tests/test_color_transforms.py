@@ -0,0 +1,132 @@
+"""Tests for bulk color transforms and theme variant generation."""
+
+import colorsys
+
+import pytest
+
+from vfwidgets_theme.benchmarks import SuiteConfig, run_scenarios
+from vfwidgets_theme.core.color_transforms import (
+    HSLTransform,
+    OKLabTransform,
+    PackedPalette,
+    RGBTransform,
+    parse_color,
+    transform_color,
+)
+from vfwidgets_theme.core.theme import Theme
+from vfwidgets_theme.factory import ThemeFactory, ThemeVariantGenerator, VariantSpec
+
+COLORS = {
+    "editor.background": "#1e1e1e",
+    "editor.foreground": "#d4d4d4",
+    "button.background": "#0e639c",
+    "focusBorder": "#007fd4",
+    "short": "#abc",
+    "translucent": "#ff000080",
+    "rgb": "rgba(255, 0, 0, 0.5)",
+    "gradient": "linear-gradient(red, blue)",
+}
+
+
+def test_parse_color():
+    assert parse_color("#0e639c") == (14, 99, 156, None)
+    assert parse_color("#abc") == (170, 187, 204, None)
+    assert parse_color(" #ff000080 ") == (255, 0, 0, 128)
+    assert parse_color("rgb(1, 2, 3)") == (1.0, 2.0, 3.0, None)
+    assert parse_color("red") is None
+    assert parse_color(None) is None
+
+
+def test_identity_transforms_round_trip():
+    palette = PackedPalette.from_colors(COLORS)
+
+    for color_transform in (RGBTransform(), HSLTransform(), OKLabTransform()):
+        colors = palette.transform(color_transform).to_colors()
+
+        assert colors["button.background"] == "#0e639c"
+        assert colors["short"] == "#aabbcc"
+        # Alpha is kept, unparseable values pass through
+        assert colors["translucent"] == "#ff000080"
+        assert colors["rgb"] == "#ff000080"
+        assert colors["gradient"] == "linear-gradient(red, blue)"
+
+
+def test_transforms_match_single_color_math():
+    palette = PackedPalette.from_colors(COLORS)
+
+    hsl = palette.transform(HSLTransform(hue=120, saturation=0.5, lightness=0.1)).to_colors()
+    hue, lightness, saturation = colorsys.rgb_to_hls(14 / 255, 99 / 255, 156 / 255)
+    expected = colorsys.hls_to_rgb((hue + 1 / 3) % 1, lightness + 0.1, saturation * 0.5)
+    assert parse_color(hsl["button.background"])[:3] == pytest.approx(
+        [channel * 255 for channel in expected], abs=1
+    )
+
+    darker = palette.transform(RGBTransform(scale=0.5)).to_colors()
+    assert darker["editor.foreground"] == "#6a6a6a"
+    assert transform_color("#ffffff", RGBTransform(scale=0.5)) == "#7f7f7f"
+    assert transform_color("invalid", RGBTransform(scale=0.5)) == "invalid"
+
+    # Raising contrast pushes light colors lighter and dark colors darker
+    contrast = palette.transform(OKLabTransform(contrast=1.5)).to_colors()
+    assert parse_color(contrast["editor.background"])[0] < 0x1E
+    assert parse_color(contrast["editor.foreground"])[0] > 0xD4
+
+
+def test_transforms_can_target_some_tokens():
+    palette = PackedPalette.from_colors(COLORS)
+
+    colors = palette.transform(
+        HSLTransform(hue=180, where=lambda token: token.startswith("button."))
+    ).to_colors()
+
+    assert colors["button.background"] != "#0e639c"
+    assert colors["focusBorder"] == "#007fd4"
+
+    masked = palette.transform(RGBTransform(offset=40), mask=palette.light_mask())
+    assert masked.to_colors()["editor.foreground"] == "#fcfcfc"
+    assert masked.to_colors()["editor.background"] == "#1e1e1e"
+
+
+def test_light_and_dark_variants_keep_their_colors():
+    theme = Theme(name="base", type="light", colors={"primary": "#f0f0f0", "accent": "#202020"})
+    generator = ThemeVariantGenerator()
+
+    dark = generator.create_dark_variant(theme)
+    light = generator.create_light_variant(theme)
+
+    assert dark.colors == {"primary": "#ffffff", "accent": "#000000"}
+    assert light.colors == {"primary": "#c8c8c8", "accent": "#484848"}
+    assert dark.metadata["variant_of"] == "base"
+
+
+def test_many_variants_at_once():
+    theme = Theme(name="base", type="dark", colors=dict(list(COLORS.items())[:4]))
+
+    dimmed, accent = ThemeFactory().create_variants(
+        theme,
+        [
+            VariantSpec("_dimmed", [OKLabTransform(lightness=-0.1, chroma=0.5)]),
+            VariantSpec(
+                "_accent",
+                [HSLTransform(hue=90, where=lambda token: token == "focusBorder")],
+                variant_type="high-contrast",
+                description="Green accents",
+            ),
+        ],
+    )
+
+    assert dimmed.name == "base_dimmed"
+    assert dimmed.type == "dark"
+    assert dimmed.colors["editor.foreground"] < "#d4d4d4"
+    assert accent.type == "high-contrast"
+    assert accent.colors["focusBorder"] != "#007fd4"
+    assert accent.colors["editor.foreground"] == "#d4d4d4"
+
+
+def test_theme_variants_benchmark_runs():
+    config = SuiteConfig(iterations=1, variant_tokens=50, variant_count=3)
+
+    results = run_scenarios(["theme_variants"], config)
+
+    assert set(results) == {"theme_variants_3x50"}
+    assert results["theme_variants_3x50"].errors == []
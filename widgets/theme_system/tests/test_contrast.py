@@ -0,0 +1,104 @@
+"""Tests for contrast validation of all foreground/background token pairs."""
+
+import math
+
+import pytest
+
+from vfwidgets_theme.core.contrast import (
+    MINIMUM_INACTIVE_CONTRAST,
+    ContrastMatrix,
+    ContrastPair,
+    contrast_ratio,
+    derive_pairs,
+    relative_luminance,
+)
+from vfwidgets_theme.core.theme import Theme, ThemeValidator
+from vfwidgets_theme.core.tokens import ColorTokenRegistry
+
+COLORS = {
+    "colors.background": "#ffffff",
+    "colors.foreground": "#000000",
+    "button.background": "#0e639c",
+    "button.foreground": "#ffffff",
+    "button.hoverBackground": "#ffffff",
+    "button.hoverForeground": "#eeeeee",
+    "input.placeholderForeground": "#949494",
+    "list.highlightForeground": "#ffff00",
+    "editor.foreground": "not-a-color",
+}
+
+
+def test_relative_luminance():
+    assert relative_luminance("#ff0000") == pytest.approx(0.2126)
+    assert relative_luminance("#fff") == pytest.approx(1.0)
+    assert relative_luminance("#12345678") == relative_luminance("#123456")
+    assert relative_luminance("rgb(0, 0, 0)") is None
+    # The validator keeps its mid-grey default for colors it can't parse
+    assert ThemeValidator()._get_relative_luminance("rgb(0, 0, 0)") == 0.5
+    assert contrast_ratio(1.0, 0.0) == pytest.approx(21.0)
+
+
+def test_pairs_are_derived_from_token_names():
+    pairs = {(pair.foreground, pair.background): pair.minimum for pair in derive_pairs(COLORS)}
+
+    assert pairs[("button.hoverForeground", "button.hoverBackground")] == 4.5
+    assert pairs[("button.foreground", "button.background")] == 4.5
+    assert pairs[("list.highlightForeground", "colors.background")] == 4.5
+    assert pairs[("input.placeholderForeground", "colors.background")] == MINIMUM_INACTIVE_CONTRAST
+    assert ("colors.background", "colors.background") not in pairs
+
+
+def test_failures_are_sorted_and_skip_unparseable_colors():
+    matrix = ContrastMatrix(COLORS)
+
+    failures = matrix.failures()
+
+    assert [(result.foreground, result.background) for result in failures] == [
+        ("list.highlightForeground", "colors.background"),
+        ("button.hoverForeground", "button.hoverBackground"),
+    ]
+    assert matrix.ratio("editor.foreground", "colors.background") is None
+    assert matrix.ratio("colors.foreground", "colors.background") == pytest.approx(21.0)
+
+
+def test_update_only_reevaluates_pairs_using_the_token():
+    matrix = ContrastMatrix(COLORS)
+
+    changed = matrix.update_color("button.hoverBackground", "#000000")
+
+    assert [(result.foreground, result.passes) for result in changed] == [
+        ("button.hoverForeground", True)
+    ]
+    assert len(matrix.failures()) == 1
+
+    # Unknown tokens only extend the table
+    assert matrix.update_color("custom.foreground", "#ffffff") == []
+    result = matrix.add_pair("custom.foreground", "colors.background", minimum=3.0)
+    assert result.ratio == pytest.approx(1.0)
+    assert not result.passes
+    assert [result.foreground for result in matrix.update_color("custom.foreground", "#000")] == [
+        "custom.foreground"
+    ]
+
+
+def test_matrix_of_every_foreground_against_every_background():
+    matrix = ContrastMatrix(COLORS)
+
+    ratios = matrix.matrix(["colors.foreground", "editor.foreground"], ["colors.background"])
+
+    assert ratios[0][0] == pytest.approx(21.0)
+    assert math.isnan(ratios[1][0])
+
+
+def test_theme_is_validated_over_all_registry_tokens():
+    theme = Theme(name="low-contrast", type="light", colors={"button.foreground": "#fefefe"})
+
+    matrix = ContrastMatrix.from_theme(
+        theme, extra_pairs=[ContrastPair("colors.focusBorder", "colors.background", 3.0)]
+    )
+
+    assert set(matrix.tokens) >= set(ColorTokenRegistry.get_all_token_names())
+    assert len(matrix.pairs) > 60
+    assert ("button.foreground", "button.background") in {
+        (result.foreground, result.background) for result in matrix.failures()
+    }
@@ -0,0 +1,100 @@
+"""Tests for memoised and batched file-to-icon resolution."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from vfwidgets_theme.icons.file_associations import FileAssociationManager
+
+NAMES = [
+    "main.py",
+    "test_main.py",
+    "Makefile",
+    "README.md",
+    "notes.MD",
+    ".gitignore",
+    "archive.tar.gz",
+    "Component.spec.ts",
+    "component.test.js",
+    "unknown.xyz",
+    "noextension",
+    ".hidden",
+    "trailing.",
+]
+
+
+def linear_scan(manager, filename):
+    for pattern, icon_name in manager.pattern_mappings:
+        if pattern.match(filename):
+            return icon_name
+    return None
+
+
+def test_resolve_many_matches_single_lookups_and_is_memoised():
+    manager = FileAssociationManager()
+    paths = [f"/project/src/{name}" for name in NAMES] + [Path("/other/main.py")]
+
+    icon_names = manager.resolve_many(paths)
+
+    assert icon_names == [FileAssociationManager().get_icon_for_file(Path(path)) for path in paths]
+    assert icon_names[0] == icon_names[-1] == "python"
+    # The two main.py paths share one resolution
+    assert manager.get_statistics()["cached_resolutions"] == len(NAMES)
+
+    with patch.object(manager, "_resolve") as resolve:
+        assert manager.resolve_many(reversed(paths)) == icon_names[::-1]
+        assert manager.get_icon_for_file(Path("main.py")) == "python"
+        resolve.assert_not_called()
+
+
+def test_adding_associations_invalidates_memoised_resolutions():
+    manager = FileAssociationManager()
+    assert manager.resolve_many(["a.xyz", "Justfile", "test_a.py", "a.py"]) == [
+        None,
+        None,
+        "python",
+        "python",
+    ]
+
+    manager.add_extension_mapping(".XYZ", "custom")
+    manager.add_filename_mapping("Justfile", "makefile")
+    manager.add_pattern_mapping(r"test_.*\.py$", "test")
+
+    assert manager.resolve_many(["a.xyz", "Justfile", "test_a.py", "a.py"]) == [
+        "custom",
+        "makefile",
+        "test",
+        "python",
+    ]
+
+    # Patterns added later are picked up by the combined regex too
+    manager.add_pattern_mapping(r".*\.xyz$", "pattern")
+    assert manager.get_icon_for_file(Path("a.xyz")) == "pattern"
+
+    assert manager.remove_extension_mapping("py")
+    manager.resolution_order.remove("language")
+    manager.invalidate_cache()
+    assert manager.resolve_many(["a.py"]) == [None]
+
+
+@pytest.mark.parametrize(
+    ("patterns", "combined"),
+    [
+        # Overlapping patterns: the first one added wins
+        ([r"test_.*", r".*\.py$", r".*\.(?:spec|test)\.[jt]s$", r"readme", r"\."], True),
+        # A group of its own keeps the patterns from being combined
+        ([r"(\w)\1.*", r".*\.md$", r"make"], False),
+        # So does an inline flag that is only valid at the start
+        ([r"(?x) \.hidden", r"component", r".*\.gz$"], False),
+    ],
+)
+def test_combined_patterns_match_like_a_linear_scan(patterns, combined):
+    manager = FileAssociationManager()
+    for index, pattern in enumerate(patterns):
+        manager.add_pattern_mapping(pattern, f"icon{index}")
+
+    for name in NAMES + ["aab.txt", "Readme.rst", "x"]:
+        assert manager.get_icon_for_pattern(name) == linear_scan(manager, name), name
+
+    assert (manager._combined_pattern is not False) == combined
@@ -0,0 +1,143 @@
+"""Tests for the rendered icon cache and background icon preloading."""
+
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtCore import QSize
+from PySide6.QtGui import QPixmap
+
+from vfwidgets_theme.icons import pixmap_cache
+from vfwidgets_theme.icons.pixmap_cache import IconCacheKey, IconPixmapCache
+from vfwidgets_theme.icons.svg_handler import SVGIconHandler
+
+SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="16" height="16">'
+    '<rect width="16" height="16" fill="#000000"/></svg>'
+)
+
+
+class StubImage:
+    """Image stand-in with just the size the cache accounts for."""
+
+    def __init__(self, size=4):
+        self._size = size
+
+    def width(self):
+        return self._size
+
+    def height(self):
+        return self._size
+
+
+class StubPixmap(StubImage):
+    """Pixmap stand-in, converted from a StubImage."""
+
+    @classmethod
+    def fromImage(cls, image):
+        return cls(image.width())
+
+
+@pytest.fixture
+def stub_pixmaps():
+    with patch.object(pixmap_cache, "QPixmap", StubPixmap):
+        yield
+
+
+@pytest.fixture
+def icons(tmp_path):
+    paths = []
+    for name in ("file", "folder", "python"):
+        path = tmp_path / f"{name}.svg"
+        path.write_text(SVG)
+        paths.append(path)
+    return paths
+
+
+def make_key(path="icon.svg", size=4, ratio=1.0, color=None):
+    return IconCacheKey(path, 0, size, size, ratio, color)
+
+
+def test_cache_hits_convert_images_once(stub_pixmaps):
+    cache = IconPixmapCache()
+    key = make_key()
+    cache.put(key, StubImage())
+
+    first = cache.get(key)
+    second = cache.get(key)
+
+    assert isinstance(first, StubPixmap)
+    assert second is first
+    assert cache.get(make_key(color="#ff0000")) is None
+    stats = cache.get_statistics()
+    assert (stats["hits"], stats["misses"], stats["bytes"]) == (2, 1, 64)
+
+
+def test_least_recently_used_icons_are_evicted(stub_pixmaps):
+    cache = IconPixmapCache(max_bytes=128)
+    first, second, third = (make_key(f"{name}.svg") for name in ("a", "b", "c"))
+    cache.put(first, StubImage())
+    cache.put(second, StubImage())
+    cache.get(first)
+
+    cache.put(third, StubImage())
+
+    assert cache.contains(first)
+    assert not cache.contains(second)
+    assert cache.contains(third)
+    assert cache.get_statistics()["evictions"] == 1
+
+    # Icons larger than the whole budget are not cached
+    cache.put(make_key("large.svg"), StubImage(size=16))
+    assert len(cache) == 2
+
+    # Replacing an entry accounts for the old one
+    cache.put(third, StubImage(size=2))
+    assert cache.get_statistics()["bytes"] == 80
+
+    cache.max_bytes = 64
+    assert len(cache) == 1
+    assert cache.invalidate_path("c.svg") == 1
+    assert cache.get_statistics()["bytes"] == 0
+
+
+def test_handlers_keep_an_empty_cache_they_are_given():
+    cache = IconPixmapCache()
+
+    assert SVGIconHandler(cache).pixmap_cache is cache
+    assert SVGIconHandler().pixmap_cache is pixmap_cache.get_shared_pixmap_cache()
+
+
+def test_device_pixel_ratios_are_cached_separately(qapp, icons):
+    handler = SVGIconHandler(IconPixmapCache())
+    size = QSize(16, 16)
+
+    normal = handler._get_pixmap(icons[0], size, None, 1.0)
+    retina = handler._get_pixmap(icons[0], size, None, 2.0)
+
+    assert isinstance(normal, QPixmap)
+    assert normal.width() == 16
+    assert retina.width() == 32
+    assert retina.devicePixelRatio() == 2.0
+    assert handler.pixmap_cache.get_statistics()["entries"] == 2
+
+    with patch.object(handler, "_render_image") as render_image:
+        assert handler._get_pixmap(icons[0], size, None, 2.0) is retina
+        render_image.assert_not_called()
+
+
+def test_preloaded_icons_are_served_from_the_cache(qapp, icons):
+    handler = SVGIconHandler(IconPixmapCache())
+    sizes = [QSize(16, 16), QSize(24, 24)]
+    requested = [(path, None) for path in icons] + [(icons[0], "#ff0000")]
+
+    rendered = handler.preload_icons(requested, sizes, device_pixel_ratio=1.0, max_workers=2)
+
+    assert rendered.result(timeout=10) == 8
+    assert handler.pixmap_cache.get_statistics()["entries"] == 8
+    # Everything is cached, so a second preload has nothing to do
+    assert handler.preload_icons(requested, sizes, device_pixel_ratio=1.0).result(timeout=10) == 0
+
+    with patch.object(handler, "_render_image") as render_image:
+        icon = handler.load_svg_icon(icons[0], sizes[1], "#ff0000", device_pixel_ratio=1.0)
+        render_image.assert_not_called()
+    assert not icon.isNull()
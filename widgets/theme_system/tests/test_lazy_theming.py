@@ -0,0 +1,106 @@
+"""Tests for visibility-aware lazy theming of ThemedWidget."""
+
+from PySide6.QtWidgets import QApplication, QWidget
+
+from vfwidgets_theme import ThemedWidget
+from vfwidgets_theme.core.manager import ThemeManager
+
+
+class CountingWidget(ThemedWidget, QWidget):
+    """Widget that counts theme applications."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.apply_count = 0
+        self.handler_count = 0
+
+    def _apply_theme_update(self):
+        self.apply_count += 1
+        super()._apply_theme_update()
+
+    def on_theme_changed(self):
+        self.handler_count += 1
+
+
+def make_hidden_child(qtbot, widget_class=CountingWidget):
+    """Create a hidden themed child inside a shown window."""
+    window = QWidget()
+    qtbot.addWidget(window)
+    child = widget_class(window)
+    child.hide()
+    window.show()
+
+    # Let the deferred initial theme application run, then reset counters
+    QApplication.processEvents()
+    child.apply_count = 0
+    child.handler_count = 0
+    return window, child
+
+
+def test_hidden_widget_in_visible_window_is_deferred(qtbot):
+    """Hidden children of a shown window are marked dirty, not restyled."""
+    window, child = make_hidden_child(qtbot)
+
+    child._on_global_theme_changed("dark")
+
+    assert child.apply_count == 0
+    assert child.handler_count == 0
+    assert child.theme_statistics["theme_dirty"] is True
+
+    # Repeated switches while hidden still cost nothing
+    child._on_global_theme_changed("light")
+    assert child.apply_count == 0
+    assert child.theme_statistics["deferred_updates"] == 1
+
+    child.show()
+
+    assert child.apply_count == 1
+    assert child.handler_count == 1
+    assert child.theme_statistics["theme_dirty"] is False
+
+
+def test_never_shown_widget_is_themed_eagerly(qtbot):
+    """Widgets still under construction are themed immediately."""
+    widget = CountingWidget()
+    qtbot.addWidget(widget)
+    QApplication.processEvents()
+    widget.apply_count = 0
+    widget.handler_count = 0
+
+    widget._on_global_theme_changed("dark")
+
+    assert widget.apply_count == 1
+    assert widget.handler_count == 1
+
+
+def test_lazy_theme_updates_opt_out(qtbot):
+    """Subclasses can disable deferral for widgets rendered while hidden."""
+
+    class EagerWidget(CountingWidget):
+        lazy_theme_updates = False
+
+    window, child = make_hidden_child(qtbot, EagerWidget)
+
+    child._on_global_theme_changed("dark")
+
+    assert child.apply_count == 1
+
+
+def test_deferred_updates_emit_theme_changed_from_both_entry_points(qtbot):
+    """Hidden widgets report the new theme the same way for either handler."""
+    window, child = make_hidden_child(qtbot)
+    received = []
+    child.theme_changed.connect(received.append)
+
+    child._on_global_theme_changed("dark")
+    child._on_theme_changed(ThemeManager.get_instance().get_theme("light"))
+
+    assert received == ["dark", "light"]
+    assert child.apply_count == 0
+
+    # Visible widgets emit it too
+    child.show()
+    received.clear()
+    child._on_global_theme_changed("dark")
+
+    assert received == ["dark"]
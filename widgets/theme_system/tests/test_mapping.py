@@ -381,6 +381,55 @@ class TestThemeMapping:
         stats = self.mapping.get_statistics()
         assert stats["performance_stats"]["cache_hits"] > 0
 
+    def test_conditional_rules_not_cached_when_condition_fails(self):
+        """Test a failing condition does not get its result cached."""
+        self.mapping.add_rule("#test-button", {"color": "red"}, conditions=[lambda w: w.ready])
+
+        widget = MockWidget(widget_id="test-button")
+        widget.ready = False
+        assert "color" not in self.mapping.get_mapping(widget)
+
+        widget.ready = True
+        assert self.mapping.get_mapping(widget).get("color") == "red"
+
+    def test_rule_index_candidates(self):
+        """Test only rules keyed for the widget are considered."""
+        self.mapping.add_rule("#other", {"color": "red"})
+        self.mapping.add_rule("QLabel", {"color": "green"})
+        self.mapping.add_rule(".primary", {"font-weight": "bold"})
+        self.mapping.add_rule("*", {"margin": "0"})
+        self.mapping.add_rule("QDialog #test", {"padding": "2px"})
+        self.mapping.add_rule("[role=toolbar]", {"spacing": "4"})
+
+        widget = MockWidget(
+            widget_id="test", theme_classes={"primary"}, attributes={"role": "toolbar"}
+        )
+        candidates = self.mapping._get_rule_index().candidates(widget)
+
+        assert [position for position, _rule in candidates] == [2, 3, 4, 5]
+        assert self.mapping.get_mapping(widget) == {
+            "font-weight": "bold",
+            "margin": "0",
+            "padding": "2px",
+            "spacing": "4",
+        }
+
+    def test_cache_hit_evaluates_no_rules(self):
+        """Test cached mappings are returned before any rule is matched."""
+        self.mapping.add_rule("#test", {"color": "red"})
+        widget = MockWidget(widget_id="test")
+        self.mapping.get_mapping(widget)
+
+        self.mapping._get_rule_index = None  # Any rule lookup would now fail
+        assert self.mapping.get_mapping(widget) == {"color": "red"}
+        del self.mapping._get_rule_index
+
+        # Pseudo-class state is part of the signature
+        widget._focused = True
+        misses = self.mapping.get_statistics()["performance_stats"]["cache_misses"]
+        assert self.mapping.get_mapping(widget) == {"color": "red"}
+        assert self.mapping.get_statistics()["performance_stats"]["cache_misses"] == misses + 1
+
     def test_mapping_composition(self):
         """Test mapping composition."""
         mapping1 = ThemeMapping()
@@ -0,0 +1,97 @@
+"""Tests for cached palette generation and application-level palettes."""
+
+from unittest.mock import patch
+
+from PySide6.QtGui import QColor, QPalette
+from PySide6.QtWidgets import QApplication, QWidget
+
+from vfwidgets_theme import ThemedWidget
+from vfwidgets_theme.core.theme import Theme
+from vfwidgets_theme.widgets.palette_generator import PaletteGenerator
+
+
+def make_theme(name="palette-test", background="#101010"):
+    return Theme(
+        name=name,
+        colors={"window.background": background, "window.foreground": "#eeeeee"},
+    )
+
+
+class PlainWidget(ThemedWidget, QWidget):
+    """Themed widget using the base palette."""
+
+
+class CustomPaletteWidget(ThemedWidget, QWidget):
+    """Themed widget with its own palette."""
+
+    def _generate_custom_palette(self):
+        palette = QPalette()
+        palette.setColor(QPalette.ColorRole.Base, QColor("#123456"))
+        return palette
+
+
+def setup_function():
+    PaletteGenerator.clear_cache()
+
+
+def test_cached_palette_generated_once_per_theme_generation(qapp):
+    theme = make_theme()
+
+    with patch.object(
+        PaletteGenerator, "generate_palette", autospec=True, return_value=QPalette()
+    ) as generate:
+        PaletteGenerator.cached_palette(theme)
+        PaletteGenerator.cached_palette(make_theme())
+        assert generate.call_count == 1
+
+        # Changed content is a new generation
+        PaletteGenerator.cached_palette(make_theme(background="#202020"))
+        assert generate.call_count == 2
+
+
+def test_apply_to_application_sets_palette_once(qapp):
+    theme = make_theme(background="#101010")
+
+    with patch.object(QApplication, "setPalette") as set_palette:
+        assert PaletteGenerator.apply_to_application(theme) is True
+        assert PaletteGenerator.apply_to_application(theme) is True
+        assert set_palette.call_count == 1
+
+        PaletteGenerator.apply_to_application(make_theme(background="#303030"))
+        assert set_palette.call_count == 2
+
+
+def test_nested_widgets_inherit_application_palette(qtbot):
+    parent = PlainWidget()
+    qtbot.addWidget(parent)
+    child = PlainWidget(parent)
+    plain_child = QWidget(child)
+    QApplication.processEvents()
+
+    with patch.object(QWidget, "setPalette") as set_palette:
+        parent._apply_theme_update()
+        child._apply_theme_update()
+
+    # The base palette comes from QApplication, no per-widget palettes
+    set_palette.assert_not_called()
+    theme = parent._theme_manager.current_theme
+    expected = PaletteGenerator.cached_palette(theme)
+    role = QPalette.ColorRole.AlternateBase
+    for widget in (parent, child, plain_child):
+        assert widget.palette().color(role) == expected.color(role)
+
+
+def test_custom_palette_applied_in_single_pass(qtbot):
+    widget = CustomPaletteWidget()
+    qtbot.addWidget(widget)
+    child = QWidget(widget)
+    grandchild = QWidget(child)
+    PlainWidget(widget)
+    QApplication.processEvents()
+
+    targets = []
+    with patch.object(QWidget, "setPalette", lambda self, palette: targets.append(self)):
+        widget._apply_theme_update()
+
+    # Nested themed widgets are skipped, they apply their own palette
+    assert sorted(map(id, targets)) == sorted(map(id, [widget, child, grandchild]))
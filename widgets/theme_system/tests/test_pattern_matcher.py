@@ -5,8 +5,10 @@ This module provides comprehensive tests for the PatternMatcher,
 including performance benchmarks and integration tests.
 """
 
+import ntpath
 import threading
 import time
+from unittest.mock import patch
 
 import pytest
 
@@ -306,9 +308,58 @@ class TestPatternMatcher:
         assert "patterns_per_second" in results
 
         assert results["iterations"] == 100
+        assert results["compiled_speedup"] > 0
         assert results["average_time_ms"] > 0
         assert results["patterns_per_second"] > 0
 
+    def test_compiled_matching_agrees_with_individual_matching(self):
+        """Test the combined regex finds the same matches as per-pattern matching."""
+        self.matcher.add_pattern("*Dialog", PatternType.GLOB)
+        self.matcher.add_pattern("Custom?ialog", PatternType.GLOB)
+        self.matcher.add_pattern(r"Dia\w+", PatternType.REGEX)
+        self.matcher.add_pattern(r"^(Custom|Main)", PatternType.REGEX)  # Has a group
+        self.matcher.add_pattern(r"(?i)customdialog", PatternType.REGEX)  # Global flag
+        self.matcher.add_pattern("[!C]*", PatternType.GLOB)
+        removed = self.matcher.add_pattern("Custom*", PatternType.GLOB)
+        self.matcher.remove_pattern(removed)
+
+        for target in ["CustomDialog", "MainWindow", "Dialog", "customdialog", ""]:
+            compiled = self.matcher._match_patterns_uncached(target, self.widget)
+            individual = self.matcher._match_patterns_individually(target, self.widget)
+
+            assert [(i, r.score) for i, _p, r in compiled] == [
+                (i, r.score) for i, _p, r in individual
+            ]
+
+        matches = self.matcher._match_patterns_uncached("CustomDialog", self.widget)
+        assert [i for i, _p, _r in matches] == [0, 1, 2, 3, 4]
+        assert matches[2][2].metadata["match"].group(0) == "Dialog"
+
+    def test_compiled_regexes_ignore_case_normalization(self):
+        """Test only globs are matched case-insensitively where paths are."""
+        self.matcher.add_pattern("*dialog", PatternType.GLOB)
+        self.matcher.add_pattern(r"^Custom", PatternType.REGEX)
+
+        with patch("os.path.normcase", ntpath.normcase):
+            for target in ["CustomDialog", "customdialog"]:
+                compiled = self.matcher._match_patterns_uncached(target, self.widget)
+                individual = self.matcher._match_patterns_individually(target, self.widget)
+                assert [i for i, _p, _r in compiled] == [i for i, _p, _r in individual]
+
+            matches = self.matcher._match_patterns_uncached("customdialog", self.widget)
+            assert [i for i, _p, _r in matches] == [0]
+
+    def test_compiled_patterns_rebuilt_on_change(self):
+        """Test adding or disabling patterns is reflected by the combined regex."""
+        self.matcher.add_pattern("Test*", PatternType.GLOB)
+        assert len(self.matcher.match_patterns("TestWidget", self.widget)) == 1
+
+        self.matcher.add_pattern("*Widget", PatternType.GLOB)
+        assert len(self.matcher.match_patterns("TestWidget", self.widget)) == 2
+
+        self.matcher._patterns[0].enabled = False
+        assert len(self.matcher._match_patterns_uncached("TestWidget", self.widget)) == 1
+
     def test_performance_requirement(self):
         """Test that pattern matching meets performance requirements."""
         # Add 100 patterns
@@ -18,7 +18,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 import unittest
 
 from vfwidgets_theme.core.theme import Theme
-from vfwidgets_theme.widgets.stylesheet_generator import StylesheetGenerator
+from vfwidgets_theme.widgets.stylesheet_generator import (
+    APPLICATION_SCOPE_SELECTOR,
+    StylesheetGenerator,
+)
 
 
 class TestStylesheetGenerator(unittest.TestCase):
@@ -430,5 +433,26 @@ class TestStylesheetGenerator(unittest.TestCase):
         self.assertNotIn("\n\n\n\n\n", stylesheet)
 
 
+class TestApplicationStylesheet(unittest.TestCase):
+    """Test the consolidated application-level stylesheet."""
+
+    def test_application_stylesheet_is_scoped(self):
+        """Test consolidated application stylesheet uses the scope selector."""
+        theme = Theme(
+            name="minimal",
+            type="dark",
+            colors={
+                "colors.background": "#1e1e1e",
+                "colors.foreground": "#d4d4d4",
+            },
+        )
+
+        stylesheet = StylesheetGenerator.generate_application_stylesheet(theme)
+
+        self.assertIn(f"{APPLICATION_SCOPE_SELECTOR} QPushButton", stylesheet)
+        self.assertIn(f"{APPLICATION_SCOPE_SELECTOR} {{", stylesheet)
+        self.assertNotIn("TestWidget", stylesheet)
+
+
 if __name__ == "__main__":
     unittest.main()
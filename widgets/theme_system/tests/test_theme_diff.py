@@ -0,0 +1,249 @@
+"""Tests for theme diffs and the incremental updates built on them."""
+
+import pytest
+from PySide6.QtWidgets import QApplication, QWidget
+
+from vfwidgets_theme import ThemedWidget
+from vfwidgets_theme.core.manager import ThemeManager
+from vfwidgets_theme.core.theme import Theme
+from vfwidgets_theme.core.theme_diff import ThemeDiff
+from vfwidgets_theme.development.hot_reload import HotReloader
+
+
+def make_theme(name="diff-test", theme_type="dark", **colors):
+    base = {"colors.background": "#1e1e1e", "button.background": "#0e639c"}
+    base.update(colors)
+    return Theme(
+        name=name,
+        type=theme_type,
+        colors=base,
+        fonts={"fonts.size": 13},
+        token_colors=[
+            {"scope": "comment", "settings": {"foreground": "#6a9955"}},
+            {"scope": ["string", "string.quoted"], "settings": {"foreground": "#ce9178"}},
+        ],
+    )
+
+
+class CountingWidget(ThemedWidget, QWidget):
+    """Widget that counts full theme updates."""
+
+    theme_config = {"accent": "accent.color"}
+    incremental_theme_updates = True
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.apply_count = 0
+        self.handler_count = 0
+
+    def _apply_theme_update(self):
+        self.apply_count += 1
+        super()._apply_theme_update()
+
+    def on_theme_changed(self):
+        self.handler_count += 1
+
+
+def test_compare_reports_section_changes():
+    old = make_theme()
+    new = Theme(
+        name="diff-test",
+        type="dark",
+        colors={"colors.background": "#000000", "editor.background": "#111111"},
+        fonts={"fonts.size": 14},
+        token_colors=[{"scope": "comment", "settings": {"foreground": "#00ff00"}}],
+    )
+
+    diff = ThemeDiff.compare(old, new)
+
+    assert diff.colors.changed == {"colors.background"}
+    assert diff.colors.added == {"editor.background"}
+    assert diff.colors.removed == {"button.background"}
+    assert diff.fonts.changed == {"fonts.size"}
+    assert diff.token_colors.changed == {"comment"}
+    assert diff.token_colors.removed == {"string,string.quoted"}
+    assert not diff.styles
+    assert not diff.type_changed
+    assert "tokenColors:comment" in diff.changed_tokens
+
+
+def test_identical_content_is_empty():
+    diff = ThemeDiff.compare(make_theme(), make_theme())
+
+    assert diff.is_empty
+    assert not diff.affects(None)
+    assert ThemeDiff.compare(make_theme(), make_theme(name="other")).is_empty
+
+
+def test_affects_matches_tokens_and_parents():
+    # Nested color groups come from trusted sources such as the discovery cache
+    old = Theme.from_trusted(name="nested", colors={"editor": {"background": "#000000"}})
+    new = Theme.from_trusted(name="nested", colors={"editor": {"background": "#ffffff"}})
+    diff = ThemeDiff.compare(old, new)
+
+    assert diff.affects({"editor.background"})
+    assert not diff.affects({"button.background"})
+    assert diff.affects(None)
+
+
+def test_type_change_affects_everything():
+    diff = ThemeDiff.compare(make_theme(theme_type="dark"), make_theme(theme_type="light"))
+
+    assert diff.type_changed
+    assert diff.affects({"some.unrelated.token"})
+
+
+def test_compare_against_no_theme_adds_everything():
+    diff = ThemeDiff.compare(None, make_theme())
+
+    assert diff.colors.added == {"colors.background", "button.background"}
+    assert diff.affects({"anything"})
+
+
+@pytest.fixture
+def manager():
+    manager = ThemeManager.get_instance()
+    previous = manager.current_theme.name if manager.current_theme else "default"
+    yield manager
+    manager.set_theme(previous, immediate=True)
+    for name in ("diff-base", "diff-variant"):
+        manager._repository.remove_theme(name)
+
+
+def rendered_widget(qtbot, manager, base):
+    """Create a widget that has fully rendered the base theme."""
+    manager.add_theme(base)
+    manager.set_theme(base.name, immediate=True)
+
+    widget = CountingWidget()
+    qtbot.addWidget(widget)
+    QApplication.processEvents()
+    widget.apply_count = 0
+    widget.handler_count = 0
+    return widget
+
+
+def switch(manager, widget, theme):
+    manager.add_theme(theme)
+    manager.set_theme(theme.name, immediate=True)
+    widget._on_global_theme_changed(theme.name)
+
+
+def test_unrelated_change_skips_widget_update(qtbot, manager):
+    widget = rendered_widget(qtbot, manager, make_theme("diff-base"))
+
+    switch(manager, widget, make_theme("diff-variant", **{"terminal.ansiRed": "#ff0000"}))
+
+    assert manager.last_theme_diff.colors.added == {"terminal.ansiRed"}
+    assert widget.apply_count == 0
+    assert widget.handler_count == 0
+
+
+def test_stylesheet_token_change_updates_widget(qtbot, manager):
+    widget = rendered_widget(qtbot, manager, make_theme("diff-base"))
+
+    switch(manager, widget, make_theme("diff-variant", **{"button.background": "#ff0000"}))
+
+    assert widget.apply_count == 1
+    assert widget.handler_count == 1
+
+
+def test_property_reads_become_dependencies(qtbot, manager):
+    widget = rendered_widget(qtbot, manager, make_theme("diff-base"))
+    assert widget.theme.accent is not None
+
+    switch(manager, widget, make_theme("diff-variant", **{"accent.color": "#ff0000"}))
+
+    assert widget.apply_count == 1
+
+
+def test_whole_theme_readers_always_update(qtbot, manager):
+    widget = rendered_widget(qtbot, manager, make_theme("diff-base"))
+    widget.get_current_theme()
+
+    switch(manager, widget, make_theme("diff-variant", **{"terminal.ansiRed": "#ff0000"}))
+
+    assert widget.apply_count == 1
+
+
+def test_incremental_updates_are_opt_in(qtbot, manager):
+    class ManagerReadingWidget(CountingWidget):
+        incremental_theme_updates = ThemedWidget.incremental_theme_updates
+
+        def on_theme_changed(self):
+            super().on_theme_changed()
+            self.ansi_red = self._theme_manager.current_theme.colors["terminal.ansiRed"]
+
+    manager.add_theme(make_theme("diff-base", **{"terminal.ansiRed": "#ff0000"}))
+    manager.set_theme("diff-base", immediate=True)
+    widget = ManagerReadingWidget()
+    qtbot.addWidget(widget)
+    QApplication.processEvents()
+    widget.apply_count = 0
+
+    # Reads that bypass self.theme are not tracked, so nothing is skipped
+    switch(manager, widget, make_theme("diff-variant", **{"terminal.ansiRed": "#00ff00"}))
+
+    assert widget.apply_count == 1
+    assert widget.ansi_red == "#00ff00"
+
+
+def test_override_change_invalidates_diff(qtbot, manager):
+    widget = rendered_widget(qtbot, manager, make_theme("diff-base"))
+    manager.add_theme(make_theme("diff-variant", **{"terminal.ansiRed": "#ff0000"}))
+    manager.set_theme("diff-variant", immediate=True)
+
+    manager.set_app_override("editor.background", "#123456", notify=False)
+    try:
+        assert manager.last_theme_diff is None
+        widget._on_global_theme_changed("diff-variant")
+        assert widget.apply_count == 1
+    finally:
+        manager.remove_app_override("editor.background", notify=False)
+
+
+def test_reload_identical_theme_is_noop(manager):
+    original = make_theme("diff-base")
+    manager.add_theme(original)
+
+    diff = manager.reload_theme(make_theme("diff-base"))
+
+    assert diff.is_empty
+    assert manager.get_theme("diff-base") is original
+
+
+def test_reload_current_theme_applies_changes(manager):
+    manager.add_theme(make_theme("diff-base"))
+    manager.set_theme("diff-base", immediate=True)
+
+    reloaded = make_theme("diff-base", **{"button.background": "#ff0000"})
+    diff = manager.reload_theme(reloaded)
+
+    assert diff.colors.changed == {"button.background"}
+    assert manager.current_theme is reloaded
+    assert manager.last_theme_diff.colors.changed == {"button.background"}
+
+
+def test_hot_reload_skips_unchanged_content(qapp, tmp_path):
+    theme_file = tmp_path / "theme.json"
+    theme_file.write_text('{"name": "hot"}')
+
+    reloaded = []
+    reloader = HotReloader(debounce_ms=0)
+    reloader.enable()
+    reloader.set_reload_callback(lambda path: reloaded.append(path) or True)
+    reloader.watch_file(theme_file)
+
+    # Saved without changes
+    reloader._reload_single_file(theme_file)
+    assert reloaded == []
+    assert reloader.get_statistics()["skipped_reloads"] == 1
+    assert reloader.get_recent_events(1)[0].unchanged
+
+    theme_file.write_text('{"name": "hot", "type": "dark"}')
+    reloader._reload_single_file(theme_file)
+    reloader._reload_single_file(theme_file)
+    assert reloaded == [theme_file]
+    assert reloader.get_statistics()["skipped_reloads"] == 2
+
+    reloader.stop_watching()
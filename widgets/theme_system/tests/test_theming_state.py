@@ -0,0 +1,104 @@
+"""Tests for the compact per-widget theming state."""
+
+import pytest
+from PySide6.QtWidgets import QWidget
+
+from vfwidgets_theme import ThemedWidget
+from vfwidgets_theme.core.manager import ThemeManager
+from vfwidgets_theme.lifecycle import (
+    MAX_LIFECYCLE_EVENTS_PER_WIDGET,
+    WidgetLifecycleState,
+    WidgetRegistry,
+)
+from vfwidgets_theme.widgets.base import ThemePropertiesManager, _shared_properties
+
+
+class StateWidget(ThemedWidget, QWidget):
+    """Widget reading a couple of tokens."""
+
+    theme_config = {"background": "colors.background", "accent": "button.background"}
+
+
+class PlainWidget:
+    """Weak-referenceable stand-in for a widget."""
+
+
+@pytest.mark.usefixtures("qapp")
+def test_widgets_of_one_class_share_resolved_values():
+    first = StateWidget()
+    second = StateWidget()
+    try:
+        background = first.theme.background
+        assert second.theme.background == background
+
+        # Resolved once per class, not per widget
+        assert first._theme_properties._local is None
+        assert second._theme_properties._local is None
+        assert "background" in _shared_properties[StateWidget].values
+        assert second._theme_properties.dependencies == {"colors.background"}
+    finally:
+        first.deleteLater()
+        second.deleteLater()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_override_starts_a_new_generation():
+    manager = ThemeManager.get_instance()
+    widget = StateWidget()
+    try:
+        _ = widget.theme.accent
+        generation = manager.theme_generation
+
+        manager.set_app_override("button.background", "#123456", notify=False)
+        assert manager.theme_generation != generation
+        assert widget.theme.accent == "#123456"
+    finally:
+        manager.remove_app_override("button.background", notify=False)
+        widget.deleteLater()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_instance_values_stay_per_widget():
+    first = StateWidget()
+    second = StateWidget()
+    try:
+        first._theme_properties.set_property("background", "#abcdef")
+
+        assert first.theme.background == "#abcdef"
+        assert second.theme.background != "#abcdef"
+    finally:
+        first.deleteLater()
+        second.deleteLater()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_fallback_defaults_stay_per_call():
+    first = StateWidget()
+    second = StateWidget()
+    try:
+        missing = "missing.colorToken"
+
+        assert first._theme_properties.get_property(missing, "#111111") == "#111111"
+        assert second._theme_properties.get_property(missing, "#222222") == "#222222"
+        assert missing not in _shared_properties[StateWidget].values
+    finally:
+        first.deleteLater()
+        second.deleteLater()
+
+
+def test_properties_manager_has_no_instance_dict():
+    properties = ThemePropertiesManager(PlainWidget())
+
+    assert not hasattr(properties, "__dict__")
+    assert properties.memory_size() > 0
+
+
+def test_lifecycle_history_is_bounded():
+    registry = WidgetRegistry()
+    widget = PlainWidget()
+
+    registry.register(widget)
+    for _ in range(MAX_LIFECYCLE_EVENTS_PER_WIDGET * 3):
+        registry._update_lifecycle_state(id(widget), WidgetLifecycleState.UPDATED)
+
+    assert len(registry.get_lifecycle_events(widget)) == MAX_LIFECYCLE_EVENTS_PER_WIDGET
@@ -0,0 +1,118 @@
+"""Tests for token color scope resolution."""
+
+import copy
+import dataclasses
+import pickle
+
+from vfwidgets_theme.benchmarks import SuiteConfig, run_scenarios
+from vfwidgets_theme.core.theme import Theme
+from vfwidgets_theme.core.token_scopes import TokenScopeResolver, TokenStyle
+
+TOKEN_COLORS = [
+    {"scope": "", "settings": {"foreground": "#d4d4d4"}},
+    {"scope": "comment", "settings": {"foreground": "#6a9955", "fontStyle": "italic"}},
+    {"scope": "string, constant.other", "settings": {"foreground": "#ce9178"}},
+    {"scope": "string.quoted.double", "settings": {"foreground": "#ff0000"}},
+    {"scope": ["meta.embedded string"], "settings": {"foreground": "#00ff00"}},
+    {"scope": "meta.embedded", "settings": {"background": "#111111"}},
+    {"scope": "keyword - meta.embedded", "settings": {"foreground": "#569cd6"}},
+]
+
+
+def test_deepest_scope_match_wins():
+    resolver = TokenScopeResolver(TOKEN_COLORS)
+
+    assert resolver.resolve("source.python string.quoted.single").foreground == "#ce9178"
+    assert resolver.resolve("source.python string.quoted.double.python").foreground == "#ff0000"
+    # Segment boundaries only: "strings" is not "string"
+    assert resolver.resolve("source.python strings").foreground == "#d4d4d4"
+    assert resolver.resolve(["source.css", "constant.other.color"]).foreground == "#ce9178"
+
+
+def test_parent_scopes_and_inheritance():
+    resolver = TokenScopeResolver(TOKEN_COLORS)
+
+    style = resolver.resolve("text.html meta.embedded.block source.js string.template")
+
+    # Parent selector applies through intermediate scopes
+    assert style == TokenStyle(foreground="#00ff00", background="#111111")
+    assert resolver.resolve("source.js comment.line").to_settings() == {
+        "foreground": "#6a9955",
+        "fontStyle": "italic",
+    }
+
+
+def test_specific_rules_setting_some_settings_keep_the_others():
+    resolver = TokenScopeResolver(
+        [
+            {"scope": "string", "settings": {"foreground": "#aa0000"}},
+            {"scope": "meta.embedded string", "settings": {"foreground": "#00aa00"}},
+            {"scope": "string.quoted", "settings": {"fontStyle": "italic"}},
+        ]
+    )
+
+    assert resolver.resolve(["source.py", "string.quoted.double"]) == TokenStyle(
+        foreground="#aa0000", font_style="italic"
+    )
+    assert resolver.resolve("meta.embedded string.quoted") == TokenStyle(
+        foreground="#00aa00", font_style="italic"
+    )
+
+
+def test_later_rule_wins_ties():
+    resolver = TokenScopeResolver(
+        [
+            {"scope": "keyword", "settings": {"foreground": "#000001"}},
+            {"scope": "keyword", "settings": {"foreground": "#000002"}},
+        ]
+    )
+
+    assert resolver.resolve("keyword.control").foreground == "#000002"
+
+
+def test_excluded_scopes():
+    resolver = TokenScopeResolver(TOKEN_COLORS)
+
+    assert resolver.resolve("source.python keyword.control").foreground == "#569cd6"
+    assert resolver.resolve("meta.embedded keyword.control").foreground == "#d4d4d4"
+
+
+def test_resolutions_are_cached():
+    resolver = TokenScopeResolver(TOKEN_COLORS, max_cache_size=2)
+
+    first = resolver.resolve("source.python comment.line")
+    assert resolver.resolve(("source.python", "comment.line")) is first
+    assert resolver.cache_info()["hits"] == 1
+    assert resolver.cache_info()["size"] == 2
+
+    resolver.clear_cache()
+    assert resolver.cache_info()["size"] == 0
+
+
+def test_theme_compiles_its_resolver_once():
+    theme = Theme(name="scopes", token_colors=TOKEN_COLORS)
+
+    assert theme.token_scopes is theme.token_scopes
+    assert theme.token_scopes.rule_count == 7
+    assert theme.token_scopes.resolve("source.go comment").font_style == "italic"
+    # The compiled engine is not part of the theme's identity
+    assert theme == Theme(name="scopes", token_colors=TOKEN_COLORS)
+
+
+def test_themes_stay_copyable_after_resolving_scopes():
+    theme = Theme(name="scopes", token_colors=TOKEN_COLORS)
+    style = theme.token_scopes.resolve("source.go comment")
+
+    for copied in (copy.deepcopy(theme), pickle.loads(pickle.dumps(theme))):
+        assert copied == theme
+        assert copied.token_scopes.resolve("source.go comment") == style
+    assert dataclasses.asdict(theme)["token_colors"] == TOKEN_COLORS
+
+
+def test_token_scope_benchmark_runs():
+    config = SuiteConfig(iterations=1, token_color_rules=50, scope_stacks=100)
+
+    results = run_scenarios(["token_scopes"], config)
+
+    assert set(results) == {"token_scope_compile_50", "token_scope_resolution_100"}
+    assert all(result.errors == [] for result in results.values())
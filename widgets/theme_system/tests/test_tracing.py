@@ -0,0 +1,135 @@
+"""Tests for theme pipeline tracing."""
+
+import json
+
+import pytest
+from PySide6.QtWidgets import QApplication, QWidget
+
+from vfwidgets_theme import ThemedWidget
+from vfwidgets_theme.core.manager import ThemeManager
+from vfwidgets_theme.logging import PerformanceTracker
+from vfwidgets_theme.tracing import (
+    TRACE_ENV_VAR,
+    Tracer,
+    configure_from_environment,
+    disable_tracing,
+    enable_tracing,
+    get_tracer,
+    is_tracing_enabled,
+    trace_span,
+    traced,
+)
+
+
+@pytest.fixture
+def tracer():
+    tracer = enable_tracing()
+    yield tracer
+    disable_tracing()
+    tracer.clear()
+
+
+class TracedWidget(ThemedWidget, QWidget):
+    """Widget with a theme change handler."""
+
+    theme_config = {"background": "colors.background"}
+
+    def on_theme_changed(self):
+        pass
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer()
+
+    with tracer.span("work", widget=object()) as span:
+        pass
+
+    assert span is None
+    assert tracer.events() == []
+    assert not is_tracing_enabled()
+    with trace_span("work"):
+        pass
+    assert get_tracer().events() == []
+
+
+def test_spans_export_chrome_trace(tracer, tmp_path):
+    @traced("decorated", "test")
+    def decorated():
+        return 42
+
+    widget = object()
+    with trace_span("outer", "test", widget, theme="dark") as span:
+        span.set_arg("widgets", 3)
+        assert decorated() == 42
+
+    trace = json.loads(tracer.write_chrome_trace(tmp_path / "trace.json").read_text())
+    events = {event["name"]: event for event in trace["traceEvents"]}
+
+    assert set(events) == {"outer", "decorated"}
+    outer = events["outer"]
+    assert outer["ph"] == "X"
+    assert outer["cat"] == "test"
+    assert outer["dur"] >= events["decorated"]["dur"]
+    assert outer["args"]["widget_class"] == "object"
+    assert outer["args"]["theme"] == "dark"
+    assert outer["args"]["widgets"] == 3
+
+
+def test_failed_span_records_error(tracer):
+    with pytest.raises(KeyError), trace_span("failing"):
+        raise KeyError("missing")
+
+    assert tracer.events()[0].args == {"error": "KeyError"}
+
+
+@pytest.mark.usefixtures("qapp")
+def test_theme_switch_traces_pipeline(tracer):
+    manager = ThemeManager.get_instance()
+    previous = manager.current_theme.name if manager.current_theme else "default"
+    manager.set_theme("dark", immediate=True)
+    widget = TracedWidget()
+    QApplication.processEvents()
+    tracer.clear()
+
+    try:
+        manager.set_theme("light", immediate=True)
+        # Delivered by ThemedApplication in a running app
+        widget._on_global_theme_changed("light")
+    finally:
+        manager.set_theme(previous, immediate=True)
+        widget.deleteLater()
+
+    names = {event.name for event in tracer.events()}
+    assert {"set_theme", "repository_lookup", "apply_theme_globally"} <= names
+    assert {"apply_theme_update", "generate_stylesheet", "on_theme_changed"} <= names
+
+    costs = {
+        (cost.widget_class, cost.operation): cost for cost in tracer.widget_class_costs()
+    }
+    assert costs[("TracedWidget", "apply_theme_update")].count >= 1
+    assert "TracedWidget" in tracer.format_widget_class_costs()
+
+
+def test_performance_tracker_measurements_are_traced(tracer):
+    tracker = PerformanceTracker()
+
+    with tracker.measure("theme_load"):
+        pass
+
+    assert tracker.get_stats()["theme_load"]["count"] == 1
+    assert [(event.name, event.category) for event in tracer.events()] == [
+        ("theme_load", "measure")
+    ]
+
+
+def test_environment_variable_enables_tracing(monkeypatch):
+    monkeypatch.setenv(TRACE_ENV_VAR, "0")
+    assert not configure_from_environment()
+    assert not is_tracing_enabled()
+
+    monkeypatch.setenv(TRACE_ENV_VAR, "1")
+    try:
+        assert configure_from_environment()
+        assert is_tracing_enabled()
+    finally:
+        disable_tracing()
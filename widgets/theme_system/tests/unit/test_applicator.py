@@ -72,6 +72,7 @@ from vfwidgets_theme.core.applicator import (
     BatchThemeUpdater,
     PlatformThemeAdapter,
     StyleInvalidator,
+    StyleReferenceResolver,
     ThemeApplicator,
     WidgetThemeApplicator,
     create_theme_applicator,
@@ -310,6 +311,20 @@ class TestWidgetThemeApplicator(ThemedTestCase):
         successful_count = sum(1 for success in results.values() if success)
         self.assertEqual(successful_count, 10)
 
+    def test_batch_application_skips_unchanged_stylesheets(self):
+        """Test widgets keep their stylesheet when the previous theme styles them the same."""
+        widget = MockWidget()
+        widget_id = self.registry.register_widget(widget)
+        self.applicator.apply_theme_batch([widget_id], self.sample_theme)
+
+        data = self.sample_theme.to_dict()
+        data["colors"]["unused"] = "#123456"
+        variant = Theme.from_dict(data)
+        results = self.applicator.apply_theme_batch([widget_id], variant, self.sample_theme)
+
+        self.assertTrue(results[widget_id])
+        self.assertEqual(len(widget.style_sheets), 1)
+
     def test_style_generation(self):
         """Test CSS style generation from theme."""
         theme_with_references = Theme.from_dict(
@@ -364,6 +379,47 @@ class TestWidgetThemeApplicator(ThemedTestCase):
         label_style = label.styleSheet()
         self.assertIn("font-weight: bold", label_style)
 
+    def test_reference_resolution_single_pass(self):
+        """Test references resolve by exact key, namespaced or not."""
+        colors = {"primary": "#007acc", "primaryHover": "#1f8ad2", "colors.accent": "#ff0000"}
+
+        resolved = StyleReferenceResolver.resolve(
+            "color: @colors.primaryHover; border: @colors.primary; "
+            "background: @colors.accent; outline: @colors.missing;",
+            colors,
+        )
+
+        self.assertEqual(
+            resolved,
+            "color: #1f8ad2; border: #007acc; background: #ff0000; outline: @colors.missing;",
+        )
+
+    def test_resolved_styles_memoised_per_theme(self):
+        """Test styles and base styles are resolved once per theme generation."""
+        theme = Theme.from_dict(
+            {
+                "name": "memo-theme",
+                "version": "1.0.0",
+                "colors": {"primary": "#007acc"},
+                "styles": {"*": "color: @colors.primary;"},
+            }
+        )
+        widget = MockWidget()
+
+        with patch.object(
+            StyleReferenceResolver, "resolve", wraps=StyleReferenceResolver.resolve
+        ) as resolve:
+            self.applicator.apply_theme(widget, theme)
+            self.applicator.clear_cache()
+            self.applicator.apply_theme(widget, theme)
+            base_styles = self.applicator._generate_base_styles(theme)
+            self.applicator._generate_widget_specific_stylesheet(widget, theme, base_styles)
+
+        # clear_cache() drops the memo once, the last call hits it
+        self.assertEqual(resolve.call_count, 2)
+        self.assertIn("color: #007acc", widget.styleSheet())
+        self.assertIs(base_styles, self.applicator._generate_base_styles(theme))
+
 
 class TestApplicationThemeApplicator(ThemedTestCase):
     """Test ApplicationThemeApplicator for application-level theming."""
@@ -432,6 +488,24 @@ class TestApplicationThemeApplicator(ThemedTestCase):
         self.assertEqual(current, "existing stylesheet")
         mock_app.styleSheet.assert_called_once()
 
+    @patch("vfwidgets_theme.core.applicator.QApplication.instance")
+    def test_apply_with_scoped_stylesheet_factory(self, mock_instance):
+        """Test consolidated widget rules are appended to the app stylesheet."""
+        mock_app = Mock()
+        mock_instance.return_value = mock_app
+
+        self.assertFalse(self.applicator.scoped_stylesheet_enabled)
+        self.applicator.set_scoped_stylesheet_factory(
+            lambda theme: f'*[vftheme_scope="true"] QLabel {{ color: {theme.name}; }}'
+        )
+        self.assertTrue(self.applicator.scoped_stylesheet_enabled)
+
+        self.applicator.apply_theme(self.sample_theme)
+
+        call_args = mock_app.setStyleSheet.call_args[0][0]
+        self.assertIn("background-color: #f0f0f0", call_args)
+        self.assertIn('*[vftheme_scope="true"] QLabel { color: app-theme; }', call_args)
+
 
 class TestBatchThemeUpdater(ThemedTestCase):
     """Test BatchThemeUpdater for efficient bulk updates."""
@@ -651,6 +725,62 @@ class TestAsyncThemeApplicator(ThemedTestCase):
         self.assertTrue(success)
         self.assertEqual(cb_widget_id, widget_id)
 
+    @pytest.mark.skipif(not QT_AVAILABLE, reason="Qt not available")
+    @pytest.mark.usefixtures("qapp")
+    def test_prepare_theme_computes_per_class(self):
+        """Test stylesheets and palette colors are computed per widget class."""
+        widgets = [MockWidget(), MockWidget(), QPushButton()]
+        for widget in widgets:
+            self.registry.register_widget(widget)
+
+        prepared = self.async_applicator.prepare_theme(self.sample_theme).result(timeout=1.0)
+
+        # Other tests rename MockWidget, so compare against the live class names
+        self.assertEqual(set(prepared.stylesheets), {type(w).__name__ for w in widgets})
+        self.assertIn("#007acc", prepared.stylesheets["QPushButton"])
+        self.assertTrue(prepared.palette_colors)
+
+    @pytest.mark.skipif(not QT_AVAILABLE, reason="Qt not available")
+    @pytest.mark.usefixtures("qapp")
+    def test_async_batch_applies_on_gui_thread(self):
+        """Test async batch application restyles widgets in one GUI-thread batch."""
+        applied = []
+
+        class RecordingWidget(MockWidget):
+            def setStyleSheet(self, stylesheet):
+                applied.append((threading.current_thread(), self.window().updatesEnabled()))
+                super().setStyleSheet(stylesheet)
+
+        window = QWidget()
+        widgets = [RecordingWidget(window) for _ in range(5)]
+        widget_ids = [self.registry.register_widget(w) for w in widgets]
+        completed = []
+        theme = Theme.from_dict(
+            {
+                "name": "async-batch-theme",
+                "colors": {"primary": "#007acc"},
+                "styles": {"RecordingWidget": "color: @colors.primary;"},
+            }
+        )
+
+        future = self.async_applicator.apply_theme_batch_async(
+            widget_ids, theme, callback=completed.append
+        )
+        deadline = time.time() + 2.0
+        while not future.done() and time.time() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.001)
+
+        # Delivered through the event loop, not by waiting on the future
+        self.assertTrue(future.done())
+        self.assertTrue(all(future.result().values()))
+        self.assertEqual(len(completed), 1)
+        self.assertEqual(len(applied), 5)
+        for thread, updates_enabled in applied:
+            self.assertIs(thread, threading.main_thread())
+            self.assertFalse(updates_enabled)
+        self.assertTrue(window.updatesEnabled())
+
     def test_cancel_async_operation(self):
         """Test canceling async theme application."""
         widget = MockWidget()
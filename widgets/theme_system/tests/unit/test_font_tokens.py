@@ -11,8 +11,9 @@ Based on: widgets/theme_system/docs/fonts-implementation-tasks-PLAN.md
 Phase 2 - Font Token Resolution
 """
 
+from unittest.mock import patch
 
-from PySide6.QtGui import QFont
+from PySide6.QtGui import QFont, QGuiApplication
 
 from vfwidgets_theme.core.font_tokens import FontTokenRegistry
 from vfwidgets_theme.core.theme import Theme
@@ -291,3 +292,67 @@ class TestFontTokenResolution:
         for family in generic_families:
             result = FontTokenRegistry.get_available_font((family,))
             assert result == family
+
+
+class TestQFontCache:
+    """Test suite for prebuilt QFont caching and its invalidation."""
+
+    THEME = Theme(
+        name="cached-fonts",
+        fonts={"fonts.mono": ["Consolas", "monospace"], "terminal.fontSize": 15},
+    )
+
+    def test_get_qfont_is_built_once_per_theme(self, qtbot):
+        """Repeated get_qfont calls should reuse the prebuilt font."""
+        FontTokenRegistry.clear_cache()
+
+        with patch.object(
+            FontTokenRegistry, "_build_qfont", wraps=FontTokenRegistry._build_qfont
+        ) as build:
+            first = FontTokenRegistry.get_qfont("terminal", self.THEME)
+            second = FontTokenRegistry.get_qfont("terminal", self.THEME)
+            FontTokenRegistry.get_qfont("tabs", self.THEME)
+
+        assert build.call_count == 2
+        assert first == second
+        assert second.pointSizeF() == 15.0
+
+    def test_returned_fonts_are_copies(self, qtbot):
+        """Modifying a returned font should not affect later calls."""
+        font = FontTokenRegistry.get_qfont("terminal", self.THEME)
+        font.setPointSizeF(30.0)
+
+        assert FontTokenRegistry.get_qfont("terminal", self.THEME).pointSizeF() == 15.0
+
+    def test_font_override_hook_rebuilds_fonts(self, qtbot):
+        """invalidate_font_overrides() should start a new font generation."""
+        FontTokenRegistry.get_qfont("terminal", self.THEME)
+
+        FontTokenRegistry.invalidate_font_overrides()
+
+        with patch.object(
+            FontTokenRegistry, "_build_qfont", wraps=FontTokenRegistry._build_qfont
+        ) as build:
+            FontTokenRegistry.get_qfont("terminal", self.THEME)
+        assert build.call_count == 1
+
+    def test_font_database_is_probed_once(self, qtbot):
+        """Font availability should query the font database once per process."""
+        FontTokenRegistry.invalidate_font_database()
+
+        with patch(
+            "vfwidgets_theme.core.font_tokens.QFontDatabase.families",
+            return_value=["Fake Mono", "Other Sans"],
+        ) as families:
+            assert FontTokenRegistry.get_available_font(("fake mono",)) == "fake mono"
+            assert FontTokenRegistry.get_available_font(("Missing", "Other Sans")) == "Other Sans"
+            assert FontTokenRegistry.get_available_font(("Missing",)) is None
+
+            assert families.call_count == 1
+
+            # Installing fonts invalidates the probe
+            QGuiApplication.instance().fontDatabaseChanged.emit()
+            FontTokenRegistry.get_available_font(("fake mono",))
+            assert families.call_count == 2
+
+        FontTokenRegistry.invalidate_font_database()
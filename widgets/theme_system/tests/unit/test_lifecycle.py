@@ -197,6 +197,27 @@ class TestWidgetRegistrySystem(ThemedTestCase):
         for widget in widgets:
             assert widget in iterated_widgets
 
+    def test_registry_iteration_is_a_snapshot(self):
+        """Test registering and unregistering while iterating."""
+        from src.vfwidgets_theme.lifecycle import WidgetRegistry
+
+        registry = WidgetRegistry()
+        widgets = [MockWidget() for _ in range(3)]
+        for widget in widgets:
+            registry.register(widget)
+
+        late_widget = MockWidget()
+        iterated_widgets = []
+        for widget in registry.iter_widgets():
+            iterated_widgets.append(widget)
+            if widget is widgets[0]:
+                registry.unregister(widgets[0])
+                registry.register(late_widget)
+
+        assert iterated_widgets == widgets
+        assert late_widget in list(registry.iter_widgets())
+        assert widgets[0] not in list(registry.iter_widgets())
+
     def test_registry_filtering(self):
         """Test filtering widgets by metadata."""
         from src.vfwidgets_theme.lifecycle import WidgetRegistry
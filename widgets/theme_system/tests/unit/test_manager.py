@@ -13,6 +13,7 @@ import tempfile
 import threading
 import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -170,6 +171,52 @@ class TestThemeManager(ThemedTestCase):
         # Widget should receive theme application
         # This would be verified through the applicator's effects
 
+    @patch("vfwidgets_theme.core.manager.QTimer.singleShot")
+    @patch("vfwidgets_theme.core.manager.QApplication.instance", return_value=object())
+    def test_set_theme_coalesced(self, mock_instance, mock_single_shot):
+        """Test rapid set_theme calls collapse to the last requested theme."""
+        manager = ThemeManager()
+        manager.add_theme(self.sample_theme)
+        manager.add_theme(Theme.from_dict({**self.sample_theme_data, "name": "other-theme"}))
+        manager.set_coalescing_enabled(True)
+
+        manager.set_theme("manager-test-theme")
+        manager.set_theme("other-theme")
+
+        # One flush scheduled, nothing applied yet
+        self.assertEqual(mock_single_shot.call_count, 1)
+        self.assertEqual(manager.pending_theme_name, "other-theme")
+        self.assertNotEqual(getattr(manager.current_theme, "name", None), "other-theme")
+
+        # Fire the zero-timer
+        mock_single_shot.call_args[0][1]()
+
+        self.assertEqual(manager.current_theme.name, "other-theme")
+        self.assertIsNone(manager.pending_theme_name)
+        stats = manager.get_statistics()
+        self.assertEqual(stats["theme_switches"], 1)
+        self.assertEqual(stats["coalesced_switches"], 1)
+
+    @patch("vfwidgets_theme.core.manager.QTimer.singleShot")
+    @patch("vfwidgets_theme.core.manager.QApplication.instance", return_value=object())
+    def test_set_theme_coalesced_escape_hatches(self, mock_instance, mock_single_shot):
+        """Test flush_pending_theme and immediate=True apply synchronously."""
+        manager = ThemeManager()
+        manager.add_theme(self.sample_theme)
+        manager.set_coalescing_enabled(True)
+
+        manager.set_theme("manager-test-theme")
+        self.assertTrue(manager.flush_pending_theme())
+        self.assertEqual(manager.current_theme.name, "manager-test-theme")
+        self.assertFalse(manager.flush_pending_theme())
+
+        # Unknown themes still fail synchronously
+        with self.assertRaises(ThemeNotFoundError):
+            manager.set_theme("nonexistent-theme")
+
+        manager.set_theme("manager-test-theme", immediate=True)
+        self.assertEqual(mock_single_shot.call_count, 1)
+
     def test_register_widget(self):
         """Test registering widget for theme management."""
         manager = ThemeManager()
@@ -12,6 +12,8 @@ Tests change notification system including:
 
 import threading
 import time
+import weakref
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -62,6 +64,7 @@ from vfwidgets_theme.core.notifier import (
     CallbackRegistry,
     CrossThreadNotifier,
     EventFilter,
+    FrameBudgetDispatcher,
     NotificationBatcher,
     NotificationQueue,
     ThemeNotifier,
@@ -378,6 +381,27 @@ class TestWidgetNotificationManager(ThemedTestCase):
         # Should be 0 after cleanup
         self.assertEqual(registered_count, 0)
 
+    def test_registration_during_notification(self):
+        """Test widgets registered while notifying wait for the next round."""
+        late_widgets = []
+
+        def register_late_widget(theme_name):
+            late_widget = MockWidget("late-widget")
+            late_widgets.append(late_widget)
+            self.manager.register_widget(late_widget)
+
+        widget = MockWidget("registering-widget")
+        widget.theme_changed = MagicMock()
+        widget.theme_changed.emit.side_effect = register_late_widget
+        self.manager.register_widget(widget)
+
+        results = self.manager.notify_all_widgets("snapshot-theme")
+
+        self.assertEqual(len(results), 1)
+        self.assertTrue(all(results.values()))
+        self.assertEqual(self.manager.get_registered_count(), 2)
+        self.assertTrue(self.manager.is_registered(late_widgets[0]))
+
     def test_thread_safety(self):
         """Test thread safety of widget registration."""
         widgets = []
@@ -897,6 +921,141 @@ class TestNotificationBatcher(ThemedTestCase):
         self.assertEqual(large_batch_count, 20)
 
 
+class RecordingSignal:
+    """Signal stand-in recording emitted theme names."""
+
+    def __init__(self, log, name):
+        self._log = log
+        self._name = name
+
+    def emit(self, theme_name):
+        self._log.append((self._name, theme_name))
+
+
+class FakeWindow:
+    def __init__(self, active):
+        self._active = active
+
+    def isActiveWindow(self):
+        return self._active
+
+
+class FakeWidget:
+    """Widget stand-in with visibility and window state."""
+
+    def __init__(self, visible=True, active=False):
+        self._visible = visible
+        self._window = FakeWindow(active)
+
+    def isVisible(self):
+        return self._visible
+
+    def window(self):
+        return self._window
+
+
+@pytest.mark.skipif(not QT_AVAILABLE, reason="Requires Qt event loop")
+@pytest.mark.usefixtures("qapp")
+class TestFrameBudgetDispatcher(ThemedTestCase):
+    """Test time-sliced notification delivery (slices run only when asked to)."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self.delivered = []
+        self.dispatcher = FrameBudgetDispatcher(budget_ms=8.0, min_widgets=1)
+        self.dispatcher.set_delivery(
+            lambda theme_name, widget_id, widget, signal: signal.emit(theme_name)
+        )
+
+    def make_entries(self, widgets):
+        return tuple(
+            (name, weakref.ref(widget), RecordingSignal(self.delivered, name))
+            for name, widget in widgets.items()
+        )
+
+    def test_superseded_notifications_are_coalesced(self):
+        """Test a newer theme replaces pending notifications for a widget."""
+        widgets = {f"widget-{i}": FakeWidget() for i in range(3)}
+        self.dispatcher.schedule("first", self.make_entries(widgets))
+        self.dispatcher.schedule("second", self.make_entries(widgets))
+
+        self.assertEqual(self.dispatcher.pending_count(), 3)
+        self.assertEqual(self.dispatcher.flush(), 3)
+        self.assertEqual({theme for _name, theme in self.delivered}, {"second"})
+        self.assertEqual(self.dispatcher.get_statistics()["coalesced"], 3)
+
+    def test_active_and_visible_widgets_first(self):
+        """Test delivery order follows widget visibility."""
+        widgets = {
+            "hidden": FakeWidget(visible=False),
+            "visible": FakeWidget(),
+            "active": FakeWidget(active=True),
+        }
+        self.dispatcher.schedule("theme", self.make_entries(widgets))
+        self.dispatcher.flush()
+
+        self.assertEqual([name for name, _theme in self.delivered], ["active", "visible", "hidden"])
+
+    def test_slice_respects_budget(self):
+        """Test an exhausted budget still delivers one notification per slice."""
+        widgets = {f"widget-{i}": FakeWidget() for i in range(5)}
+        self.dispatcher.schedule("theme", self.make_entries(widgets))
+        self.dispatcher.clear()
+        self.dispatcher.schedule("theme", self.make_entries(widgets))
+
+        self.assertEqual(self.dispatcher.process_slice(budget_ms=0), 1)
+        self.assertEqual(self.dispatcher.pending_count(), 4)
+        self.dispatcher.flush()
+
+
+@pytest.mark.skipif(not QT_AVAILABLE, reason="Requires Qt event loop")
+def test_frame_budget_notifier_yields_to_event_loop(qtbot):
+    """Test sliced notifications are delivered from the event loop."""
+    notifier = ThemeNotifier()
+    notifier.set_frame_budget(8.0, min_widgets=1)
+
+    delivered = []
+    notifier.register_callback(lambda theme_name, widget_id: delivered.append(theme_name))
+    widgets = [MockWidget(f"sliced-{i}") for i in range(3)]
+    for widget in widgets:
+        widget.theme_changed = RecordingSignal([], widget.name)
+        notifier.register_widget(widget)
+
+    notifier.notify_theme_changed("first")
+    notifier.notify_theme_changed("second")
+    assert delivered == []
+
+    qtbot.waitUntil(lambda: len(delivered) == 3)
+    assert delivered == ["second"] * 3
+    assert notifier.get_statistics()["dispatch_stats"]["pending"] == 0
+
+
+@pytest.mark.skipif(not QT_AVAILABLE, reason="Requires Qt event loop")
+def test_synchronous_notification_drops_pending_sliced_ones(qtbot):
+    """Test a sliced switch does not land after a later synchronous one."""
+    notifier = ThemeNotifier()
+    notifier.set_frame_budget(8.0, min_widgets=3)
+
+    delivered = []
+    widgets = [MockWidget(f"sliced-{i}") for i in range(3)]
+    for widget in widgets:
+        widget.theme_changed = RecordingSignal(delivered, widget.name)
+        notifier.register_widget(widget)
+
+    notifier.notify_theme_changed("first")
+    assert delivered == []
+
+    # Below the slicing threshold the next switch is delivered synchronously
+    notifier.unregister_widget(widgets[0])
+    notifier.notify_theme_changed("second")
+    assert delivered == [("sliced-1", "second"), ("sliced-2", "second")]
+
+    qtbot.wait(50)
+    assert notifier.flush_pending_notifications() == 0
+    assert delivered == [("sliced-1", "second"), ("sliced-2", "second")]
+
+
 class TestNotifierIntegration(ThemedTestCase):
     """Integration tests for notifier components working together."""
 
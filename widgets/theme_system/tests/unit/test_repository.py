@@ -12,6 +12,7 @@ Tests theme storage and retrieval operations including:
 """
 
 import json
+import os
 import tempfile
 import threading
 import time
@@ -26,6 +27,7 @@ from vfwidgets_theme.core.repository import (
     FileThemeLoader,
     ThemeCache,
     ThemeDiscovery,
+    ThemeDiscoveryCache,
     ThemeRepository,
     create_theme_repository,
 )
@@ -507,6 +509,173 @@ class TestThemeDiscovery(ThemedTestCase):
             self.assertEqual(themes[0].name, "nested-theme")
 
 
+class TestThemeDiscoveryCache(ThemedTestCase):
+    """Test the on-disk discovery cache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        super().setUp()
+        self._temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self._temp_dir.name)
+        self.cache_path = self.temp_path / "cache" / "themes.cache"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self._temp_dir.cleanup()
+        super().tearDown()
+
+    def _write_theme(self, name, color="#000000"):
+        theme_file = self.temp_path / f"{name}.json"
+        theme_data = {"name": name, "version": "1.0.0", "colors": {"editor.background": color}}
+        theme_file.write_text(json.dumps(theme_data))
+        return theme_file
+
+    def test_cache_round_trip(self):
+        """Test cached entries survive a reload of the cache file."""
+        theme_file = self._write_theme("cached-theme")
+        cache = ThemeDiscoveryCache(self.cache_path)
+        self.assertTrue(cache.store(theme_file, FileThemeLoader().load_theme(theme_file)))
+        self.assertTrue(cache.save())
+        self.assertFalse(cache.save())  # Nothing changed since
+
+        data = ThemeDiscoveryCache(self.cache_path).lookup(theme_file)
+        self.assertEqual(data["name"], "cached-theme")
+        self.assertEqual(data["colors"]["editor.background"], "#000000")
+
+        # Files written by another format version are ignored
+        self.cache_path.write_bytes(b"VFTHEMEC0:0.0\n" + self.cache_path.read_bytes()[16:])
+        self.assertEqual(len(ThemeDiscoveryCache(self.cache_path)), 0)
+
+    def test_cache_invalidated_per_file(self):
+        """Test editing one theme file only invalidates its own entry."""
+        first = self._write_theme("first")
+        second = self._write_theme("second")
+        cache = ThemeDiscoveryCache(self.cache_path)
+        loader = FileThemeLoader()
+        cache.store(first, loader.load_theme(first))
+        cache.store(second, loader.load_theme(second))
+
+        self._write_theme("first", color="#ffffff")
+        stat = first.stat()
+        os.utime(first, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        self.assertIsNone(cache.lookup(first))
+        self.assertEqual(cache.lookup(second)["name"], "second")
+
+        # Touching a file without changing its content keeps the entry
+        stat = second.stat()
+        os.utime(second, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        self.assertEqual(cache.lookup(second)["name"], "second")
+
+        # Deleted files are pruned
+        second.unlink()
+        self.assertEqual(cache.prune_directory(self.temp_path, set()), 1)
+        self.assertEqual(len(cache), 0)
+
+    def _index_directory(self, repo):
+        for name, source, file_path, version in repo._discover_directory(self.temp_path):
+            repo._register_discovered_theme(name, source, file_path, version)
+
+    def test_repository_restores_cached_themes_lazily(self):
+        """Test unchanged theme files are not reloaded and build on first use."""
+        self._write_theme("lazy-theme")
+        repo = ThemeRepository(discovery_cache=ThemeDiscoveryCache(self.cache_path))
+        self._index_directory(repo)
+        repo.get_theme("lazy-theme")
+
+        repo = ThemeRepository(discovery_cache=ThemeDiscoveryCache(self.cache_path))
+        with patch.object(ThemeDiscovery, "load_theme_file") as load_theme_file:
+            self._index_directory(repo)
+            load_theme_file.assert_not_called()
+
+        self.assertIsInstance(repo._pending_themes["lazy-theme"], dict)
+        self.assertTrue(repo.has_theme("lazy-theme"))
+        self.assertIn("lazy-theme", repo.list_themes())
+
+        theme = repo.get_theme("lazy-theme")
+        self.assertEqual(theme.colors["editor.background"], "#000000")
+        self.assertNotIn("lazy-theme", repo._pending_themes)
+        self.assertIs(repo.get_theme("lazy-theme"), theme)
+
+    def test_discovery_indexes_without_loading(self):
+        """Test new theme files are only indexed until first requested."""
+        theme_file = self._write_theme("indexed-theme")
+        repo = ThemeRepository(discovery_cache=ThemeDiscoveryCache(self.cache_path))
+        with patch.object(ThemeDiscovery, "load_theme_file") as load_theme_file:
+            self._index_directory(repo)
+            load_theme_file.assert_not_called()
+
+        self.assertEqual(repo._pending_themes["indexed-theme"], theme_file)
+        self.assertFalse(repo.is_theme_loaded("indexed-theme"))
+        self.assertTrue(repo.has_theme("indexed-theme"))
+
+        theme = repo.get_theme("indexed-theme")
+        self.assertEqual(theme.name, "indexed-theme")
+        self.assertTrue(repo.is_theme_loaded("indexed-theme"))
+        # Loaded themes are written back to the discovery cache
+        self.assertIsNotNone(ThemeDiscoveryCache(self.cache_path).lookup(theme_file))
+
+    def test_invalid_indexed_theme_is_dropped(self):
+        """Test a theme file that fails validation is removed on first use."""
+        theme_file = self.temp_path / "broken.json"
+        theme_file.write_text(json.dumps({"name": "broken", "colors": {"bad": 42}}))
+        repo = ThemeRepository(discovery_cache=ThemeDiscoveryCache(self.cache_path))
+        self._index_directory(repo)
+        self.assertTrue(repo.has_theme("broken"))
+
+        with self.assertRaises(ThemeNotFoundError):
+            repo.get_theme("broken")
+        self.assertFalse(repo.has_theme("broken"))
+
+    def test_invalid_theme_file_falls_back_to_shadowed_theme(self):
+        """Test a theme file shadowing a built-in that fails validation restores it."""
+        theme_file = self.temp_path / "dark.json"
+        theme_file.write_text(json.dumps({"name": "dark", "colors": {"bad": 42}}))
+        repo = ThemeRepository(discovery_cache=ThemeDiscoveryCache(self.cache_path))
+        builtin = repo.get_theme("dark")
+        self._index_directory(repo)
+        self.assertEqual(repo._pending_themes["dark"], theme_file)
+
+        self.assertIs(repo.get_theme("dark"), builtin)
+        self.assertIsNone(repo._metadata["dark"].file_path)
+        self.assertNotIn("dark", repo._pending_themes)
+
+    def test_index_reads_only_the_file_header(self):
+        """Test theme files are indexed from their first characters."""
+        theme_file = self.temp_path / "large.json"
+        colors = {f"token{i}.background": "#000000" for i in range(2000)}
+        theme_file.write_text(
+            json.dumps({"name": "large", "type": "dark", "version": "2.0", "colors": colors})
+        )
+        loader = FileThemeLoader()
+
+        with patch("vfwidgets_theme.core.repository.json.load") as json_load:
+            index = loader.read_index(theme_file)
+            json_load.assert_not_called()
+        self.assertEqual(index, {"name": "large", "type": "dark", "version": "2.0"})
+
+        # A name after nested values is found by parsing the whole file
+        theme_file.write_text(json.dumps({"colors": colors, "name": "late"}))
+        self.assertEqual(loader.read_index(theme_file)["name"], "late")
+        self.assertIsNone(loader.read_index(theme_file)["type"])
+
+    def test_load_pending_themes_in_background(self):
+        """Test indexed theme files are loaded on a thread pool."""
+        for i in range(5):
+            self._write_theme(f"background-{i}")
+        repo = ThemeRepository(discovery_cache=ThemeDiscoveryCache(self.cache_path))
+        self._index_directory(repo)
+        pending = [name for name, src in repo._pending_themes.items() if isinstance(src, Path)]
+
+        loaded = repo.load_pending_themes(max_workers=3).result(timeout=10)
+
+        self.assertEqual(loaded, len(pending))
+        for i in range(5):
+            self.assertTrue(repo.is_theme_loaded(f"background-{i}"))
+        self.assertEqual(len(ThemeDiscoveryCache(self.cache_path)), len(pending))
+        self.assertEqual(repo.load_pending_themes().result(timeout=10), 0)
+
+
 class TestRepositoryIntegration(ThemedTestCase):
     """Integration tests for repository components working together."""
 
@@ -17,6 +17,7 @@ import json
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import FrozenInstanceError
+from unittest.mock import patch
 
 import pytest
 
@@ -71,6 +72,33 @@ class TestThemeImmutability(ThemedTestCase):
         assert hash(theme1) != hash(theme3)
         assert theme1 != theme3
 
+    def test_theme_hash_is_lazy(self):
+        """Theme hash should be computed on first use, independent of key order."""
+        theme1 = Theme(name="test", colors={"a": "#ff0000", "b": "#00ff00"})
+        theme2 = Theme(name="test", colors={"b": "#00ff00", "a": "#ff0000"})
+
+        assert theme1._hash is None
+        assert hash(theme1) == hash(theme2)
+        assert theme1._hash is not None
+
+        # Nested, unhashable values are supported
+        nested = Theme(name="nested", metadata={"tags": ["dark"], "extra": {"k": [1]}})
+        assert hash(nested) == hash(Theme(name="nested", metadata=dict(nested.metadata)))
+
+    def test_theme_trusted_construction(self):
+        """Trusted construction should skip validation of already-validated data."""
+        theme = Theme(name="trusted", colors={"primary": "#ff0000"})
+
+        with patch.object(Theme, "_is_valid_color") as is_valid_color:
+            restored = Theme.from_dict(theme.to_dict(), trusted=True)
+
+        is_valid_color.assert_not_called()
+        assert restored == theme
+
+        # Regular construction still validates
+        with pytest.raises(InvalidThemeFormatError):
+            Theme(name="untrusted", colors={"primary": "not-a-color"})
+
     def test_theme_concurrent_access_safety(self):
         """Theme should be safe for concurrent access."""
         theme = Theme(
@@ -428,6 +456,17 @@ class TestThemeComposer(ThemedTestCase):
         composed = self.composer.compose_with_strategy([theme1, theme2], strategy="last_wins")
         assert composed.colors["conflict"] == "#00ff00"  # theme2 wins
 
+    def test_compose_skips_revalidation(self):
+        """Composition of validated themes should not validate them again."""
+        base = Theme(name="base", colors={"primary": "#ff0000"})
+        override = Theme(name="override", colors={"secondary": "#00ff00"})
+
+        with patch.object(Theme, "_is_valid_color") as is_valid_color:
+            composed = self.composer.compose(base, override)
+
+        is_valid_color.assert_not_called()
+        assert composed.colors == {"primary": "#ff0000", "secondary": "#00ff00"}
+
     def test_compose_performance(self):
         """Theme composition should be performant."""
         base_theme = Theme(
@@ -539,6 +578,54 @@ class TestPropertyResolver(ThemedTestCase):
         with pytest.raises(InvalidThemeFormatError, match="circular"):
             resolver.get_color("a")
 
+    def test_resolver_compile(self):
+        """Resolver should compile the whole theme into frozen lookup tables."""
+        compiled = self.resolver.compile()
+
+        assert compiled.colors["accent"] == "#ff0000"
+        assert compiled.colors["derived"] == "#ff0000"
+        assert compiled.styles["header-font"] == "Arial"
+        assert compiled.circular == frozenset()
+        with pytest.raises(TypeError):
+            compiled.colors["accent"] = "#000000"
+
+        # Resolvers for the same theme share the compiled result
+        assert PropertyResolver(self.theme).compile() is compiled
+
+    def test_resolver_max_cache_size_is_deprecated(self):
+        """The per-resolver cache size no longer applies to compiled tables."""
+        with pytest.warns(DeprecationWarning, match="max_cache_size"):
+            resolver = PropertyResolver(self.theme, max_cache_size=10)
+
+        assert resolver.get_color("primary") == PropertyResolver(self.theme).get_color("primary")
+
+    def test_resolver_compile_circular_dependents(self):
+        """Keys depending on a cycle should be reported, the rest resolved."""
+        theme = Theme(
+            name="circular-dependents",
+            colors={"a": "@b", "b": "@a", "c": "@a", "d": "#123456", "e": "@d"},
+        )
+        resolver = PropertyResolver(theme)
+
+        compiled = resolver.compile()
+
+        assert compiled.circular == {("color", "a"), ("color", "b"), ("color", "c")}
+        assert compiled.colors == {"d": "#123456", "e": "#123456"}
+        with pytest.raises(InvalidThemeFormatError, match="circular"):
+            resolver.get_color("c")
+
+    def test_resolver_load_compiled(self):
+        """Compiled properties should round-trip through JSON across sessions."""
+        data = json.loads(json.dumps(self.resolver.compile().to_dict()))
+        self.resolver.clear_cache()
+
+        resolver = PropertyResolver(self.theme)
+        assert resolver.load_compiled(data)
+        assert resolver.get_color("accent") == "#ff0000"
+
+        other = PropertyResolver(Theme(name="test", colors={"primary": "#0000ff"}))
+        assert not other.load_compiled(data)
+
     def test_resolver_concurrent_access(self):
         """Resolver should be thread-safe for concurrent access."""
 